@@ -0,0 +1,3 @@
+from .metrics import Metrics, Regression, compare, extract
+
+__all__ = ["Metrics", "Regression", "compare", "extract"]
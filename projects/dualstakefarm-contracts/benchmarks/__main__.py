@@ -0,0 +1,181 @@
+"""
+Opcode cost benchmarks for the DualstakeFarm ABI methods.
+
+    python -m benchmarks run               simulate scenarios, print metrics
+    python -m benchmarks record            simulate and store baseline + traces
+    python -m benchmarks check             simulate and fail on regressions
+    python -m benchmarks replay [--check]  metrics from stored traces, offline
+
+Network and farms come from the environment: ALGOD_SERVER, ALGOD_PORT,
+ALGOD_TOKEN, DUALSTAKEFARM_APP_ID, BENCH_SENDER, BENCH_FARM_APP_IDS (comma
+separated), and optionally BENCH_OPTED_ASSET, BENCH_UNOPTED_ASSET and
+BENCH_NEW_FARM_APP_ID for the cost and create_farm scenarios.
+
+With --mock every command runs against an in-process simulation.mock_algod
+network instead and uses the committed baseline.mock.json. The mock prices calls
+with the build's cost model without running the contract, so only opcode cost is
+reported. Scenarios the mock does not simulate are left out.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from algosdk import encoding
+from algosdk.v2client.algod import AlgodClient
+from dotenv import load_dotenv
+
+from simulation.mock_algod import farm_network, serve
+
+from .metrics import Metrics, compare
+from .runner import replay, run
+from .scenarios import BenchContext, find_payable
+
+root_path = Path(__file__).parent
+BASELINE = root_path / "baseline.json"
+TRACES = root_path / "traces"
+MOCK_BASELINE = root_path / "baseline.mock.json"
+MOCK_TRACES = TRACES / "mock"
+# mock network: farms holding enough stake to have unpaid proposals for every
+# payout scenario once it advanced MOCK_ROUNDS
+MOCK_FARMS = 8
+MOCK_FARM_STAKE_SHARE = 0.5
+MOCK_ROUNDS = 900
+# the mock does not run the contract: inner txns, logs and box writes of the
+# payout calls would all read 0
+MOCK_METRICS = ("opcode_cost",)
+
+logger = logging.getLogger(__name__)
+
+
+def _optional_int(name: str) -> int | None:
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+def _bench_context(
+    algod: AlgodClient,
+    app_id: int,
+    sender: str,
+    farm_app_ids: list[int],
+    **assets: int | None,
+) -> BenchContext:
+    ctx = BenchContext(
+        algod=algod,
+        app_id=app_id,
+        sender=sender,
+        farm_app_ids=farm_app_ids,
+        params=algod.suggested_params(),
+        last_round=int(algod.status()["last-round"]),
+        **assets,
+    )
+    if ctx.farm_app_ids:
+        find_payable(ctx)
+    return ctx
+
+
+@contextmanager
+def _context() -> Iterator[BenchContext]:
+    load_dotenv()
+    server = os.environ.get("ALGOD_SERVER", "http://localhost")
+    port = os.environ.get("ALGOD_PORT")
+    algod = AlgodClient(
+        os.environ.get("ALGOD_TOKEN", ""), f"{server}:{port}" if port else server
+    )
+    farm_ids = os.environ.get("BENCH_FARM_APP_IDS", "")
+    yield _bench_context(
+        algod,
+        int(os.environ["DUALSTAKEFARM_APP_ID"]),
+        os.environ["BENCH_SENDER"],
+        [int(i) for i in farm_ids.split(",") if i],
+        opted_asset=_optional_int("BENCH_OPTED_ASSET"),
+        unopted_asset=_optional_int("BENCH_UNOPTED_ASSET"),
+        new_farm_app_id=_optional_int("BENCH_NEW_FARM_APP_ID"),
+    )
+
+
+@contextmanager
+def _mock_context() -> Iterator[BenchContext]:
+    mock = farm_network(farms=MOCK_FARMS, farm_stake_share=MOCK_FARM_STAKE_SHARE)
+    mock.advance(MOCK_ROUNDS)
+    with serve(mock, port=0) as url:
+        yield _bench_context(
+            AlgodClient("", url),
+            mock.app_id,
+            # simulate skips signatures, any sender will do
+            encoding.encode_address(bytes(32)),
+            mock.farm_ids,
+        )
+
+
+def _rows(
+    results: dict[str, Metrics], columns: tuple[str, ...]
+) -> dict[str, dict[str, int]]:
+    return {
+        name: {c: v for c, v in metrics.as_dict().items() if c in columns}
+        for name, metrics in results.items()
+    }
+
+
+def _print(rows: dict[str, dict[str, int]], columns: tuple[str, ...]) -> None:
+    print(f"{'scenario':<48}" + "".join(f"{c:>16}" for c in columns))
+    for name, values in rows.items():
+        print(f"{name:<48}" + "".join(f"{values[c]:>16}" for c in columns))
+
+
+def _check(
+    current: dict[str, dict[str, int]], baseline_path: Path, tolerance: float
+) -> int:
+    if not baseline_path.exists():
+        print(
+            f"No baseline at {baseline_path}. Run `python -m benchmarks record` first"
+        )
+        return 2
+    baseline = json.loads(baseline_path.read_text())
+    regressions, missing = compare(baseline, current, tolerance=tolerance)
+    for name in missing:
+        print(f"not compared (missing on one side): {name}")
+    for r in regressions:
+        print(f"REGRESSION {r.scenario} {r.metric}: {r.baseline} -> {r.current}")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DualstakeFarm opcode benchmarks")
+    parser.add_argument("command", choices=("run", "record", "check", "replay"))
+    parser.add_argument("--only", help="run scenarios containing this text")
+    parser.add_argument("--tolerance", type=float, default=0.02)
+    parser.add_argument("--check", action="store_true", help="replay: compare too")
+    parser.add_argument(
+        "--mock", action="store_true", help="run against an in-process mock algod"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    baseline, traces_dir = BASELINE, TRACES
+    columns = tuple(Metrics.__dataclass_fields__)
+    if args.mock:
+        baseline, traces_dir, columns = MOCK_BASELINE, MOCK_TRACES, MOCK_METRICS
+
+    if args.command == "replay":
+        results = replay(traces_dir)
+    else:
+        traces = traces_dir if args.command == "record" else None
+        with _mock_context() if args.mock else _context() as ctx:
+            results = run(ctx, traces, args.only)
+    rows = _rows(results, columns)
+    _print(rows, columns)
+
+    if args.command == "record":
+        baseline.write_text(json.dumps(rows, indent=2) + "\n")
+        print(f"Baseline written to {baseline}")
+    elif args.command == "check" or (args.command == "replay" and args.check):
+        sys.exit(_check(rows, baseline, args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Cost metrics extracted from algod simulate responses."""
+
+import base64
+import dataclasses
+from typing import Any
+
+SimulateResponse = dict[str, Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class Metrics:
+    opcode_cost: int
+    inner_txns: int
+    log_bytes: int
+    box_writes: int
+    box_write_bytes: int
+    box_refs: int
+
+    def as_dict(self) -> dict[str, int]:
+        return dataclasses.asdict(self)
+
+
+def _count_inner(txn_result: dict[str, Any]) -> int:
+    inner = txn_result.get("inner-txns", [])
+    return len(inner) + sum(_count_inner(i) for i in inner)
+
+
+def _log_bytes(txn_result: dict[str, Any]) -> int:
+    own = sum(len(base64.b64decode(log)) for log in txn_result.get("logs", []))
+    return own + sum(_log_bytes(i) for i in txn_result.get("inner-txns", []))
+
+
+def _box_changes(trace: dict[str, Any]) -> tuple[int, int]:
+    writes = 0
+    written = 0
+    for step in trace.get("approval-program-trace", []):
+        for change in step.get("state-changes", []):
+            if change.get("app-state-type") != "b":
+                continue
+            writes += 1
+            value = change.get("new-value", {}).get("bytes")
+            if value:
+                written += len(base64.b64decode(value))
+    for inner in trace.get("inner-trace", []):
+        w, b = _box_changes(inner)
+        writes += w
+        written += b
+    return writes, written
+
+
+def extract(response: SimulateResponse, group: int = 0) -> Metrics:
+    """
+    Metrics for one simulated group. Needs a simulate request with
+    exec-trace-config.state-change enabled for box write counts.
+    """
+    txn_group = response["txn-groups"][group]
+    results = txn_group["txn-results"]
+    if txn_group.get("failure-message"):
+        raise ValueError(f"Simulation failed: {txn_group['failure-message']}")
+
+    box_writes = 0
+    box_write_bytes = 0
+    for result in results:
+        writes, written = _box_changes(result.get("exec-trace", {}))
+        box_writes += writes
+        box_write_bytes += written
+
+    unnamed = txn_group.get("unnamed-resources-accessed", {})
+    return Metrics(
+        opcode_cost=int(
+            txn_group.get(
+                "app-budget-consumed",
+                sum(r.get("app-budget-consumed", 0) for r in results),
+            )
+        ),
+        inner_txns=sum(_count_inner(r["txn-result"]) for r in results),
+        log_bytes=sum(_log_bytes(r["txn-result"]) for r in results),
+        box_writes=box_writes,
+        box_write_bytes=box_write_bytes,
+        box_refs=len(unnamed.get("boxes", [])),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Regression:
+    scenario: str
+    metric: str
+    baseline: int
+    current: int
+
+
+def compare(
+    baseline: dict[str, dict[str, int]],
+    current: dict[str, dict[str, int]],
+    *,
+    tolerance: float = 0.02,
+) -> tuple[list[Regression], list[str]]:
+    """
+    Regressions are metrics above baseline * (1 + tolerance).
+    Scenarios missing from either side are reported separately.
+    """
+    regressions = []
+    for scenario, metrics in current.items():
+        base = baseline.get(scenario)
+        if base is None:
+            continue
+        for metric, value in metrics.items():
+            limit = base.get(metric, 0) * (1 + tolerance)
+            if value > limit:
+                regressions.append(
+                    Regression(scenario, metric, base.get(metric, 0), value)
+                )
+    missing = sorted(set(baseline) ^ set(current))
+    return regressions, missing
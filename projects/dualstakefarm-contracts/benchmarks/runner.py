@@ -0,0 +1,47 @@
+import json
+import logging
+from pathlib import Path
+
+from .metrics import Metrics, SimulateResponse, extract
+from .scenarios import BenchContext, Scenario, all_scenarios, simulate_request
+
+logger = logging.getLogger(__name__)
+
+
+def run_scenario(ctx: BenchContext, scenario: Scenario) -> SimulateResponse:
+    atc = scenario.build(ctx)
+    result = atc.simulate(ctx.algod, simulate_request())
+    return result.simulate_response
+
+
+def run(
+    ctx: BenchContext, traces_dir: Path | None = None, only: str | None = None
+) -> dict[str, Metrics]:
+    """Simulate every available scenario. Optionally save the raw responses."""
+    results = {}
+    for scenario in all_scenarios():
+        if only and only not in scenario.name:
+            continue
+        if not scenario.available(ctx):
+            logger.info(f"Skipping {scenario.name}: not available on this network")
+            continue
+        response = run_scenario(ctx, scenario)
+        if traces_dir is not None:
+            traces_dir.mkdir(parents=True, exist_ok=True)
+            (traces_dir / f"{scenario.name}.json").write_text(json.dumps(response))
+        try:
+            results[scenario.name] = extract(response)
+        except ValueError as e:
+            logger.error(f"{scenario.name}: {e}")
+    return results
+
+
+def replay(traces_dir: Path) -> dict[str, Metrics]:
+    """Metrics from previously recorded simulate responses, no node needed."""
+    results = {}
+    for path in sorted(traces_dir.glob("*.json")):
+        try:
+            results[path.stem] = extract(json.loads(path.read_text()))
+        except ValueError as e:
+            logger.error(f"{path.stem}: {e}")
+    return results
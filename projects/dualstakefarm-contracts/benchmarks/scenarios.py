@@ -0,0 +1,350 @@
+"""
+Benchmark scenarios: one simulated group per scenario, swept over the
+parameters that drive cost (farms per call, round span, swap, opt-in state).
+"""
+
+import base64
+import copy
+import dataclasses
+import struct
+from collections.abc import Callable, Iterator
+
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    TransactionWithSigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.transaction import AssetTransferTxn, PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest, SimulateTraceConfig
+
+from keeper.farms import decode_farm_box
+from keeper.payouts import validity_window
+
+SIGNER = EmptySigner()
+
+
+def _method(signature: str) -> Method:
+    return Method.from_signature(signature)
+
+
+GET_STATE = _method("get_state(application)(uint64,uint64,uint64,uint64)")
+LOG_STATES = _method("log_states(uint64[])void")
+LOG_STATES_AND_APRS = _method("log_states_and_aprs(uint64[])void")
+LOG_STATES_AND_APRS_OVERRIDE = _method(
+    "log_states_and_aprs_override(uint64[],uint64)void"
+)
+PROJECT_APR = _method(
+    "project_apr(application,uint64)"
+    "(uint64,uint64,uint64,uint64,uint64,uint64,uint64,"
+    "uint64,uint64,uint64,uint64,uint64,uint64,uint64)"
+)
+PROJECT_APR_CURVE = _method("project_apr_curve(application,uint64[])(uint64,uint64)[]")
+GET_ALGO_COST = _method(
+    "get_algo_cost(application,asset,uint64)"
+    "(uint64,uint64,uint64,uint64,uint64,uint64)"
+)
+LOG_BLOCK_PROPOSERS = _method("log_block_proposers(uint64,uint64)void")
+LOG_FARM_PROPOSALS = _method("log_farm_proposals(uint64[],uint64,uint64)uint64[]")
+GET_GLOBAL_SNAPSHOT = _method(
+    "get_global_snapshot()"
+    "(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,"
+    "uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)"
+)
+CREATE_FARM = _method("create_farm(application,asset,uint64,uint64)void")
+PAYOUT = _method("payout(application,uint64,bool)void")
+PAYOUT_MANY = _method("payout_many(application,uint64[],bool)void")
+PAYOUT_BATCH = _method("payout_batch((uint64,uint64)[],bool)uint64")
+RECORD_PROPOSALS = _method("record_proposals(application,uint64[])void")
+SETTLE = _method("settle(application,bool)void")
+
+
+@dataclasses.dataclass
+class BenchContext:
+    algod: AlgodClient
+    app_id: int
+    sender: str
+    farm_app_ids: list[int]
+    params: SuggestedParams
+    last_round: int
+    opted_asset: int | None = None
+    unopted_asset: int | None = None
+    new_farm_app_id: int | None = None
+    # farm app id -> proposed rounds after last_block_paid, still provable
+    payable: dict[int, list[int]] = dataclasses.field(default_factory=dict)
+    farm_assets: dict[int, int] = dataclasses.field(default_factory=dict)
+
+    def sp(self, first: int | None = None, last: int | None = None) -> SuggestedParams:
+        sp = copy.copy(self.params)
+        sp.first = self.last_round + 1 if first is None else first
+        sp.last = sp.first if last is None else last
+        sp.flat_fee = True
+        sp.fee = 1000
+        return sp
+
+    def farms(self, n: int) -> list[int]:
+        # repeat ids when fewer farms exist, cost per entry is the same
+        return [self.farm_app_ids[i % len(self.farm_app_ids)] for i in range(n)]
+
+
+Builder = Callable[[BenchContext], AtomicTransactionComposer]
+
+
+def _has_farms(ctx: BenchContext) -> bool:
+    return bool(ctx.farm_app_ids)
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    name: str
+    build: Builder
+    available: Callable[[BenchContext], bool] = _has_farms
+
+
+def _call(
+    ctx: BenchContext,
+    method: Method,
+    args: list[object],
+    *,
+    atc: AtomicTransactionComposer | None = None,
+    sp: SuggestedParams | None = None,
+) -> AtomicTransactionComposer:
+    atc = atc or AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=ctx.app_id,
+        method=method,
+        sender=ctx.sender,
+        sp=sp or ctx.sp(),
+        signer=SIGNER,
+        method_args=args,
+    )
+    return atc
+
+
+def _payout_sp(ctx: BenchContext, rounds: list[int]) -> SuggestedParams:
+    first, last = validity_window(rounds, ctx.last_round, 8)
+    return ctx.sp(first, last)
+
+
+def _payable_farm(ctx: BenchContext, min_rounds: int = 1) -> int | None:
+    for app_id, rounds in ctx.payable.items():
+        if len(rounds) >= min_rounds:
+            return app_id
+    return None
+
+
+def _payout(swap: bool) -> Builder:  # noqa: FBT001
+    def build(ctx: BenchContext) -> AtomicTransactionComposer:
+        app_id = _payable_farm(ctx)
+        assert app_id is not None
+        rnd = ctx.payable[app_id][0]
+        return _call(ctx, PAYOUT, [app_id, rnd, swap], sp=_payout_sp(ctx, [rnd]))
+
+    return build
+
+
+def _payout_many(k: int, swap: bool) -> Builder:  # noqa: FBT001
+    def build(ctx: BenchContext) -> AtomicTransactionComposer:
+        app_id = _payable_farm(ctx, k)
+        assert app_id is not None
+        rounds = ctx.payable[app_id][:k]
+        return _call(
+            ctx, PAYOUT_MANY, [app_id, rounds, swap], sp=_payout_sp(ctx, rounds)
+        )
+
+    return build
+
+
+def _record_proposals(k: int, settle: bool) -> Builder:  # noqa: FBT001
+    def build(ctx: BenchContext) -> AtomicTransactionComposer:
+        app_id = _payable_farm(ctx, k)
+        assert app_id is not None
+        rounds = ctx.payable[app_id][:k]
+        sp = _payout_sp(ctx, rounds)
+        atc = _call(ctx, RECORD_PROPOSALS, [app_id, rounds], sp=sp)
+        if settle:
+            # settle needs pending blocks, so it is measured after a record
+            _call(ctx, SETTLE, [app_id, False], atc=atc, sp=sp)
+        return atc
+
+    return build
+
+
+def _payout_batch(ctx: BenchContext) -> AtomicTransactionComposer:
+    items = [(app_id, rounds[0]) for app_id, rounds in ctx.payable.items() if rounds]
+    rounds = [rnd for _, rnd in items]
+    return _call(ctx, PAYOUT_BATCH, [items, False], sp=_payout_sp(ctx, rounds))
+
+
+def _algo_cost(
+    opted: bool,  # noqa: FBT001
+) -> tuple[Builder, Callable[[BenchContext], bool]]:
+    def asset(ctx: BenchContext) -> int | None:
+        return ctx.opted_asset if opted else ctx.unopted_asset
+
+    def build(ctx: BenchContext) -> AtomicTransactionComposer:
+        return _call(ctx, GET_ALGO_COST, [ctx.farm_app_ids[0], asset(ctx), 1000])
+
+    return build, lambda ctx: bool(ctx.farm_app_ids) and asset(ctx) is not None
+
+
+def _create_farm(ctx: BenchContext) -> AtomicTransactionComposer:
+    assert ctx.new_farm_app_id is not None and ctx.opted_asset is not None
+    duration, amount = 100, 1
+    cost = simulate_return(
+        ctx, _call(ctx, GET_ALGO_COST, [ctx.new_farm_app_id, ctx.opted_asset, duration])
+    )
+    sp = ctx.sp(ctx.last_round + 1, ctx.last_round + 100)
+    app_address = get_application_address(ctx.app_id)
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(
+        TransactionWithSigner(PaymentTxn(ctx.sender, sp, app_address, cost[0]), SIGNER)
+    )
+    _call(
+        ctx,
+        CREATE_FARM,
+        [ctx.new_farm_app_id, ctx.opted_asset, amount, duration],
+        atc=atc,
+        sp=sp,
+    )
+    atc.add_transaction(
+        TransactionWithSigner(
+            AssetTransferTxn(
+                ctx.sender, sp, app_address, amount * duration, ctx.opted_asset
+            ),
+            SIGNER,
+        )
+    )
+    return atc
+
+
+def all_scenarios() -> Iterator[Scenario]:
+    yield Scenario("get_state", lambda ctx: _call(ctx, GET_STATE, [ctx.farms(1)[0]]))
+    yield Scenario(
+        "project_apr", lambda ctx: _call(ctx, PROJECT_APR, [ctx.farms(1)[0], 9000000])
+    )
+    for n in (8, 63):
+        yield Scenario(
+            f"project_apr_curve[points={n}]",
+            lambda ctx, n=n: _call(
+                ctx,
+                PROJECT_APR_CURVE,
+                [ctx.farms(1)[0], [9000000 * (i + 1) for i in range(n)]],
+            ),
+        )
+    for n in (1, 8, 32, 128):
+        yield Scenario(
+            f"log_states[n={n}]",
+            lambda ctx, n=n: _call(ctx, LOG_STATES, [ctx.farms(n)]),
+        )
+    for n in (1, 8, 32):
+        yield Scenario(
+            f"log_states_and_aprs[n={n}]",
+            lambda ctx, n=n: _call(ctx, LOG_STATES_AND_APRS, [ctx.farms(n)]),
+        )
+        yield Scenario(
+            f"log_states_and_aprs_override[n={n},override=0]",
+            lambda ctx, n=n: _call(
+                ctx, LOG_STATES_AND_APRS_OVERRIDE, [ctx.farms(n), 0]
+            ),
+        )
+    for span in (10, 100, 500):
+        yield Scenario(
+            f"log_block_proposers[span={span}]",
+            lambda ctx, span=span: _call(
+                ctx, LOG_BLOCK_PROPOSERS, [ctx.last_round - span + 1, ctx.last_round]
+            ),
+            available=lambda ctx: True,
+        )
+    for n in (1, 8, 32):
+        yield Scenario(
+            f"log_farm_proposals[n={n},span=500]",
+            lambda ctx, n=n: _call(
+                ctx,
+                LOG_FARM_PROPOSALS,
+                [ctx.farms(n), ctx.last_round - 499, ctx.last_round],
+            ),
+        )
+    yield Scenario(
+        "get_global_snapshot",
+        lambda ctx: _call(ctx, GET_GLOBAL_SNAPSHOT, []),
+        available=lambda ctx: True,
+    )
+    for opted in (True, False):
+        build, available = _algo_cost(opted)
+        yield Scenario(f"get_algo_cost[opted_in={opted}]", build, available)
+    yield Scenario(
+        "create_farm",
+        _create_farm,
+        available=lambda ctx: ctx.new_farm_app_id is not None
+        and ctx.opted_asset is not None,
+    )
+    for swap in (False, True):
+        yield Scenario(
+            f"payout[swap={swap}]",
+            _payout(swap),
+            available=lambda ctx: _payable_farm(ctx) is not None,
+        )
+    for k in (1, 4, 16):
+        yield Scenario(
+            f"payout_many[k={k}]",
+            _payout_many(k, swap=False),
+            available=lambda ctx, k=k: _payable_farm(ctx, k) is not None,
+        )
+    for k in (1, 16):
+        yield Scenario(
+            f"record_proposals[k={k}]",
+            _record_proposals(k, settle=False),
+            available=lambda ctx, k=k: _payable_farm(ctx, k) is not None,
+        )
+        yield Scenario(
+            f"record_proposals+settle[k={k}]",
+            _record_proposals(k, settle=True),
+            available=lambda ctx, k=k: _payable_farm(ctx, k) is not None,
+        )
+    yield Scenario(
+        "payout_batch",
+        _payout_batch,
+        available=lambda ctx: any(ctx.payable.values()),
+    )
+
+
+def simulate_request(extra_opcode_budget: int = 320000) -> SimulateRequest:
+    return SimulateRequest(
+        txn_groups=[],
+        allow_more_logs=True,
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+        extra_opcode_budget=extra_opcode_budget,
+        exec_trace_config=SimulateTraceConfig(enable=True, state_change=True),
+    )
+
+
+def simulate_return(ctx: BenchContext, atc: AtomicTransactionComposer) -> list[int]:
+    result = atc.simulate(ctx.algod, simulate_request())
+    return list(result.abi_results[-1].return_value)
+
+
+def find_payable(ctx: BenchContext) -> None:
+    """Fill ctx.payable with provable, unpaid proposals of the configured farms."""
+    last_paid = {}
+    for app_id in ctx.farm_app_ids:
+        box = ctx.algod.application_box_by_name(ctx.app_id, app_id.to_bytes(8, "big"))
+        farm = decode_farm_box(app_id, base64.b64decode(box["value"]))
+        last_paid[app_id] = farm.last_block_paid
+        ctx.farm_assets[app_id] = farm.farm_asset
+
+    # leave room for the validity window of the payout itself
+    start = max(ctx.last_round - 990, 1)
+    atc = _call(ctx, LOG_FARM_PROPOSALS, [ctx.farm_app_ids, start, ctx.last_round])
+    result = atc.simulate(ctx.algod, simulate_request())
+    logs = result.simulate_response["txn-groups"][0]["txn-results"][0]["txn-result"][
+        "logs"
+    ]
+    for log in logs[:-1]:  # last log is the ABI return
+        rnd, idx = struct.unpack(">QH", base64.b64decode(log))
+        app_id = ctx.farm_app_ids[idx]
+        if rnd > last_paid[app_id]:
+            ctx.payable.setdefault(app_id, []).append(rnd)
@@ -0,0 +1,25 @@
+from .client import (
+    CallLimits,
+    CostQuery,
+    DualstakeFarmClient,
+    SimulateError,
+    chunk_size,
+    rounds_to_expiry,
+)
+from .pool import AlgodError, AlgodPool, Endpoint
+from .spec import AppSpec, ItemCost, StructCodec
+
+__all__ = [
+    "AlgodError",
+    "AlgodPool",
+    "AppSpec",
+    "CallLimits",
+    "CostQuery",
+    "DualstakeFarmClient",
+    "Endpoint",
+    "ItemCost",
+    "SimulateError",
+    "StructCodec",
+    "chunk_size",
+    "rounds_to_expiry",
+]
@@ -0,0 +1,52 @@
+"""
+Print the state and APR of every farm as JSON lines.
+
+ALGOD_SERVERS holds comma separated algod URLs sharing ALGOD_TOKEN.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
+
+from client.client import DualstakeFarmClient
+from client.pool import AlgodPool, Endpoint
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--app-id", type=int, default=int(os.environ.get("DUALSTAKEFARM_APP_ID", 0))
+    )
+    parser.add_argument("--sender", default=os.environ.get("CLIENT_SENDER"))
+    parser.add_argument("--max-chunk-size", type=int, default=None)
+    args = parser.parse_args()
+    if not args.app_id or not args.sender:
+        parser.error("--app-id and --sender are required")
+
+    token = os.environ.get("ALGOD_TOKEN", "")
+    servers = os.environ.get("ALGOD_SERVERS", "http://localhost:4001").split(",")
+    async with AlgodPool([Endpoint(url, token) for url in servers]) as pool:
+        client = DualstakeFarmClient(
+            pool, args.app_id, args.sender, max_chunk_size=args.max_chunk_size
+        )
+        start = time.perf_counter()
+        farms = await client.refresh()
+        elapsed = time.perf_counter() - start
+    for app_id, farm in farms.items():
+        print(json.dumps({"app_id": app_id, **farm._asdict()}))
+    logger.info(f"{len(farms)} farms in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    asyncio.run(main())
@@ -0,0 +1,324 @@
+"""
+Async read client for DualstakeFarm.
+
+Read methods run through algod simulate. App id lists are split into chunks
+that fit one app call's opcode budget, log limits and app args, the chunks are
+simulated concurrently over the pool and the results merged.
+"""
+
+import asyncio
+import base64
+import dataclasses
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+from algosdk import encoding
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from keeper.farms import LEGACY_FARM_BOX_SIZE, decode_farm_box
+
+from .pool import AlgodPool
+from .spec import AppSpec, ItemCost
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+ChunkRunner = Callable[[Sequence[T]], Awaitable[list[R]]]
+
+SIGNER = EmptySigner()
+# budget of one app call before simulate adds extra_opcode_budget
+APP_CALL_BUDGET = 700
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+# app args of a uint64[] call: selector and array length prefix
+UINT64_ARRAY_OVERHEAD = 4 + 2
+# simulate failures that a smaller chunk can avoid
+SPLITTABLE_FAILURES = ("budget exceeded", "too many", "log size")
+
+
+class SimulateError(Exception):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class CallLimits:
+    """Per simulated app call limits, as algod applies them to simulate."""
+
+    # simulate adds at most 320_000 (16 * 20_000) to a group's budget
+    extra_opcode_budget: int = 320_000
+    # log limits with allow-more-logging
+    max_logs: int = 2048
+    max_log_bytes: int = 65_536
+    # total app args of one call
+    max_args_bytes: int = 2048
+    max_group_size: int = 16
+
+
+# conservative estimates for app specs built without a cost model. a chunk
+# that still runs out of budget is split
+LOG_STATES_COST = ItemCost(base=200, per_item=150)
+LOG_STATES_AND_APRS_COST = ItemCost(base=2000, per_item=1200)
+
+
+@dataclasses.dataclass(frozen=True)
+class CostQuery:
+    recipient_app: int
+    farm_asset: int
+    duration_blocks: int
+
+
+def chunk_size(limits: CallLimits, cost: ItemCost, item_log_bytes: int) -> int:
+    """App ids per log_* call that stay within budget, log and app args limits."""
+    by_budget = (APP_CALL_BUDGET + limits.extra_opcode_budget - cost.base) // (
+        cost.per_item
+    )
+    by_logs = min(limits.max_logs, limits.max_log_bytes // item_log_bytes)
+    by_args = (limits.max_args_bytes - UINT64_ARRAY_OVERHEAD) // 8
+    return max(1, min(by_budget, by_logs, by_args))
+
+
+def rounds_to_expiry(state: Any) -> int | None:  # noqa: ANN401
+    """
+    Rounds until a farm's remaining blocks are proposed, from its
+    FarmStateAndAPR. The escrow proposes staked / online_stake of all rounds on
+    average. None while the escrow is not staked.
+    """
+    if not state.staked:
+        return None
+    return state.remaining_duration_blocks * state.online_stake // state.staked
+
+
+def _chunks(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class DualstakeFarmClient:
+    """
+    Read side of the contract, as in the TS DSFarmSDK, without node.js.
+    sender must be a funded account: simulate still charges it the call fees.
+    """
+
+    def __init__(
+        self,
+        pool: AlgodPool,
+        app_id: int,
+        sender: str,
+        *,
+        spec: AppSpec | None = None,
+        limits: CallLimits | None = None,
+        max_chunk_size: int | None = None,
+        params_ttl: float = 30.0,
+    ) -> None:
+        self.pool = pool
+        self.app_id = app_id
+        self.sender = sender
+        self.spec = spec or AppSpec.load()
+        self.limits = limits or CallLimits()
+        # smaller chunks spread a refresh over more concurrent requests
+        self.max_chunk_size = max_chunk_size
+        self.params_ttl = params_ttl
+        self._params: SuggestedParams | None = None
+        self._params_at = 0.0
+        self._params_lock = asyncio.Lock()
+
+    async def suggested_params(self) -> SuggestedParams:
+        async with self._params_lock:
+            if self._params is None or time.monotonic() - self._params_at > (
+                self.params_ttl
+            ):
+                self._params = await self.pool.suggested_params()
+                self._params_at = time.monotonic()
+            return self._params
+
+    async def simulate(
+        self, calls: Sequence[tuple[Method, list[Any]]]
+    ) -> list[dict[str, Any]]:
+        """Simulate one group of app calls. Returns each call's txn-result."""
+        sp = await self.suggested_params()
+        atc = AtomicTransactionComposer()
+        for method, args in calls:
+            atc.add_method_call(
+                app_id=self.app_id,
+                method=method,
+                sender=self.sender,
+                sp=sp,
+                signer=SIGNER,
+                method_args=args,
+            )
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=atc.gather_signatures())],
+            allow_more_logs=True,
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+            extra_opcode_budget=self.limits.extra_opcode_budget,
+        )
+        response = await self.pool.simulate(
+            base64.b64decode(encoding.msgpack_encode(request))
+        )
+        group = response["txn-groups"][0]
+        if group.get("failure-message"):
+            raise SimulateError(group["failure-message"])
+        return [result["txn-result"] for result in group["txn-results"]]
+
+    async def _split_on_failure(
+        self, run: ChunkRunner[T, R], chunk: Sequence[T]
+    ) -> list[R]:
+        try:
+            return await run(chunk)
+        except SimulateError as e:
+            message = str(e)
+            if len(chunk) == 1 or not any(m in message for m in SPLITTABLE_FAILURES):
+                raise
+            logger.info(f"Splitting a chunk of {len(chunk)} after: {message}")
+            half = len(chunk) // 2
+            left, right = await asyncio.gather(
+                self._split_on_failure(run, chunk[:half]),
+                self._split_on_failure(run, chunk[half:]),
+            )
+            return left + right
+
+    async def _map_chunks(
+        self, run: ChunkRunner[T, R], items: Sequence[T], size: int
+    ) -> list[R]:
+        if self.max_chunk_size:
+            size = min(size, self.max_chunk_size)
+        results = await asyncio.gather(
+            *(self._split_on_failure(run, chunk) for chunk in _chunks(items, size))
+        )
+        return [item for chunk in results for item in chunk]
+
+    async def _logs(
+        self,
+        method_name: str,
+        app_ids: Sequence[int],
+        cost: ItemCost,
+        item_log_bytes: int,
+        *extra_args: int,
+    ) -> dict[int, bytes]:
+        """The value a log_* method logs per app id, empty values left out."""
+        method = self.spec.method(method_name)
+        cost = self.spec.costs.get(method_name, cost)
+
+        async def run(chunk: Sequence[int]) -> list[bytes]:
+            (result,) = await self.simulate([(method, [list(chunk), *extra_args])])
+            logs = [base64.b64decode(log) for log in result.get("logs", [])]
+            if len(logs) != len(chunk):
+                raise SimulateError(f"{len(chunk)} app ids but {len(logs)} logs")
+            return logs
+
+        ids = list(dict.fromkeys(app_ids))
+        size = chunk_size(self.limits, cost, item_log_bytes)
+        logs = await self._map_chunks(run, ids, size)
+        # an empty value for app ids without a farm
+        return {app_id: raw for app_id, raw in zip(ids, logs) if raw}
+
+    async def _log_structs(
+        self,
+        method_name: str,
+        app_ids: Sequence[int],
+        cost: ItemCost,
+        *extra_args: int,
+    ) -> dict[int, tuple[Any, ...]]:
+        codec = self.spec.logged_struct(method_name)
+        logs = await self._logs(
+            method_name, app_ids, cost, codec.abi_type.byte_len(), *extra_args
+        )
+        return {app_id: codec.decode(raw) for app_id, raw in logs.items()}
+
+    async def farm_ids(self) -> list[int]:
+        """App ids of every farm box. Farm boxes are keyed by the 8 byte app id."""
+        names = await self.pool.box_names(self.app_id)
+        return sorted(int.from_bytes(name) for name in names if len(name) == 8)
+
+    async def get_states(self, app_ids: Sequence[int]) -> dict[int, tuple[Any, ...]]:
+        """FarmState per app id. App ids without a farm are left out."""
+        # log_states logs the farm boxes as stored, legacy boxes being the longest
+        boxes = await self._logs(
+            "log_states", app_ids, LOG_STATES_COST, LEGACY_FARM_BOX_SIZE
+        )
+        farm_state = self.spec.returns["get_state"].tuple_type
+        states = {}
+        for app_id, raw in boxes.items():
+            farm = decode_farm_box(app_id, raw)
+            states[app_id] = farm_state(
+                farm_asset=farm.farm_asset,
+                amount_per_block=farm.amount_per_block,
+                remaining_duration_blocks=farm.remaining_duration_blocks,
+                last_block_paid=farm.last_block_paid,
+            )
+        return states
+
+    async def get_states_and_aprs(
+        self, app_ids: Sequence[int], override_farm_amount: int | None = None
+    ) -> dict[int, tuple[Any, ...]]:
+        """
+        FarmStateAndAPR per app id, priced with the contract's default override
+        amount or the given one. App ids without a farm get zero farm fields.
+        """
+        if override_farm_amount is None:
+            return await self._log_structs(
+                "log_states_and_aprs", app_ids, LOG_STATES_AND_APRS_COST
+            )
+        return await self._log_structs(
+            "log_states_and_aprs_override",
+            app_ids,
+            LOG_STATES_AND_APRS_COST,
+            override_farm_amount,
+        )
+
+    async def get_state(self, app_id: int) -> tuple[Any, ...] | None:
+        return (await self.get_states([app_id])).get(app_id)
+
+    async def refresh(self) -> dict[int, tuple[Any, ...]]:
+        """State and APR of every farm."""
+        return await self.get_states_and_aprs(await self.farm_ids())
+
+    async def get_active_farms(self) -> list[tuple[int, tuple[Any, ...]]]:
+        """
+        State and APR of every farm, soonest expected expiry first, unstaked
+        farms last. A farm box only exists while the farm has blocks left, so
+        the box names are the live farms and their order is derived here.
+        """
+
+        def by_expiry(item: tuple[int, tuple[Any, ...]]) -> tuple[bool, int, int]:
+            app_id, state = item
+            rounds = rounds_to_expiry(state)
+            return rounds is None, rounds or 0, app_id
+
+        return sorted((await self.refresh()).items(), key=by_expiry)
+
+    def _struct_return(
+        self, method_name: str, result: dict[str, Any]
+    ) -> tuple[Any, ...]:
+        raw = base64.b64decode(result["logs"][-1])
+        if not raw.startswith(ABI_RETURN_PREFIX):
+            raise SimulateError(f"{method_name} returned no ABI value")
+        return self.spec.returns[method_name].decode(raw[len(ABI_RETURN_PREFIX) :])
+
+    async def get_global_snapshot(self) -> tuple[Any, ...]:
+        """GlobalSnapshot: counters, fee parameters, round time and online stake."""
+        (result,) = await self.simulate([(self.spec.method("get_global_snapshot"), [])])
+        return self._struct_return("get_global_snapshot", result)
+
+    async def get_algo_cost_and_max_duration(
+        self, queries: Sequence[CostQuery]
+    ) -> list[tuple[Any, ...]]:
+        """AlgoCostAndMaxDuration per query, in order. Up to 16 calls per simulate."""
+        name = "get_algo_cost_and_max_duration"
+        method = self.spec.method(name)
+
+        async def run(chunk: Sequence[CostQuery]) -> list[tuple[Any, ...]]:
+            results = await self.simulate(
+                [
+                    (method, [q.recipient_app, q.farm_asset, q.duration_blocks])
+                    for q in chunk
+                ]
+            )
+            return [self._struct_return(name, result) for result in results]
+
+        return await self._map_chunks(run, queries, self.limits.max_group_size)
@@ -0,0 +1,141 @@
+"""Pooled async HTTP access to one or more algod endpoints."""
+
+import asyncio
+import base64
+import dataclasses
+import logging
+from typing import Any
+
+import httpx
+from algosdk.transaction import SuggestedParams
+
+logger = logging.getLogger(__name__)
+
+
+class AlgodError(Exception):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class Endpoint:
+    url: str
+    token: str = ""
+    # requests in flight against this node at once
+    max_concurrency: int = 8
+
+
+@dataclasses.dataclass
+class _EndpointState:
+    endpoint: Endpoint
+    semaphore: asyncio.Semaphore
+    in_flight: int = 0
+    failures: int = 0
+
+
+class AlgodPool:
+    """
+    One keep-alive httpx session shared by every endpoint. Each request goes to
+    the endpoint with the fewest requests in flight and fails over to the others
+    on connection errors and 5xx responses.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[Endpoint],
+        *,
+        timeout: float = 30.0,
+        max_connections: int = 64,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("At least one algod endpoint is required")
+        self._endpoints = [
+            _EndpointState(e, asyncio.Semaphore(e.max_concurrency)) for e in endpoints
+        ]
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    async def __aenter__(self) -> "AlgodPool":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    def _ordered(self) -> list[_EndpointState]:
+        return sorted(self._endpoints, key=lambda s: (s.failures, s.in_flight))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """JSON body of an algod /v2 request. 4xx responses raise AlgodError."""
+        last_error: Exception | None = None
+        for state in self._ordered():
+            endpoint = state.endpoint
+            async with state.semaphore:
+                state.in_flight += 1
+                try:
+                    resp = await self._http.request(
+                        method,
+                        f"{endpoint.url.rstrip('/')}/v2{path}",
+                        content=content,
+                        params=params,
+                        headers={"X-Algo-API-Token": endpoint.token, **(headers or {})},
+                    )
+                except httpx.TransportError as e:
+                    last_error = e
+                    state.failures += 1
+                    logger.warning(f"{endpoint.url}: {e!r}, trying the next endpoint")
+                    continue
+                finally:
+                    state.in_flight -= 1
+            if resp.status_code >= 500:
+                last_error = AlgodError(
+                    f"{endpoint.url}: {resp.status_code} {resp.text}"
+                )
+                state.failures += 1
+                logger.warning(f"{last_error}, trying the next endpoint")
+                continue
+            state.failures = 0
+            if resp.status_code >= 400:
+                raise AlgodError(f"{resp.status_code}: {resp.text}")
+            return resp.json()
+        raise AlgodError(f"Every algod endpoint failed: {last_error!r}")
+
+    async def suggested_params(self) -> SuggestedParams:
+        params = await self.request("GET", "/transactions/params")
+        return SuggestedParams(
+            fee=params["min-fee"],
+            first=params["last-round"] + 1,
+            # reads are cached for a while, keep them valid for the max window
+            last=params["last-round"] + 1000,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=True,
+            min_fee=params["min-fee"],
+        )
+
+    async def box_names(self, app_id: int) -> list[bytes]:
+        resp = await self.request("GET", f"/applications/{app_id}/boxes")
+        return [base64.b64decode(box["name"]) for box in resp["boxes"]]
+
+    async def simulate(self, request: bytes) -> dict[str, Any]:
+        """POST a msgpack encoded SimulateRequest, returns the JSON response."""
+        return await self.request(
+            "POST",
+            "/transactions/simulate",
+            content=request,
+            headers={"Content-Type": "application/msgpack"},
+        )
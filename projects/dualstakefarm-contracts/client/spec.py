@@ -0,0 +1,109 @@
+"""ABI methods and return structs read from the ARC-32 app spec."""
+
+import collections
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+from algosdk.abi import ABIType, Method
+
+DEFAULT_APP_SPEC = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "dualstakefarm"
+    / "DualstakeFarm.arc32.json"
+)
+
+# void methods that log one struct per app id, and the method returning that struct.
+# log_states logs the raw farm box instead
+LOGGED_STRUCTS = {
+    "log_states_and_aprs": "get_state_and_apr",
+    "log_states_and_aprs_override": "get_state_and_apr",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class StructCodec:
+    """Decodes an ABI tuple into a named tuple using the app spec struct hint."""
+
+    name: str
+    abi_type: ABIType
+    tuple_type: type[tuple[Any, ...]]
+
+    @classmethod
+    def from_hint(cls, hint: dict[str, Any]) -> "StructCodec":
+        names = [name for name, _ in hint["elements"]]
+        types = ",".join(type_ for _, type_ in hint["elements"])
+        return cls(
+            name=hint["name"],
+            abi_type=ABIType.from_string(f"({types})"),
+            tuple_type=collections.namedtuple(hint["name"], names),
+        )
+
+    def decode(self, raw: bytes) -> tuple[Any, ...]:
+        return self.tuple_type(*self.abi_type.decode(raw))
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemCost:
+    """Opcode cost of a call that handles a list of app ids."""
+
+    base: int
+    per_item: int
+
+    @classmethod
+    def from_cost_model(cls, method: dict[str, Any]) -> "ItemCost":
+        # the log_* methods run one loop over their app ids
+        return cls(
+            base=method["cost"],
+            per_item=sum(loop["cost_per_iteration"] for loop in method["loops"]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class AppSpec:
+    methods: dict[str, Method]
+    # method name -> codec of its struct return value
+    returns: dict[str, StructCodec]
+    # method name -> static cost from the build's cost model, when there is one
+    costs: dict[str, ItemCost] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_APP_SPEC) -> "AppSpec":
+        """Load an app spec and the <Contract>.cost.json the build writes next to it."""
+        cost_model = path.with_name(
+            path.name.removesuffix(".arc32.json") + ".cost.json"
+        )
+        return cls.from_json(
+            json.loads(path.read_text()),
+            json.loads(cost_model.read_text()) if cost_model.exists() else None,
+        )
+
+    @classmethod
+    def from_json(
+        cls, spec: dict[str, Any], cost_model: dict[str, Any] | None = None
+    ) -> "AppSpec":
+        methods = {m["name"]: Method.undictify(m) for m in spec["contract"]["methods"]}
+        returns = {}
+        for signature, hint in spec.get("hints", {}).items():
+            output = hint.get("structs", {}).get("output")
+            if output is not None:
+                returns[signature.split("(", 1)[0]] = StructCodec.from_hint(output)
+        costs = {
+            name: ItemCost.from_cost_model(method)
+            for name, method in (cost_model or {}).get("methods", {}).items()
+        }
+        return cls(methods=methods, returns=returns, costs=costs)
+
+    def method(self, name: str) -> Method:
+        try:
+            return self.methods[name]
+        except KeyError:
+            raise KeyError(
+                f"{name} is not in the app spec, rebuild the contract artifacts"
+            ) from None
+
+    def logged_struct(self, method_name: str) -> StructCodec:
+        return self.returns[LOGGED_STRUCTS[method_name]]
@@ -0,0 +1,39 @@
+from .backtest import (
+    Backtest,
+    BlockHistory,
+    Escrow,
+    HistoryRow,
+    backtest,
+    summarize,
+    write_history,
+)
+from .model import (
+    AlgoCost,
+    APRProjection,
+    calc_tm_denom,
+    calculate_algo_cost,
+    get_max_duration,
+    get_tinyman_algo_price,
+    get_tm2_net_amt,
+    project_apr,
+    yearly_blocks,
+)
+
+__all__ = [
+    "APRProjection",
+    "AlgoCost",
+    "Backtest",
+    "BlockHistory",
+    "Escrow",
+    "HistoryRow",
+    "backtest",
+    "calc_tm_denom",
+    "calculate_algo_cost",
+    "get_max_duration",
+    "get_tinyman_algo_price",
+    "get_tm2_net_amt",
+    "project_apr",
+    "summarize",
+    "write_history",
+    "yearly_blocks",
+]
@@ -0,0 +1,415 @@
+"""
+Backtest of the APR and max duration projections against realized proposals.
+
+A block history is a directory of memory mapped .npy arrays, one row per round:
+proposer ids (into addresses.txt), timestamps, block bonus and online stake.
+Projections are replayed with the exact model formulas at evenly spaced rounds
+and compared with the blocks the escrow went on to propose.
+
+    python -m economics.backtest synth --out history --rounds 2000000
+    python -m economics.backtest run --history history --escrows history/escrows.csv
+"""
+
+import argparse
+import csv
+import dataclasses
+import json
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from . import model
+
+SECONDS_PER_DAY = 86400
+DAYS_PER_YEAR = 365
+# blocks the oracle and the round time sample look back over
+PROOF_WINDOW = 1000
+
+PROPOSER_FILE = "proposer.npy"
+TIMESTAMP_FILE = "timestamp.npy"
+BONUS_FILE = "bonus.npy"
+ONLINE_STAKE_FILE = "online_stake.npy"
+ADDRESSES_FILE = "addresses.txt"
+META_FILE = "meta.json"
+
+
+class HistoryRow(NamedTuple):
+    proposer: str
+    timestamp: int
+    bonus: int
+    online_stake: int
+
+
+@dataclasses.dataclass
+class BlockHistory:
+    first_round: int
+    proposer: npt.NDArray[np.uint32]
+    timestamp: npt.NDArray[np.uint64]
+    bonus: npt.NDArray[np.uint64]
+    online_stake: npt.NDArray[np.uint64]
+    addresses: list[str]
+    # avg_round_time per (source, oracle interval, start, end, step)
+    round_times: dict[tuple[str, int, int, int, int], model.IntArray] = (
+        dataclasses.field(default_factory=dict)
+    )
+    _order: npt.NDArray[np.intp] | None = None
+    _bounds: npt.NDArray[np.intp] | None = None
+
+    def __len__(self) -> int:
+        return len(self.proposer)
+
+    @classmethod
+    def load(cls, path: Path) -> "BlockHistory":
+        """Memory map a history directory. Nothing is read until it is used."""
+        meta = json.loads((path / META_FILE).read_text())
+        return cls(
+            first_round=meta["first_round"],
+            proposer=np.load(path / PROPOSER_FILE, mmap_mode="r"),
+            timestamp=np.load(path / TIMESTAMP_FILE, mmap_mode="r"),
+            bonus=np.load(path / BONUS_FILE, mmap_mode="r"),
+            online_stake=np.load(path / ONLINE_STAKE_FILE, mmap_mode="r"),
+            addresses=(path / ADDRESSES_FILE).read_text().split(),
+        )
+
+    def proposals(self, address: str) -> npt.NDArray[np.intp]:
+        """Sorted row indices of the blocks address proposed."""
+        if self._order is None:
+            # one stable sort groups every proposer's rows, still in round order
+            self._order = np.argsort(self.proposer, kind="stable")
+            self._bounds = np.searchsorted(
+                self.proposer[self._order], np.arange(len(self.addresses) + 1)
+            )
+        try:
+            pid = self.addresses.index(address)
+        except ValueError:
+            return np.empty(0, dtype=np.intp)
+        assert self._bounds is not None
+        return self._order[self._bounds[pid] : self._bounds[pid + 1]]
+
+
+def write_history(
+    path: Path, first_round: int, count: int, rows: Iterable[HistoryRow]
+) -> None:
+    """Write count rows starting at first_round, streaming them to disk."""
+    path.mkdir(parents=True, exist_ok=True)
+    arrays = {
+        name: np.lib.format.open_memmap(path / name, "w+", dtype, (count,))
+        for name, dtype in (
+            (PROPOSER_FILE, np.uint32),
+            (TIMESTAMP_FILE, np.uint64),
+            (BONUS_FILE, np.uint64),
+            (ONLINE_STAKE_FILE, np.uint64),
+        )
+    }
+    ids: dict[str, int] = {}
+    written = 0
+    for i, row in zip(range(count), rows, strict=False):
+        arrays[PROPOSER_FILE][i] = ids.setdefault(row.proposer, len(ids))
+        arrays[TIMESTAMP_FILE][i] = row.timestamp
+        arrays[BONUS_FILE][i] = row.bonus
+        arrays[ONLINE_STAKE_FILE][i] = row.online_stake
+        written += 1
+    if written != count:
+        raise ValueError(f"Expected {count} rows, got {written}")
+    for array in arrays.values():
+        array.flush()
+    (path / ADDRESSES_FILE).write_text("".join(f"{a}\n" for a in ids))
+    (path / META_FILE).write_text(json.dumps({"first_round": first_round}))
+
+
+@dataclasses.dataclass(frozen=True)
+class Escrow:
+    """A dualstake escrow and the farm priced on it, as project_apr reads them."""
+
+    address: str
+    balance: int
+    staked: int
+    farm_amount: int = 0
+    asset_1_id: int = 1
+    asset_1_reserves: int = 1
+    asset_2_reserves: int = 1
+
+
+class Backtest(NamedTuple):
+    rounds: npt.NDArray[np.int64]
+    avg_round_time: model.IntArray
+    projection: model.APRProjection
+    max_duration: model.IntArray
+    # realized over horizon_days after each round, annualized. nan past the end
+    realized_yearly_blocks: npt.NDArray[np.float64]
+    realized_base_apr_bps: npt.NDArray[np.float64]
+    realized_farm_apr_bps: npt.NDArray[np.float64]
+    # blocks proposed in the max_duration_days after each round. -1 past the end
+    realized_max_duration: npt.NDArray[np.int64]
+
+
+def sample_round_time(
+    history: BlockHistory, rows: npt.NDArray[np.intp], sample: int = PROOF_WINDOW
+) -> model.IntArray:
+    """get_avg_round_time before the oracle is seeded: the last sample rounds."""
+    if rows.min() < sample:
+        raise ValueError(f"Round time samples need {sample} rounds of history")
+    ts = np.asarray(history.timestamp)
+    dt = model.ints(ts[rows] - ts[rows - sample])
+    return 10000 * dt // sample
+
+
+def oracle_round_time(
+    history: BlockHistory,
+    rows: npt.NDArray[np.intp],
+    interval: int,
+    window: int = PROOF_WINDOW,
+) -> model.IntArray:
+    """
+    avg_round_time of an oracle updated every interval rounds, replaying
+    update_oracle step by step. Rounds before the first update fall back to
+    the round time sample, as the contract does.
+    """
+    ts = np.asarray(history.timestamp)
+    updates = np.arange(rows.min() - rows.min() % interval, rows.max() + 1, interval)
+    values = []
+    avg = 0
+    oracle_row = 0
+    for row in updates.tolist():
+        first = max(row - PROOF_WINDOW, oracle_row)
+        if row > first:
+            dr = row - first
+            sample = 10000 * int(ts[row] - ts[first]) // dr
+            weight = min(dr, window)
+            # math.ema: the sample counts weight / window
+            avg = (
+                sample
+                if avg == 0
+                else (avg * (window - weight) + sample * weight) // window
+            )
+        oracle_row = row
+        values.append(avg)
+    result = np.asarray(values, dtype=np.object_)[
+        np.searchsorted(updates, rows, side="right") - 1
+    ]
+    unseeded = result == 0
+    if np.any(unseeded):
+        result[unseeded] = sample_round_time(history, rows[unseeded])
+    return result
+
+
+def _window_ends(
+    history: BlockHistory, rows: npt.NDArray[np.intp], days: int
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.bool_]]:
+    """
+    First row more than days after each row, and whether the history reaches
+    that far.
+    """
+    ts = np.asarray(history.timestamp)
+    horizon = ts[rows] + np.uint64(days * SECONDS_PER_DAY)
+    return np.searchsorted(ts, horizon, side="right"), horizon <= ts[-1]
+
+
+def backtest(
+    history: BlockHistory,
+    escrow: Escrow,
+    *,
+    start: int | None = None,
+    end: int | None = None,
+    step: int = 1000,
+    horizon_days: int = 30,
+    round_time: str = "sample",
+    oracle_interval: int = 100,
+    max_duration_days: int = model.DEFAULT_MAX_DURATION_DAYS,
+) -> Backtest:
+    """
+    Project at every step rounds in [start, end) and compare with what followed.
+    start and end are rounds. round_time is "sample" or "oracle".
+    """
+    first = history.first_round
+    start_row = max((start or first) - first, PROOF_WINDOW)
+    end_row = min((end or first + len(history)) - first, len(history))
+    rows = np.arange(start_row, end_row, step)
+    if not len(rows):
+        raise ValueError("No rounds to project in the window")
+
+    # the same for every escrow: computed once per history and window
+    key = (round_time, oracle_interval, start_row, end_row, step)
+    avg_round_time = history.round_times.get(key)
+    if avg_round_time is None:
+        if round_time == "sample":
+            avg_round_time = sample_round_time(history, rows)
+        elif round_time == "oracle":
+            avg_round_time = oracle_round_time(history, rows, oracle_interval)
+        else:
+            raise ValueError(f"Unknown round time source {round_time}")
+        history.round_times[key] = avg_round_time
+
+    online_stake = model.ints(np.asarray(history.online_stake)[rows])
+    projection = model.project_apr(
+        balance=escrow.balance,
+        staked=escrow.staked,
+        online_stake=online_stake,
+        block_bonus=model.ints(np.asarray(history.bonus)[rows]),
+        avg_round_time=avg_round_time,
+        farm_amount=escrow.farm_amount,
+        asset_1_id=escrow.asset_1_id,
+        asset_1_reserves=escrow.asset_1_reserves,
+        asset_2_reserves=escrow.asset_2_reserves,
+    )
+    max_duration = model.get_max_duration(
+        escrow.balance,
+        online_stake,
+        avg_round_time,
+        max_duration_days=max_duration_days,
+    )
+
+    proposed = history.proposals(escrow.address)
+    # proposals after each row: indices into proposed, from the next row on
+    after = np.searchsorted(proposed, rows, side="right")
+    ends, covered = _window_ends(history, rows, horizon_days)
+    blocks = np.searchsorted(proposed, ends) - after
+    bonus_sums = np.concatenate(
+        ([0.0], np.cumsum(np.asarray(history.bonus)[proposed], dtype=np.float64))
+    )
+    bonus = bonus_sums[np.searchsorted(proposed, ends)] - bonus_sums[after]
+    duration_ends, duration_covered = _window_ends(history, rows, max_duration_days)
+    duration_blocks = np.searchsorted(proposed, duration_ends) - after
+
+    annualize = DAYS_PER_YEAR / horizon_days
+    staked = float(escrow.staked) or np.nan
+    realized_yearly = np.where(covered, blocks * annualize, np.nan)
+    farm_algo = projection.farm_amount_algo.astype(np.float64)
+    return Backtest(
+        rounds=rows + first,
+        avg_round_time=avg_round_time,
+        projection=projection,
+        max_duration=max_duration,
+        realized_yearly_blocks=realized_yearly,
+        realized_base_apr_bps=np.where(
+            covered, 10000 * bonus * annualize / staked, np.nan
+        ),
+        realized_farm_apr_bps=10000 * farm_algo * realized_yearly / staked,
+        realized_max_duration=np.where(duration_covered, duration_blocks, -1),
+    )
+
+
+def _errors(
+    projected: model.IntArray, realized: npt.NDArray[np.float64]
+) -> dict[str, float]:
+    projected = projected.astype(np.float64)
+    valid = np.isfinite(realized) & (realized >= 0)
+    if not np.any(valid):
+        return {"points": 0}
+    diff = projected[valid] - realized[valid]
+    return {
+        "points": int(valid.sum()),
+        "mean_projected": float(projected[valid].mean()),
+        "mean_realized": float(realized[valid].mean()),
+        "bias_pct": float(100 * diff.sum() / max(realized[valid].sum(), 1)),
+        "mae_pct": float(100 * np.abs(diff).sum() / max(realized[valid].sum(), 1)),
+    }
+
+
+def summarize(result: Backtest) -> dict[str, dict[str, float]]:
+    """
+    Projected against realized totals. bias_pct is the aggregate over (-) or
+    under (+) projection, mae_pct the aggregate absolute error.
+    """
+    realized_duration = result.realized_max_duration.astype(np.float64)
+    realized_duration[result.realized_max_duration < 0] = np.nan
+    return {
+        "yearly_blocks": _errors(
+            result.projection.expected_yearly_blocks, result.realized_yearly_blocks
+        ),
+        "base_apr_bps": _errors(
+            result.projection.base_apr_bps, result.realized_base_apr_bps
+        ),
+        "max_duration": _errors(result.max_duration, realized_duration),
+    }
+
+
+def _read_escrows(path: Path) -> list[Escrow]:
+    with path.open() as f:
+        return [
+            Escrow(row["address"], int(row["balance"]), int(row["staked"]))
+            for row in csv.DictReader(f)
+        ]
+
+
+def _synth(args: argparse.Namespace) -> None:
+    from algosdk.logic import get_application_address
+
+    from simulation.chain import ChainConfig, Staker, SyntheticChain
+
+    config = ChainConfig(seed=args.seed)
+    stake = int(config.online_stake * args.escrow_share)
+    escrows = [
+        Staker(get_application_address(10_000 + i), stake)
+        for i in range(args.escrows)
+    ]
+    chain = SyntheticChain(dataclasses.replace(config, stakers=tuple(escrows)))
+    rows = (
+        HistoryRow(b.proposer, b.timestamp, b.bonus, config.online_stake)
+        for b in chain.blocks(1, args.rounds + 1)
+    )
+    write_history(args.out, 1, args.rounds, rows)
+    with (args.out / "escrows.csv").open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["address", "balance", "staked"])
+        writer.writerows([e.address, e.stake, e.stake] for e in escrows)
+
+
+def _run(args: argparse.Namespace) -> None:
+    history = BlockHistory.load(args.history)
+    started = time.perf_counter()
+    for escrow in _read_escrows(args.escrows):
+        result = backtest(
+            history,
+            escrow,
+            start=args.start,
+            end=args.end,
+            step=args.step,
+            horizon_days=args.horizon_days,
+            round_time=args.round_time,
+            oracle_interval=args.oracle_interval,
+        )
+        print(json.dumps({"address": escrow.address, **summarize(result)}))
+    elapsed = time.perf_counter() - started
+    print(f"{len(history)} rounds, evaluated in {elapsed:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    synth = commands.add_parser("synth", help="write a synthetic block history")
+    synth.add_argument("--out", type=Path, required=True)
+    synth.add_argument("--rounds", type=int, default=1_000_000)
+    synth.add_argument("--seed", type=int, default=0)
+    synth.add_argument("--escrows", type=int, default=100)
+    synth.add_argument("--escrow-share", type=float, default=0.001)
+
+    run = commands.add_parser("run", help="backtest escrows over a history")
+    run.add_argument("--history", type=Path, required=True)
+    run.add_argument(
+        "--escrows",
+        type=Path,
+        required=True,
+        help="CSV with address, balance and staked columns",
+    )
+    run.add_argument("--start", type=int, default=None)
+    run.add_argument("--end", type=int, default=None)
+    run.add_argument("--step", type=int, default=1000)
+    run.add_argument("--horizon-days", type=int, default=30)
+    run.add_argument("--round-time", choices=("sample", "oracle"), default="sample")
+    run.add_argument("--oracle-interval", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.command == "synth":
+        _synth(args)
+    else:
+        _run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Reference model of the DualstakeFarm economics.
+
+Mirrors the contract formulas with its integer semantics: every division
+floors, products divided through common/math.py mul_div are 128 bit and never
+overflow, and anything the contract keeps in a uint64 raises OverflowError
+when it would not fit (the contract would fail).
+
+Every function accepts scalars or array-likes and broadcasts them, so a whole
+grid of parameters is evaluated in one call. Values are held in object arrays
+of Python ints to stay exact past 2**64.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+MAX_UINT64 = 2**64 - 1
+
+# constants from smart_contracts/dualstakefarm/contract.py
+TM2_FEE_BPS = 30
+MIN_TXN_FEE = 1000
+ASSET_OPT_IN_MIN_BALANCE = 100_000
+FARM_BOX_MBR = 2500 + 400 * (8 + 26)
+IX_REWARDS_PER_BLOCK = 100
+PLATFORM_FEE_PER_BLOCK = 97
+TXN_FEE_PER_BLOCK = 3
+DEFAULT_MAX_DURATION_DAYS = 45
+DEFAULT_MIN_DURATION_BLOCKS = 30
+
+Ints = npt.ArrayLike
+IntArray = npt.NDArray[np.object_]
+
+
+class AlgoCost(NamedTuple):
+    total_cost: IntArray
+    optin_cost: IntArray
+    box_cost: IntArray
+    platform_cost: IntArray
+    ix_cost: IntArray
+    txn_fee_cost: IntArray
+
+
+class APRProjection(NamedTuple):
+    expected_yearly_blocks: IntArray
+    base_apr_bps: IntArray
+    farm_amount_algo: IntArray
+    farm_apr_bps: IntArray
+
+
+def ints(x: Ints) -> IntArray:
+    """Exact integer array. Python ints are kept as is, numpy ints are widened."""
+    if isinstance(x, np.ndarray) and x.dtype != np.object_:
+        if x.dtype.kind not in "iub":
+            raise TypeError(f"Expected integers, got {x.dtype}")
+        return x.astype(np.object_)
+    # not np.asarray(x): a list mixing magnitudes like [-1, 2**63] becomes float64
+    arr = np.asarray(x, dtype=np.object_)
+    values = []
+    for value in arr.flat:
+        if not isinstance(value, int | np.integer | np.bool_):
+            raise TypeError(f"Expected integers, got {type(value).__name__}")
+        values.append(int(value))
+    out = np.empty(arr.shape, dtype=np.object_)
+    out.flat[:] = values
+    return out
+
+
+def u64(x: Ints, what: str) -> IntArray:
+    """Check a value the contract holds in a uint64."""
+    arr = np.asarray(x, dtype=np.object_)
+    if np.any(arr < 0) or np.any(arr > MAX_UINT64):
+        raise OverflowError(f"{what} does not fit in uint64")
+    return arr
+
+
+def _floordiv_or_zero(num: IntArray, den: IntArray) -> IntArray:
+    # `num // den if den > 0 else 0` without dividing by zero in the other branch.
+    # 0-d object arithmetic gives bare Python ints, which np.where would narrow to
+    # int64, so both branches are object arrays
+    den = ints(den)
+    safe = np.where(den > 0, den, 1)
+    return np.where(den > 0, ints(num // safe), 0)
+
+
+def get_tm2_net_amt(amt: Ints) -> IntArray:
+    amt = ints(amt)
+    # the fee is mul_div(30, amt, 10000): 30 * amt may exceed uint64
+    return u64(amt - TM2_FEE_BPS * amt // 10000, "net amount")
+
+
+def calc_tm_denom(a1: Ints, a2: Ints, v: Ints, amount: Ints) -> IntArray:
+    a1, a2, v = ints(a1), ints(a2), ints(v)
+    return u64(a1 * a2 // u64(v + get_tm2_net_amt(amount), "denominator"), "denom")
+
+
+def get_tinyman_algo_price(
+    asset_1_id: Ints, asset_1_reserves: Ints, asset_2_reserves: Ints, amount: Ints
+) -> IntArray:
+    """ALGO received for selling amount of the farm asset into a Tinyman v2 pool."""
+    aid1, a1, a2, amount = np.broadcast_arrays(
+        ints(asset_1_id), ints(asset_1_reserves), ints(asset_2_reserves), ints(amount)
+    )
+    # asset_1 is the farm asset unless it is ALGO
+    algo_reserves = np.where(aid1 != 0, a2, a1)
+    asset_reserves = np.where(aid1 != 0, a1, a2)
+    nonzero = amount > 0
+    # price zero amounts against an amount of 1 so the unused branch can not fail
+    priced = np.where(nonzero, amount, 1)
+    price = algo_reserves - calc_tm_denom(a1, a2, asset_reserves, priced) - 1
+    return u64(np.where(nonzero, ints(price), 0), "price")
+
+
+def calculate_algo_cost(
+    duration_blocks: Ints,
+    *,
+    farm_exists: npt.ArrayLike = False,
+    opted_in: npt.ArrayLike = False,
+    min_txn_fee: Ints = MIN_TXN_FEE,
+    asset_opt_in_min_balance: Ints = ASSET_OPT_IN_MIN_BALANCE,
+    ix_pb: Ints = IX_REWARDS_PER_BLOCK,
+    plat_fee_pb: Ints = PLATFORM_FEE_PER_BLOCK,
+    txn_fee_pb: Ints = TXN_FEE_PER_BLOCK,
+) -> AlgoCost:
+    duration = ints(duration_blocks)
+    fee = ints(min_txn_fee)
+    optin_cost = np.where(np.asarray(opted_in), 0, ints(asset_opt_in_min_balance))
+    box_cost = np.where(np.asarray(farm_exists), 0, FARM_BOX_MBR)
+    ix_cost = u64(u64(ints(ix_pb) * fee, "ix per block") * duration, "ix cost")
+    txn_fee_cost = u64(
+        u64(ints(txn_fee_pb) * fee, "txn fee per block") * duration, "txn fee cost"
+    )
+    platform_cost = u64(
+        u64(ints(plat_fee_pb) * fee, "platform per block") * duration,
+        "platform cost",
+    )
+    total_cost = u64(ix_cost + txn_fee_cost + platform_cost, "total cost")
+    return AlgoCost(
+        *np.broadcast_arrays(
+            total_cost, optin_cost, box_cost, platform_cost, ix_cost, txn_fee_cost
+        )
+    )
+
+
+def yearly_blocks(avg_round_time: Ints) -> IntArray:
+    """Chain wide blocks per year. avg_round_time is in 1/10000 seconds."""
+    return u64(86400 * 365 * 10000 // ints(avg_round_time), "yearly blocks")
+
+
+def get_max_duration(
+    balance: Ints,
+    online_stake: Ints,
+    avg_round_time: Ints,
+    *,
+    max_duration_days: Ints = DEFAULT_MAX_DURATION_DAYS,
+    min_duration_blocks: Ints = DEFAULT_MIN_DURATION_BLOCKS,
+) -> IntArray:
+    """Blocks the escrow is expected to propose over max_duration_days."""
+    blocks_produced = u64(
+        u64(86400 * ints(max_duration_days) * 10000, "seconds") // ints(avg_round_time),
+        "blocks produced",
+    )
+    max_duration = u64(
+        ints(balance) * blocks_produced // ints(online_stake), "max duration"
+    )
+    return ints(np.maximum(ints(min_duration_blocks), max_duration))
+
+
+def project_apr(
+    *,
+    balance: Ints,
+    staked: Ints,
+    online_stake: Ints,
+    block_bonus: Ints,
+    avg_round_time: Ints,
+    farm_amount: Ints = 0,
+    asset_1_id: Ints = 1,
+    asset_1_reserves: Ints = 1,
+    asset_2_reserves: Ints = 1,
+) -> APRProjection:
+    """
+    _project_apr_in_context for one farm amount. Pool reserves are only read
+    when farm_amount is non zero, as in the contract.
+    """
+    staked = ints(staked)
+    own_yearly_blocks = u64(
+        yearly_blocks(avg_round_time) * ints(balance) // ints(online_stake),
+        "expected yearly blocks",
+    )
+    base_apr_bps = u64(
+        _floordiv_or_zero(10000 * ints(block_bonus) * own_yearly_blocks, staked),
+        "base apr",
+    )
+    farm_amount_algo = get_tinyman_algo_price(
+        asset_1_id, asset_1_reserves, asset_2_reserves, farm_amount
+    )
+    farm_apr_bps = u64(
+        _floordiv_or_zero(10000 * farm_amount_algo * own_yearly_blocks, staked),
+        "farm apr",
+    )
+    return APRProjection(
+        *np.broadcast_arrays(
+            own_yearly_blocks, base_apr_bps, farm_amount_algo, farm_apr_bps
+        )
+    )
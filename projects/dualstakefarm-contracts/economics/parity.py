@@ -0,0 +1,156 @@
+"""
+Parity check of the reference model against the contract code.
+
+Runs the contract subroutines in the algorand-python-testing emulator on random
+inputs and compares them with the model, including where both fail. The
+common/math.py wide integer kernel is checked against Python ints the same way.
+
+    poetry run python -m economics.parity --samples 2000 --seed 1
+"""
+
+import argparse
+import random
+import sys
+from collections.abc import Callable
+from functools import partial
+
+from . import model
+
+
+def _outcome(fn: Callable[[], object]) -> int | str:
+    """The int fn returns, UInt64 or a 0-d model array, or how it failed."""
+    try:
+        return int(fn())  # type: ignore[call-overload]
+    except (OverflowError, ZeroDivisionError, ArithmeticError, ValueError):
+        return "fail"
+    except Exception as e:  # emulator raises its own error types on avm failures
+        return f"fail:{type(e).__name__}"
+
+
+def _same(a: int | str, b: int | str) -> bool:
+    return a == b or (isinstance(a, str) and isinstance(b, str))
+
+
+def _sample_u64(rng: random.Random) -> int:
+    # spread samples over magnitudes so overflow edges are hit too
+    return rng.randrange(1, 2 ** rng.choice((8, 16, 32, 48, 56, 63, 64)))
+
+
+def _checked_remainder(product: int, divisor: int) -> int:
+    # mul_divmod fails when the quotient does not fit, even if the remainder would
+    model.u64(product // divisor, "quotient")
+    return product % divisor
+
+
+def _mul_div(x: int, y: int, z: int) -> int:
+    return int(model.u64(x * y // z, "mul_div"))
+
+
+def _mul_div_ceil(x: int, y: int, z: int) -> int:
+    return int(model.u64(-(-x * y // z), "mul_div_ceil"))
+
+
+def _scaled_mul_div(scale: int, x: int, y: int, z: int) -> int:
+    return int(model.u64(scale * x * y // z, "scaled_mul_div"))
+
+
+def check_parity(samples: int, seed: int) -> list[str]:
+    from algopy import UInt64
+    from algopy_testing import algopy_testing_context
+
+    from smart_contracts.common import math
+    from smart_contracts.dualstakefarm.contract import (
+        DualstakeFarm,
+        TinymanPool,
+        get_tm2_net_amt,
+    )
+
+    def mul_divmod_remainder(x: UInt64, y: UInt64, z: UInt64) -> UInt64:
+        return math.mul_divmod(x, y, z)[1]
+
+    rng = random.Random(seed)
+    mismatches = []
+    with algopy_testing_context():
+        contract = DualstakeFarm()
+        for _ in range(samples):
+            amount = _sample_u64(rng)
+            aid1 = rng.choice((0, rng.randrange(1, 2**40)))
+            a1 = _sample_u64(rng)
+            a2 = _sample_u64(rng)
+            x, y = _sample_u64(rng), _sample_u64(rng)
+            # division by zero is sampled too
+            z = 0 if rng.random() < 0.05 else _sample_u64(rng)
+            pool = TinymanPool(UInt64(aid1), UInt64(a1), UInt64(a2))
+
+            # partial binds this sample's values, the calls run in _outcome
+            checks: list[tuple[str, Callable[[], object], Callable[[], object]]] = [
+                (
+                    f"get_tm2_net_amt({amount})",
+                    partial(get_tm2_net_amt, UInt64(amount)),
+                    partial(model.get_tm2_net_amt, amount),
+                ),
+                (
+                    f"calc_tm_denom({a1}, {a2}, {a1}, {amount})",
+                    partial(
+                        contract.calc_tm_denom,
+                        UInt64(a1),
+                        UInt64(a2),
+                        UInt64(a1),
+                        UInt64(amount),
+                    ),
+                    partial(model.calc_tm_denom, a1, a2, a1, amount),
+                ),
+                (
+                    f"get_tinyman_algo_price({aid1}, {a1}, {a2}, {amount})",
+                    partial(contract.get_tinyman_algo_price, pool, UInt64(amount)),
+                    partial(model.get_tinyman_algo_price, aid1, a1, a2, amount),
+                ),
+                (
+                    f"mul_div({x}, {y}, {z})",
+                    partial(math.mul_div, UInt64(x), UInt64(y), UInt64(z)),
+                    partial(_mul_div, x, y, z),
+                ),
+                (
+                    f"mul_div_ceil({x}, {y}, {z})",
+                    partial(math.mul_div_ceil, UInt64(x), UInt64(y), UInt64(z)),
+                    partial(_mul_div_ceil, x, y, z),
+                ),
+                (
+                    f"mul_divmod({x}, {y}, {z}) remainder",
+                    partial(mul_divmod_remainder, UInt64(x), UInt64(y), UInt64(z)),
+                    partial(_checked_remainder, x * y, z),
+                ),
+                (
+                    f"scaled_mul_div(10000, {x}, {y}, {z})",
+                    partial(
+                        math.scaled_mul_div,
+                        UInt64(10000),
+                        UInt64(x),
+                        UInt64(y),
+                        UInt64(z),
+                    ),
+                    partial(_scaled_mul_div, 10000, x, y, z),
+                ),
+            ]
+            for name, on_contract, on_model in checks:
+                expected, actual = _outcome(on_contract), _outcome(on_model)
+                if not _same(expected, actual):
+                    mismatches.append(f"{name}: contract={expected} model={actual}")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mismatches = check_parity(args.samples, args.seed)
+    for line in mismatches[:50]:
+        print(line)
+    print(f"{args.samples} samples, {len(mismatches)} mismatches")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
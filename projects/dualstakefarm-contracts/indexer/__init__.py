@@ -0,0 +1,42 @@
+from .archive import (
+    ArchiveStore,
+    FarmHistory,
+    PayoutCounters,
+    RoundGapError,
+    ingest,
+    payout_counters,
+    payout_history,
+)
+from .calls import FarmCall, block_calls
+from .dumps import iter_blocks
+from .events import (
+    EVENTS,
+    Event,
+    EventSpec,
+    amounts_paid,
+    decode_log,
+    decode_logs,
+    stream_events,
+    transaction_events,
+)
+
+__all__ = [
+    "EVENTS",
+    "ArchiveStore",
+    "Event",
+    "EventSpec",
+    "FarmCall",
+    "FarmHistory",
+    "PayoutCounters",
+    "RoundGapError",
+    "amounts_paid",
+    "block_calls",
+    "decode_log",
+    "decode_logs",
+    "ingest",
+    "iter_blocks",
+    "payout_counters",
+    "payout_history",
+    "stream_events",
+    "transaction_events",
+]
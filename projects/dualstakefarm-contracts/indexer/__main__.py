@@ -0,0 +1,108 @@
+"""
+Offline farm payout history from block dumps.
+
+    python -m indexer ingest --store DIR --app-id N [--farm ID ...]
+                             [--farms-from-algod] DUMP...
+    python -m indexer history --store DIR [--min-round R] [--max-round R] [--json]
+
+ingest appends the farm calls and farm proposals of msgpack or JSONL block dumps
+to the store and resumes after the last committed round. Farms are learnt from
+the calls seen, so an archive started after the app's creation round misses the
+proposals of farms created before it until their first call. Pass --farm for
+them, or --farms-from-algod to add every farm with a box now, read from the
+algod nodes in ALGOD_SERVERS (comma separated, sharing ALGOD_TOKEN). Farms that
+expired before then still need --farm.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from client.pool import AlgodPool, Endpoint
+
+from .archive import ArchiveStore, RoundGapError, ingest, payout_history
+from .dumps import iter_blocks
+
+logger = logging.getLogger(__name__)
+
+
+async def _box_farms(app_id: int) -> list[int]:
+    token = os.environ.get("ALGOD_TOKEN", "")
+    servers = os.environ.get("ALGOD_SERVERS", "http://localhost:4001").split(",")
+    async with AlgodPool([Endpoint(url, token) for url in servers]) as pool:
+        names = await pool.box_names(app_id)
+    # farm boxes are keyed by the 8 byte app id
+    return [int.from_bytes(name) for name in names if len(name) == 8]
+
+
+def _ingest(args: argparse.Namespace) -> None:
+    store = ArchiveStore(args.store)
+    store.farms.update(args.farm)
+    if args.farms_from_algod:
+        store.farms.update(asyncio.run(_box_farms(args.app_id)))
+    try:
+        stats = ingest(store, iter_blocks(args.dumps), args.app_id, args.commit_every)
+    except RoundGapError as e:
+        logger.error(f"{e}. Archive at round {store.last_round}")
+        sys.exit(1)
+    finally:
+        store.close()
+    logger.info(f"{stats}, archive at round {store.last_round}")
+
+
+def _history(args: argparse.Namespace) -> None:
+    store = ArchiveStore(args.store)
+    history = payout_history(store, args.min_round, args.max_round)
+    rows = {
+        app_id: {
+            "proposed": len(farm.proposed),
+            "paid": len(farm.paid),
+            "unpaid": farm.unpaid,
+            "amount_paid": farm.amount_paid,
+        }
+        for app_id, farm in sorted(history.items())
+    }
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'app id':>12} {'proposed':>9} {'paid':>9} {'unpaid':>9} {'amount':>16}")
+    for app_id, row in rows.items():
+        print(
+            f"{app_id:>12} {row['proposed']:>9} {row['paid']:>9} "
+            f"{len(row['unpaid']):>9} {row['amount_paid']:>16}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = sub.add_parser("ingest")
+    ingest_parser.add_argument("--store", type=Path, required=True)
+    ingest_parser.add_argument("--app-id", type=int, required=True)
+    ingest_parser.add_argument("--farm", type=int, action="append", default=[])
+    ingest_parser.add_argument("--farms-from-algod", action="store_true")
+    ingest_parser.add_argument("--commit-every", type=int, default=1000)
+    ingest_parser.add_argument("dumps", type=Path, nargs="+")
+    ingest_parser.set_defaults(func=_ingest)
+
+    history_parser = sub.add_parser("history")
+    history_parser.add_argument("--store", type=Path, required=True)
+    history_parser.add_argument("--min-round", type=int, default=0)
+    history_parser.add_argument("--max-round", type=int)
+    history_parser.add_argument("--json", action="store_true")
+    history_parser.set_defaults(func=_history)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    main()
@@ -0,0 +1,301 @@
+"""
+Append-only, round ordered archive of DualstakeFarm activity.
+
+records/<segment>.jsonl hold one JSON record per line, segment = round //
+SEGMENT_ROUNDS. Records are "call" (see calls.FarmCall) and "proposal" (a block
+proposed by the escrow of a known farm). checkpoint.json commits progress: the
+last ingested round, the committed length of the open segment and the known
+farms. Anything past the committed length is left over from an interrupted run
+and is dropped on open, so ingestion resumes exactly after the checkpoint.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from algosdk.logic import get_application_address
+
+from .calls import block_calls
+from .dumps import Block, as_address
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_ROUNDS = 100_000
+
+Record = dict[str, Any]
+
+
+class RoundGapError(Exception):
+    """A block dump is missing rounds. Ingestion stops before the gap"""
+
+
+class ArchiveStore:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.records_path = path / "records"
+        self.checkpoint_path = path / "checkpoint.json"
+        self.records_path.mkdir(parents=True, exist_ok=True)
+
+        self.last_round = 0
+        self.farms: set[int] = set()
+        self._segment = 0
+        self._file: IO[str] | None = None
+        self._recover()
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.records_path / f"{segment:08d}.jsonl"
+
+    def _recover(self) -> None:
+        offset = 0
+        if self.checkpoint_path.exists():
+            checkpoint = json.loads(self.checkpoint_path.read_text())
+            self.last_round = checkpoint["round"]
+            self.farms = set(checkpoint["farms"])
+            self._segment = checkpoint["segment"]
+            offset = checkpoint["offset"]
+
+        # drop whatever an interrupted run appended after the checkpoint
+        for path in self.records_path.glob("*.jsonl"):
+            if int(path.stem) > self._segment:
+                path.unlink()
+        current = self._segment_path(self._segment)
+        if current.exists() and current.stat().st_size > offset:
+            logger.info(f"Truncating {current} to the last checkpoint")
+            with current.open("r+b") as f:
+                f.truncate(offset)
+
+    def append(self, confirmed_round: int, records: list[Record]) -> None:
+        if not records:
+            return
+        segment = confirmed_round // SEGMENT_ROUNDS
+        if self._file is None or segment != self._segment:
+            self.close()
+            self._segment = segment
+            self._file = self._segment_path(segment).open("a")
+        for record in records:
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def commit(self, confirmed_round: int) -> None:
+        """Make everything appended up to confirmed_round durable."""
+        offset = 0
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            offset = self._file.tell()
+        else:
+            current = self._segment_path(self._segment)
+            offset = current.stat().st_size if current.exists() else 0
+        self.last_round = confirmed_round
+        checkpoint = {
+            "round": confirmed_round,
+            "segment": self._segment,
+            "offset": offset,
+            "farms": sorted(self.farms),
+        }
+        tmp = self.checkpoint_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(checkpoint))
+        os.replace(tmp, self.checkpoint_path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def records(
+        self, min_round: int = 0, max_round: int | None = None
+    ) -> Iterator[Record]:
+        """Committed records with min_round <= round <= max_round, in round order."""
+        last = self.last_round if max_round is None else min(max_round, self.last_round)
+        for segment in range(min_round // SEGMENT_ROUNDS, last // SEGMENT_ROUNDS + 1):
+            path = self._segment_path(segment)
+            if not path.exists():
+                continue
+            with path.open() as f:
+                for line in f:
+                    record = json.loads(line)
+                    if record["round"] > last:
+                        return
+                    if record["round"] >= min_round:
+                        yield record
+
+
+def _call_farms(record: Record) -> set[int]:
+    args = record["args"]
+    if record["method"] == "payout_batch":
+        return {app_id for app_id, _ in args["items"]}
+    if "recipient_app" in args:
+        return {args["recipient_app"]}
+    return set()
+
+
+@dataclasses.dataclass
+class IngestStats:
+    blocks: int = 0
+    skipped: int = 0
+    calls: int = 0
+    proposals: int = 0
+
+
+def ingest(
+    store: ArchiveStore,
+    blocks: Iterable[Block],
+    app_id: int,
+    commit_every: int = 1000,
+) -> IngestStats:
+    """
+    Append the farm calls and farm proposals of blocks after the store's last
+    round. Blocks must come in round order, older ones are skipped. A missing
+    round raises RoundGapError once everything before it is committed, since a
+    skipped block could hold farm calls or proposals. An empty store starts at
+    the first block.
+    """
+    stats = IngestStats()
+    escrows = {get_application_address(farm): farm for farm in store.farms}
+    last_round = store.last_round
+    for block in blocks:
+        confirmed_round = block.get("rnd", 0)
+        if confirmed_round <= last_round:
+            stats.skipped += 1
+            continue
+        if last_round and confirmed_round != last_round + 1:
+            if last_round > store.last_round:
+                store.commit(last_round)
+            raise RoundGapError(
+                f"round {confirmed_round} follows {last_round}, "
+                f"rounds {last_round + 1} to {confirmed_round - 1} are missing"
+            )
+
+        records = []
+        for call in block_calls(block, app_id):
+            record = call.to_record()
+            for farm in _call_farms(record) - store.farms:
+                store.farms.add(farm)
+                escrows[get_application_address(farm)] = farm
+            records.append(record)
+            stats.calls += 1
+
+        proposer = as_address(block.get("prp"))
+        if proposer in escrows:
+            records.append(
+                {
+                    "round": confirmed_round,
+                    "type": "proposal",
+                    "app_id": escrows[proposer],
+                    "proposer": proposer,
+                }
+            )
+            stats.proposals += 1
+
+        store.append(confirmed_round, records)
+        last_round = confirmed_round
+        stats.blocks += 1
+        if stats.blocks % commit_every == 0:
+            store.commit(last_round)
+
+    if last_round > store.last_round:
+        store.commit(last_round)
+    return stats
+
+
+@dataclasses.dataclass
+class FarmHistory:
+    proposed: set[int] = dataclasses.field(default_factory=set)
+    paid: set[int] = dataclasses.field(default_factory=set)
+    amount_paid: int = 0
+
+    @property
+    def unpaid(self) -> list[int]:
+        return sorted(self.proposed - self.paid)
+
+
+def paid_rounds(record: Record) -> list[tuple[int, int]]:
+    """
+    (farm app id, round) pairs a call actually paid. A farm counts as paid
+    when its escrow received an asset transfer from the call, which also holds
+    for calls made before the contract emitted events. Recorded blocks count as
+    paid: they can no longer age out and settle pays them later.
+    """
+    args = record["args"]
+    match record["method"]:
+        case "record_proposals":
+            return [(args["recipient_app"], rnd) for rnd in args["block_rounds"]]
+        case "payout":
+            claims = [(args["recipient_app"], args["block_round"])]
+        case "payout_many":
+            claims = [(args["recipient_app"], rnd) for rnd in args["block_rounds"]]
+        case "payout_batch":
+            skipped = {tuple(item) for item in record["skipped"]}
+            claims = [
+                (app, rnd) for app, rnd in args["items"] if (app, rnd) not in skipped
+            ]
+        case _:
+            return []
+    receivers = {axfer["receiver"] for axfer in record["axfers"]}
+    return [
+        (app, rnd) for app, rnd in claims if get_application_address(app) in receivers
+    ]
+
+
+@dataclasses.dataclass
+class PayoutCounters:
+    """Payout activity the contract does not count in global state."""
+
+    last_payout_round: int = 0
+    swap_calls: int = 0
+
+
+def payout_counters(
+    store: ArchiveStore, min_round: int = 0, max_round: int | None = None
+) -> PayoutCounters:
+    """
+    Round of the last call that paid a farm, and the swaps payouts made over a
+    round range. A call with call_swap swaps once for every farm it pays.
+    """
+    counters = PayoutCounters()
+    for record in store.records(min_round, max_round):
+        if record["type"] != "call" or "call_swap" not in record["args"]:
+            continue
+        receivers = {axfer["receiver"] for axfer in record["axfers"]}
+        paid = [
+            app
+            for app in _call_farms(record)
+            if get_application_address(app) in receivers
+        ]
+        if not paid:
+            continue
+        counters.last_payout_round = record["round"]
+        if record["args"]["call_swap"]:
+            counters.swap_calls += len(paid)
+    return counters
+
+
+def payout_history(
+    store: ArchiveStore, min_round: int = 0, max_round: int | None = None
+) -> dict[int, FarmHistory]:
+    """Proposed vs paid blocks per farm over a round range."""
+    history: dict[int, FarmHistory] = {}
+    for record in store.records(min_round, max_round):
+        if record["type"] == "proposal":
+            history.setdefault(record["app_id"], FarmHistory()).proposed.add(
+                record["round"]
+            )
+            continue
+        for app, rnd in paid_rounds(record):
+            history.setdefault(app, FarmHistory()).paid.add(rnd)
+        payouts = [event for event in record["events"] if event["name"] == "FarmPayout"]
+        for event in payouts:
+            app = event["recipient_app"]
+            history.setdefault(app, FarmHistory()).amount_paid += event["amount"]
+        if payouts:
+            continue
+        # calls made before the contract emitted events: count the transfers
+        escrows = {get_application_address(app): app for app in _call_farms(record)}
+        for axfer in record["axfers"]:
+            if axfer["receiver"] in escrows:
+                app = escrows[axfer["receiver"]]
+                history.setdefault(app, FarmHistory()).amount_paid += axfer["amount"]
+    return history
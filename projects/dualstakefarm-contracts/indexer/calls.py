@@ -0,0 +1,173 @@
+"""DualstakeFarm app calls in blocks: ABI args, inner asset transfers and events."""
+
+import dataclasses
+import struct
+from collections.abc import Iterator
+from typing import Any
+
+from algosdk.abi import ABIReferenceType, Method
+
+from .dumps import Block, as_address, as_bytes
+from .events import decode_logs
+
+
+def _method(signature: str, *arg_names: str) -> Method:
+    # selectors only carry types. records are keyed by the contract's arg names
+    method = Method.from_signature(signature)
+    for arg, name in zip(method.args, arg_names, strict=True):
+        arg.name = name
+    return method
+
+
+# mirrors the ABI of smart_contracts/dualstakefarm/contract.py, return types
+# included as they are part of the selector. other methods are ignored
+METHODS = [
+    _method(
+        "create_farm(application,asset,uint64,uint64)void",
+        "recipient_app",
+        "farm_asset",
+        "amount_per_block",
+        "duration_blocks",
+    ),
+    _method(
+        "extend_duration_blocks(application,uint64)void",
+        "recipient_app",
+        "duration_blocks",
+    ),
+    _method(
+        "extend_amount_per_block(application,uint64)void",
+        "recipient_app",
+        "amount_per_block",
+    ),
+    _method(
+        "payout(application,uint64,bool)void",
+        "recipient_app",
+        "block_round",
+        "call_swap",
+    ),
+    _method(
+        "payout_many(application,uint64[],bool)void",
+        "recipient_app",
+        "block_rounds",
+        "call_swap",
+    ),
+    _method("payout_batch((uint64,uint64)[],bool)uint64", "items", "call_swap"),
+    _method(
+        "record_proposals(application,uint64[])void", "recipient_app", "block_rounds"
+    ),
+    _method("settle(application,bool)void", "recipient_app", "call_swap"),
+    _method("withdraw_fees(uint64)void", "amount"),
+    _method("claim_ix_rewards()uint64"),
+]
+BY_SELECTOR = {method.get_selector(): method for method in METHODS}
+
+# payout_batch logs b"SKIP" + PayoutItem for items it did not pay
+SKIP_PREFIX = b"SKIP"
+
+
+@dataclasses.dataclass
+class FarmCall:
+    confirmed_round: int
+    # position of the top level transaction in its block
+    intra: int
+    method: str
+    sender: str
+    args: dict[str, Any]
+    axfers: list[dict[str, Any]]
+    events: list[dict[str, Any]]
+    skipped: list[tuple[int, int]]
+
+    def to_record(self) -> dict[str, Any]:
+        record = dataclasses.asdict(self)
+        return {"round": record.pop("confirmed_round"), "type": "call", **record}
+
+
+def _jsonable(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, list | tuple):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, bytes):
+        return value.hex()
+    return value
+
+
+def _jsonable_fields(fields: dict[str, Any]) -> dict[str, Any]:
+    return {name: _jsonable(value) for name, value in fields.items()}
+
+
+def _resolve_reference(kind: str, index: int, txn: dict[str, Any]) -> int | str:
+    if kind == ABIReferenceType.APPLICATION:
+        return txn.get("apid", 0) if index == 0 else txn["apfa"][index - 1]
+    if kind == ABIReferenceType.ASSET:
+        return txn["apas"][index]
+    return as_address(txn.get("snd") if index == 0 else txn["apat"][index - 1])
+
+
+def decode_call(
+    stxn: dict[str, Any], confirmed_round: int, intra: int
+) -> FarmCall | None:
+    """Decode one app call to the farm app. None for bare or unknown methods."""
+    txn = stxn.get("txn", {})
+    apply_data = stxn.get("dt", {})
+    app_args = [as_bytes(arg) for arg in txn.get("apaa", [])]
+    method = BY_SELECTOR.get(app_args[0]) if app_args else None
+    if method is None:
+        return None
+
+    args = {}
+    for arg, raw in zip(method.args, app_args[1:]):
+        if isinstance(arg.type, str):
+            args[arg.name] = _resolve_reference(arg.type, raw[0], txn)
+        else:
+            args[arg.name] = _jsonable(arg.type.decode(raw))
+
+    axfers = []
+    for inner in apply_data.get("itx", []):
+        inner_txn = inner.get("txn", {})
+        if inner_txn.get("type") == "axfer":
+            axfers.append(
+                {
+                    "asset": inner_txn.get("xaid", 0),
+                    "amount": inner_txn.get("aamt", 0),
+                    "receiver": as_address(inner_txn.get("arcv")),
+                }
+            )
+
+    logs = [as_bytes(log) for log in apply_data.get("lg", [])]
+    events = [
+        {"name": name, **_jsonable_fields(fields)} for name, fields in decode_logs(logs)
+    ]
+    skipped = [
+        struct.unpack(">QQ", log[len(SKIP_PREFIX) :])
+        for log in logs
+        if log.startswith(SKIP_PREFIX) and len(log) == len(SKIP_PREFIX) + 16
+    ]
+    return FarmCall(
+        confirmed_round=confirmed_round,
+        intra=intra,
+        method=method.name,
+        sender=as_address(txn.get("snd")),
+        args=args,
+        axfers=axfers,
+        events=events,
+        skipped=skipped,
+    )
+
+
+def _calls(
+    stxn: dict[str, Any], app_id: int, confirmed_round: int, intra: int
+) -> Iterator[FarmCall]:
+    txn = stxn.get("txn", {})
+    if txn.get("type") == "appl" and txn.get("apid", 0) == app_id:
+        call = decode_call(stxn, confirmed_round, intra)
+        if call is not None:
+            yield call
+    # the farm app may also be called by other apps
+    for inner in stxn.get("dt", {}).get("itx", []):
+        yield from _calls(inner, app_id, confirmed_round, intra)
+
+
+def block_calls(block: Block, app_id: int) -> Iterator[FarmCall]:
+    """Calls to app_id in a block, in execution order."""
+    confirmed_round = block.get("rnd", 0)
+    for intra, stxn in enumerate(block.get("txns", [])):
+        yield from _calls(stxn, app_id, confirmed_round, intra)
@@ -0,0 +1,93 @@
+"""
+Block dumps on disk.
+
+Two formats are read, optionally gzipped:
+- msgpack files as served by algod /v2/blocks/{round}?format=msgpack. A file
+  holds one block or several concatenated ones.
+- JSONL files with one JSON block per line. Byte fields are base64 encoded.
+Both are normalised only where the indexer reads them, see as_bytes/as_address.
+Files are named by the first round they hold, e.g. 00012345.msgpack or
+blocks-12345.jsonl.gz.
+"""
+
+import base64
+import gzip
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+import msgpack
+from algosdk.encoding import encode_address
+
+Block = dict[str, Any]
+
+MSGPACK_SUFFIXES = (".msgpack", ".mp")
+JSONL_SUFFIXES = (".jsonl", ".json")
+
+
+def _suffix(path: Path) -> str:
+    return Path(path.stem).suffix if path.suffix == ".gz" else path.suffix
+
+
+def _first_round(path: Path) -> int:
+    """The round in a dump file name. 0 when it has none, those sort first"""
+    match = re.search(r"\d+", path.name)
+    return int(match.group()) if match else 0
+
+
+def dump_files(paths: Iterable[Path]) -> list[Path]:
+    """
+    Dump files under paths, directories expanded, in round order. Names are
+    compared by their round number, not as text, so 9.jsonl comes before
+    10.jsonl even without zero padding.
+    """
+    files = []
+    for path in paths:
+        candidates = sorted(path.rglob("*")) if path.is_dir() else [path]
+        files.extend(
+            file
+            for file in candidates
+            if _suffix(file) in MSGPACK_SUFFIXES + JSONL_SUFFIXES
+        )
+    return sorted(files, key=lambda file: (_first_round(file), file.name))
+
+
+def _open(path: Path) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.suffix == ".gz" else path.open("rb")
+
+
+def _unwrap(obj: dict[str, Any]) -> Block:
+    # algod wraps the block next to its certificate
+    return obj["block"] if "block" in obj else obj
+
+
+def read_blocks(path: Path) -> Iterator[Block]:
+    with _open(path) as f:
+        if _suffix(path) in MSGPACK_SUFFIXES:
+            for obj in msgpack.Unpacker(f, raw=False, strict_map_key=False):
+                yield _unwrap(obj)
+        else:
+            for line in f:
+                if line.strip():
+                    yield _unwrap(json.loads(line))
+
+
+def iter_blocks(paths: Iterable[Path]) -> Iterator[Block]:
+    for file in dump_files(paths):
+        yield from read_blocks(file)
+
+
+def as_bytes(value: bytes | str | None) -> bytes:
+    if value is None:
+        return b""
+    return value if isinstance(value, bytes) else base64.b64decode(value)
+
+
+def as_address(value: bytes | str | None) -> str:
+    """Address from raw public key bytes, base64 or an already encoded address."""
+    if isinstance(value, str) and len(value) == 58:
+        return value
+    raw = as_bytes(value)
+    return encode_address(raw) if raw else ""
@@ -0,0 +1,165 @@
+"""
+Decoder for the ARC-28 events emitted by the DualstakeFarm contract.
+
+An event log is a 4 byte selector, the start of sha512_256("Name(types)"),
+followed by the ABI encoded event struct. Other logs (ABI return values,
+SKIP items, error messages) are ignored.
+"""
+
+import base64
+import dataclasses
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from algosdk.abi import ABIType
+from algosdk.encoding import checksum
+from algosdk.v2client.indexer import IndexerClient
+
+
+@dataclasses.dataclass(frozen=True)
+class EventSpec:
+    name: str
+    fields: tuple[tuple[str, str], ...]
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}({','.join(abi_type for _, abi_type in self.fields)})"
+
+    @property
+    def selector(self) -> bytes:
+        return checksum(self.signature.encode())[:4]
+
+    @property
+    def abi_type(self) -> ABIType:
+        return ABIType.from_string(self.signature[len(self.name) :])
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        values = self.abi_type.decode(data)
+        return {name: value for (name, _), value in zip(self.fields, values)}
+
+
+# mirrors the event structs in smart_contracts/dualstakefarm/contract.py
+EVENTS = (
+    EventSpec(
+        "FarmCreated",
+        (
+            ("recipient_app", "uint64"),
+            ("farm_asset", "uint64"),
+            ("amount_per_block", "uint64"),
+            ("duration_blocks", "uint64"),
+            ("creator", "address"),
+        ),
+    ),
+    EventSpec(
+        "FarmExtended",
+        (
+            ("recipient_app", "uint64"),
+            ("added_amount_per_block", "uint64"),
+            ("added_duration_blocks", "uint64"),
+            ("amount_per_block", "uint64"),
+            ("remaining_duration_blocks", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "FarmPayout",
+        (
+            ("recipient_app", "uint64"),
+            ("block_round", "uint64"),
+            ("num_blocks", "uint64"),
+            ("amount", "uint64"),
+            ("keeper", "address"),
+        ),
+    ),
+    EventSpec(
+        "FarmProposalsRecorded",
+        (
+            ("recipient_app", "uint64"),
+            ("block_round", "uint64"),
+            ("num_blocks", "uint64"),
+            ("pending_blocks", "uint64"),
+            ("keeper", "address"),
+        ),
+    ),
+    EventSpec("FarmExpired", (("recipient_app", "uint64"), ("farm_asset", "uint64"))),
+    EventSpec("IXRewardsClaimed", (("amount", "uint64"), ("keeper", "address"))),
+    EventSpec("FeesWithdrawn", (("amount", "uint64"), ("receiver", "address"))),
+)
+SELECTORS = {spec.selector: spec for spec in EVENTS}
+
+
+@dataclasses.dataclass(frozen=True)
+class Event:
+    name: str
+    fields: dict[str, Any]
+    confirmed_round: int = 0
+    # id of the top level transaction, shared by events of its inner calls
+    txid: str = ""
+
+
+def decode_log(log: bytes) -> tuple[str, dict[str, Any]] | None:
+    """(event name, fields) for an event log, None for any other log."""
+    spec = SELECTORS.get(log[:4])
+    # every event is a static struct, so the length tells events from lookalikes
+    if spec is None or len(log) != 4 + spec.abi_type.byte_len():
+        return None
+    return spec.name, spec.decode(log[4:])
+
+
+def decode_logs(logs: Iterable[bytes]) -> Iterator[tuple[str, dict[str, Any]]]:
+    for log in logs:
+        decoded = decode_log(log)
+        if decoded is not None:
+            yield decoded
+
+
+def transaction_events(txn: dict[str, Any], app_id: int) -> Iterator[Event]:
+    """
+    Events of app_id in an indexer transaction, including its inner transactions,
+    in execution order.
+    """
+    rnd = txn.get("confirmed-round", 0)
+    yield from _transaction_events(txn, app_id, rnd, txn["id"])
+
+
+def _transaction_events(
+    txn: dict[str, Any], app_id: int, rnd: int, txid: str
+) -> Iterator[Event]:
+    app_call = txn.get("application-transaction", {})
+    if txn.get("tx-type") == "appl" and app_call.get("application-id") == app_id:
+        logs = (base64.b64decode(log) for log in txn.get("logs", []))
+        for name, fields in decode_logs(logs):
+            yield Event(name, fields, rnd, txid)
+    for inner in txn.get("inner-txns", []):
+        yield from _transaction_events(inner, app_id, rnd, txid)
+
+
+def amounts_paid(events: Iterable[Event]) -> dict[int, int]:
+    """Farm asset paid per farm app id, summed from FarmPayout events."""
+    paid: dict[int, int] = {}
+    for event in events:
+        if event.name == "FarmPayout":
+            app_id = event.fields["recipient_app"]
+            paid[app_id] = paid.get(app_id, 0) + event.fields["amount"]
+    return paid
+
+
+def stream_events(
+    indexer: IndexerClient, app_id: int, min_round: int = 0, page_size: int = 1000
+) -> Iterator[Event]:
+    """
+    Follow the events of app_id from min_round on, oldest first.
+    Resume from the round after the last event handled to continue incrementally.
+    """
+    next_page = None
+    while True:
+        resp = indexer.search_transactions(
+            application_id=app_id,
+            min_round=min_round,
+            limit=page_size,
+            next_page=next_page,
+        )
+        for txn in resp.get("transactions", []):
+            yield from transaction_events(txn, app_id)
+        next_page = resp.get("next-token")
+        if not next_page or not resp.get("transactions"):
+            return
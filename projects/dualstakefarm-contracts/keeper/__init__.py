@@ -0,0 +1,19 @@
+from .algod import Algod, AlgodClientAdapter, BlockHeader
+from .config import KeeperConfig
+from .farms import Farm, FarmBook, decode_farm_box, encode_farm_box
+from .local import LocalAlgod
+from .pipeline import Keeper, KeeperStats
+
+__all__ = [
+    "Algod",
+    "AlgodClientAdapter",
+    "BlockHeader",
+    "Farm",
+    "FarmBook",
+    "Keeper",
+    "KeeperConfig",
+    "KeeperStats",
+    "LocalAlgod",
+    "decode_farm_box",
+    "encode_farm_box",
+]
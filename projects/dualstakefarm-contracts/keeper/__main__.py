@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import os
+
+from algosdk import mnemonic
+from algosdk.account import address_from_private_key
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.v2client.algod import AlgodClient
+from dotenv import load_dotenv
+
+from keeper.algod import AlgodClientAdapter
+from keeper.config import KeeperConfig
+from keeper.pipeline import Keeper
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    load_dotenv()
+    server = os.environ.get("ALGOD_SERVER", "http://localhost")
+    port = os.environ.get("ALGOD_PORT")
+    algod = AlgodClient(
+        os.environ.get("ALGOD_TOKEN", ""), f"{server}:{port}" if port else server
+    )
+    private_key = mnemonic.to_private_key(os.environ["KEEPER_MNEMONIC"])
+    sender = address_from_private_key(private_key)
+
+    config = KeeperConfig.from_env()
+    keeper = Keeper(
+        AlgodClientAdapter(algod), config, sender, AccountTransactionSigner(private_key)
+    )
+    logger.info(f"Keeper {sender} following app {config.app_id}")
+    try:
+        await keeper.run()
+    finally:
+        logger.info(f"Keeper stopped: {keeper.stats}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+"""Async view of the algod endpoints the keeper uses."""
+
+import asyncio
+import base64
+from typing import NamedTuple, Protocol
+
+import msgpack
+from algosdk.encoding import encode_address
+from algosdk.transaction import (
+    GenericSignedTransaction,
+    SuggestedParams,
+    wait_for_confirmation,
+)
+from algosdk.v2client.algod import AlgodClient
+
+
+class BlockHeader(NamedTuple):
+    round_: int
+    proposer: str
+    timestamp: int
+
+
+class Algod(Protocol):
+    async def current_round(self) -> int: ...
+
+    async def wait_for_round_after(self, rnd: int) -> int:
+        """Block until a round after rnd is committed. Returns the latest round."""
+        ...
+
+    async def block_header(self, rnd: int) -> BlockHeader: ...
+
+    async def box_names(self, app_id: int) -> list[bytes]: ...
+
+    async def box(self, app_id: int, name: bytes) -> bytes | None: ...
+
+    async def global_state(self, app_id: int) -> dict[bytes, int | bytes]: ...
+
+    async def suggested_params(self) -> SuggestedParams: ...
+
+    async def send_group(self, signed: list[GenericSignedTransaction]) -> str: ...
+
+    async def wait_for_confirmation(self, txid: str, wait_rounds: int) -> int:
+        """Block until txid is confirmed. Returns its round, raises after wait_rounds."""
+        ...
+
+
+class AlgodClientAdapter:
+    """Runs the blocking algosdk client in worker threads."""
+
+    def __init__(self, client: AlgodClient) -> None:
+        self.client = client
+
+    async def current_round(self) -> int:
+        status = await asyncio.to_thread(self.client.status)
+        return int(status["last-round"])
+
+    async def wait_for_round_after(self, rnd: int) -> int:
+        status = await asyncio.to_thread(self.client.status_after_block, rnd)
+        return int(status["last-round"])
+
+    async def block_header(self, rnd: int) -> BlockHeader:
+        raw = await asyncio.to_thread(
+            self.client.algod_request,
+            "GET",
+            f"/blocks/{rnd}",
+            params={"header-only": "true", "format": "msgpack"},
+            response_format="msgpack",
+        )
+        block = msgpack.unpackb(raw, raw=False, strict_map_key=False)["block"]
+        return BlockHeader(
+            round_=int(block["rnd"]),
+            proposer=encode_address(block["prp"]) if block.get("prp") else "",
+            timestamp=int(block.get("ts", 0)),
+        )
+
+    async def box_names(self, app_id: int) -> list[bytes]:
+        resp = await asyncio.to_thread(self.client.application_boxes, app_id)
+        return [base64.b64decode(box["name"]) for box in resp["boxes"]]
+
+    async def box(self, app_id: int, name: bytes) -> bytes | None:
+        try:
+            resp = await asyncio.to_thread(
+                self.client.application_box_by_name, app_id, name
+            )
+        except Exception as e:  # algosdk raises AlgodHTTPError(404)
+            if getattr(e, "code", None) == 404:
+                return None
+            raise
+        return base64.b64decode(resp["value"])
+
+    async def global_state(self, app_id: int) -> dict[bytes, int | bytes]:
+        info = await asyncio.to_thread(self.client.application_info, app_id)
+        state: dict[bytes, int | bytes] = {}
+        for kv in info["params"].get("global-state", []):
+            value = kv["value"]
+            state[base64.b64decode(kv["key"])] = (
+                base64.b64decode(value["bytes"])
+                if value["type"] == 1
+                else value["uint"]
+            )
+        return state
+
+    async def suggested_params(self) -> SuggestedParams:
+        return await asyncio.to_thread(self.client.suggested_params)
+
+    async def send_group(self, signed: list[GenericSignedTransaction]) -> str:
+        return await asyncio.to_thread(self.client.send_transactions, signed)
+
+    async def wait_for_confirmation(self, txid: str, wait_rounds: int) -> int:
+        result = await asyncio.to_thread(
+            wait_for_confirmation, self.client, txid, wait_rounds
+        )
+        return int(result["confirmed-round"])
@@ -0,0 +1,48 @@
+import dataclasses
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:  # noqa: FBT001
+    value = os.environ.get(name)
+    return default if value is None else value.lower() in ("1", "true", "yes")
+
+
+@dataclasses.dataclass
+class KeeperConfig:
+    app_id: int
+    call_swap: bool = True
+    workers: int = 4
+    header_queue_size: int = 256
+    job_queue_size: int = 4096
+    # rounds per payout_many call. bounded by the opcode budget of update_oracle
+    # + payout_many, with update_oracle folding a full window of blocks
+    max_rounds_per_call: int = 12
+    max_attempts: int = 5
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    inflight_delay: float = 0.5
+    refresh_interval: float = 60.0
+    txn_validity: int = 8
+    # rounds before their proof deadline at which blocks are recorded with
+    # record_proposals instead of paid. settle pays them on the next refresh
+    record_margin: int = 100
+    # claim accrued IX rewards once they reach this many microALGO. 0: never
+    claim_threshold: int = 10_000_000
+
+    @classmethod
+    def from_env(cls) -> "KeeperConfig":
+        return cls(
+            app_id=int(os.environ["DUALSTAKEFARM_APP_ID"]),
+            call_swap=_env_bool("KEEPER_CALL_SWAP", default=True),
+            workers=int(os.environ.get("KEEPER_WORKERS", cls.workers)),
+            max_rounds_per_call=int(
+                os.environ.get("KEEPER_MAX_ROUNDS_PER_CALL", cls.max_rounds_per_call)
+            ),
+            txn_validity=int(os.environ.get("KEEPER_TXN_VALIDITY", cls.txn_validity)),
+            record_margin=int(
+                os.environ.get("KEEPER_RECORD_MARGIN", cls.record_margin)
+            ),
+            claim_threshold=int(
+                os.environ.get("KEEPER_CLAIM_THRESHOLD", cls.claim_threshold)
+            ),
+        )
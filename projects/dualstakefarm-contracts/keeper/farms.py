@@ -0,0 +1,116 @@
+"""Farm box decoding and the escrow -> farm lookup used by the keeper."""
+
+import dataclasses
+import struct
+
+from algosdk.encoding import decode_address
+from algosdk.logic import get_application_address
+
+# mirrors the box layouts in smart_contracts/dualstakefarm/contract.py
+LEGACY_FARM_BOX_SIZE = 32
+FARM_BOX_SIZE = 26
+
+# box I/O budget each box ref adds to a group
+BOX_REF_BYTES = 1024
+
+# IX rewards accrued per keeper. payouts must reference the caller's box
+IX_REWARDS_KEY_PREFIX = b"k"
+
+# blocks stay accessible to blk_proposer for this many rounds
+PROOF_WINDOW = 1000
+
+
+@dataclasses.dataclass
+class Farm:
+    app_id: int
+    farm_asset: int
+    amount_per_block: int
+    remaining_duration_blocks: int
+    last_block_paid: int
+    # blocks recorded with record_proposals and not settled yet
+    pending_blocks: int = 0
+
+    @property
+    def escrow(self) -> str:
+        return get_application_address(self.app_id)
+
+    @property
+    def provable_blocks(self) -> int:
+        """Blocks that can still be paid or recorded"""
+        return self.remaining_duration_blocks - self.pending_blocks
+
+
+@dataclasses.dataclass(frozen=True)
+class DualstakeInfo:
+    """Dualstake app globals needed as references when swapping"""
+
+    tm2_app_id: int
+    lp_id: str
+
+
+def ix_rewards_key(keeper: str) -> bytes:
+    return IX_REWARDS_KEY_PREFIX + decode_address(keeper)
+
+
+def decode_farm_box(app_id: int, value: bytes) -> Farm:
+    """Decode a farm box value in the compact or the legacy layout."""
+    pending = 0
+    if len(value) == LEGACY_FARM_BOX_SIZE:
+        asset, amount, remaining, last = struct.unpack(">QQQQ", value)
+    elif len(value) == FARM_BOX_SIZE:
+        asset, amount, remaining, last, pending = struct.unpack(">QQIIH", value)
+    else:
+        raise ValueError(f"Unknown farm box layout for {app_id}: {value.hex()}")
+    return Farm(app_id, asset, amount, remaining, last, pending)
+
+
+def encode_farm_box(farm: Farm) -> bytes:
+    """Encode a farm in the compact layout, as the contract stores it."""
+    return struct.pack(
+        ">QQIIH",
+        farm.farm_asset,
+        farm.amount_per_block,
+        farm.remaining_duration_blocks,
+        farm.last_block_paid,
+        farm.pending_blocks,
+    )
+
+
+class FarmBook:
+    """Live farms indexed by app id and by escrow address."""
+
+    def __init__(self) -> None:
+        self.farms: dict[int, Farm] = {}
+        self.by_escrow: dict[str, int] = {}
+        self.dualstake: dict[int, DualstakeInfo] = {}
+
+    def __len__(self) -> int:
+        return len(self.farms)
+
+    def get(self, app_id: int) -> Farm | None:
+        return self.farms.get(app_id)
+
+    def for_proposer(self, proposer: str) -> Farm | None:
+        app_id = self.by_escrow.get(proposer)
+        return None if app_id is None else self.farms.get(app_id)
+
+    def upsert(self, farm: Farm) -> None:
+        if farm.remaining_duration_blocks == 0:
+            self.remove(farm.app_id)
+            return
+        self.farms[farm.app_id] = farm
+        self.by_escrow[farm.escrow] = farm.app_id
+
+    def remove(self, app_id: int) -> None:
+        farm = self.farms.pop(app_id, None)
+        if farm is not None:
+            self.by_escrow.pop(farm.escrow, None)
+        self.dualstake.pop(app_id, None)
+
+    def replace_all(self, farms: list[Farm]) -> None:
+        live = {farm.app_id for farm in farms}
+        for app_id in list(self.farms):
+            if app_id not in live:
+                self.remove(app_id)
+        for farm in farms:
+            self.upsert(farm)
@@ -0,0 +1,241 @@
+"""
+In-memory stand-in for algod.
+
+Serves block headers, farm boxes and global state from memory and applies
+submitted payout, payout_many, record_proposals and settle calls with the contract's
+checks, including the group's box references, so the keeper pipeline can be exercised without a node. Accepted groups
+change the boxes right away but only confirm in the next proposed round.
+"""
+
+import asyncio
+import random
+from collections.abc import Callable
+
+from algosdk.abi import ABIType
+from algosdk.transaction import (
+    ApplicationCallTxn,
+    GenericSignedTransaction,
+    SuggestedParams,
+)
+
+from .algod import BlockHeader
+from .farms import (
+    BOX_REF_BYTES,
+    PROOF_WINDOW,
+    Farm,
+    decode_farm_box,
+    encode_farm_box,
+)
+from .payouts import PAYOUT, PAYOUT_MANY, RECORD_PROPOSALS, SETTLE
+
+_ROUND_TYPE = ABIType.from_string("uint64")
+_ROUNDS_TYPE = ABIType.from_string("uint64[]")
+_FARM_CALLS = {
+    method.get_selector() for method in (PAYOUT, PAYOUT_MANY, RECORD_PROPOSALS, SETTLE)
+}
+
+
+class LocalAlgodError(Exception):
+    pass
+
+
+class LocalAlgod:
+    def __init__(
+        self,
+        app_id: int,
+        *,
+        start_round: int = 1000,
+        round_time: float = 0.0,
+        fail_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.app_id = app_id
+        self.round = start_round
+        self.round_time = round_time
+        self.fail_rate = fail_rate
+        self.headers: dict[int, BlockHeader] = {}
+        self.boxes: dict[bytes, bytes] = {}
+        self.global_states: dict[int, dict[bytes, int | bytes]] = {}
+        self.submitted: list[list[GenericSignedTransaction]] = []
+        # txid -> round the group confirms in
+        self.confirmed_in: dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._new_round = asyncio.Condition()
+
+    # chain control
+
+    def set_farm(self, farm: Farm) -> None:
+        self.boxes[farm.app_id.to_bytes(8, "big")] = encode_farm_box(farm)
+
+    def get_farm(self, app_id: int) -> Farm | None:
+        value = self.boxes.get(app_id.to_bytes(8, "big"))
+        return None if value is None else decode_farm_box(app_id, value)
+
+    async def propose(self, proposer: str, timestamp: int | None = None) -> int:
+        """Commit the next round with the given proposer."""
+        if self.round_time:
+            await asyncio.sleep(self.round_time)
+        async with self._new_round:
+            self.round += 1
+            self.headers[self.round] = BlockHeader(
+                self.round, proposer, self.round * 3 if timestamp is None else timestamp
+            )
+            self._new_round.notify_all()
+        return self.round
+
+    # Algod protocol
+
+    async def current_round(self) -> int:
+        return self.round
+
+    async def wait_for_round_after(self, rnd: int) -> int:
+        async with self._new_round:
+            await self._new_round.wait_for(lambda: self.round > rnd)
+        return self.round
+
+    async def block_header(self, rnd: int) -> BlockHeader:
+        header = self.headers.get(rnd)
+        if header is None:
+            raise LocalAlgodError(f"no block {rnd}")
+        return header
+
+    async def box_names(self, app_id: int) -> list[bytes]:
+        return list(self.boxes) if app_id == self.app_id else []
+
+    async def box(self, app_id: int, name: bytes) -> bytes | None:
+        return self.boxes.get(name) if app_id == self.app_id else None
+
+    async def global_state(self, app_id: int) -> dict[bytes, int | bytes]:
+        return self.global_states.get(app_id, {})
+
+    async def suggested_params(self) -> SuggestedParams:
+        return SuggestedParams(
+            fee=0,
+            first=self.round,
+            last=self.round + 1000,
+            gh="",
+            flat_fee=True,
+            min_fee=1000,
+        )
+
+    async def send_group(self, signed: list[GenericSignedTransaction]) -> str:
+        if self.fail_rate and self._random.random() < self.fail_rate:
+            raise LocalAlgodError("injected failure")
+        self._check_box_refs(signed)
+        for stxn in signed:
+            txn = stxn.transaction
+            if isinstance(txn, ApplicationCallTxn):
+                apply_farm_call(
+                    txn, self.round, self.boxes, lambda rnd: self.headers[rnd].proposer
+                )
+        self.submitted.append(signed)
+        txid = signed[0].get_txid()
+        self.confirmed_in[txid] = self.round + 1
+        return txid
+
+    def _check_box_refs(self, signed: list[GenericSignedTransaction]) -> None:
+        """
+        Every farm box a call writes must be referenced in the group, and the
+        boxes read must fit the box I/O budget of the group's refs.
+        """
+        calls = [
+            stxn.transaction
+            for stxn in signed
+            if isinstance(stxn.transaction, ApplicationCallTxn)
+        ]
+        refs = [ref for txn in calls for ref in txn.boxes or []]
+        names = {ref.name for ref in refs if ref.app_index == 0}
+        touched = set()
+        for txn in calls:
+            if txn.app_args and txn.app_args[0] in _FARM_CALLS:
+                farm_app_id = txn.foreign_apps[txn.app_args[1][0] - 1]
+                touched.add(farm_app_id.to_bytes(8, "big"))
+        if touched - names:
+            raise LocalAlgodError("invalid Box reference")
+        read = sum(len(self.boxes.get(name, b"")) for name in names)
+        if read > BOX_REF_BYTES * len(refs):
+            raise LocalAlgodError("box read budget exceeded")
+
+    async def wait_for_confirmation(self, txid: str, wait_rounds: int) -> int:
+        confirmed_in = self.confirmed_in.get(txid)
+        if confirmed_in is None:
+            raise LocalAlgodError(f"txn {txid} not found")
+        last_round = self.round + wait_rounds
+        async with self._new_round:
+            await self._new_round.wait_for(
+                lambda: self.round >= min(confirmed_in, last_round)
+            )
+        if self.round < confirmed_in:
+            raise LocalAlgodError(
+                f"txn {txid} not confirmed after {wait_rounds} rounds"
+            )
+        return confirmed_in
+
+
+def apply_farm_call(
+    txn: ApplicationCallTxn,
+    current_round: int,
+    boxes: dict[bytes, bytes],
+    proposer: Callable[[int], str],
+) -> tuple[int, list[int]] | None:
+    """
+    Check a payout, payout_many, record_proposals or settle call the way the
+    contract does and update the farm box in boxes. Returns the farm app id and
+    the rounds proven by the call, None for other calls.
+    """
+    selector = txn.app_args[0] if txn.app_args else b""
+    if selector not in _FARM_CALLS:
+        return None
+    if not txn.first_valid_round <= current_round + 1 <= txn.last_valid_round:
+        raise LocalAlgodError("txn dead")
+    app_index = txn.app_args[1][0]
+    farm_app_id = txn.foreign_apps[app_index - 1]
+    key = farm_app_id.to_bytes(8, "big")
+    if key not in boxes:
+        raise LocalAlgodError("ERR:NO FARM")
+    farm = decode_farm_box(farm_app_id, boxes[key])
+
+    rounds: list[int] = []
+    if selector == SETTLE.get_selector():
+        if not farm.pending_blocks:
+            raise LocalAlgodError("ERR:NO PEND")
+        farm.remaining_duration_blocks -= farm.pending_blocks
+        farm.pending_blocks = 0
+    else:
+        if selector == PAYOUT.get_selector():
+            rounds = [_ROUND_TYPE.decode(txn.app_args[2])]
+        else:
+            rounds = _ROUNDS_TYPE.decode(txn.app_args[2])
+        _check_proposals(txn, farm, rounds, proposer)
+        farm.last_block_paid = rounds[-1]
+        if selector == RECORD_PROPOSALS.get_selector():
+            farm.pending_blocks += len(rounds)
+        else:
+            farm.remaining_duration_blocks -= len(rounds)
+
+    if farm.remaining_duration_blocks == 0:
+        del boxes[key]
+    else:
+        boxes[key] = encode_farm_box(farm)
+    return farm_app_id, rounds
+
+
+def _check_proposals(
+    txn: ApplicationCallTxn,
+    farm: Farm,
+    rounds: list[int],
+    proposer: Callable[[int], str],
+) -> None:
+    if not rounds or len(rounds) > farm.provable_blocks:
+        raise LocalAlgodError("ERR:BLKS")
+
+    first_accessible = max(txn.last_valid_round - PROOF_WINDOW - 1, 1)
+    last = farm.last_block_paid
+    for rnd in rounds:
+        if rnd <= last:
+            raise LocalAlgodError("ERR:PAST")
+        if not first_accessible <= rnd < txn.first_valid_round:
+            raise LocalAlgodError("block not available")
+        if proposer(rnd) != farm.escrow:
+            raise LocalAlgodError("ERR:NOT BLK PROP")
+        last = rnd
@@ -0,0 +1,190 @@
+"""Payout transaction group construction."""
+
+import copy
+
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+)
+from algosdk.encoding import encode_address
+from algosdk.transaction import GenericSignedTransaction, SuggestedParams
+
+from .farms import PROOF_WINDOW, DualstakeInfo, Farm, ix_rewards_key
+
+UPDATE_ORACLE = Method.from_signature("update_oracle()void")
+PAYOUT = Method.from_signature("payout(application,uint64,bool)void")
+PAYOUT_MANY = Method.from_signature("payout_many(application,uint64[],bool)void")
+RECORD_PROPOSALS = Method.from_signature("record_proposals(application,uint64[])void")
+SETTLE = Method.from_signature("settle(application,bool)void")
+CLAIM_IX_REWARDS = Method.from_signature("claim_ix_rewards()uint64")
+
+
+class TooLateError(Exception):
+    """The oldest round of a payout is no longer accessible to blk_proposer"""
+
+
+def payout_deadline(block_round: int) -> int:
+    """Last round at which a payout proving block_round can still be confirmed."""
+    return block_round + PROOF_WINDOW
+
+
+def validity_window(
+    rounds: list[int], last_round: int, txn_validity: int
+) -> tuple[int, int]:
+    """
+    First/last valid for a payout of rounds.
+    blk_proposer needs every round in [last_valid - 1001, first_valid - 1].
+    """
+    first_valid = max(rounds) + 1
+    last_valid = min(last_round + txn_validity, min(rounds) + PROOF_WINDOW)
+    if last_valid <= last_round or last_valid < first_valid:
+        raise TooLateError(f"rounds {rounds} can not be proven after {last_round}")
+    return first_valid, last_valid
+
+
+def build_payout_group(
+    *,
+    app_id: int,
+    farm: Farm,
+    dualstake: DualstakeInfo | None,
+    rounds: list[int],
+    call_swap: bool,
+    sender: str,
+    signer: TransactionSigner,
+    params: SuggestedParams,
+    last_round: int,
+    txn_validity: int,
+    record: bool = False,
+) -> list[GenericSignedTransaction]:
+    """
+    update_oracle + payout_many(farm, rounds, call_swap). update_oracle only
+    folds new blocks in every ORACLE_UPDATE_ROUNDS rounds, and adds its
+    opcode budget to the group.
+    Inner transaction fees are paid by the farm app. The IX rewards accrue to
+    sender until it calls claim_ix_rewards.
+    With record, record_proposals(farm, rounds) proves the rounds without paying
+    them and accrues the record share of their IX rewards. settle pays them later.
+    """
+    rounds = sorted(rounds)
+    first_valid, last_valid = validity_window(rounds, last_round, txn_validity)
+
+    sp = copy.copy(params)
+    sp.first = first_valid
+    sp.last = last_valid
+    if record:
+        return _farm_call_group(
+            app_id=app_id,
+            method=RECORD_PROPOSALS,
+            method_args=[farm.app_id, rounds],
+            farm=farm,
+            dualstake=None,
+            sender=sender,
+            signer=signer,
+            sp=sp,
+        )
+    return _farm_call_group(
+        app_id=app_id,
+        method=PAYOUT_MANY,
+        method_args=[farm.app_id, rounds, call_swap],
+        farm=farm,
+        dualstake=dualstake if call_swap else None,
+        sender=sender,
+        signer=signer,
+        sp=sp,
+    )
+
+
+def build_settle_group(
+    *,
+    app_id: int,
+    farm: Farm,
+    dualstake: DualstakeInfo | None,
+    call_swap: bool,
+    sender: str,
+    signer: TransactionSigner,
+    params: SuggestedParams,
+) -> list[GenericSignedTransaction]:
+    """update_oracle + settle(farm, call_swap): pays the pending blocks."""
+    return _farm_call_group(
+        app_id=app_id,
+        method=SETTLE,
+        method_args=[farm.app_id, call_swap],
+        farm=farm,
+        dualstake=dualstake if call_swap else None,
+        sender=sender,
+        signer=signer,
+        sp=copy.copy(params),
+    )
+
+
+def _farm_call_group(
+    *,
+    app_id: int,
+    method: Method,
+    method_args: list[object],
+    farm: Farm,
+    dualstake: DualstakeInfo | None,
+    sender: str,
+    signer: TransactionSigner,
+    sp: SuggestedParams,
+) -> list[GenericSignedTransaction]:
+    """update_oracle + a call writing the farm box"""
+    sp.flat_fee = True
+    sp.fee = max(sp.min_fee or 1000, 1000)
+
+    foreign_apps = [farm.app_id]
+    accounts: list[str] = []
+    if dualstake is not None:
+        foreign_apps.append(dualstake.tm2_app_id)
+        accounts.append(dualstake.lp_id)
+
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id, method=UPDATE_ORACLE, sender=sender, sp=sp, signer=signer
+    )
+    atc.add_method_call(
+        app_id=app_id,
+        method=method,
+        sender=sender,
+        sp=sp,
+        signer=signer,
+        method_args=method_args,
+        foreign_apps=foreign_apps,
+        foreign_assets=[farm.farm_asset],
+        accounts=accounts,
+        boxes=[
+            (0, farm.app_id.to_bytes(8, "big")),
+            (0, ix_rewards_key(sender)),
+        ],
+    )
+    return atc.gather_signatures()
+
+
+def build_claim_group(
+    *,
+    app_id: int,
+    sender: str,
+    signer: TransactionSigner,
+    params: SuggestedParams,
+) -> list[GenericSignedTransaction]:
+    """claim_ix_rewards(). The fee covers the inner payment."""
+    sp = copy.copy(params)
+    sp.flat_fee = True
+    sp.fee = 2 * max(sp.min_fee or 1000, 1000)
+
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id,
+        method=CLAIM_IX_REWARDS,
+        sender=sender,
+        sp=sp,
+        signer=signer,
+        boxes=[(0, ix_rewards_key(sender))],
+    )
+    return atc.gather_signatures()
+
+
+def lp_address(lp_id: bytes) -> str:
+    # lp_id is stored as the 32 byte public key of the pool account
+    return encode_address(lp_id)
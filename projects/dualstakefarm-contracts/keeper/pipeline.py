@@ -0,0 +1,373 @@
+"""
+Round following payout pipeline.
+
+follow  -> headers queue (bounded) -> detect -> jobs queue (deadline ordered)
+        -> submit workers (batch per farm, retry with backoff until deadline)
+
+Batches close to their deadline are recorded instead of paid. The refresh loop
+settles recorded blocks. The farm book only follows a group once it is confirmed.
+"""
+
+import asyncio
+import dataclasses
+import heapq
+import itertools
+import logging
+import time
+
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.transaction import GenericSignedTransaction
+
+from .algod import Algod, BlockHeader
+from .config import KeeperConfig
+from .farms import DualstakeInfo, FarmBook, decode_farm_box, ix_rewards_key
+from .payouts import (
+    TooLateError,
+    build_claim_group,
+    build_payout_group,
+    build_settle_group,
+    lp_address,
+    payout_deadline,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class KeeperStats:
+    headers: int = 0
+    detected: int = 0
+    paid: int = 0
+    recorded: int = 0
+    settled: int = 0
+    missed: int = 0
+    retries: int = 0
+    groups: int = 0
+    claimed: int = 0
+    started: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def missed_rate(self) -> float:
+        return self.missed / self.detected if self.detected else 0.0
+
+
+@dataclasses.dataclass
+class PayoutJob:
+    app_id: int
+    block_round: int
+    attempts: int = 0
+
+    @property
+    def deadline(self) -> int:
+        return payout_deadline(self.block_round)
+
+
+class Keeper:
+    def __init__(
+        self,
+        algod: Algod,
+        config: KeeperConfig,
+        sender: str,
+        signer: TransactionSigner,
+    ) -> None:
+        self.algod = algod
+        self.config = config
+        self.sender = sender
+        self.signer = signer
+
+        self.book = FarmBook()
+        self.stats = KeeperStats()
+        self.last_round = 0
+
+        self.headers: asyncio.Queue[BlockHeader] = asyncio.Queue(
+            config.header_queue_size
+        )
+        # (deadline, seq, job): earliest deadline first. entries of jobs a batch
+        # took early stay behind and are dropped when they come up
+        self.jobs: asyncio.PriorityQueue[tuple[int, int, PayoutJob]] = (
+            asyncio.PriorityQueue(config.job_queue_size)
+        )
+        self._seq = itertools.count()
+        # farm app id -> block round -> job, for the jobs still queued
+        self._queued: dict[int, dict[int, PayoutJob]] = {}
+        self._inflight: set[int] = set()
+        self._stopping = asyncio.Event()
+
+    async def run(self, start_round: int | None = None) -> KeeperStats:
+        await self.refresh_farms()
+        self.last_round = await self.algod.current_round()
+        next_round = self.last_round + 1 if start_round is None else start_round
+
+        tasks = [
+            asyncio.create_task(self._follow(next_round), name="follow"),
+            asyncio.create_task(self._detect(), name="detect"),
+            asyncio.create_task(self._refresh_loop(), name="refresh"),
+        ] + [
+            asyncio.create_task(self._submit_worker(), name=f"submit-{i}")
+            for i in range(self.config.workers)
+        ]
+        try:
+            await self._stopping.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self.stats
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def refresh_farms(self) -> None:
+        app_id = self.config.app_id
+        farms = []
+        for name in await self.algod.box_names(app_id):
+            # farm boxes are keyed by the 8 byte recipient app id
+            if len(name) != 8:
+                continue
+            value = await self.algod.box(app_id, name)
+            if value is not None:
+                farms.append(decode_farm_box(int.from_bytes(name, "big"), value))
+        self.book.replace_all(farms)
+        logger.info(f"Tracking {len(self.book)} farms")
+
+    async def refresh_farm(self, farm_app_id: int) -> None:
+        value = await self.algod.box(self.config.app_id, farm_app_id.to_bytes(8, "big"))
+        if value is None:
+            self.book.remove(farm_app_id)
+        else:
+            self.book.upsert(decode_farm_box(farm_app_id, value))
+
+    async def _confirm(self, signed: list[GenericSignedTransaction]) -> None:
+        txid = await self.algod.send_group(signed)
+        await self.algod.wait_for_confirmation(txid, self.config.txn_validity)
+
+    async def claim_rewards(self) -> None:
+        """Claim the accrued IX rewards once they reach the claim threshold."""
+        if not self.config.claim_threshold:
+            return
+        value = await self.algod.box(self.config.app_id, ix_rewards_key(self.sender))
+        accrued = 0 if value is None else int.from_bytes(value, "big")
+        if accrued < self.config.claim_threshold:
+            return
+        signed = build_claim_group(
+            app_id=self.config.app_id,
+            sender=self.sender,
+            signer=self.signer,
+            params=await self.algod.suggested_params(),
+        )
+        await self._confirm(signed)
+        self.stats.claimed += accrued
+        logger.info(f"Claimed {accrued} microALGO of IX rewards")
+
+    async def settle_pending(self) -> None:
+        """Pay the blocks recorded with record_proposals."""
+        for farm in list(self.book.farms.values()):
+            if not farm.pending_blocks or farm.app_id in self._inflight:
+                continue
+            pending = farm.pending_blocks
+            self._inflight.add(farm.app_id)
+            try:
+                signed = build_settle_group(
+                    app_id=self.config.app_id,
+                    farm=farm,
+                    dualstake=await self._dualstake_info(farm.app_id),
+                    call_swap=self.config.call_swap,
+                    sender=self.sender,
+                    signer=self.signer,
+                    params=await self.algod.suggested_params(),
+                )
+                await self._confirm(signed)
+            except Exception as e:
+                logger.info(f"Settle {farm.app_id} failed: {e}")
+                continue
+            finally:
+                self._inflight.discard(farm.app_id)
+            self.stats.groups += 1
+            self.stats.settled += pending
+            self._apply_settle(farm.app_id, pending)
+
+    def _apply_settle(self, app_id: int, pending: int) -> None:
+        farm = self.book.get(app_id)
+        # a refresh while the group confirmed may have read the settled box
+        if farm is None or not farm.pending_blocks:
+            return
+        farm.remaining_duration_blocks -= pending
+        farm.pending_blocks = 0
+        if farm.remaining_duration_blocks <= 0:
+            self.book.remove(app_id)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.refresh_interval)
+            try:
+                await self.refresh_farms()
+            except Exception:
+                logger.exception("Farm refresh failed")
+            try:
+                await self.settle_pending()
+            except Exception:
+                logger.exception("Settling recorded blocks failed")
+            try:
+                await self.claim_rewards()
+            except Exception:
+                logger.exception("IX rewards claim failed")
+
+    async def _follow(self, next_round: int) -> None:
+        while True:
+            if next_round > self.last_round:
+                self.last_round = await self.algod.wait_for_round_after(
+                    next_round - 1
+                )
+            while next_round <= self.last_round:
+                header = await self.algod.block_header(next_round)
+                # bounded queue: waits here if detection falls behind
+                await self.headers.put(header)
+                next_round += 1
+
+    async def _detect(self) -> None:
+        while True:
+            header = await self.headers.get()
+            self.stats.headers += 1
+            farm = self.book.for_proposer(header.proposer)
+            if farm is None or header.round_ <= farm.last_block_paid:
+                continue
+            self.stats.detected += 1
+            await self._enqueue(PayoutJob(farm.app_id, header.round_))
+
+    async def _enqueue(self, job: PayoutJob) -> None:
+        farm_jobs = self._queued.setdefault(job.app_id, {})
+        if job.block_round in farm_jobs:
+            return
+        farm_jobs[job.block_round] = job
+        await self.jobs.put((job.deadline, next(self._seq), job))
+
+    def _unqueue(self, job: PayoutJob) -> bool:
+        """Take job out of the queued jobs. False if a batch already took it."""
+        farm_jobs = self._queued.get(job.app_id, {})
+        if farm_jobs.pop(job.block_round, None) is None:
+            return False
+        if not farm_jobs:
+            del self._queued[job.app_id]
+        return True
+
+    def _requeue_later(self, job: PayoutJob, delay: float) -> None:
+        asyncio.get_running_loop().call_later(
+            delay, lambda: asyncio.ensure_future(self._enqueue(job))
+        )
+
+    def _take_batch(self, first: PayoutJob) -> list[PayoutJob]:
+        """Take the farm's earliest other queued jobs to pay them in the same call."""
+        farm_jobs = self._queued.get(first.app_id, {})
+        rounds = heapq.nsmallest(self.config.max_rounds_per_call - 1, farm_jobs)
+        batch = [first, *(farm_jobs[rnd] for rnd in rounds)]
+        for job in batch[1:]:
+            self._unqueue(job)
+        return batch
+
+    async def _submit_worker(self) -> None:
+        while True:
+            _, _, job = await self.jobs.get()
+            if not self._unqueue(job):
+                continue
+            if job.app_id in self._inflight:
+                # one group per farm at a time, rounds must be paid in order
+                self._requeue_later(job, self.config.inflight_delay)
+                continue
+            batch = self._take_batch(job)
+            self._inflight.add(job.app_id)
+            try:
+                await self._submit(batch)
+            finally:
+                self._inflight.discard(job.app_id)
+
+    async def _submit(self, batch: list[PayoutJob]) -> None:
+        app_id = batch[0].app_id
+        farm = self.book.get(app_id)
+        if farm is None:
+            return
+        batch = [job for job in batch if job.block_round > farm.last_block_paid]
+        batch = sorted(batch, key=lambda j: j.block_round)[: farm.provable_blocks]
+        if not batch:
+            return
+
+        rounds = [job.block_round for job in batch]
+        # proving is cheap and can not fail on the swap. pay later
+        record = batch[0].deadline - self.last_round <= self.config.record_margin
+        try:
+            signed = build_payout_group(
+                app_id=self.config.app_id,
+                farm=farm,
+                dualstake=await self._dualstake_info(app_id),
+                rounds=rounds,
+                call_swap=self.config.call_swap,
+                sender=self.sender,
+                signer=self.signer,
+                params=await self.algod.suggested_params(),
+                last_round=self.last_round,
+                txn_validity=self.config.txn_validity,
+                record=record,
+            )
+            await self._confirm(signed)
+        except TooLateError:
+            self.stats.missed += len(batch)
+            logger.warning(f"Missed {app_id} rounds {rounds}")
+            return
+        except Exception as e:
+            logger.info(f"Payout {app_id} {rounds} failed: {e}")
+            await self._retry(batch)
+            return
+
+        self.stats.groups += 1
+        if record:
+            self.stats.recorded += len(batch)
+        else:
+            self.stats.paid += len(batch)
+        # the book may have been refreshed, or the farm removed, while confirming
+        farm = self.book.get(app_id)
+        if farm is None or farm.last_block_paid >= rounds[-1]:
+            return
+        farm.last_block_paid = rounds[-1]
+        if record:
+            farm.pending_blocks += len(batch)
+            return
+        farm.remaining_duration_blocks -= len(batch)
+        if farm.remaining_duration_blocks <= 0:
+            self.book.remove(app_id)
+
+    async def _retry(self, batch: list[PayoutJob]) -> None:
+        # someone else may have paid in the meantime. resync before retrying
+        app_id = batch[0].app_id
+        try:
+            await self.refresh_farm(app_id)
+        except Exception:
+            logger.exception(f"Could not refresh farm {app_id}")
+        farm = self.book.get(app_id)
+        for job in batch:
+            if farm is None or job.block_round <= farm.last_block_paid:
+                continue
+            job.attempts += 1
+            if (
+                job.attempts > self.config.max_attempts
+                or job.deadline <= self.last_round + 1
+            ):
+                self.stats.missed += 1
+                continue
+            self.stats.retries += 1
+            delay = min(
+                self.config.retry_base_delay * 2 ** (job.attempts - 1),
+                self.config.retry_max_delay,
+            )
+            self._requeue_later(job, delay)
+
+    async def _dualstake_info(self, app_id: int) -> DualstakeInfo | None:
+        if not self.config.call_swap:
+            return None
+        info = self.book.dualstake.get(app_id)
+        if info is None:
+            state = await self.algod.global_state(app_id)
+            tm2_app_id, lp_id = state.get(b"tm2_app_id"), state.get(b"lp_id")
+            if not isinstance(tm2_app_id, int) or not isinstance(lp_id, bytes):
+                return None
+            info = DualstakeInfo(tm2_app_id, lp_address(lp_id))
+            self.book.dualstake[app_id] = info
+        return info
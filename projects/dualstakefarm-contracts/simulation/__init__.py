@@ -0,0 +1,21 @@
+from .chain import ChainConfig, PoolConfig, Staker, SyntheticChain
+from .emulator import CallFailedError, Chain, Emulator
+from .harness import Harness, InvariantError, Model, Stats
+from .mock_algod import MockAlgod, farm_network, serve
+
+__all__ = [
+    "CallFailedError",
+    "Chain",
+    "ChainConfig",
+    "Emulator",
+    "Harness",
+    "InvariantError",
+    "MockAlgod",
+    "Model",
+    "PoolConfig",
+    "Staker",
+    "Stats",
+    "SyntheticChain",
+    "farm_network",
+    "serve",
+]
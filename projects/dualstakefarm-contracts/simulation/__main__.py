@@ -0,0 +1,75 @@
+"""
+Randomized stateful simulation of DualstakeFarm in the algorand-python-testing
+emulator, with invariant checks every --check-every operations.
+
+    python -m simulation --ops 20000 --farms 64 --assets 8 --seed 1
+
+Fails with the seed and operation count of the first invariant violation, so
+the run can be repeated up to that point.
+"""
+
+import argparse
+import logging
+import random
+import sys
+
+from .emulator import Chain, Emulator
+from .harness import CHECK_EVERY, Harness, InvariantError
+
+logger = logging.getLogger(__name__)
+
+# 2B ALGO online
+ONLINE_STAKE = 2 * 10**15
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--farms", type=int, default=64)
+    parser.add_argument("--assets", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-duration",
+        type=int,
+        default=200,
+        help="longest farm or extension in blocks. short farms expire more often",
+    )
+    parser.add_argument(
+        "--check-every",
+        type=int,
+        default=CHECK_EVERY,
+        help="operations between full invariant checks. 1 checks after every one",
+    )
+    parser.add_argument("--progress-every", type=int, default=10_000)
+    args = parser.parse_args()
+    if args.farms < 1:
+        parser.error("--farms must be at least 1")
+
+    rng = random.Random(args.seed)
+    chain = Chain(rng=random.Random(rng.getrandbits(64)), online_stake=ONLINE_STAKE)
+    with Emulator.start(chain) as emulator:
+        harness = Harness(
+            emulator,
+            rng,
+            num_farms=args.farms,
+            num_assets=args.assets,
+            max_duration=args.max_duration,
+            check_every=args.check_every,
+        )
+        try:
+            stats = harness.run(args.ops, args.progress_every)
+        except InvariantError as e:
+            logger.error(
+                f"invariant violated after {harness.stats.total} ops "
+                f"(seed {args.seed}): {e}"
+            )
+            print(harness.stats.report())
+            sys.exit(1)
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    main()
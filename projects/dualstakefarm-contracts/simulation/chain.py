@@ -0,0 +1,324 @@
+"""
+Deterministic synthetic chains for offline runs.
+
+Every round is derived from the seed and the round number alone, so any block
+can be produced in any order without keeping the chain in memory. Timestamps
+and pool prices accumulate over rounds: they are stepped from checkpoints kept
+every CHECKPOINT_INTERVAL rounds, which keeps random access cheap and
+sequential access O(1) per round.
+
+    python -m simulation.chain --rounds 1000000 --seed 1
+"""
+
+import argparse
+import bisect
+import dataclasses
+import hashlib
+import math
+import struct
+import time
+from collections.abc import Iterator
+
+from algosdk.encoding import encode_address
+
+CHECKPOINT_INTERVAL = 1024
+# consensus bonus plan: 10 ALGO, -1% every 1M rounds
+BONUS_BASE = 10_000_000
+BONUS_DECAY_INTERVAL = 1_000_000
+BONUS_DECAY_PERCENT = 1
+# share of the collected fees that goes to an eligible proposer
+PROPOSER_FEES_PERCENT = 50
+MIN_FEE = 1000
+SECONDS_PER_YEAR = 86400 * 365
+
+_U64 = 2**64
+
+
+@dataclasses.dataclass(frozen=True)
+class Staker:
+    address: str
+    stake: int
+    # incentive eligible proposers get the proposer payout
+    eligible: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolConfig:
+    """A Tinyman style asset/ALGO pool whose price follows a random walk."""
+
+    asset_id: int
+    asset_reserves: int
+    algo_reserves: int
+    # standard deviation of the log price change per round
+    volatility: float = 0.0005
+
+
+@dataclasses.dataclass(frozen=True)
+class ChainConfig:
+    seed: int = 0
+    # total online stake. stake not held by stakers is spread over filler accounts
+    online_stake: int = 2 * 10**15
+    stakers: tuple[Staker, ...] = ()
+    fillers: int = 100
+    # share of the filler stake that is incentive eligible
+    filler_eligible_share: float = 0.5
+    genesis_timestamp: int = 1_700_000_000
+    round_time_ms: int = 2800
+    # round times are uniform in round_time_ms +- round_time_jitter_ms
+    round_time_jitter_ms: int = 400
+    bonus_base: int = BONUS_BASE
+    bonus_decay_interval: int = BONUS_DECAY_INTERVAL
+    bonus_decay_percent: int = BONUS_DECAY_PERCENT
+    # transactions per round are uniform in [0, 2 * mean_txns_per_round)
+    mean_txns_per_round: int = 20
+    pools: tuple[PoolConfig, ...] = ()
+
+    def __post_init__(self) -> None:
+        staked = sum(s.stake for s in self.stakers)
+        if staked > self.online_stake:
+            raise ValueError(f"Stakers hold {staked}, over the online stake")
+        if not 0 <= self.round_time_jitter_ms < self.round_time_ms:
+            raise ValueError("round_time_jitter_ms must be below round_time_ms")
+        if self.fillers < 1 and staked < self.online_stake:
+            raise ValueError("Stake left to fillers but no fillers")
+
+
+@dataclasses.dataclass(frozen=True)
+class Block:
+    round_: int
+    timestamp: int
+    proposer: str
+    bonus: int
+    fees_collected: int
+    # 0 when the proposer is not incentive eligible
+    proposer_payout: int
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolState:
+    asset_id: int
+    asset_reserves: int
+    algo_reserves: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _State:
+    """Accumulated values at the end of a round."""
+
+    round_: int
+    elapsed_ms: int
+    log_prices: tuple[float, ...]
+
+
+def _address(seed: int, tag: bytes) -> str:
+    return encode_address(
+        hashlib.blake2b(tag, digest_size=32, key=seed.to_bytes(8, "big")).digest()
+    )
+
+
+class SyntheticChain:
+    def __init__(self, config: ChainConfig) -> None:
+        self.config = config
+        self._key = config.seed.to_bytes(8, "big")
+
+        staked = sum(s.stake for s in config.stakers)
+        rest = config.online_stake - staked
+        fillers = []
+        if rest:
+            eligible = round(config.fillers * config.filler_eligible_share)
+            for i in range(config.fillers):
+                stake = rest // config.fillers + (i < rest % config.fillers)
+                fillers.append(
+                    Staker(_address(config.seed, b"filler%d" % i), stake, i < eligible)
+                )
+        self.stakers = [*config.stakers, *fillers]
+        self._cumulative = []
+        total = 0
+        for staker in self.stakers:
+            total += staker.stake
+            self._cumulative.append(total)
+
+        genesis = _State(0, 0, tuple(0.0 for _ in config.pools))
+        self._checkpoints = [genesis]
+        self._cursor = genesis
+        self._bonuses = [config.bonus_base]
+
+    # randomness
+
+    def _draws(self, rnd: int) -> tuple[float, float, float]:
+        """Proposer, round time and load draws of a round, uniform in [0, 1)"""
+        digest = hashlib.blake2b(
+            rnd.to_bytes(8, "big"), digest_size=24, key=self._key
+        ).digest()
+        a, b, c = struct.unpack(">QQQ", digest)
+        return a / _U64, b / _U64, c / _U64
+
+    def _pool_draw(self, rnd: int, pool: int) -> float:
+        """Price move of a pool in a round, with mean 0 and variance 1"""
+        digest = hashlib.blake2b(
+            struct.pack(">QI", rnd, pool), digest_size=8, key=self._key, person=b"pool"
+        ).digest()
+        (a,) = struct.unpack(">Q", digest)
+        return (2 * a / _U64 - 1) * math.sqrt(3)
+
+    # accumulated state
+
+    def _round_time_ms(self, rnd: int) -> int:
+        jitter = self.config.round_time_jitter_ms
+        draw = self._draws(rnd)[1]
+        return self.config.round_time_ms + round((2 * draw - 1) * jitter)
+
+    def _step(self, state: _State) -> _State:
+        rnd = state.round_ + 1
+        return _State(
+            rnd,
+            state.elapsed_ms + self._round_time_ms(rnd),
+            tuple(
+                log_price + pool.volatility * self._pool_draw(rnd, i)
+                for i, (log_price, pool) in enumerate(
+                    zip(state.log_prices, self.config.pools)
+                )
+            ),
+        )
+
+    def _state(self, rnd: int) -> _State:
+        if rnd < 0:
+            raise ValueError(f"No round {rnd}")
+        index = rnd // CHECKPOINT_INTERVAL
+        while len(self._checkpoints) <= index:
+            state = self._checkpoints[-1]
+            for _ in range(CHECKPOINT_INTERVAL):
+                state = self._step(state)
+            self._checkpoints.append(state)
+        state = self._checkpoints[index]
+        if state.round_ < self._cursor.round_ <= rnd:
+            state = self._cursor
+        while state.round_ < rnd:
+            state = self._step(state)
+        self._cursor = state
+        return state
+
+    # blocks
+
+    def bonus(self, rnd: int) -> int:
+        """Block bonus, decayed as the consensus bonus plan does."""
+        decays = rnd // self.config.bonus_decay_interval
+        while len(self._bonuses) <= decays:
+            self._bonuses.append(
+                self._bonuses[-1] * (100 - self.config.bonus_decay_percent) // 100
+            )
+        return self._bonuses[decays]
+
+    def _pick(self, draw: float) -> Staker:
+        pick = int(draw * self._cumulative[-1])
+        return self.stakers[bisect.bisect_right(self._cumulative, pick)]
+
+    def proposer(self, rnd: int) -> Staker:
+        return self._pick(self._draws(rnd)[0])
+
+    def timestamp(self, rnd: int) -> int:
+        return self.config.genesis_timestamp + self._state(rnd).elapsed_ms // 1000
+
+    def block(self, rnd: int) -> Block:
+        proposer_draw, _, load_draw = self._draws(rnd)
+        proposer = self._pick(proposer_draw)
+        txns = int(load_draw * 2 * self.config.mean_txns_per_round)
+        fees = txns * MIN_FEE
+        bonus = self.bonus(rnd)
+        return Block(
+            round_=rnd,
+            timestamp=self.timestamp(rnd),
+            proposer=proposer.address,
+            bonus=bonus,
+            fees_collected=fees,
+            proposer_payout=(
+                bonus + fees * PROPOSER_FEES_PERCENT // 100 if proposer.eligible else 0
+            ),
+        )
+
+    def blocks(self, start: int, end: int) -> Iterator[Block]:
+        """Blocks start..end-1"""
+        for rnd in range(start, end):
+            yield self.block(rnd)
+
+    def pool(self, index: int, rnd: int) -> PoolState:
+        """Reserves of a pool at the end of a round, at constant product."""
+        pool = self.config.pools[index]
+        # the ALGO price of the asset moves by exp(log_price)
+        move = math.exp(self._state(rnd).log_prices[index])
+        asset_reserves = max(1, round(pool.asset_reserves / math.sqrt(move)))
+        product = pool.asset_reserves * pool.algo_reserves
+        return PoolState(pool.asset_id, asset_reserves, product // asset_reserves)
+
+    def expected_share(self, address: str) -> float:
+        stake = sum(s.stake for s in self.stakers if s.address == address)
+        return stake / self._cumulative[-1]
+
+
+@dataclasses.dataclass
+class ChainSummary:
+    rounds: int = 0
+    seconds: int = 0
+    payouts: int = 0
+    proposals: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def avg_round_time(self) -> float:
+        return self.seconds / self.rounds if self.rounds else 0.0
+
+
+def summarize(chain: SyntheticChain, start: int, end: int) -> ChainSummary:
+    """Proposals per configured staker and chain averages over start..end-1"""
+    tracked = {s.address for s in chain.config.stakers}
+    summary = ChainSummary(rounds=end - start, proposals=dict.fromkeys(tracked, 0))
+    first = chain.timestamp(start - 1)
+    for block in chain.blocks(start, end):
+        summary.payouts += block.proposer_payout
+        if block.proposer in tracked:
+            summary.proposals[block.proposer] += 1
+    # after the pass, so the timestamp comes from the sequential cursor
+    summary.seconds = chain.timestamp(end - 1) - first
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stakers", type=int, default=8)
+    parser.add_argument(
+        "--staker-share",
+        type=float,
+        default=0.01,
+        help="share of the online stake held by each tracked staker",
+    )
+    args = parser.parse_args()
+
+    online_stake = ChainConfig.online_stake
+    stake = int(online_stake * args.staker_share)
+    stakers = tuple(
+        Staker(_address(args.seed, b"staker%d" % i), stake) for i in range(args.stakers)
+    )
+    chain = SyntheticChain(ChainConfig(seed=args.seed, stakers=stakers))
+    started = time.perf_counter()
+    summary = summarize(chain, 1, args.rounds + 1)
+    elapsed = time.perf_counter() - started
+
+    yearly_rounds = SECONDS_PER_YEAR / summary.avg_round_time
+    print(
+        f"{summary.rounds} rounds in {elapsed:.1f}s "
+        f"({summary.rounds / elapsed:,.0f} rounds/s)"
+    )
+    print(f"avg round time {summary.avg_round_time:.4f}s")
+    print(f"avg proposer payout {summary.payouts / summary.rounds:,.0f} microALGO")
+    for staker in stakers:
+        expected = chain.expected_share(staker.address) * summary.rounds
+        proposed = summary.proposals[staker.address]
+        print(
+            f"{staker.address} proposed {proposed} expected {expected:.0f} "
+            f"({proposed / summary.rounds * yearly_rounds:,.0f} blocks/year)"
+        )
+
+
+if __name__ == "__main__":
+    main()
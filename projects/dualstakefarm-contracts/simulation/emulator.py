@@ -0,0 +1,277 @@
+"""
+DualstakeFarm running in the algorand-python-testing emulator.
+
+The emulator executes the contract code but keeps no real ledger: inner
+transactions are recorded, not applied, and block headers and online stake are
+not modelled. Recipient apps are Dualstake mocks that the contract's
+swap_or_fail() calls run on. Emulator feeds it a synthetic chain and the balances the harness
+tracks, and wraps the transaction groups each ABI method expects.
+"""
+
+import contextlib
+import dataclasses
+import random
+from collections.abc import Iterator
+from typing import Any
+from unittest import mock
+
+import algopy
+from algopy import arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.dualstakefarm import contract
+from smart_contracts.dualstakefarm.contract import DualstakeFarm
+
+# blocks stay readable by blk_* for this many rounds before first_valid
+PROOF_WINDOW = 1001
+TXN_VALIDITY = 10
+
+
+@dataclasses.dataclass
+class Chain:
+    """
+    Rounds with a stake weighted random proposer. Only the last PROOF_WINDOW
+    rounds are kept, which is all a contract call can read.
+    """
+
+    rng: random.Random
+    online_stake: int
+    round_: int = 0
+    timestamp: int = 1_700_000_000
+    block_bonus: int = 10_000_000
+    stakes: dict[str, int] = dataclasses.field(default_factory=dict)
+    proposers: dict[int, str] = dataclasses.field(default_factory=dict)
+    timestamps: dict[int, int] = dataclasses.field(default_factory=dict)
+    # proposer payouts that differ from block_bonus, by round
+    payouts: dict[int, int] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # history so the first calls already see a full proof window
+        self.advance(PROOF_WINDOW + TXN_VALIDITY)
+
+    def advance(self, rounds: int = 1) -> list[tuple[int, str]]:
+        """Produce rounds blocks. Returns the ones proposed by staked accounts"""
+        proposed = []
+        total = sum(self.stakes.values())
+        for _ in range(rounds):
+            self.round_ += 1
+            # ~2.8s rounds
+            self.timestamp += self.rng.choice((2, 3, 3, 3))
+            self.timestamps[self.round_] = self.timestamp
+            pick = self.rng.randrange(self.online_stake)
+            proposer = ""
+            if pick < total:
+                for address, stake in self.stakes.items():
+                    if pick < stake:
+                        proposer = address
+                        break
+                    pick -= stake
+                proposed.append((self.round_, proposer))
+            self.proposers[self.round_] = proposer
+            self.proposers.pop(self.round_ - PROOF_WINDOW - TXN_VALIDITY, None)
+            self.timestamps.pop(self.round_ - PROOF_WINDOW - TXN_VALIDITY, None)
+        return proposed
+
+    @property
+    def first_valid(self) -> int:
+        return self.round_ + 1
+
+    @property
+    def last_valid(self) -> int:
+        return self.round_ + TXN_VALIDITY
+
+    def first_provable(self) -> int:
+        return self.last_valid - PROOF_WINDOW
+
+
+class _Block:
+    """Stands in for algopy.op.Block, backed by a Chain"""
+
+    def __init__(self, chain: Chain) -> None:
+        self.chain = chain
+
+    def _round(self, rnd: algopy.UInt64) -> int:
+        value = int(rnd)
+        if not self.chain.first_provable() <= value < self.chain.first_valid:
+            raise ValueError(f"block {value} is not available")
+        return value
+
+    def blk_timestamp(self, rnd: algopy.UInt64) -> algopy.UInt64:
+        return algopy.UInt64(self.chain.timestamps[self._round(rnd)])
+
+    def blk_proposer(self, rnd: algopy.UInt64) -> algopy.Account:
+        proposer = self.chain.proposers[self._round(rnd)]
+        return algopy.Account(proposer) if proposer else algopy.Account()
+
+    def blk_bonus(self, rnd: algopy.UInt64) -> algopy.UInt64:
+        self._round(rnd)
+        return algopy.UInt64(self.chain.block_bonus)
+
+    def blk_proposer_payout(self, rnd: algopy.UInt64) -> algopy.UInt64:
+        value = self._round(rnd)
+        return algopy.UInt64(self.chain.payouts.get(value, self.chain.block_bonus))
+
+
+@dataclasses.dataclass
+class Dualstake:
+    """A mocked recipient app. It counts the swap_or_fail() calls it receives"""
+
+    app: algopy.Application
+    swaps: int = 0
+
+    def swap_or_fail(self) -> None:
+        self.swaps += 1
+
+
+class CallFailedError(Exception):
+    """The contract rejected a call. Its state changes are not rolled back"""
+
+
+class Emulator:
+    def __init__(self, context: AlgopyTestContext, chain: Chain) -> None:
+        self.context = context
+        self.chain = chain
+        self.contract = DualstakeFarm()
+        self.app = context.ledger.get_app(self.contract)
+        self.manager = context.default_sender
+        self.dualstakes: dict[int, Dualstake] = {}
+
+    @classmethod
+    @contextlib.contextmanager
+    def start(cls, chain: Chain) -> Iterator["Emulator"]:
+        block = _Block(chain)
+        with (
+            algopy_testing_context() as context,
+            mock.patch.object(algopy.op, "Block", block),
+            mock.patch.object(
+                algopy.op, "online_stake", lambda: algopy.UInt64(chain.online_stake)
+            ),
+        ):
+            emulator = cls(context, chain)
+            with mock.patch.object(contract, "abi_call", emulator.abi_call):
+                yield emulator
+
+    # ledger
+
+    def new_account(self, balance: int = 0) -> algopy.Account:
+        return self.context.any.account(balance=algopy.UInt64(balance))
+
+    def new_asset(self) -> algopy.Asset:
+        return self.context.any.asset(total=algopy.UInt64(2**63))
+
+    def new_dualstake(self, asset: algopy.Asset, stake: int) -> algopy.Application:
+        """A recipient app with the globals the farm reads and a staked escrow"""
+        app = self.context.any.application()
+        self.context.ledger.set_global_state(app, b"asa_id", asset.id)
+        self.context.ledger.update_account(app.address, balance=algopy.UInt64(stake))
+        self.chain.stakes[str(app.address)] = stake
+        self.dualstakes[int(app.id)] = Dualstake(app)
+        return app
+
+    def set_app_account(
+        self, balance: int, min_balance: int, opted: dict[int, int]
+    ) -> None:
+        """Mirror the harness ledger into the farm app account"""
+        address = self.app.address
+        self.context.ledger.update_account(
+            address,
+            balance=algopy.UInt64(balance),
+            min_balance=algopy.UInt64(min_balance),
+        )
+        for asset_id, amount in opted.items():
+            self.context.ledger.update_asset_holdings(
+                asset_id, address, balance=algopy.UInt64(amount)
+            )
+
+    def box(self, key: bytes) -> bytes | None:
+        if not self.context.ledger.box_exists(self.app, key):
+            return None
+        return bytes(self.context.ledger.get_box(self.app, key))
+
+    def global_uint(self, name: str) -> int:
+        value = getattr(self.contract, name)
+        if isinstance(value, algopy.GlobalState):
+            # declared without an initial value, unset reads as 0
+            value = value.get(algopy.UInt64(0))
+        return int(value)
+
+    # calls
+
+    def call(
+        self,
+        method: str,
+        *args: Any,
+        sender: algopy.Account | None = None,
+        before: list[Any] | None = None,
+        after: list[Any] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Call an ABI method as the app call of a group, with optional
+        transactions before and after it. Raises CallFailedError on rejection.
+        """
+        sender = sender or self.manager
+        self.context.ledger.patch_global_fields(
+            round=algopy.UInt64(self.chain.first_valid),
+            latest_timestamp=algopy.UInt64(self.chain.timestamp),
+        )
+        app_call = self.context.any.txn.application_call(
+            app_id=self.app,
+            sender=sender,
+            first_valid=algopy.UInt64(self.chain.first_valid),
+            last_valid=algopy.UInt64(self.chain.last_valid),
+        )
+        gtxns = [*(before or []), app_call, *(after or [])]
+        with self.context.txn.create_group(
+            gtxns=gtxns, active_txn_index=len(before or [])
+        ):
+            try:
+                return getattr(self.contract, method)(*args)
+            except Exception as e:
+                raise CallFailedError(f"{method}: {e}") from e
+
+    def abi_call(
+        self, method: str, *, app_id: algopy.Application, fee: algopy.UInt64
+    ) -> None:
+        """
+        arc4.abi_call, which algorand-python-testing does not implement. The call
+        is recorded as an inner app call and run on the recipient's Dualstake.
+        Calls to any other app fail.
+        """
+        algopy.itxn.ApplicationCall(
+            app_id=app_id, app_args=(arc4.arc4_signature(method),), fee=fee
+        ).submit()
+        dualstake = self.dualstakes.get(int(app_id.id))
+        if dualstake is None:
+            raise ValueError(f"app {int(app_id.id)} is not a dualstake app")
+        getattr(dualstake, method.split("(")[0])()
+
+    def inner_effects(self) -> tuple[int, dict[int, int]]:
+        """ALGO (amounts and fees) and assets sent by the last call's inner txns"""
+        algo_out = 0
+        asset_out: dict[int, int] = {}
+        for group in self.context.txn.last_group.itxn_groups:
+            for itxn in group:
+                algo_out += int(itxn.fee)
+                if itxn.type == algopy.TransactionType.Payment:
+                    algo_out += int(itxn.amount)
+                elif itxn.type == algopy.TransactionType.AssetTransfer:
+                    asset_id = int(itxn.xfer_asset.id)
+                    asset_out[asset_id] = asset_out.get(asset_id, 0) + int(
+                        itxn.asset_amount
+                    )
+        return algo_out, asset_out
+
+    def payment(self, sender: algopy.Account, amount: int) -> Any:  # noqa: ANN401
+        return self.context.any.txn.payment(
+            sender=sender, receiver=self.app.address, amount=algopy.UInt64(amount)
+        )
+
+    def asset_transfer(
+        self, sender: algopy.Account, asset: algopy.Asset, amount: int
+    ) -> Any:  # noqa: ANN401
+        return self.context.any.txn.asset_transfer(
+            sender=sender,
+            asset_receiver=self.app.address,
+            xfer_asset=asset,
+            asset_amount=algopy.UInt64(amount),
+        )
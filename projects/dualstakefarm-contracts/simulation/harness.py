@@ -0,0 +1,767 @@
+"""
+Randomized stateful simulation of DualstakeFarm.
+
+Drives the contract through long random sequences of create, extend, payout,
+record / settle, withdraw and keeper reward claim calls over many farms
+and assets. A plain Python model tracks what every call should do. The inner
+transactions of every call are checked against it. Every check_every operations
+the contract state is compared with the model too: the farm boxes, the keeper
+reward boxes, txn_fuel, global_remaining_blocks, ix_accrued and the operational
+counters, the swaps each recipient app received, and the balances that back
+them.
+"""
+
+import dataclasses
+import logging
+import random
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import algopy
+from algopy import arc4
+
+from keeper.farms import decode_farm_box
+from smart_contracts.dualstakefarm.contract import (
+    FARM_BOX_MBR,
+    IX_REWARDS_BOX_MBR,
+    IX_REWARDS_KEY_PREFIX,
+    IX_REWARDS_PER_BLOCK,
+    PLATFORM_FEE_PER_BLOCK,
+    RECORD_IX_REWARDS_SHARE,
+    TXN_FEE_PER_BLOCK,
+    PayoutItem,
+)
+
+from .emulator import CallFailedError, Emulator
+
+logger = logging.getLogger(__name__)
+
+MIN_TXN_FEE = 1000
+ACCOUNT_MBR = 100_000
+ASSET_MBR = 100_000
+IX_REWARD = IX_REWARDS_PER_BLOCK * MIN_TXN_FEE
+# accrued by record_proposals. settle accrues the rest of IX_REWARD
+RECORD_IX_REWARD = IX_REWARD * RECORD_IX_REWARDS_SHARE // 100
+# reserved per block in txn_fuel, and charged per block on create and extend
+SPEND_PER_BLOCK = (TXN_FEE_PER_BLOCK + IX_REWARDS_PER_BLOCK) * MIN_TXN_FEE
+COST_PER_BLOCK = SPEND_PER_BLOCK + PLATFORM_FEE_PER_BLOCK * MIN_TXN_FEE
+
+MAX_AMOUNT_PER_BLOCK = 10**6
+MAX_BLOCKS_PER_CALL = 16
+MAX_BATCH_FARMS = 4
+NUM_KEEPERS = 3
+# operations between two full invariant checks. inner txns are checked every call
+CHECK_EVERY = 100
+# operational counter globals of the contract
+COUNTERS = (
+    "blocks_funded",
+    "farms_created",
+    "farms_extended",
+    "farms_expired",
+)
+
+
+class InvariantError(Exception):
+    """Contract state or behaviour disagrees with the model"""
+
+
+@dataclasses.dataclass
+class ModelFarm:
+    app_id: int
+    asset_id: int
+    amount_per_block: int
+    remaining: int
+    # last recorded or paid block
+    last_block_paid: int
+    # recorded, not yet settled. part of remaining
+    pending: int = 0
+
+    @property
+    def provable(self) -> int:
+        return self.remaining - self.pending
+
+
+@dataclasses.dataclass
+class Model:
+    """What the farm app account and its boxes should hold"""
+
+    balance: int
+    holdings: dict[int, int] = dataclasses.field(default_factory=dict)
+    farms: dict[int, ModelFarm] = dataclasses.field(default_factory=dict)
+    # keeper address bytes -> accrued IX rewards box value
+    ix_rewards: dict[bytes, int] = dataclasses.field(default_factory=dict)
+    # operational counter globals by name
+    counters: dict[str, int] = dataclasses.field(
+        default_factory=lambda: dict.fromkeys(COUNTERS, 0)
+    )
+    # swap_or_fail() calls per recipient app
+    swaps: Counter[int] = dataclasses.field(default_factory=Counter)
+
+    def remaining_blocks(self) -> int:
+        return sum(farm.remaining for farm in self.farms.values())
+
+    def txn_fuel(self) -> int:
+        """Recorded blocks moved their record share of the IX reward out already"""
+        pending = sum(farm.pending for farm in self.farms.values())
+        return self.remaining_blocks() * SPEND_PER_BLOCK - pending * RECORD_IX_REWARD
+
+    def min_balance(self, farms: int | None = None, assets: int | None = None) -> int:
+        farms = len(self.farms) if farms is None else farms
+        assets = len(self.holdings) if assets is None else assets
+        box_mbr = farms * FARM_BOX_MBR + len(self.ix_rewards) * IX_REWARDS_BOX_MBR
+        return ACCOUNT_MBR + assets * ASSET_MBR + box_mbr
+
+    def locked_balance(self) -> int:
+        return self.min_balance() + self.txn_fuel() + sum(self.ix_rewards.values())
+
+
+@dataclasses.dataclass
+class Stats:
+    ops: Counter[str] = dataclasses.field(default_factory=Counter)
+    # calls the contract rejected as the model expected
+    rejected: Counter[str] = dataclasses.field(default_factory=Counter)
+    calls: int = 0
+    checks: int = 0
+    blocks_paid: int = 0
+    rounds: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return sum(self.ops.values())
+
+    def ops_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        lines = [
+            f"{self.total} ops, {self.calls} calls, {self.checks} invariant checks "
+            f"in {self.elapsed:.1f}s: {self.ops_per_second():.0f} ops/s",
+            f"{self.rounds} rounds simulated, {self.blocks_paid} blocks paid",
+        ]
+        for name, count in sorted(self.ops.items()):
+            rejected = self.rejected[name]
+            lines.append(
+                f"  {name:<24} {count:>9}"
+                + (f"  ({rejected} rejected as expected)" if rejected else "")
+            )
+        return "\n".join(lines)
+
+
+class Harness:
+    def __init__(
+        self,
+        emulator: Emulator,
+        rng: random.Random,
+        *,
+        num_farms: int,
+        num_assets: int,
+        max_duration: int,
+        check_every: int = CHECK_EVERY,
+    ) -> None:
+        self.emu = emulator
+        self.chain = emulator.chain
+        self.rng = rng
+        self.max_duration = max_duration
+        self.check_every = check_every
+        self.stats = Stats()
+
+        self.assets: dict[int, algopy.Asset] = {}
+        for _ in range(num_assets):
+            asset = emulator.new_asset()
+            self.assets[int(asset.id)] = asset
+        self.apps: dict[int, algopy.Application] = {}
+        self.app_assets: dict[int, int] = {}
+        self.escrows: dict[str, int] = {}
+        for _ in range(num_farms):
+            asset_id = rng.choice(list(self.assets))
+            # 0.2% - 1% of online stake each
+            stake = int(self.chain.online_stake * rng.uniform(0.002, 0.01))
+            app = emulator.new_dualstake(self.assets[asset_id], stake)
+            app_id = int(app.id)
+            self.apps[app_id] = app
+            self.app_assets[app_id] = asset_id
+            self.escrows[str(app.address)] = app_id
+        # proposals per farmed app not yet known to be paid or out of the window
+        self.proposals: dict[int, list[int]] = {app_id: [] for app_id in self.apps}
+
+        self.creator = emulator.new_account()
+        self.keepers = [emulator.new_account() for _ in range(NUM_KEEPERS)]
+        # caller of the current operation's payouts and claims
+        self.keeper = self.keepers[0]
+        # enough to back the MBR of every box and opt in the run can need
+        self.model = Model(
+            balance=Model(0).min_balance(farms=num_farms, assets=num_assets)
+        )
+
+        self.operations: Sequence[tuple[Callable[[], bool], int]] = (
+            (self.create_farm, 4),
+            (self.create_existing_farm, 1),
+            (self.extend_duration_blocks, 2),
+            (self.extend_amount_per_block, 2),
+            (self.payout, 8),
+            (self.payout_many, 8),
+            (self.payout_batch, 4),
+            (self.record_proposals, 4),
+            (self.settle, 3),
+            (self.payout_unproposed, 1),
+            (self.withdraw_fees, 2),
+            (self.withdraw_fees_over, 1),
+            (self.claim_ix_rewards, 1),
+        )
+
+    # driver
+
+    def run(self, num_ops: int, progress_every: int = 0) -> Stats:
+        operations, weights = zip(*self.operations, strict=True)
+        start = time.perf_counter()
+        while self.stats.total < num_ops:
+            self.advance()
+            self.keeper = self.rng.choice(self.keepers)
+            operation = self.rng.choices(operations, weights)[0]
+            # operations return False when nothing applies in the current state
+            if not operation():
+                continue
+            if self.stats.total % self.check_every == 0:
+                self.check()
+            self.stats.elapsed = time.perf_counter() - start
+            if progress_every and self.stats.total % progress_every == 0:
+                logger.info(
+                    f"{self.stats.total} ops, {len(self.model.farms)} live farms, "
+                    f"{self.stats.ops_per_second():.0f} ops/s"
+                )
+        self.check()
+        self.stats.elapsed = time.perf_counter() - start
+        return self.stats
+
+    def advance(self) -> None:
+        rounds = self.rng.randint(0, 3)
+        for rnd, proposer in self.chain.advance(rounds):
+            app_id = self.escrows[proposer]
+            # idle escrows have nothing to pay. create_farm starts after them
+            if app_id in self.model.farms:
+                self.proposals[app_id].append(rnd)
+        self.stats.rounds += rounds
+
+    def call(
+        self,
+        name: str,
+        method: str,
+        *args: Any,
+        reject: bool = False,
+        **kwargs: Any,
+    ) -> Any:  # noqa: ANN401
+        """Call a method after mirroring the model balances into the emulator"""
+        model = self.model
+        self.emu.set_app_account(model.balance, model.min_balance(), model.holdings)
+        self.stats.calls += 1
+        try:
+            result = self.emu.call(method, *args, **kwargs)
+        except CallFailedError as e:
+            if not reject:
+                raise InvariantError(f"{name} failed unexpectedly: {e}") from e
+            self.stats.rejected[name] += 1
+            return None
+        if reject:
+            raise InvariantError(f"{name} succeeded but should have been rejected")
+        return result
+
+    def expect(self, what: str, actual: object, expected: object) -> None:
+        if actual != expected:
+            raise InvariantError(f"{what}: contract {actual!r}, model {expected!r}")
+
+    def expect_inner(self, name: str, algo_out: int, asset_out: dict[int, int]) -> None:
+        actual_algo, actual_assets = self.emu.inner_effects()
+        self.expect(f"{name} inner ALGO out", actual_algo, algo_out)
+        self.expect(
+            f"{name} inner asset out",
+            {k: v for k, v in actual_assets.items() if v},
+            {k: v for k, v in asset_out.items() if v},
+        )
+
+    # model helpers
+
+    def payable_rounds(self, farm: ModelFarm) -> list[int]:
+        """Rounds the farm escrow proposed that can still be paid, ascending"""
+        first = max(self.chain.first_provable(), farm.last_block_paid + 1)
+        rounds = [r for r in self.proposals[farm.app_id] if r >= first]
+        self.proposals[farm.app_id] = rounds
+        return rounds
+
+    def unproposed_round(self, farm: ModelFarm) -> int:
+        """An accessible round after the last paid one not proposed by the escrow"""
+        escrow = str(self.apps[farm.app_id].address)
+        first = max(self.chain.first_provable(), farm.last_block_paid + 1)
+        if first >= self.chain.first_valid:
+            return farm.last_block_paid
+        for _ in range(32):
+            rnd = self.rng.randrange(first, self.chain.first_valid)
+            if self.chain.proposers[rnd] != escrow:
+                return rnd
+        return farm.last_block_paid
+
+    def query_max_duration(self, app: algopy.Application, asset: algopy.Asset) -> int:
+        quote = self.call(
+            "get_algo_cost_and_max_duration",
+            "get_algo_cost_and_max_duration",
+            app,
+            asset,
+            algopy.UInt64(1),
+        )
+        self.expect("cost per block", int(quote.total_cost.as_uint64()), COST_PER_BLOCK)
+        return int(quote.max_duration.as_uint64())
+
+    def accrue_ix_rewards(self, reward: int) -> None:
+        # IX rewards accrue to the caller. a new box is funded from the reward
+        keeper = self.keeper.bytes.value
+        if keeper not in self.model.ix_rewards:
+            reward -= IX_REWARDS_BOX_MBR
+        self.model.ix_rewards[keeper] = self.model.ix_rewards.get(keeper, 0) + reward
+
+    def apply_payouts(
+        self,
+        name: str,
+        paid: dict[int, list[int]],
+        *,
+        call_swap: bool,
+        ix_reward: int = IX_REWARD,
+    ) -> None:
+        """Check the inner txns of a payout call and apply it to the model"""
+        algo_out = 0
+        asset_out: dict[int, int] = {}
+        total = 0
+        for app_id, rounds in paid.items():
+            farm = self.model.farms[app_id]
+            amount = farm.amount_per_block * len(rounds)
+            asset_out[farm.asset_id] = asset_out.get(farm.asset_id, 0) + amount
+            algo_out += MIN_TXN_FEE * (2 if call_swap else 1)
+            total += len(rounds)
+            if call_swap:
+                self.model.swaps[app_id] += 1
+        self.expect_inner(name, algo_out, asset_out)
+
+        self.accrue_ix_rewards(ix_reward * total)
+
+        self.model.balance -= algo_out
+        for asset_id, amount in asset_out.items():
+            self.model.holdings[asset_id] -= amount
+        for app_id, rounds in paid.items():
+            farm = self.model.farms[app_id]
+            farm.remaining -= len(rounds)
+            farm.last_block_paid = rounds[-1]
+            if not farm.remaining:
+                del self.model.farms[app_id]
+                self.model.counters["farms_expired"] += 1
+        self.stats.blocks_paid += total
+
+    # operations
+
+    def create_farm(self) -> bool:
+        idle = [app_id for app_id in self.apps if app_id not in self.model.farms]
+        if not idle:
+            return False
+        app_id = self.rng.choice(idle)
+        asset_id = self.app_assets[app_id]
+        app, asset = self.apps[app_id], self.assets[asset_id]
+        max_duration = self.query_max_duration(app, asset)
+        duration = self.rng.randint(1, min(max_duration, self.max_duration))
+        amount = self.rng.randint(1, MAX_AMOUNT_PER_BLOCK)
+        cost = COST_PER_BLOCK * duration
+
+        # MBR is not part of the payment. the ledger would reject a create the
+        # platform fees collected so far can not back
+        opted = asset_id in self.model.holdings
+        min_balance = self.model.min_balance(
+            farms=len(self.model.farms) + 1,
+            assets=len(self.model.holdings) + (0 if opted else 1),
+        )
+        if self.model.balance + cost < min_balance:
+            return False
+
+        self.call(
+            "create_farm",
+            "create_farm",
+            app,
+            asset,
+            algopy.UInt64(amount),
+            algopy.UInt64(duration),
+            sender=self.creator,
+            before=[self.emu.payment(self.creator, cost)],
+            after=[self.emu.asset_transfer(self.creator, asset, amount * duration)],
+        )
+        self.expect_inner("create_farm", 0, {})
+        self.model.balance += cost
+        self.model.holdings[asset_id] = (
+            self.model.holdings.get(asset_id, 0) + amount * duration
+        )
+        self.proposals[app_id] = []
+        self.model.farms[app_id] = ModelFarm(
+            app_id=app_id,
+            asset_id=asset_id,
+            amount_per_block=amount,
+            remaining=duration,
+            last_block_paid=self.chain.first_valid + 1,
+        )
+        self.model.counters["farms_created"] += 1
+        self.model.counters["blocks_funded"] += duration
+        self.stats.ops["create_farm"] += 1
+        return True
+
+    def create_existing_farm(self) -> bool:
+        if not self.model.farms:
+            return False
+        farm = self.rng.choice(list(self.model.farms.values()))
+        self.call(
+            "create_existing_farm",
+            "create_farm",
+            self.apps[farm.app_id],
+            self.assets[farm.asset_id],
+            algopy.UInt64(1),
+            algopy.UInt64(1),
+            sender=self.creator,
+            reject=True,
+        )
+        self.stats.ops["create_existing_farm"] += 1
+        return True
+
+    def extend_duration_blocks(self) -> bool:
+        if not self.model.farms:
+            return False
+        farm = self.rng.choice(list(self.model.farms.values()))
+        app, asset = self.apps[farm.app_id], self.assets[farm.asset_id]
+        allowed = self.query_max_duration(app, asset) - farm.remaining
+        if allowed < 1:
+            return False
+        duration = self.rng.randint(1, min(allowed, self.max_duration))
+        cost = COST_PER_BLOCK * duration
+        deposit = farm.amount_per_block * duration
+        self.call(
+            "extend_duration_blocks",
+            "extend_duration_blocks",
+            app,
+            algopy.UInt64(duration),
+            sender=self.creator,
+            before=[self.emu.payment(self.creator, cost)],
+            after=[self.emu.asset_transfer(self.creator, asset, deposit)],
+        )
+        self.expect_inner("extend_duration_blocks", 0, {})
+        self.model.balance += cost
+        self.model.holdings[farm.asset_id] += deposit
+        farm.remaining += duration
+        self.model.counters["farms_extended"] += 1
+        self.model.counters["blocks_funded"] += duration
+        self.stats.ops["extend_duration_blocks"] += 1
+        return True
+
+    def extend_amount_per_block(self) -> bool:
+        if not self.model.farms:
+            return False
+        farm = self.rng.choice(list(self.model.farms.values()))
+        amount = self.rng.randint(1, MAX_AMOUNT_PER_BLOCK)
+        deposit = amount * farm.remaining
+        self.call(
+            "extend_amount_per_block",
+            "extend_amount_per_block",
+            self.apps[farm.app_id],
+            algopy.UInt64(amount),
+            sender=self.creator,
+            after=[
+                self.emu.asset_transfer(
+                    self.creator, self.assets[farm.asset_id], deposit
+                )
+            ],
+        )
+        self.expect_inner("extend_amount_per_block", 0, {})
+        self.model.holdings[farm.asset_id] += deposit
+        farm.amount_per_block += amount
+        self.model.counters["farms_extended"] += 1
+        self.stats.ops["extend_amount_per_block"] += 1
+        return True
+
+    def _payable_farms(self) -> list[tuple[ModelFarm, list[int]]]:
+        return [
+            (farm, rounds)
+            for farm in self.model.farms.values()
+            if farm.provable and (rounds := self.payable_rounds(farm))
+        ]
+
+    def payout(self) -> bool:
+        payable = self._payable_farms()
+        if not payable:
+            return False
+        farm, rounds = self.rng.choice(payable)
+        # any payable round, skipped earlier ones are forfeited
+        rnd = self.rng.choice(rounds)
+        call_swap = self.rng.random() < 0.5
+        self.call(
+            "payout",
+            "payout",
+            self.apps[farm.app_id],
+            algopy.UInt64(rnd),
+            arc4.Bool(call_swap),
+            sender=self.keeper,
+        )
+        self.apply_payouts("payout", {farm.app_id: [rnd]}, call_swap=call_swap)
+        self.stats.ops["payout"] += 1
+        return True
+
+    def payout_many(self) -> bool:
+        payable = self._payable_farms()
+        if not payable:
+            return False
+        farm, rounds = self.rng.choice(payable)
+        count = self.rng.randint(
+            1, min(len(rounds), farm.provable, MAX_BLOCKS_PER_CALL)
+        )
+        paid = sorted(self.rng.sample(rounds, count))
+        call_swap = self.rng.random() < 0.5
+        self.call(
+            "payout_many",
+            "payout_many",
+            self.apps[farm.app_id],
+            arc4.DynamicArray[arc4.UInt64](*(arc4.UInt64(r) for r in paid)),
+            arc4.Bool(call_swap),
+            sender=self.keeper,
+        )
+        self.apply_payouts("payout_many", {farm.app_id: paid}, call_swap=call_swap)
+        self.stats.ops["payout_many"] += 1
+        return True
+
+    def payout_batch(self) -> bool:
+        payable = self._payable_farms()
+        if not payable:
+            return False
+        chosen = self.rng.sample(payable, min(len(payable), MAX_BATCH_FARMS))
+        items: list[tuple[int, int]] = []
+        paid: dict[int, list[int]] = {}
+        for farm, rounds in chosen:
+            count = self.rng.randint(
+                1, min(len(rounds), farm.provable, MAX_BLOCKS_PER_CALL)
+            )
+            farm_rounds = sorted(self.rng.sample(rounds, count))
+            paid[farm.app_id] = farm_rounds
+            farm_items = [(farm.app_id, r) for r in farm_rounds]
+            # rounds the escrow did not propose are skipped, not failed
+            if self.rng.random() < 0.3:
+                farm_items.insert(
+                    self.rng.randint(0, len(farm_items)),
+                    (farm.app_id, self.unproposed_round(farm)),
+                )
+            items.extend(farm_items)
+        idle = [app_id for app_id in self.apps if app_id not in self.model.farms]
+        if idle and self.rng.random() < 0.3:
+            items.append((self.rng.choice(idle), self.chain.round_))
+
+        call_swap = self.rng.random() < 0.5
+        total = self.call(
+            "payout_batch",
+            "payout_batch",
+            arc4.DynamicArray[PayoutItem](
+                *(
+                    PayoutItem(
+                        recipient_app=arc4.UInt64(app_id),
+                        block_round=arc4.UInt64(rnd),
+                    )
+                    for app_id, rnd in items
+                )
+            ),
+            arc4.Bool(call_swap),
+            sender=self.keeper,
+        )
+        self.expect(
+            "payout_batch blocks paid",
+            int(total.as_uint64()),
+            sum(len(r) for r in paid.values()),
+        )
+        self.apply_payouts("payout_batch", paid, call_swap=call_swap)
+        self.stats.ops["payout_batch"] += 1
+        return True
+
+    def record_proposals(self) -> bool:
+        payable = self._payable_farms()
+        if not payable:
+            return False
+        farm, rounds = self.rng.choice(payable)
+        count = self.rng.randint(
+            1, min(len(rounds), farm.provable, MAX_BLOCKS_PER_CALL)
+        )
+        recorded = sorted(self.rng.sample(rounds, count))
+        self.call(
+            "record_proposals",
+            "record_proposals",
+            self.apps[farm.app_id],
+            arc4.DynamicArray[arc4.UInt64](*(arc4.UInt64(r) for r in recorded)),
+            sender=self.keeper,
+        )
+        self.expect_inner("record_proposals", 0, {})
+        self.accrue_ix_rewards(RECORD_IX_REWARD * count)
+        farm.pending += count
+        farm.last_block_paid = recorded[-1]
+        self.stats.ops["record_proposals"] += 1
+        return True
+
+    def settle(self) -> bool:
+        pending = [farm for farm in self.model.farms.values() if farm.pending]
+        if not pending:
+            return False
+        farm = self.rng.choice(pending)
+        call_swap = self.rng.random() < 0.5
+        self.call(
+            "settle",
+            "settle",
+            self.apps[farm.app_id],
+            arc4.Bool(call_swap),
+            sender=self.keeper,
+        )
+        # pays the pending blocks as if proposed up to the last recorded one
+        self.apply_payouts(
+            "settle",
+            {farm.app_id: [farm.last_block_paid] * farm.pending},
+            call_swap=call_swap,
+            ix_reward=IX_REWARD - RECORD_IX_REWARD,
+        )
+        farm.pending = 0
+        self.stats.ops["settle"] += 1
+        return True
+
+    def payout_unproposed(self) -> bool:
+        if not self.model.farms:
+            return False
+        farm = self.rng.choice(list(self.model.farms.values()))
+        self.call(
+            "payout_unproposed",
+            "payout",
+            self.apps[farm.app_id],
+            algopy.UInt64(self.unproposed_round(farm)),
+            arc4.Bool(False),  # noqa: FBT003
+            sender=self.keeper,
+            reject=True,
+        )
+        self.stats.ops["payout_unproposed"] += 1
+        return True
+
+    def withdraw_fees(self) -> bool:
+        available = self.model.balance - self.model.locked_balance()
+        if available <= 0:
+            return False
+        amount = self.rng.randint(1, available)
+        self.call("withdraw_fees", "withdraw_fees", algopy.UInt64(amount))
+        self.expect_inner("withdraw_fees", amount, {})
+        self.model.balance -= amount
+        self.stats.ops["withdraw_fees"] += 1
+        return True
+
+    def withdraw_fees_over(self) -> bool:
+        available = max(0, self.model.balance - self.model.locked_balance())
+        amount = available + self.rng.randint(1, SPEND_PER_BLOCK)
+        self.call(
+            "withdraw_fees_over",
+            "withdraw_fees",
+            algopy.UInt64(amount),
+            reject=True,
+        )
+        self.stats.ops["withdraw_fees_over"] += 1
+        return True
+
+    def claim_ix_rewards(self) -> bool:
+        keeper = self.keeper.bytes.value
+        accrued = self.model.ix_rewards.get(keeper)
+        if accrued is None:
+            self.call(
+                "claim_ix_rewards",
+                "claim_ix_rewards",
+                sender=self.keeper,
+                reject=True,
+            )
+            self.stats.ops["claim_ix_rewards"] += 1
+            return True
+        amount = self.call("claim_ix_rewards", "claim_ix_rewards", sender=self.keeper)
+        expected = accrued + IX_REWARDS_BOX_MBR
+        self.expect("claim_ix_rewards amount", int(amount), expected)
+        self.expect_inner("claim_ix_rewards", expected, {})
+        del self.model.ix_rewards[keeper]
+        self.model.balance -= expected
+        self.stats.ops["claim_ix_rewards"] += 1
+        return True
+
+    # invariants
+
+    def check(self) -> None:
+        self.stats.checks += 1
+        model = self.model
+        remaining = model.remaining_blocks()
+        self.expect(
+            "global_remaining_blocks",
+            self.emu.global_uint("global_remaining_blocks"),
+            remaining,
+        )
+        self.expect("txn_fuel", self.emu.global_uint("txn_fuel"), model.txn_fuel())
+        self.expect(
+            "ix_accrued",
+            self.emu.global_uint("ix_accrued"),
+            sum(model.ix_rewards.values()),
+        )
+        for name, value in model.counters.items():
+            self.expect(name, self.emu.global_uint(name), value)
+        for keeper in self.keepers:
+            address = keeper.bytes.value
+            box = self.emu.box(IX_REWARDS_KEY_PREFIX + address)
+            accrued = model.ix_rewards.get(address)
+            self.expect(
+                f"ix rewards of {keeper}",
+                None if box is None else int.from_bytes(box, "big"),
+                accrued,
+            )
+
+        for app_id in self.apps:
+            self.expect(
+                f"swaps of {app_id}",
+                self.emu.dualstakes[app_id].swaps,
+                model.swaps[app_id],
+            )
+            box = self.emu.box(app_id.to_bytes(8, "big"))
+            farm = model.farms.get(app_id)
+            if farm is None:
+                self.expect(f"farm box {app_id}", box, None)
+                continue
+            if box is None:
+                raise InvariantError(f"farm box {app_id} missing")
+            state = decode_farm_box(app_id, box)
+            self.expect(
+                f"farm {app_id}",
+                (
+                    state.farm_asset,
+                    state.amount_per_block,
+                    state.remaining_duration_blocks,
+                    state.last_block_paid,
+                    state.pending_blocks,
+                ),
+                (
+                    farm.asset_id,
+                    farm.amount_per_block,
+                    farm.remaining,
+                    farm.last_block_paid,
+                    farm.pending,
+                ),
+            )
+
+        # the ledger would reject any group leaving the app below its min balance
+        self.expect(
+            "balance covers MBR",
+            model.balance >= model.min_balance(),
+            expected=True,
+        )
+        self.expect(
+            "balance covers locked",
+            model.balance >= model.locked_balance(),
+            expected=True,
+        )
+        for asset_id, holding in model.holdings.items():
+            owed = sum(
+                farm.amount_per_block * farm.remaining
+                for farm in model.farms.values()
+                if farm.asset_id == asset_id
+            )
+            self.expect(f"asset {asset_id} holdings cover farms", holding, owed)
@@ -0,0 +1,726 @@
+"""
+Local mock of the algod endpoints our tools use, backed by a SyntheticChain.
+
+Serves status, block headers, suggested params, the ledger supply, app globals,
+boxes, Tinyman pool local state and pending transactions, and accepts
+transaction groups, which confirm in the next round. payout, payout_many,
+record_proposals and settle calls are checked against the synthetic proposers
+and applied to the farm boxes, so the keeper runs against it unchanged. Recorded
+rounds count as paid in the reports. Simulate runs the proposer scans,
+log_states and the payout calls, priced with the build's cost model.
+
+    python -m simulation.mock_algod --farms 32 --rounds-per-second 50 --seed 1
+
+then start the keeper with ALGOD_SERVER=http://127.0.0.1 ALGOD_PORT=4001.
+"""
+
+import argparse
+import base64
+import dataclasses
+import json
+import logging
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import msgpack
+from algosdk import encoding
+from algosdk.abi import ABIType
+from algosdk.logic import get_application_address
+from algosdk.transaction import ApplicationCallTxn, SignedTransaction, Transaction
+
+from client.client import ABI_RETURN_PREFIX
+from client.spec import AppSpec
+from keeper.farms import PROOF_WINDOW, Farm, encode_farm_box
+from keeper.local import LocalAlgodError, apply_farm_call
+
+from .chain import ChainConfig, PoolConfig, Staker, SyntheticChain
+
+logger = logging.getLogger(__name__)
+
+GENESIS_ID = "mocknet-v1"
+GENESIS_HASH = bytes(32)
+CONSENSUS_VERSION = "future"
+MIN_FEE = 1000
+# algod answers wait-for-block-after after a minute even without a new round
+WAIT_TIMEOUT = 60.0
+# app ids of the generated network
+FARM_APP_ID = 1000
+TM2_APP_ID = 1001
+DUALSTAKE_APP_ID_BASE = 10_000
+POOL_APP_ID_BASE = 20_000
+FARM_ASSET_ID_BASE = 30_000
+# values the simulated read methods log
+_APP_IDS_TYPE = ABIType.from_string("uint64[]")
+_PROPOSAL_MATCH_TYPE = ABIType.from_string("(uint64,uint16)")
+
+
+class MockAlgodError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclasses.dataclass
+class MockApp:
+    global_state: dict[bytes, int | bytes] = dataclasses.field(default_factory=dict)
+    boxes: dict[bytes, bytes] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class MockStats:
+    groups: int = 0
+    rejected: int = 0
+    rounds_paid: int = 0
+
+
+def _teal_kv(state: dict[bytes, int | bytes]) -> list[dict[str, Any]]:
+    return [
+        {
+            "key": base64.b64encode(key).decode(),
+            "value": (
+                {"type": 1, "bytes": base64.b64encode(value).decode(), "uint": 0}
+                if isinstance(value, bytes)
+                else {"type": 2, "bytes": "", "uint": value}
+            ),
+        }
+        for key, value in state.items()
+    ]
+
+
+def _json_safe(value: Any) -> Any:  # noqa: ANN401
+    """algod JSON encodes byte fields as base64"""
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    return value
+
+
+class MockAlgod:
+    """
+    Ledger and clock of the mock. The round only moves with advance() or a
+    running clock. Every block up to the current round is served from the chain.
+    """
+
+    def __init__(
+        self,
+        chain: SyntheticChain,
+        *,
+        app_id: int = FARM_APP_ID,
+        start_round: int = PROOF_WINDOW + 1,
+        apps: dict[int, MockApp] | None = None,
+        pools: dict[tuple[str, int], int] | None = None,
+        farm_ids: list[int] | None = None,
+        spec: AppSpec | None = None,
+    ) -> None:
+        self.chain = chain
+        # the DualstakeFarm app. payout calls to it are applied
+        self.app_id = app_id
+        self.start_round = start_round
+        self.round = start_round
+        self.apps = apps or {}
+        # (pool account, pool app id) -> index of the pool in the chain config
+        self.pools = pools or {}
+        # recipient apps whose proposals farm_report follows
+        self.farm_ids = farm_ids or []
+        # methods and cost model of the farm app, for simulate
+        self.spec = spec or AppSpec.load()
+        self._methods = {m.get_selector(): m for m in self.spec.methods.values()}
+        self.stats = MockStats()
+        self.paid: dict[int, set[int]] = {app_id: set() for app_id in self.farm_ids}
+        # txid -> round the accepted group confirms in
+        self.confirmed_in: dict[str, int] = {}
+        self._round_at = time.monotonic()
+        self._lock = threading.Condition()
+        # the chain steps shared checkpoints, one request at a time
+        self._chain_lock = threading.Lock()
+
+    # clock
+
+    def advance(self, rounds: int = 1) -> int:
+        with self._lock:
+            self.round += rounds
+            self._round_at = time.monotonic()
+            self._lock.notify_all()
+            return self.round
+
+    def run_clock(self, rounds_per_second: float, stop: threading.Event) -> None:
+        """Advance one round every 1 / rounds_per_second seconds until stop."""
+        interval = 1 / rounds_per_second
+        next_at = time.monotonic()
+        while not stop.is_set():
+            next_at += interval
+            if not stop.wait(max(0.0, next_at - time.monotonic())):
+                self.advance()
+
+    def wait_for_round_after(self, rnd: int, timeout: float = WAIT_TIMEOUT) -> None:
+        with self._lock:
+            self._lock.wait_for(lambda: self.round > rnd, timeout)
+
+    # endpoints
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "last-round": self.round,
+                "last-version": CONSENSUS_VERSION,
+                "next-version": CONSENSUS_VERSION,
+                "next-version-round": self.round + 1,
+                "next-version-supported": True,
+                "time-since-last-round": int((time.monotonic() - self._round_at) * 1e9),
+                "catchup-time": 0,
+                "stopped-at-unsupported-round": False,
+            }
+
+    def block_header(self, rnd: int) -> dict[str, Any]:
+        if not 1 <= rnd <= self.round:
+            raise MockAlgodError(HTTPStatus.NOT_FOUND, f"no block {rnd}")
+        with self._chain_lock:
+            block = self.chain.block(rnd)
+        return {
+            "rnd": block.round_,
+            "ts": block.timestamp,
+            "prp": encoding.decode_address(block.proposer),
+            "bi": block.bonus,
+            "fc": block.fees_collected,
+            "pp": block.proposer_payout,
+            "gen": GENESIS_ID,
+            "gh": GENESIS_HASH,
+        }
+
+    def suggested_params(self) -> dict[str, Any]:
+        return {
+            "consensus-version": CONSENSUS_VERSION,
+            "fee": 0,
+            "genesis-hash": base64.b64encode(GENESIS_HASH).decode(),
+            "genesis-id": GENESIS_ID,
+            "last-round": self.round,
+            "min-fee": MIN_FEE,
+        }
+
+    def supply(self) -> dict[str, Any]:
+        online = self.chain.config.online_stake
+        return {
+            "current_round": self.round,
+            "online-money": online,
+            "total-money": online,
+        }
+
+    def _app(self, app_id: int) -> MockApp:
+        app = self.apps.get(app_id)
+        if app is None:
+            raise MockAlgodError(HTTPStatus.NOT_FOUND, "application does not exist")
+        return app
+
+    def application(self, app_id: int) -> dict[str, Any]:
+        with self._lock:
+            state = _teal_kv(self._app(app_id).global_state)
+        return {"id": app_id, "params": {"global-state": state}}
+
+    def box_names(self, app_id: int) -> dict[str, Any]:
+        with self._lock:
+            names = list(self._app(app_id).boxes)
+        return {"boxes": [{"name": base64.b64encode(name).decode()} for name in names]}
+
+    def box(self, app_id: int, name: bytes) -> dict[str, Any]:
+        with self._lock:
+            value = self._app(app_id).boxes.get(name)
+        if value is None:
+            raise MockAlgodError(HTTPStatus.NOT_FOUND, "box not found")
+        return {
+            "name": base64.b64encode(name).decode(),
+            "round": self.round,
+            "value": base64.b64encode(value).decode(),
+        }
+
+    def account_application(self, address: str, app_id: int) -> dict[str, Any]:
+        """Local state of a Tinyman pool account at the current round."""
+        index = self.pools.get((address, app_id))
+        if index is None:
+            raise MockAlgodError(HTTPStatus.NOT_FOUND, "account is not opted in")
+        with self._chain_lock:
+            pool = self.chain.pool(index, self.round)
+        state: dict[bytes, int | bytes] = {
+            b"asset_1_id": pool.asset_id,
+            b"asset_2_id": 0,
+            b"asset_1_reserves": pool.asset_reserves,
+            b"asset_2_reserves": pool.algo_reserves,
+        }
+        return {
+            "round": self.round,
+            "app-local-state": {"id": app_id, "key-value": _teal_kv(state)},
+        }
+
+    def send_group(self, raw: bytes) -> dict[str, Any]:
+        """Apply the farm calls of a group, all or nothing."""
+        signed = _decode_group(raw)
+        with self._lock:
+            app = self.apps.get(self.app_id)
+            boxes = dict(app.boxes) if app is not None else {}
+            paid = []
+            try:
+                for stxn in signed:
+                    txn = stxn.transaction
+                    if isinstance(txn, ApplicationCallTxn) and txn.index == self.app_id:
+                        result = apply_farm_call(txn, self.round, boxes, self._proposer)
+                        if result is not None:
+                            paid.append(result)
+            except LocalAlgodError as e:
+                self.stats.rejected += 1
+                raise MockAlgodError(
+                    HTTPStatus.BAD_REQUEST,
+                    f"transaction rejected: logic eval error: {e}",
+                ) from e
+            if app is not None:
+                app.boxes = boxes
+            self.stats.groups += 1
+            for stxn in signed:
+                self.confirmed_in[stxn.get_txid()] = self.round + 1
+            for farm_app_id, rounds in paid:
+                self.stats.rounds_paid += len(rounds)
+                self.paid.setdefault(farm_app_id, set()).update(rounds)
+        return {"txId": signed[0].get_txid()}
+
+    def pending_transaction(self, txid: str) -> dict[str, Any]:
+        with self._lock:
+            confirmed_in = self.confirmed_in.get(txid)
+            if confirmed_in is None:
+                raise MockAlgodError(HTTPStatus.NOT_FOUND, "txn does not exist")
+            confirmed = confirmed_in <= self.round
+        return {"confirmed-round": confirmed_in if confirmed else 0, "pool-error": ""}
+
+    def simulate(self, raw: bytes) -> dict[str, Any]:
+        """
+        Simulate groups of farm app calls against the farm boxes and the chain.
+        log_states, log_block_proposers and log_farm_proposals log what the
+        contract would. payout, payout_many, record_proposals and settle are
+        checked and applied to a copy of the boxes. Any other call fails the
+        group.
+
+        Opcode cost comes from the build's cost model: the method's cost plus
+        its per iteration cost for every array element and round it is passed.
+        The contract is not run, so the payout calls log nothing and make no
+        inner transactions.
+        """
+        request = msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        groups = []
+        with self._lock:
+            app = self.apps.get(self.app_id)
+            for group in request.get("txn-groups", []):
+                boxes = dict(app.boxes) if app is not None else {}
+                results = []
+                failure = None
+                for stxn in group["txns"]:
+                    try:
+                        # simulate takes unsigned transactions
+                        txn = Transaction.undictify(stxn["txn"])
+                        results.append(self._simulate_txn(txn, boxes))
+                    except (MockAlgodError, LocalAlgodError) as e:
+                        failure = (len(results), str(e))
+                        break
+                if failure is not None:
+                    index, message = failure
+                    results = [{"txn-result": {}} for _ in group["txns"]]
+                    groups.append(
+                        {
+                            "txn-results": results,
+                            "failure-message": f"transaction {index}: {message}",
+                            "failed-at": [index],
+                        }
+                    )
+                    continue
+                groups.append(
+                    {
+                        "txn-results": results,
+                        "app-budget-consumed": sum(
+                            r.get("app-budget-consumed", 0) for r in results
+                        ),
+                    }
+                )
+        return {"version": 2, "last-round": self.round, "txn-groups": groups}
+
+    def _simulate_txn(
+        self, txn: Transaction, boxes: dict[bytes, bytes]
+    ) -> dict[str, Any]:
+        if not isinstance(txn, ApplicationCallTxn) or txn.index != self.app_id:
+            return {"txn-result": {}}
+        selector = txn.app_args[0] if txn.app_args else b""
+        method = self._methods.get(selector)
+        if method is None:
+            raise MockAlgodError(HTTPStatus.BAD_REQUEST, "bare calls are not simulated")
+        args = {
+            arg.name: arg.type.decode(raw)
+            for arg, raw in zip(method.args, txn.app_args[1:], strict=False)
+            if isinstance(arg.type, ABIType)
+        }
+        logs: list[bytes] = []
+        state_changes = []
+        match method.name:
+            case "log_states":
+                # the farm boxes as stored, empty for app ids without a farm
+                logs = [
+                    boxes.get(app_id.to_bytes(8, "big"), b"")
+                    for app_id in args["box_names"]
+                ]
+            case "log_block_proposers":
+                logs = [
+                    encoding.decode_address(self._proposer(rnd))
+                    for rnd in _round_range(args)
+                ]
+            case "log_farm_proposals":
+                logs = self._farm_proposals(args)
+            case "payout" | "payout_many" | "record_proposals" | "settle":
+                result = apply_farm_call(txn, self.round, boxes, self._proposer)
+                assert result is not None
+                key = result[0].to_bytes(8, "big")
+                state_changes.append(_box_change(key, boxes.get(key)))
+            case _:
+                raise MockAlgodError(
+                    HTTPStatus.BAD_REQUEST, f"{method.name} is not simulated"
+                )
+
+        cost = self.spec.costs.get(method.name)
+        iterations = sum(len(v) for v in args.values() if isinstance(v, list))
+        if "start_round" in args:
+            iterations += len(_round_range(args))
+        return {
+            "txn-result": {"logs": [base64.b64encode(log).decode() for log in logs]},
+            "app-budget-consumed": (
+                cost.base + cost.per_item * iterations if cost else 0
+            ),
+            "exec-trace": {
+                "approval-program-trace": [{"pc": 0, "state-changes": state_changes}]
+            },
+        }
+
+    def _farm_proposals(self, args: dict[str, Any]) -> list[bytes]:
+        escrows = [get_application_address(app_id) for app_id in args["app_ids"]]
+        counts = [0] * len(escrows)
+        logs = []
+        for rnd in _round_range(args):
+            proposer = self._proposer(rnd)
+            if proposer in escrows:
+                index = escrows.index(proposer)
+                counts[index] += 1
+                logs.append(_PROPOSAL_MATCH_TYPE.encode([rnd, index]))
+        return [*logs, ABI_RETURN_PREFIX + _APP_IDS_TYPE.encode(counts)]
+
+    def _proposer(self, rnd: int) -> str:
+        return self.chain.proposer(rnd).address
+
+    # reporting
+
+    def farm_report(self) -> dict[int, dict[str, int]]:
+        """
+        Per farm since the start round: blocks proposed, paid, missed (out of
+        the proof window unpaid) and still payable.
+        """
+        with self._lock:
+            current = self.round
+            paid = {app_id: set(rounds) for app_id, rounds in self.paid.items()}
+        escrows = {get_application_address(app_id): app_id for app_id in self.farm_ids}
+        report = {
+            app_id: {"proposed": 0, "paid": 0, "missed": 0, "payable": 0}
+            for app_id in self.farm_ids
+        }
+        for rnd in range(self.start_round + 1, current + 1):
+            app_id = escrows.get(self._proposer(rnd))
+            if app_id is None:
+                continue
+            counts = report[app_id]
+            counts["proposed"] += 1
+            if rnd in paid.get(app_id, ()):
+                counts["paid"] += 1
+            elif rnd + PROOF_WINDOW <= current:
+                counts["missed"] += 1
+            else:
+                counts["payable"] += 1
+        return report
+
+
+def _round_range(args: dict[str, Any]) -> range:
+    return range(args["start_round"], args["end_round"] + 1)
+
+
+def _box_change(key: bytes, value: bytes | None) -> dict[str, Any]:
+    """A box write or delete, as simulate's exec trace reports it."""
+    change: dict[str, Any] = {
+        "app-state-type": "b",
+        "key": base64.b64encode(key).decode(),
+        "operation": "w" if value is not None else "d",
+    }
+    if value is not None:
+        change["new-value"] = {"type": 1, "bytes": base64.b64encode(value).decode()}
+    return change
+
+
+def _decode_group(raw: bytes) -> list[SignedTransaction]:
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    unpacker.feed(raw)
+    signed = [encoding.msgpack_decode(obj) for obj in unpacker]
+    if not signed:
+        raise MockAlgodError(HTTPStatus.BAD_REQUEST, "empty transaction group")
+    return signed
+
+
+def farm_network(
+    *,
+    seed: int = 0,
+    farms: int = 16,
+    farm_stake_share: float = 0.05,
+    assets: int = 4,
+    amount_per_block: int = 1_000_000,
+    duration_blocks: int = 1_000_000,
+    start_round: int = PROOF_WINDOW + 1,
+    config: ChainConfig | None = None,
+) -> MockAlgod:
+    """
+    A farm app with farms on dualstake apps whose escrows together hold
+    farm_stake_share of the online stake. Every farm asset has a Tinyman pool.
+    """
+    config = config or ChainConfig(seed=seed)
+    dualstake_ids = [DUALSTAKE_APP_ID_BASE + i for i in range(farms)]
+    stake = int(config.online_stake * farm_stake_share) // max(farms, 1)
+    pools = tuple(
+        PoolConfig(FARM_ASSET_ID_BASE + i, 10**13, 10**12) for i in range(assets)
+    )
+    chain = SyntheticChain(
+        dataclasses.replace(
+            config,
+            stakers=(
+                *config.stakers,
+                *(Staker(get_application_address(i), stake) for i in dualstake_ids),
+            ),
+            pools=(*config.pools, *pools),
+        )
+    )
+
+    farm_app = MockApp()
+    apps = {FARM_APP_ID: farm_app}
+    pool_accounts = {}
+    for index in range(len(config.pools), len(chain.config.pools)):
+        lp = get_application_address(POOL_APP_ID_BASE + index)
+        pool_accounts[(lp, TM2_APP_ID)] = index
+    lps = list(pool_accounts)
+    for i, app_id in enumerate(dualstake_ids):
+        asset = pools[i % assets].asset_id
+        lp, _ = lps[i % assets]
+        apps[app_id] = MockApp(
+            global_state={
+                b"asa_id": asset,
+                b"tm2_app_id": TM2_APP_ID,
+                b"lp_id": encoding.decode_address(lp),
+            }
+        )
+        farm = Farm(
+            app_id=app_id,
+            farm_asset=asset,
+            amount_per_block=amount_per_block,
+            remaining_duration_blocks=duration_blocks,
+            last_block_paid=start_round,
+        )
+        farm_app.boxes[app_id.to_bytes(8, "big")] = encode_farm_box(farm)
+    return MockAlgod(
+        chain,
+        app_id=FARM_APP_ID,
+        start_round=start_round,
+        apps=apps,
+        pools=pool_accounts,
+        farm_ids=dualstake_ids,
+    )
+
+
+# HTTP
+
+_ROUTES = [
+    ("GET", re.compile(r"/health"), "health"),
+    ("GET", re.compile(r"/v2/status"), "status"),
+    ("GET", re.compile(r"/v2/status/wait-for-block-after/(\d+)"), "wait"),
+    ("GET", re.compile(r"/v2/blocks/(\d+)"), "block"),
+    ("GET", re.compile(r"/v2/transactions/params"), "params"),
+    ("GET", re.compile(r"/v2/transactions/pending/(\w+)"), "pending"),
+    ("GET", re.compile(r"/v2/ledger/supply"), "supply"),
+    ("GET", re.compile(r"/v2/applications/(\d+)"), "application"),
+    ("GET", re.compile(r"/v2/applications/(\d+)/boxes"), "boxes"),
+    ("GET", re.compile(r"/v2/applications/(\d+)/box"), "box"),
+    ("GET", re.compile(r"/v2/accounts/(\w+)/applications/(\d+)"), "local_state"),
+    ("POST", re.compile(r"/v2/transactions"), "send"),
+    ("POST", re.compile(r"/v2/transactions/simulate"), "simulate"),
+]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], mock: MockAlgod) -> None:
+        super().__init__(address, _Handler)
+        self.mock = mock
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug(format, *args)
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            for route_method, pattern, name in _ROUTES:
+                match = pattern.fullmatch(url.path)
+                if match and route_method == method:
+                    self._handle(name, match.groups(), query, body)
+                    return
+            raise MockAlgodError(HTTPStatus.NOT_FOUND, f"{method} {url.path}")
+        except MockAlgodError as e:
+            self._send_json(e.status, {"message": str(e)})
+        except Exception as e:
+            logger.exception(f"{method} {self.path}")
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"message": repr(e)})
+
+    def _handle(
+        self, name: str, args: tuple[str, ...], query: dict[str, str], body: bytes
+    ) -> None:
+        mock = self.server.mock
+        match name:
+            case "health":
+                self._send_json(HTTPStatus.OK, {})
+            case "status":
+                self._send_json(HTTPStatus.OK, mock.status())
+            case "wait":
+                mock.wait_for_round_after(int(args[0]))
+                self._send_json(HTTPStatus.OK, mock.status())
+            case "block":
+                block = {"block": mock.block_header(int(args[0]))}
+                if query.get("format") == "msgpack":
+                    self._send(
+                        HTTPStatus.OK, msgpack.packb(block), "application/msgpack"
+                    )
+                else:
+                    self._send_json(HTTPStatus.OK, _json_safe(block))
+            case "params":
+                self._send_json(HTTPStatus.OK, mock.suggested_params())
+            case "pending":
+                self._send_json(HTTPStatus.OK, mock.pending_transaction(args[0]))
+            case "supply":
+                self._send_json(HTTPStatus.OK, mock.supply())
+            case "application":
+                self._send_json(HTTPStatus.OK, mock.application(int(args[0])))
+            case "boxes":
+                self._send_json(HTTPStatus.OK, mock.box_names(int(args[0])))
+            case "box":
+                encoding_name, _, value = query.get("name", "").partition(":")
+                if encoding_name != "b64":
+                    raise MockAlgodError(
+                        HTTPStatus.BAD_REQUEST, "box names must be b64: encoded"
+                    )
+                self._send_json(
+                    HTTPStatus.OK, mock.box(int(args[0]), base64.b64decode(value))
+                )
+            case "local_state":
+                self._send_json(
+                    HTTPStatus.OK, mock.account_application(args[0], int(args[1]))
+                )
+            case "send":
+                self._send_json(HTTPStatus.OK, mock.send_group(body))
+            case "simulate":
+                self._send_json(HTTPStatus.OK, mock.simulate(body))
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        self._send(status, json.dumps(body).encode(), "application/json")
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@contextmanager
+def serve(mock: MockAlgod, host: str = "127.0.0.1", port: int = 4001) -> Iterator[str]:
+    """Serve mock in a background thread. Yields the base URL."""
+    server = _Server((host, port), mock)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4001)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--farms", type=int, default=16)
+    parser.add_argument("--assets", type=int, default=4)
+    parser.add_argument(
+        "--farm-stake-share",
+        type=float,
+        default=0.05,
+        help="share of the online stake held by all farmed escrows together",
+    )
+    parser.add_argument("--rounds-per-second", type=float, default=10.0)
+    parser.add_argument("--round-time-ms", type=int, default=2800)
+    parser.add_argument("--round-time-jitter-ms", type=int, default=400)
+    parser.add_argument("--report-every", type=float, default=30.0)
+    args = parser.parse_args()
+
+    mock = farm_network(
+        seed=args.seed,
+        farms=args.farms,
+        farm_stake_share=args.farm_stake_share,
+        assets=args.assets,
+        config=ChainConfig(
+            seed=args.seed,
+            round_time_ms=args.round_time_ms,
+            round_time_jitter_ms=args.round_time_jitter_ms,
+        ),
+    )
+    stop = threading.Event()
+    clock = threading.Thread(
+        target=mock.run_clock, args=(args.rounds_per_second, stop), daemon=True
+    )
+    with serve(mock, args.host, args.port) as url:
+        logger.info(f"Mock algod on {url}, farm app {mock.app_id}")
+        clock.start()
+        try:
+            while True:
+                time.sleep(args.report_every)
+                logger.info(f"round {mock.round}: {mock.stats}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop.set()
+            clock.join()
+    totals = {"proposed": 0, "paid": 0, "missed": 0, "payable": 0}
+    for counts in mock.farm_report().values():
+        for key, value in counts.items():
+            totals[key] += value
+    print(json.dumps({"round": mock.round, **dataclasses.asdict(mock.stats), **totals}))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    main()
@@ -1,42 +1,68 @@
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from smart_contracts._helpers.build import build
-from smart_contracts._helpers.config import contracts
+from smart_contracts._helpers.build import build, compiler_version
+from smart_contracts._helpers.config import get_contracts
 
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
-)
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-# For manual script execution (bypassing `algokit project deploy`) with a custom .env,
-# modify `load_dotenv()` accordingly. For example, `load_dotenv('.env.localnet')`.
-load_dotenv()
 root_path = Path(__file__).parent
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def main(action: str, contract_name: str | None = None, *, force: bool = False) -> None:
     artifact_path = root_path / "artifacts"
 
     # Filter contracts if a specific contract name is provided
     filtered_contracts = [
-        c for c in contracts if contract_name is None or c.name == contract_name
+        c for c in get_contracts() if contract_name is None or c.name == contract_name
     ]
 
+    if action != "build":
+        logger.info("Loading .env")
+        # For manual script execution (bypassing `algokit project deploy`) with a
+        # custom .env, modify `load_dotenv()` accordingly. For example,
+        # `load_dotenv('.env.localnet')`.
+        load_dotenv()
+
     match action:
         case "build":
-            for contract in filtered_contracts:
+            if len(filtered_contracts) == 1:
+                contract = filtered_contracts[0]
                 logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+                build(artifact_path / contract.name, contract.path, force=force)
+                return
+            # independent contracts: one compiles while another generates its client
+            version = compiler_version()
+            with ProcessPoolExecutor() as pool:
+                futures = []
+                for contract in filtered_contracts:
+                    logger.info(f"Building app at {contract.path}")
+                    futures.append(
+                        pool.submit(
+                            build,
+                            artifact_path / contract.name,
+                            contract.path,
+                            force=force,
+                            version=version,
+                        )
+                    )
+                for future in futures:
+                    future.result()
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
+    logging.basicConfig(
+        level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    # --force rebuilds even when the build cache says a contract is up to date
+    force = "--force" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    if len(args) > 1:
+        main(args[0], args[1], force=force)
+    elif len(args) > 0:
+        main(args[0], force=force)
     else:
-        main("build")
+        main("build", force=force)
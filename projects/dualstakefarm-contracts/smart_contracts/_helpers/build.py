@@ -1,11 +1,66 @@
+import hashlib
 import logging
 import subprocess
 from pathlib import Path
 from shutil import rmtree
 
+from smart_contracts._helpers.cost_model import write_cost_model
+
 logger = logging.getLogger(__name__)
 deployment_extension = "ts"
 
+smart_contracts_path = Path(__file__).parent.parent
+# content hashes of the last successful build per contract. not committed
+cache_path = smart_contracts_path.parent / ".algokit" / "build-cache"
+# resolved once per process, main() passes it on to the build workers
+_compiler_version: str | None = None
+
+
+def compiler_version() -> str:
+    global _compiler_version
+    if _compiler_version is None:
+        result = subprocess.run(
+            ["algokit", "--no-color", "compile", "python", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        _compiler_version = result.stdout.strip()
+    return _compiler_version
+
+
+def source_hash(contract_path: Path, version: str | None = None) -> str:
+    """
+    Hash of everything that affects the build output: the contract folder,
+    the shared common/ modules, the build scripts and the compiler version.
+    """
+    files = sorted(contract_path.parent.rglob("*.py")) + sorted(
+        (smart_contracts_path / "common").rglob("*.py")
+    )
+    digest = hashlib.sha256()
+    helpers = [Path(__file__), Path(__file__).with_name("cost_model.py")]
+    for file in [*files, *helpers]:
+        digest.update(str(file.relative_to(smart_contracts_path)).encode())
+        digest.update(file.read_bytes())
+    digest.update((version or compiler_version()).encode())
+    digest.update(deployment_extension.encode())
+    return digest.hexdigest()
+
+
+def _cache_file(output_dir: Path) -> Path:
+    return cache_path / output_dir.name
+
+
+def _is_up_to_date(output_dir: Path, digest: str) -> bool:
+    cache_file = _cache_file(output_dir)
+    return (
+        cache_file.exists()
+        and cache_file.read_text() == digest
+        and any(output_dir.glob("*.arc32.json"))
+        and any(output_dir.glob(f"*.{deployment_extension}"))
+        and any(output_dir.glob("*.cost.json"))
+    )
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     return output_dir / Path(
@@ -15,8 +70,28 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def _app_spec_path(output_dir: Path) -> Path:
+    app_spec_file_name = next(
+        (file.name for file in output_dir.glob("*.arc32.json")), None
+    )
+    return output_dir / app_spec_file_name if app_spec_file_name else output_dir
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    *,
+    force: bool = False,
+    version: str | None = None,
+) -> Path:
     output_dir = output_dir.resolve()
+    digest = source_hash(contract_path, version)
+    if not force and _is_up_to_date(output_dir, digest):
+        logger.info(f"{contract_path} is up to date, skipping build")
+        return _app_spec_path(output_dir)
+    # invalidate first so a failed build is never mistaken for a cached one
+    _cache_file(output_dir).unlink(missing_ok=True)
+
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
@@ -31,6 +106,10 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             contract_path.absolute(),
             f"--out-dir={output_dir}",
             "--output-arc32",
+            "--no-output-arc56",
+            # keep the ARC-4 signatures of puyapy 4: apps, assets and accounts
+            # are passed as foreign array indexes
+            "--resource-encoding=index",
             "--output-source-map",
         ],
         stdout=subprocess.PIPE,
@@ -39,6 +118,8 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     )
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    for cost_model in write_cost_model(output_dir):
+        logger.info(f"Wrote opcode cost model {cost_model}")
 
     app_spec_file_names = [file.name for file in output_dir.glob("*.arc32.json")]
     app_spec_file_name = None
@@ -73,4 +154,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     f"Could not generate typed client:\n{generate_result.stdout}"
                 )
 
+    cache_path.mkdir(parents=True, exist_ok=True)
+    _cache_file(output_dir).write_text(digest)
+
     return output_dir / app_spec_file_name if app_spec_file_name else output_dir
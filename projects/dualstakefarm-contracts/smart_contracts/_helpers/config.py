@@ -2,20 +2,28 @@ import dataclasses
 import importlib
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeAlias
 
-from algokit_utils import Account, ApplicationSpecification
-from algosdk.v2client.algod import AlgodClient
-from algosdk.v2client.indexer import IndexerClient
+if TYPE_CHECKING:
+    from algokit_utils import Account, ApplicationSpecification
+    from algosdk.v2client.algod import AlgodClient
+    from algosdk.v2client.indexer import IndexerClient
 
+    DeployHook: TypeAlias = Callable[
+        [AlgodClient, IndexerClient, ApplicationSpecification, Account], None
+    ]
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(frozen=True)
 class SmartContract:
     path: Path
     name: str
-    deploy: (
-        Callable[[AlgodClient, IndexerClient, ApplicationSpecification, Account], None]
-        | None
-    ) = None
+    # dotted module path of deploy_config.py, imported only when deploy is used
+    deploy_module: str | None = None
+
+    @property
+    def deploy(self) -> "DeployHook | None":
+        return import_deploy(self.deploy_module) if self.deploy_module else None
 
 
 def import_contract(folder: Path) -> Path:
@@ -27,20 +35,18 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
-def import_deploy_if_exists(
-    folder: Path,
-) -> (
-    Callable[[AlgodClient, IndexerClient, ApplicationSpecification, Account], None]
-    | None
-):
-    """Imports the deploy function from a folder if it exists."""
-    try:
-        deploy_module = importlib.import_module(
-            f"{folder.parent.name}.{folder.name}.deploy_config"
-        )
-        return deploy_module.deploy  # type: ignore
-    except ImportError:
-        return None
+_deploy_hooks: "dict[str, DeployHook | None]" = {}
+
+
+def import_deploy(module_name: str) -> "DeployHook | None":
+    """Imports the deploy function from a deploy_config module."""
+    if module_name not in _deploy_hooks:
+        try:
+            deploy_module = importlib.import_module(module_name)
+            _deploy_hooks[module_name] = deploy_module.deploy  # type: ignore
+        except ImportError:
+            _deploy_hooks[module_name] = None
+    return _deploy_hooks[module_name]
 
 
 def has_contract_file(directory: Path) -> bool:
@@ -48,14 +54,29 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
+def deploy_module_if_exists(folder: Path) -> str | None:
+    """Module path of the folder's deploy_config.py, without importing it."""
+    if (folder / "deploy_config.py").exists():
+        return f"{folder.parent.name}.{folder.name}.deploy_config"
+    return None
+
+
 # define contracts to build and/or deploy
-base_dir = Path("smart_contracts")
-contracts = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in base_dir.iterdir()
-    if folder.is_dir() and has_contract_file(folder)
-]
+base_dir = Path(__file__).parent.parent
+_contracts: tuple[SmartContract, ...] | None = None
+
+
+def get_contracts() -> tuple[SmartContract, ...]:
+    """Manifest of contracts, discovered on first use by listing folders only."""
+    global _contracts
+    if _contracts is None:
+        _contracts = tuple(
+            SmartContract(
+                path=import_contract(folder),
+                name=folder.name,
+                deploy_module=deploy_module_if_exists(folder),
+            )
+            for folder in sorted(base_dir.iterdir())
+            if folder.is_dir() and has_contract_file(folder)
+        )
+    return _contracts
@@ -0,0 +1,442 @@
+"""
+Static opcode cost model of a compiled contract, read from its TEAL.
+
+Each subroutine and ABI method gets the cost of its most expensive path with
+every loop running zero times, and each loop its cost per iteration. A call
+that runs a loop n times costs at most cost + n * cost_per_iteration. Inner
+loops count as a single pass in the cost of the loop around them and are
+listed separately. Callees are included in the cost of the caller.
+Failing paths (err, failed asserts) are not counted.
+"""
+
+import dataclasses
+import functools
+import json
+import re
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypedDict
+
+# opcodes that do not cost 1 (AVM 11). ops with a per byte cost list the base
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 2500,
+    "ecdsa_pk_decompress": 2400,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "divmodw": 20,
+    "sqrt": 4,
+    "expw": 10,
+    "b+": 10,
+    "b-": 10,
+    "b/": 20,
+    "b*": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "bn256_add": 70,
+    "bn256_scalar_mul": 970,
+    "bn256_pairing": 8700,
+    "json_ref": 25,
+    "base64_decode": 1,
+    "mimc": 10,
+}
+# ops whose cost grows with their input, priced at OPCODE_COSTS above
+DYNAMIC_COST_OPS = {"json_ref", "base64_decode", "mimc", "ec_multi_scalar_mul"}
+BRANCH_OPS = {"b", "bz", "bnz", "switch", "match"}
+EXIT_OPS = {"return", "retsub"}
+TERMINAL_OPS = {"b", "return", "retsub", "err"}
+ROUTE_LABEL = re.compile(r"^main_(\w+)_route@\d+$")
+SOURCE_COMMENT = re.compile(r"^//\s*(\S+\.py:\d+(?:-\d+)?)$")
+
+
+class LoopDict(TypedDict):
+    subroutine: str
+    header: str
+    source: str | None
+    cost_per_iteration: int
+    inner_txns_per_iteration: int
+
+
+class CostDict(TypedDict):
+    cost: int
+    inner_txns: int
+    loops: list[LoopDict]
+    calls: list[str]
+
+
+class CostModelDict(TypedDict):
+    app_call_budget: int
+    dynamic_cost_ops: list[str]
+    methods: dict[str, CostDict]
+    subroutines: dict[str, CostDict]
+    clear: CostDict
+
+
+@dataclasses.dataclass
+class Block:
+    label: str
+    ops: list[list[str]] = dataclasses.field(default_factory=list)
+    # first source location commented in the block
+    source: str | None = None
+    # branch targets. falls_through adds the next block
+    targets: list[str] = dataclasses.field(default_factory=list)
+    falls_through: bool = True
+
+    @property
+    def is_exit(self) -> bool:
+        return bool(self.ops) and self.ops[-1][0] in EXIT_OPS
+
+    def callees(self) -> list[str]:
+        return [op[1] for op in self.ops if op[0] == "callsub"]
+
+
+@dataclasses.dataclass(frozen=True)
+class Loop:
+    subroutine: str
+    header: str
+    source: str | None
+    cost_per_iteration: int
+    inner_txns_per_iteration: int
+
+    def as_dict(self) -> LoopDict:
+        return {
+            "subroutine": self.subroutine,
+            "header": self.header,
+            "source": self.source,
+            "cost_per_iteration": self.cost_per_iteration,
+            "inner_txns_per_iteration": self.inner_txns_per_iteration,
+        }
+
+
+@dataclasses.dataclass(frozen=True)
+class Cost:
+    cost: int
+    inner_txns: int
+    loops: list[Loop]
+    calls: list[str]
+
+    def as_dict(self) -> CostDict:
+        return {
+            "cost": self.cost,
+            "inner_txns": self.inner_txns,
+            "loops": [loop.as_dict() for loop in self.loops],
+            "calls": self.calls,
+        }
+
+
+def _worst(best: tuple[int, int] | None, path: tuple[int, int]) -> tuple[int, int]:
+    """Highest cost and highest inner txn count of best and path."""
+    if best is None:
+        return path
+    return max(best[0], path[0]), max(best[1], path[1])
+
+
+def _is_label(target: str, label: str) -> bool:
+    return label == target
+
+
+def _split_op(line: str) -> list[str]:
+    """Op and immediates of a TEAL line, without its trailing comment."""
+    tokens: list[str] = []
+    i = 0
+    while i < len(line):
+        if line[i].isspace():
+            i += 1
+        elif line.startswith("//", i):
+            break
+        elif line[i] == '"':
+            end = i + 1
+            while end < len(line) and line[end] != '"':
+                end += 2 if line[end] == "\\" else 1
+            tokens.append(line[i : end + 1])
+            i = end + 1
+        else:
+            end = i
+            while end < len(line) and not line[end].isspace():
+                end += 1
+            tokens.append(line[i:end])
+            i = end
+    return tokens
+
+
+def parse_teal(teal: str) -> dict[str, Block]:
+    """Basic blocks by label, in program order. The first block is "main"."""
+    blocks: dict[str, Block] = {}
+    current = Block("main")
+    anonymous = 0
+
+    def close(block: Block) -> None:
+        # labels without ops are kept, they fall through to the next block
+        if block.ops or "~" not in block.label:
+            blocks[block.label] = block
+
+    for raw in teal.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#pragma"):
+            continue
+        if line.startswith("//"):
+            source = SOURCE_COMMENT.match(line)
+            if source and current.source is None:
+                current.source = source.group(1)
+            continue
+        if line.endswith(":") and " " not in line:
+            label = line[:-1]
+            if current.ops or current.label != "main":
+                close(current)
+            current = Block(label)
+            continue
+        op = _split_op(line)
+        current.ops.append(op)
+        if op[0] in BRANCH_OPS or op[0] in TERMINAL_OPS:
+            current.targets = op[1:] if op[0] in BRANCH_OPS else []
+            current.falls_through = op[0] not in TERMINAL_OPS
+            close(current)
+            anonymous += 1
+            current = Block(f"{current.label}~{anonymous}")
+    close(current)
+    return blocks
+
+
+class CostModel:
+    def __init__(self, blocks: dict[str, Block]) -> None:
+        self.blocks = blocks
+        self.order = list(blocks)
+        self._subroutines: dict[str, Cost] = {}
+
+    def successors(self, label: str) -> list[str]:
+        block = self.blocks[label]
+        succ = list(block.targets)
+        index = self.order.index(label)
+        if block.falls_through and index + 1 < len(self.order):
+            succ.append(self.order[index + 1])
+        return succ
+
+    def region(self, entry: str) -> set[str]:
+        """Blocks of the subroutine starting at entry."""
+        seen = {entry}
+        stack = [entry]
+        while stack:
+            for succ in self.successors(stack.pop()):
+                if succ not in seen:
+                    seen.add(succ)
+                    stack.append(succ)
+        return seen
+
+    def back_edges(self, entry: str) -> set[tuple[str, str]]:
+        back: set[tuple[str, str]] = set()
+        on_stack: set[str] = set()
+        done: set[str] = set()
+
+        def visit(label: str) -> None:
+            on_stack.add(label)
+            for succ in self.successors(label):
+                if succ in on_stack:
+                    back.add((label, succ))
+                elif succ not in done:
+                    visit(succ)
+            on_stack.discard(label)
+            done.add(label)
+
+        visit(entry)
+        return back
+
+    def block_cost(self, label: str) -> tuple[int, int]:
+        """Opcodes and inner transactions of a block, callees included."""
+        cost = 0
+        inner = 0
+        for op in self.blocks[label].ops:
+            cost += OPCODE_COSTS.get(op[0], 1)
+            if op[0] == "itxn_submit":
+                inner += 1
+            elif op[0] == "callsub":
+                callee = self.subroutine(op[1])
+                cost += callee.cost
+                inner += callee.inner_txns
+        return cost, inner
+
+    def _longest(
+        self,
+        start: str,
+        is_end: Callable[[str], bool],
+        allowed: set[str],
+        back: set[tuple[str, str]],
+    ) -> tuple[int, int] | None:
+        """
+        Highest cost and highest inner txn count over the paths from start to
+        an end block, or None when no end block is reachable.
+        """
+        memo: dict[str, tuple[int, int] | None] = {}
+
+        def walk(label: str) -> tuple[int, int] | None:
+            if label in memo:
+                return memo[label]
+            cost, inner = self.block_cost(label)
+            best: tuple[int, int] | None = (cost, inner) if is_end(label) else None
+            if best is None:
+                for succ in self.successors(label):
+                    if (label, succ) in back or succ not in allowed:
+                        continue
+                    rest = walk(succ)
+                    if rest is None:
+                        continue
+                    best = _worst(best, (cost + rest[0], inner + rest[1]))
+            memo[label] = best
+            return best
+
+        return walk(start)
+
+    def _loop_nodes(self, header: str, latch: str) -> set[str]:
+        nodes = {header, latch}
+        stack = [latch]
+        preds: dict[str, list[str]] = {}
+        for label in self.order:
+            for succ in self.successors(label):
+                preds.setdefault(succ, []).append(label)
+        while stack:
+            for pred in preds.get(stack.pop(), []):
+                if pred not in nodes:
+                    nodes.add(pred)
+                    stack.append(pred)
+        return nodes
+
+    def _loops(
+        self, owner: str, region: set[str], back: set[tuple[str, str]]
+    ) -> list[Loop]:
+        """Loops with their header in region, in program order."""
+        loops: list[Loop] = []
+        headers = {h for _, h in back if h in region}
+        for header in sorted(headers, key=self.order.index):
+            iteration: tuple[int, int] | None = None
+            for latch in (lt for lt, h in back if h == header):
+                nodes = self._loop_nodes(header, latch)
+                path = self._longest(
+                    header, functools.partial(_is_label, latch), nodes, back
+                )
+                if path is not None:
+                    iteration = _worst(iteration, path)
+            if iteration is not None:
+                loops.append(
+                    Loop(
+                        subroutine=owner,
+                        header=header,
+                        source=self.blocks[header].source,
+                        cost_per_iteration=iteration[0],
+                        inner_txns_per_iteration=iteration[1],
+                    )
+                )
+        return loops
+
+    def _callee_loops(self, calls: list[str], known: list[Loop]) -> list[Loop]:
+        """Loops of the callees not already in known, each listed once."""
+        loops: list[Loop] = []
+        for callee in calls:
+            for loop in self.subroutine(callee).loops:
+                if loop not in known and loop not in loops:
+                    loops.append(loop)
+        return loops
+
+    def subroutine(self, entry: str) -> Cost:
+        if entry in self._subroutines:
+            return self._subroutines[entry]
+        region = self.region(entry)
+        back = self.back_edges(entry)
+
+        def is_exit(label: str) -> bool:
+            return self.blocks[label].is_exit
+
+        base = self._longest(entry, is_exit, region, back) or (0, 0)
+        loops = self._loops(entry, region, back)
+        calls = sorted({c for label in region for c in self.blocks[label].callees()})
+        loops.extend(self._callee_loops(calls, loops))
+        cost = Cost(cost=base[0], inner_txns=base[1], loops=loops, calls=calls)
+        self._subroutines[entry] = cost
+        return cost
+
+    def routes(self) -> list[str]:
+        """Targets of the ARC-4 router, the match on the method selector."""
+        routes: list[str] = []
+        for label in sorted(self.region("main"), key=self.order.index):
+            ops = self.blocks[label].ops
+            for prev, op in zip(ops, ops[1:], strict=False):
+                if op[0] == "match" and prev == ["txna", "ApplicationArgs", "0"]:
+                    routes.extend(op[1:])
+        return routes
+
+    def method(self, route: str) -> Cost:
+        """
+        Routing from the program entry plus the route block to its exit. Loops
+        of a method body inlined into the router are listed under its route.
+        """
+        region = self.region("main")
+        back = self.back_edges("main")
+        to_route = self._longest(
+            "main", lambda label: label == route, region, back
+        ) or (0, 0)
+        route_cost = self.block_cost(route)
+        after = self._longest(
+            route, lambda label: self.blocks[label].is_exit, region, back
+        ) or (0, 0)
+        calls = sorted(
+            {c for label in self.region(route) for c in self.blocks[label].callees()}
+        )
+        loops = self._loops(route, self.region(route), back)
+        loops.extend(self._callee_loops(calls, loops))
+        return Cost(
+            cost=to_route[0] - route_cost[0] + after[0],
+            inner_txns=to_route[1] - route_cost[1] + after[1],
+            loops=loops,
+            calls=calls,
+        )
+
+
+def build_cost_model(approval_teal: str, clear_teal: str) -> CostModelDict:
+    approval = CostModel(parse_teal(approval_teal))
+    clear = CostModel(parse_teal(clear_teal))
+    methods: dict[str, CostDict] = {}
+    for label in approval.routes():
+        # puyapy 4 routes through main_<method>_route@<n> blocks. puyapy 5
+        # jumps to the method body, labelled with the method name
+        method = label
+        if ROUTE_LABEL.match(label):
+            method = label.removeprefix("main_").rsplit("_route@", 1)[0]
+        methods[method] = approval.method(label).as_dict()
+    subroutines = {
+        label: approval.subroutine(label).as_dict()
+        for label in approval.order
+        if any(label in block.callees() for block in approval.blocks.values())
+    }
+    return {
+        "app_call_budget": 700,
+        "dynamic_cost_ops": sorted(DYNAMIC_COST_OPS),
+        "methods": dict(sorted(methods.items())),
+        "subroutines": subroutines,
+        "clear": clear.subroutine("main").as_dict(),
+    }
+
+
+def write_cost_model(output_dir: Path) -> list[Path]:
+    """Write <Contract>.cost.json next to every approval program in output_dir."""
+    written = []
+    for approval in sorted(output_dir.glob("*.approval.teal")):
+        name = approval.name.removesuffix(".approval.teal")
+        clear = output_dir / f"{name}.clear.teal"
+        model = build_cost_model(approval.read_text(), clear.read_text())
+        path = output_dir / f"{name}.cost.json"
+        path.write_text(json.dumps(model, indent=2) + "\n")
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in write_cost_model(Path(sys.argv[1])):
+        print(path)
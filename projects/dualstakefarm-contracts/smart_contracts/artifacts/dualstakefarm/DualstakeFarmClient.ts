@@ -24,7 +24,7 @@ import { SendParams, SendSingleTransactionResult, SendAtomicTransactionComposerR
 import { Address, encodeAddress, modelsv2, OnApplicationComplete, Transaction, TransactionSigner } from 'algosdk'
 import SimulateResponse = modelsv2.SimulateResponse
 
-export const APP_SPEC: Arc56Contract = {"arcs":[],"name":"DualstakeFarm","structs":{"APRBreakdown":[{"name":"balance","type":"uint64"},{"name":"staked","type":"uint64"},{"name":"currentBlockBonus","type":"uint64"},{"name":"currentAvgBlockPayout","type":"uint64"},{"name":"currentFarmAmount","type":"uint64"},{"name":"currentFarmAmountAlgo","type":"uint64"},{"name":"overrideFarmAmount","type":"uint64"},{"name":"overrideFarmAmountAlgo","type":"uint64"},{"name":"avgRoundTime","type":"uint64"},{"name":"onlineStake","type":"uint64"},{"name":"expectedYearlyBlocks","type":"uint64"},{"name":"baseAprBps","type":"uint64"},{"name":"farmAprBps","type":"uint64"},{"name":"overrideFarmAprBps","type":"uint64"}],"AlgoCost":[{"name":"totalCost","type":"uint64"},{"name":"optinCost","type":"uint64"},{"name":"boxCost","type":"uint64"},{"name":"platformCost","type":"uint64"},{"name":"ixCost","type":"uint64"},{"name":"txnFeeCost","type":"uint64"}],"AlgoCostAndMaxDuration":[{"name":"totalCost","type":"uint64"},{"name":"optinCost","type":"uint64"},{"name":"boxCost","type":"uint64"},{"name":"platformCost","type":"uint64"},{"name":"ixCost","type":"uint64"},{"name":"txnFeeCost","type":"uint64"},{"name":"maxDuration","type":"uint64"}],"FarmState":[{"name":"farmAsset","type":"uint64"},{"name":"amountPerBlock","type":"uint64"},{"name":"remainingDurationBlocks","type":"uint64"},{"name":"lastBlockPaid","type":"uint64"}],"FarmStateAndAPR":[{"name":"balance","type":"uint64"},{"name":"staked","type":"uint64"},{"name":"currentBlockBonus","type":"uint64"},{"name":"currentAvgBlockPayout","type":"uint64"},{"name":"currentFarmAmount","type":"uint64"},{"name":"currentFarmAmountAlgo","type":"uint64"},{"name":"overrideFarmAmount","type":"uint64"},{"name":"overrideFarmAmountAlgo","type":"uint64"},{"name":"avgRoundTime","type":"uint64"},{"name":"onlineStake","type":"uint64"},{"name":"expectedYearlyBlocks","type":"uint64"},{"name":"baseAprBps","type":"uint64"},{"name":"farmAprBps","type":"uint64"},{"name":"overrideFarmAprBps","type":"uint64"},{"name":"farmAsset","type":"uint64"},{"name":"amountPerBlock","type":"uint64"},{"name":"remainingDurationBlocks","type":"uint64"},{"name":"lastBlockPaid","type":"uint64"}]},"methods":[{"name":"project_apr","args":[{"name":"recipient_app","type":"application"},{"name":"override_farm_amount","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"APRBreakdown"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_algo_cost","args":[{"name":"recipient_app","type":"application"},{"name":"farm_asset","type":"asset"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64)","struct":"AlgoCost"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_algo_cost_and_max_duration","args":[{"name":"recipient_app","type":"application"},{"name":"farm_asset","type":"asset"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"AlgoCostAndMaxDuration"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"create_farm","args":[{"name":"recipient_app","type":"application"},{"name":"farm_asset","type":"asset"},{"name":"amount_per_block","type":"uint64"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"extend_duration_blocks","args":[{"name":"recipient_app","type":"application"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"extend_amount_per_block","args":[{"name":"recipient_app","type":"application"},{"name":"amount_per_block","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"payout","args":[{"name":"recipient_app","type":"application"},{"name":"block_round","type":"uint64"},{"name":"call_swap","type":"bool"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"noop","args":[],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"withdraw_fees","args":[{"name":"amount","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"optout","args":[{"name":"asset","type":"asset"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"update_max_duration_days","args":[{"name":"max_duration","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"update_min_duration_blocks","args":[{"name":"min_duration","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_state","args":[{"name":"recipient_app","type":"application"}],"returns":{"type":"(uint64,uint64,uint64,uint64)","struct":"FarmState"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_states","args":[{"name":"box_names","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_state_and_apr","args":[{"name":"app_id","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"FarmStateAndAPR"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_states_and_aprs","args":[{"name":"app_ids","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_block_proposers","args":[{"name":"start_round","type":"uint64"},{"name":"end_round","type":"uint64"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}}],"state":{"schema":{"global":{"ints":40,"bytes":24},"local":{"ints":0,"bytes":0}},"keys":{"global":{"global_remaining_blocks":{"key":"Z2xvYmFsX3JlbWFpbmluZ19ibG9ja3M=","keyType":"AVMString","valueType":"AVMUint64"},"ix_pb":{"key":"aXhfcGI=","keyType":"AVMString","valueType":"AVMUint64"},"manager":{"key":"bWFuYWdlcg==","keyType":"AVMString","valueType":"AVMBytes"},"max_duration_days":{"key":"bWF4X2R1cmF0aW9uX2RheXM=","keyType":"AVMString","valueType":"AVMUint64"},"min_duration_blocks":{"key":"bWluX2R1cmF0aW9uX2Jsb2Nrcw==","keyType":"AVMString","valueType":"AVMUint64"},"plat_fee_pb":{"key":"cGxhdF9mZWVfcGI=","keyType":"AVMString","valueType":"AVMUint64"},"txn_fee_pb":{"key":"dHhuX2ZlZV9wYg==","keyType":"AVMString","valueType":"AVMUint64"},"txn_fuel":{"key":"dHhuX2Z1ZWw=","keyType":"AVMString","valueType":"AVMUint64"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDEgMCA4IDEwMDAwCiAgICBieXRlY2Jsb2NrICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIgInR4bl9mdWVsIiAweCAweDE1MWY3Yzc1ICJtYW5hZ2VyIiAweDAwMDAwMDAwMDAwMDAwMDAgIkVSUjpOTyBGQVJNIiAibWF4X2R1cmF0aW9uX2RheXMiICJtaW5fZHVyYXRpb25fYmxvY2tzIiAiaXhfcGIiICJwbGF0X2ZlZV9wYiIgInR4bl9mZWVfcGIiIDB4NjE3MzYxNWY2OTY0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjEKICAgIC8vIHNlbGYubWFuYWdlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjIDQgLy8gIm1hbmFnZXIiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTIzCiAgICAvLyBzZWxmLnR4bl9mdWVsID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJ0eG5fZnVlbCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI0CiAgICAvLyBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI2CiAgICAvLyBzZWxmLm1heF9kdXJhdGlvbl9kYXlzID0gVUludDY0KERFRkFVTFRfTUFYX0RVUkFUSU9OX0RBWVMpCiAgICBieXRlYyA3IC8vICJtYXhfZHVyYXRpb25fZGF5cyIKICAgIHB1c2hpbnQgNDUgLy8gNDUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjcKICAgIC8vIHNlbGYubWluX2R1cmF0aW9uX2Jsb2NrcyA9IFVJbnQ2NChERUZBVUxUX01JTl9EVVJBVElPTl9CTE9DS1MpCiAgICBieXRlYyA4IC8vICJtaW5fZHVyYXRpb25fYmxvY2tzIgogICAgcHVzaGludCAzMCAvLyAzMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gc2VsZi5peF9wYiA9IFVJbnQ2NChJWF9SRVdBUkRTX1BFUl9CTE9DSykKICAgIGJ5dGVjIDkgLy8gIml4X3BiIgogICAgcHVzaGludCAxMDAgLy8gMTAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMwCiAgICAvLyBzZWxmLnBsYXRfZmVlX3BiID0gVUludDY0KFBMQVRGT1JNX0ZFRV9QRVJfQkxPQ0spCiAgICBieXRlYyAxMCAvLyAicGxhdF9mZWVfcGIiCiAgICBwdXNoaW50IDk3IC8vIDk3CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMxCiAgICAvLyBzZWxmLnR4bl9mZWVfcGIgPSBVSW50NjQoVFhOX0ZFRV9QRVJfQkxPQ0spCiAgICBieXRlYyAxMSAvLyAidHhuX2ZlZV9wYiIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AyMgogICAgcHVzaGJ5dGVzcyAweGYzZGIwNGQ5IDB4MDgzNjIxNzggMHg1ZDY0Y2JkMCAweDc0NTg1ZGNlIDB4MDI5MGI4MjAgMHgwOTI4OTdkMyAweDlhMTRhODRmIDB4ZTgzYTg3YWIgMHgwZDEzMTc1MSAweDdjY2JlNzI2IDB4ZTlkODI3Y2MgMHhlMDgwNDhmYyAweDE1ZDY5ZWZjIDB4YzhhMDY1NGIgMHhjMDVkMDdlYyAweDViZWYxYjkyIDB4ZDI5OWYyYTAgLy8gbWV0aG9kICJwcm9qZWN0X2FwcihhcHBsaWNhdGlvbix1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfYWxnb19jb3N0KGFwcGxpY2F0aW9uLGFzc2V0LHVpbnQ2NCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfYWxnb19jb3N0X2FuZF9tYXhfZHVyYXRpb24oYXBwbGljYXRpb24sYXNzZXQsdWludDY0KSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJjcmVhdGVfZmFybShhcHBsaWNhdGlvbixhc3NldCx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgImV4dGVuZF9kdXJhdGlvbl9ibG9ja3MoYXBwbGljYXRpb24sdWludDY0KXZvaWQiLCBtZXRob2QgImV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrKGFwcGxpY2F0aW9uLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJwYXlvdXQoYXBwbGljYXRpb24sdWludDY0LGJvb2wpdm9pZCIsIG1ldGhvZCAibm9vcCgpdm9pZCIsIG1ldGhvZCAid2l0aGRyYXdfZmVlcyh1aW50NjQpdm9pZCIsIG1ldGhvZCAib3B0b3V0KGFzc2V0KXZvaWQiLCBtZXRob2QgInVwZGF0ZV9tYXhfZHVyYXRpb25fZGF5cyh1aW50NjQpdm9pZCIsIG1ldGhvZCAidXBkYXRlX21pbl9kdXJhdGlvbl9ibG9ja3ModWludDY0KXZvaWQiLCBtZXRob2QgImdldF9zdGF0ZShhcHBsaWNhdGlvbikodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAibG9nX3N0YXRlcyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfc3RhdGVfYW5kX2Fwcih1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAibG9nX3N0YXRlc19hbmRfYXBycyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJsb2dfYmxvY2tfcHJvcG9zZXJzKHVpbnQ2NCx1aW50NjQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fcHJvamVjdF9hcHJfcm91dGVANSBtYWluX2dldF9hbGdvX2Nvc3Rfcm91dGVANiBtYWluX2dldF9hbGdvX2Nvc3RfYW5kX21heF9kdXJhdGlvbl9yb3V0ZUA3IG1haW5fY3JlYXRlX2Zhcm1fcm91dGVAOCBtYWluX2V4dGVuZF9kdXJhdGlvbl9ibG9ja3Nfcm91dGVAOSBtYWluX2V4dGVuZF9hbW91bnRfcGVyX2Jsb2NrX3JvdXRlQDEwIG1haW5fcGF5b3V0X3JvdXRlQDExIG1haW5fbm9vcF9yb3V0ZUAxMiBtYWluX3dpdGhkcmF3X2ZlZXNfcm91dGVAMTMgbWFpbl9vcHRvdXRfcm91dGVAMTQgbWFpbl91cGRhdGVfbWF4X2R1cmF0aW9uX2RheXNfcm91dGVAMTUgbWFpbl91cGRhdGVfbWluX2R1cmF0aW9uX2Jsb2Nrc19yb3V0ZUAxNiBtYWluX2dldF9zdGF0ZV9yb3V0ZUAxNyBtYWluX2xvZ19zdGF0ZXNfcm91dGVAMTggbWFpbl9nZXRfc3RhdGVfYW5kX2Fwcl9yb3V0ZUAxOSBtYWluX2xvZ19zdGF0ZXNfYW5kX2FwcnNfcm91dGVAMjAgbWFpbl9sb2dfYmxvY2tfcHJvcG9zZXJzX3JvdXRlQDIxCgptYWluX2FmdGVyX2lmX2Vsc2VAMjY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIGludGNfMSAvLyAwCiAgICByZXR1cm4KCm1haW5fbG9nX2Jsb2NrX3Byb3Bvc2Vyc19yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBsb2dfYmxvY2tfcHJvcG9zZXJzCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2xvZ19zdGF0ZXNfYW5kX2FwcnNfcm91dGVAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE1LTExOQogICAgLy8gY2xhc3MgRHVhbHN0YWtlRmFybSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTEsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKGdsb2JhbF91aW50cz00MCwgZ2xvYmFsX2J5dGVzPTI0KSwKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgbG9nX3N0YXRlc19hbmRfYXBycwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfc3RhdGVfYW5kX2Fwcl9yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfc3RhdGVfYW5kX2FwcgogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9sb2dfc3RhdGVzX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGxvZ19zdGF0ZXMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3N0YXRlX3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTY1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3N0YXRlCiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZV9taW5fZHVyYXRpb25fYmxvY2tzX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTYwCiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTYwCiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIHVwZGF0ZV9taW5fZHVyYXRpb25fYmxvY2tzCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZV9tYXhfZHVyYXRpb25fZGF5c19yb3V0ZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU1NQogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU1NQogICAgLy8gQGFiaW1ldGhvZAogICAgY2FsbHN1YiB1cGRhdGVfbWF4X2R1cmF0aW9uX2RheXMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fb3B0b3V0X3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTQ0CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NDQKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgb3B0b3V0CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X2ZlZXNfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MjgKICAgIC8vIEBhYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE1LTExOQogICAgLy8gY2xhc3MgRHVhbHN0YWtlRmFybSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTEsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKGdsb2JhbF91aW50cz00MCwgZ2xvYmFsX2J5dGVzPTI0KSwKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MjgKICAgIC8vIEBhYmltZXRob2QKICAgIGNhbGxzdWIgd2l0aGRyYXdfZmVlcwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9ub29wX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTI0CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcGF5b3V0X3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDU0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE1LTExOQogICAgLy8gY2xhc3MgRHVhbHN0YWtlRmFybSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTEsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKGdsb2JhbF91aW50cz00MCwgZ2xvYmFsX2J5dGVzPTI0KSwKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ1NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHBheW91dAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9leHRlbmRfYW1vdW50X3Blcl9ibG9ja19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQzMAogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDMwCiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2V4dGVuZF9kdXJhdGlvbl9ibG9ja3Nfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzg5CiAgICAvLyBAYWJpbWV0aG9kCiAgICBjYWxsc3ViIGV4dGVuZF9kdXJhdGlvbl9ibG9ja3MKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2Zhcm1fcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMzNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMzNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9mYXJtCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hbGdvX2Nvc3RfYW5kX21heF9kdXJhdGlvbl9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjg4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYWxnb19jb3N0X2FuZF9tYXhfZHVyYXRpb24KICAgIGJ5dGVjXzMgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2FsZ29fY29zdF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjgyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNS0xMTkKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYWxnb19jb3N0CiAgICBieXRlY18zIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3Byb2plY3RfYXByX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyNDcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE1LTExOQogICAgLy8gY2xhc3MgRHVhbHN0YWtlRmFybSgKICAgIC8vICAgICBBUkM0Q29udHJhY3QsCiAgICAvLyAgICAgYXZtX3ZlcnNpb249MTEsCiAgICAvLyAgICAgc3RhdGVfdG90YWxzPVN0YXRlVG90YWxzKGdsb2JhbF91aW50cz00MCwgZ2xvYmFsX2J5dGVzPTI0KSwKICAgIC8vICk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI0NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBwcm9qZWN0X2FwcgogICAgYnl0ZWNfMyAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHN3aXRjaCBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDI1IG1haW5fYWZ0ZXJfaWZfZWxzZUAyNiBtYWluX2FmdGVyX2lmX2Vsc2VAMjYgbWFpbl9hZnRlcl9pZl9lbHNlQDI2IG1haW5fdXBkYXRlQDIzIG1haW5fZGVsZXRlQDI0CiAgICBiIG1haW5fYWZ0ZXJfaWZfZWxzZUAyNgoKbWFpbl9kZWxldGVAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzcKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz0oIkRlbGV0ZUFwcGxpY2F0aW9uIiwpKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGRlbGV0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzMKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz0oIlVwZGF0ZUFwcGxpY2F0aW9uIiwpKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAyNToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbW1vbi5zZW5kLmF4ZmVyKGFzc2V0OiB1aW50NjQsIHJlY2VpdmVyOiBieXRlcywgYW1vdW50OiB1aW50NjQsIGZlZTogdWludDY0KSAtPiB2b2lkOgpheGZlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weToxOC0xOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBheGZlcihhc3NldDogQXNzZXQsIHJlY2VpdmVyOiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCwgZmVlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weToyMC0yMgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsIGFzc2V0X3JlY2VpdmVyPXJlY2VpdmVyLCBhc3NldF9hbW91bnQ9YW1vdW50LCBmZWU9ZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6MjAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjIwLTIyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwgYXNzZXRfcmVjZWl2ZXI9cmVjZWl2ZXIsIGFzc2V0X2Ftb3VudD1hbW91bnQsIGZlZT1mZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6MjMKICAgIC8vIHJldHVybgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbW1vbi5zZW5kLmFsZ29fcGF5KHJlY2VpdmVyOiBieXRlcywgYW1vdW50OiB1aW50NjQsIGZlZTogdWludDY0KSAtPiB2b2lkOgphbGdvX3BheToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weTozOC0zOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhbGdvX3BheShyZWNlaXZlcjogQWNjb3VudCwgYW1vdW50OiBVSW50NjQsIGZlZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6NDAKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1yZWNlaXZlciwgYW1vdW50PWFtb3VudCwgZmVlPWZlZSkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18wIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weTo0MQogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29tbW9uLnZhbGlkYXRlLmF4ZmVyX2Ftb3VudF9leGFjdChheGZlcl90eG5faWQ6IHVpbnQ2NCwgZXhwZWN0ZWRfYXNzZXQ6IHVpbnQ2NCwgZXhwZWN0ZWRfYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CmF4ZmVyX2Ftb3VudF9leGFjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MjYtMjkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXhmZXJfYW1vdW50X2V4YWN0KAogICAgLy8gICAgIGF4ZmVyX3R4bl9pZDogVUludDY0LCBleHBlY3RlZF9hc3NldDogQXNzZXQsIGV4cGVjdGVkX2Ftb3VudDogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MTcKICAgIC8vIGF4ZmVyX3R4biA9IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uKGF4ZmVyX3R4bl9pZHgpCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weToxOAogICAgLy8gY3VzdG9tLmVuc3VyZShheGZlcl90eG4ueGZlcl9hc3NldCA9PSBleHBlY3RlZF9hc3NldCwgUygiRVJSOkFYRkVSIElEIikpCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZnJhbWVfZGlnIC0yCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGF4ZmVyX2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MTgKICAgIC8vIGN1c3RvbS5lbnN1cmUoYXhmZXJfdHhuLnhmZXJfYXNzZXQgPT0gZXhwZWN0ZWRfYXNzZXQsIFMoIkVSUjpBWEZFUiBJRCIpKQogICAgcHVzaGJ5dGVzICJFUlI6QVhGRVIgSUQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmF4ZmVyX2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjIwCiAgICAvLyBheGZlcl90eG4uYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogYXhmZXJfYW1vdW50X2V4YWN0X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weToyMQogICAgLy8gUygiRVJSOkFYRkVSIFJDViIpLAogICAgcHVzaGJ5dGVzICJFUlI6QVhGRVIgUkNWIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpheGZlcl9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weToyMwogICAgLy8gcmV0dXJuIGF4ZmVyX3R4bi5hc3NldF9hbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MzEKICAgIC8vIGF4ZmVyKGF4ZmVyX3R4bl9pZCwgZXhwZWN0ZWRfYXNzZXQpID49IGV4cGVjdGVkX2Ftb3VudCwgUygiRVJSOkFYRkVSIEFNVCIpCiAgICBmcmFtZV9kaWcgLTEKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogYXhmZXJfYW1vdW50X2V4YWN0X2FmdGVyX2lmX2Vsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MzEKICAgIC8vIGF4ZmVyKGF4ZmVyX3R4bl9pZCwgZXhwZWN0ZWRfYXNzZXQpID49IGV4cGVjdGVkX2Ftb3VudCwgUygiRVJSOkFYRkVSIEFNVCIpCiAgICBwdXNoYnl0ZXMgIkVSUjpBWEZFUiBBTVQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmF4ZmVyX2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDExOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbW1vbi52YWxpZGF0ZS5wYXltZW50X2Ftb3VudF9leGFjdChwYXltZW50X3R4bl9pZHg6IHVpbnQ2NCwgZXhwZWN0ZWRfYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CnBheW1lbnRfYW1vdW50X2V4YWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTo1MC01MQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBwYXltZW50X2Ftb3VudF9leGFjdChwYXltZW50X3R4bl9pZHg6IFVJbnQ2NCwgZXhwZWN0ZWRfYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MzcKICAgIC8vIHBheV90eG4gPSBndHhuLlBheW1lbnRUcmFuc2FjdGlvbih0eG5faWR4KQogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTozOQogICAgLy8gcGF5X3R4bi5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcGF5bWVudF9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjQwCiAgICAvLyBTKCJFUlI6UEFZIFJDViIpLAogICAgcHVzaGJ5dGVzICJFUlI6UEFZIFJDViIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcGF5bWVudF9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTo0MgogICAgLy8gcmV0dXJuIHBheV90eG4uYW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTo1MgogICAgLy8gY3VzdG9tLmVuc3VyZShwYXltZW50KHBheW1lbnRfdHhuX2lkeCkgPT0gZXhwZWN0ZWRfYW1vdW50LCBTKCJFUlI6UEFZIEFNVCIpKQogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHBheW1lbnRfYW1vdW50X2V4YWN0X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTo1MgogICAgLy8gY3VzdG9tLmVuc3VyZShwYXltZW50KHBheW1lbnRfdHhuX2lkeCkgPT0gZXhwZWN0ZWRfYW1vdW50LCBTKCJFUlI6UEFZIEFNVCIpKQogICAgcHVzaGJ5dGVzICJFUlI6UEFZIEFNVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcGF5bWVudF9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUA3OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbW1vbi5yb3VuZF90aW1lLmdldF9yb3VuZF90aW1lKG1pbl9yb3VuZF9zYW1wbGU6IHVpbnQ2NCkgLT4gdWludDY0LCB1aW50NjQ6CmdldF9yb3VuZF90aW1lOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjIyLTIzCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9yb3VuZF90aW1lKG1pbl9yb3VuZF9zYW1wbGU6IFVJbnQ2NCkgLT4gUm91bmRUaW1lRnJhY3Rpb246CiAgICBwcm90byAxIDIKICAgIGJ5dGVjXzIgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjI0CiAgICAvLyBmaXJzdF9hY2Nlc3NpYmxlID0gbWF0aC5zYWZlX3N1YnRyYWN0KFR4bi5sYXN0X3ZhbGlkLCBVSW50NjQoMTAwMSksIFVJbnQ2NCgxKSkKICAgIHR4biBMYXN0VmFsaWQKICAgIGludGNfMCAvLyAxCiAgICB0eG4gTGFzdFZhbGlkCiAgICBwdXNoaW50IDEwMDEgLy8gMTAwMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjE0CiAgICAvLyByZXR1cm4gYSAtIGIgaWYgYSA+IGIgZWxzZSBkZWZhdWx0CiAgICA+CiAgICBieiBnZXRfcm91bmRfdGltZV90ZXJuYXJ5X2ZhbHNlQDUKICAgIGZyYW1lX2RpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MjQKICAgIC8vIGZpcnN0X2FjY2Vzc2libGUgPSBtYXRoLnNhZmVfc3VidHJhY3QoVHhuLmxhc3RfdmFsaWQsIFVJbnQ2NCgxMDAxKSwgVUludDY0KDEpKQogICAgcHVzaGludCAxMDAxIC8vIDEwMDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weToxNAogICAgLy8gcmV0dXJuIGEgLSBiIGlmIGEgPiBiIGVsc2UgZGVmYXVsdAogICAgLQogICAgZnJhbWVfYnVyeSAwCgpnZXRfcm91bmRfdGltZV90ZXJuYXJ5X21lcmdlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MjUKICAgIC8vIGxhc3RfYWNjZXNzaWJsZSA9IFR4bi5maXJzdF92YWxpZCAtIFVJbnQ2NCgxKQogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weToyNgogICAgLy8gaWYgZmlyc3RfYWNjZXNzaWJsZSA+IFVJbnQ2NCgxKToKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzAgLy8gMQogICAgPgogICAgYnogZ2V0X3JvdW5kX3RpbWVfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MjgKICAgIC8vIGxhc3RfYWNjZXNzaWJsZSAtIGZpcnN0X2FjY2Vzc2libGUgPj0gbWluX3JvdW5kX3NhbXBsZSwKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgLQogICAgZnJhbWVfZGlnIC0xCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGdldF9yb3VuZF90aW1lX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjI5CiAgICAvLyBTKCJFUlI6QkxLIFJOR0UiKSwKICAgIHB1c2hieXRlcyAiRVJSOkJMSyBSTkdFIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpnZXRfcm91bmRfdGltZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MzEKICAgIC8vIGJsb2NrX2RlbHRhID0gbGFzdF9hY2Nlc3NpYmxlIC0gZmlyc3RfYWNjZXNzaWJsZQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjMyCiAgICAvLyB0c19kZWx0YSA9IG9wLkJsb2NrLmJsa190aW1lc3RhbXAobGFzdF9hY2Nlc3NpYmxlKSAtIG9wLkJsb2NrLmJsa190aW1lc3RhbXAoCiAgICBzd2FwCiAgICBibG9jayBCbGtUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTozMi0zNAogICAgLy8gdHNfZGVsdGEgPSBvcC5CbG9jay5ibGtfdGltZXN0YW1wKGxhc3RfYWNjZXNzaWJsZSkgLSBvcC5CbG9jay5ibGtfdGltZXN0YW1wKAogICAgLy8gICAgIGZpcnN0X2FjY2Vzc2libGUKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgYmxvY2sgQmxrVGltZXN0YW1wCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MzUKICAgIC8vIHJldHVybiBSb3VuZFRpbWVGcmFjdGlvbihkdD10c19kZWx0YSwgZHI9YmxvY2tfZGVsdGEpCiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2J1cnkgMQogICAgcmV0c3ViCgpnZXRfcm91bmRfdGltZV90ZXJuYXJ5X2ZhbHNlQDU6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGdldF9yb3VuZF90aW1lX3Rlcm5hcnlfbWVyZ2VANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0udXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMzLTEzNAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPSgiVXBkYXRlQXBwbGljYXRpb24iLCkpCiAgICAvLyBkZWYgdXBkYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNQogICAgLy8gc2VsZi5lbnN1cmVfbWFuYWdlcl9jYWxsZXIoKQogICAgY2FsbHN1YiBlbnN1cmVfbWFuYWdlcl9jYWxsZXIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZGVsZXRlKCkgLT4gdm9pZDoKZGVsZXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM3LTEzOAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICAvLyBkZWYgZGVsZXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzOQogICAgLy8gc2VsZi5lbnN1cmVfbWFuYWdlcl9jYWxsZXIoKQogICAgY2FsbHN1YiBlbnN1cmVfbWFuYWdlcl9jYWxsZXIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uY2FsY190bV9kZW5vbShhMTogdWludDY0LCBhMjogdWludDY0LCB2OiB1aW50NjQsIGFtb3VudDogdWludDY0KSAtPiB1aW50NjQ6CmNhbGNfdG1fZGVub206CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDEtMTQ0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGNfdG1fZGVub20oCiAgICAvLyAgICAgc2VsZiwgYTE6IFVJbnQ2NCwgYTI6IFVJbnQ2NCwgdjogVUludDY0LCBhbW91bnQ6IFVJbnQ2NAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gcmV0dXJuIG9wLmJ0b2koKEIoYTEpICogQihhMikgLy8gQih2ICsgZ2V0X3RtMl9uZXRfYW10KGFtb3VudCkpKS5ieXRlcykKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBiKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjkKICAgIC8vIHJldHVybiBhbXQgLSAoVUludDY0KDMwKSAqIGFtdCAvLyBVSW50NjQoMTAwMDApKQogICAgcHVzaGludCAzMCAvLyAzMAogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICBpbnRjXzMgLy8gMTAwMDAKICAgIC8KICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ1CiAgICAvLyByZXR1cm4gb3AuYnRvaSgoQihhMSkgKiBCKGEyKSAvLyBCKHYgKyBnZXRfdG0yX25ldF9hbXQoYW1vdW50KSkpLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBpdG9iCiAgICBiLwogICAgYnRvaQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldCh0bTI6IHVpbnQ2NCwgdG1hOiBieXRlcywgZmFybV9hbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0Ny0xNTMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X3RpbnltYW5fYWxnb19wcmljZV9mb3JfYXNzZXQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB0bTI6IEFwcGxpY2F0aW9uLAogICAgLy8gICAgIHRtYTogQWNjb3VudCwKICAgIC8vICAgICBmYXJtX2Ftb3VudDogVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gYWlkMSwgZXhpc3RzMSA9IG9wLkFwcExvY2FsLmdldF9leF91aW50NjQodG1hLCB0bTIsIGIiYXNzZXRfMV9pZCIpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMwogICAgcHVzaGJ5dGVzIDB4NjE3MzczNjU3NDVmMzE1ZjY5NjQKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gYTEsIGV4aXN0czIgPSBvcC5BcHBMb2NhbC5nZXRfZXhfdWludDY0KHRtYSwgdG0yLCBiImFzc2V0XzFfcmVzZXJ2ZXMiKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTMKICAgIHB1c2hieXRlcyAweDYxNzM3MzY1NzQ1ZjMxNWY3MjY1NzM2NTcyNzY2NTczCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBjb3ZlciAyCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNTYKICAgIC8vIGEyLCBleGlzdHMzID0gb3AuQXBwTG9jYWwuZ2V0X2V4X3VpbnQ2NCh0bWEsIHRtMiwgYiJhc3NldF8yX3Jlc2VydmVzIikKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0zCiAgICBwdXNoYnl0ZXMgMHg2MTczNzM2NTc0NWYzMjVmNzI2NTczNjU3Mjc2NjU3MwogICAgYXBwX2xvY2FsX2dldF9leAogICAgY292ZXIgMgogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTU3CiAgICAvLyBjdXN0b20uZW5zdXJlKGV4aXN0czEgYW5kIGV4aXN0czIgYW5kIGV4aXN0czMsIFMoIkVSUjpUTSBTVFQiKSkKICAgIGJ6IGdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0X2Jvb2xfZmFsc2VANAogICAgZnJhbWVfZGlnIDEKICAgIGJ6IGdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0X2Jvb2xfZmFsc2VANAogICAgZnJhbWVfZGlnIDMKICAgIGJ6IGdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0X2Jvb2xfZmFsc2VANAogICAgaW50Y18wIC8vIDEKCmdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0X2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNTcKICAgIC8vIGN1c3RvbS5lbnN1cmUoZXhpc3RzMSBhbmQgZXhpc3RzMiBhbmQgZXhpc3RzMywgUygiRVJSOlRNIFNUVCIpKQogICAgcHVzaGJ5dGVzICJFUlI6VE0gU1RUIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTU5CiAgICAvLyBpZiBhaWQxICE9IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAwCiAgICBieiBnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTYwCiAgICAvLyByZXQgPSBhMiAtIHNlbGYuY2FsY190bV9kZW5vbShhMSwgYTIsIGExLCBmYXJtX2Ftb3VudCkgLSBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGNhbGNfdG1fZGVub20KICAgIC0KICAgIGludGNfMCAvLyAxCiAgICAtCgpnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNjMKICAgIC8vIHJldHVybiByZXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gcmV0ID0gYTEgLSBzZWxmLmNhbGNfdG1fZGVub20oYTEsIGEyLCBhMiwgZmFybV9hbW91bnQpIC0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY2FsY190bV9kZW5vbQogICAgLQogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGIgZ2V0X3RpbnltYW5fYWxnb19wcmljZV9mb3JfYXNzZXRfYWZ0ZXJfaWZfZWxzZUA4CgpnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9ib29sX2ZhbHNlQDQ6CiAgICBpbnRjXzEgLy8gMAogICAgYiBnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldF9ib29sX21lcmdlQDUKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLl9wcm9qZWN0X2FwcihyZWNpcGllbnRfYXBwOiB1aW50NjQsIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpfcHJvamVjdF9hcHI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNjUtMTY4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9wcm9qZWN0X2FwcigKICAgIC8vICAgICBzZWxmLCByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbiwgb3ZlcnJpZGVfZmFybV9hbW91bnQ6IFVJbnQ2NAogICAgLy8gKSAtPiBBUFJCcmVha2Rvd246CiAgICBwcm90byAyIDEKICAgIGludGNfMSAvLyAwCiAgICBkdXBuIDExCiAgICBieXRlY18yIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gdG0yX2FwcF9pZCwgZXhpc3RzMiA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHJlY2lwaWVudF9hcHAsIGIidG0yX2FwcF9pZCIpCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hieXRlcyAweDc0NmQzMjVmNjE3MDcwNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTcwCiAgICAvLyB0bTJfbHBfYWRkciwgZXhpc3RzMyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMocmVjaXBpZW50X2FwcCwgYiJscF9pZCIpCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hieXRlcyAweDZjNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNzIKICAgIC8vIGFzYV9pZCwgZXhpc3RzMSA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHJlY2lwaWVudF9hcHAsIGIiYXNhX2lkIikKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWMgMTIgLy8gMHg2MTczNjE1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gc3Rha2VkLCBleGlzdHM0ID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocmVjaXBpZW50X2FwcCwgYiJzdGFrZWQiKQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoYnl0ZXMgMHg3Mzc0NjE2YjY1NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBjb3ZlciAyCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNzQKICAgIC8vIGN1c3RvbS5lbnN1cmUoZXhpc3RzMSBhbmQgZXhpc3RzMiBhbmQgZXhpc3RzMyBhbmQgZXhpc3RzNCwgUygiRVJSOkRTIFNUVCIpKQogICAgYnogX3Byb2plY3RfYXByX2Jvb2xfZmFsc2VANQogICAgZnJhbWVfZGlnIDE2CiAgICBieiBfcHJvamVjdF9hcHJfYm9vbF9mYWxzZUA1CiAgICBmcmFtZV9kaWcgMTgKICAgIGJ6IF9wcm9qZWN0X2Fwcl9ib29sX2ZhbHNlQDUKICAgIGZyYW1lX2RpZyAyMAogICAgYnogX3Byb2plY3RfYXByX2Jvb2xfZmFsc2VANQogICAgaW50Y18wIC8vIDEKCl9wcm9qZWN0X2Fwcl9ib29sX21lcmdlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogX3Byb2plY3RfYXByX2FmdGVyX2lmX2Vsc2VAMjYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE3NAogICAgLy8gY3VzdG9tLmVuc3VyZShleGlzdHMxIGFuZCBleGlzdHMyIGFuZCBleGlzdHMzIGFuZCBleGlzdHM0LCBTKCJFUlI6RFMgU1RUIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpEUyBTVFQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCl9wcm9qZWN0X2Fwcl9hZnRlcl9pZl9lbHNlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTc2CiAgICAvLyBmYXJtX2Ftb3VudCA9IFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE3NwogICAgLy8gaWYgcmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zOgogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfcHJvamVjdF9hcHJfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNzgKICAgIC8vIGZhcm1fYW1vdW50ID0gc2VsZi5mYXJtc1tyZWNpcGllbnRfYXBwXS5hbW91bnRfcGVyX2Jsb2NrLm5hdGl2ZQogICAgZnJhbWVfZGlnIDYKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZhcm1zIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDEzCgpfcHJvamVjdF9hcHJfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTgxLTE4NQogICAgLy8gc2VsZi5nZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldCgKICAgIC8vICAgICBBcHBsaWNhdGlvbih0bTJfYXBwX2lkKSwgQWNjb3VudCh0bTJfbHBfYWRkciksIGZhcm1fYW1vdW50CiAgICAvLyApCiAgICAvLyBpZiBmYXJtX2Ftb3VudCA+IFVJbnQ2NCgwKQogICAgLy8gZWxzZSBVSW50NjQoMCkKICAgIGZyYW1lX2RpZyAxMwogICAgYnogX3Byb2plY3RfYXByX3Rlcm5hcnlfZmFsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gQXBwbGljYXRpb24odG0yX2FwcF9pZCksIEFjY291bnQodG0yX2xwX2FkZHIpLCBmYXJtX2Ftb3VudAogICAgZnJhbWVfZGlnIDE5CiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTgxLTE4MwogICAgLy8gc2VsZi5nZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldCgKICAgIC8vICAgICBBcHBsaWNhdGlvbih0bTJfYXBwX2lkKSwgQWNjb3VudCh0bTJfbHBfYWRkciksIGZhcm1fYW1vdW50CiAgICAvLyApCiAgICBmcmFtZV9kaWcgMTcKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAxMwogICAgY2FsbHN1YiBnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2Zvcl9hc3NldAogICAgZnJhbWVfYnVyeSAxNAoKX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxODktMTkzCiAgICAvLyBzZWxmLmdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0KAogICAgLy8gICAgIEFwcGxpY2F0aW9uKHRtMl9hcHBfaWQpLCBBY2NvdW50KHRtMl9scF9hZGRyKSwgb3ZlcnJpZGVfZmFybV9hbW91bnQKICAgIC8vICkKICAgIC8vIGlmIG92ZXJyaWRlX2Zhcm1fYW1vdW50ID4gVUludDY0KDApCiAgICAvLyBlbHNlIFVJbnQ2NCgwKQogICAgZnJhbWVfZGlnIC0xCiAgICBieiBfcHJvamVjdF9hcHJfdGVybmFyeV9mYWxzZUAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTkwCiAgICAvLyBBcHBsaWNhdGlvbih0bTJfYXBwX2lkKSwgQWNjb3VudCh0bTJfbHBfYWRkciksIG92ZXJyaWRlX2Zhcm1fYW1vdW50CiAgICBmcmFtZV9kaWcgMTkKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxODktMTkxCiAgICAvLyBzZWxmLmdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0KAogICAgLy8gICAgIEFwcGxpY2F0aW9uKHRtMl9hcHBfaWQpLCBBY2NvdW50KHRtMl9scF9hZGRyKSwgb3ZlcnJpZGVfZmFybV9hbW91bnQKICAgIC8vICkKICAgIGZyYW1lX2RpZyAxNwogICAgc3dhcAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGdldF90aW55bWFuX2FsZ29fcHJpY2VfZm9yX2Fzc2V0CiAgICBmcmFtZV9idXJ5IDE1CgpfcHJvamVjdF9hcHJfdGVybmFyeV9tZXJnZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE5Ni0xOTcKICAgIC8vICMgYmFsYW5jZSBpcyBzdGFrZWQrZmVlcy4gVXNlIHRoaXMgdG8gY2FsY3VsYXRlIGJsb2NrcyAobm9tIGluICUgb2Ygb25saW5lKQogICAgLy8gYmFsYW5jZSA9IHJlY2lwaWVudF9hcHAuYWRkcmVzcy5iYWxhbmNlCiAgICBmcmFtZV9kaWcgLTIKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxOTgKICAgIC8vIHRvdGFsX29ubGluZV9zdGFrZSA9IEJpZ1VJbnQob3Aub25saW5lX3N0YWtlKCkpCiAgICBvbmxpbmVfc3Rha2UKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjAwCiAgICAvLyBjdXJyZW50X2Jsb2NrX3Jld2FyZHMgPSBvcC5CbG9jay5ibGtfYm9udXMoVHhuLmZpcnN0X3ZhbGlkIC0gVUludDY0KDEpKQogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBibG9jayBCbGtCb251cwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjAzCiAgICAvLyBydF9mcmFjdGlvbiA9IHJvdW5kX3RpbWUuZ2V0X3JvdW5kX3RpbWUoVUludDY0KE1JTl9ST1VORF9TQU1QTEUpKQogICAgcHVzaGludCA1MDAgLy8gNTAwCiAgICBjYWxsc3ViIGdldF9yb3VuZF90aW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMDQKICAgIC8vIGF2Z19yb3VuZF90aW1lID0gVUludDY0KDEwMDAwKSAqIHJ0X2ZyYWN0aW9uLmR0IC8vIHJ0X2ZyYWN0aW9uLmRyCiAgICBpbnRjXzMgLy8gMTAwMDAKICAgIGRpZyAyCiAgICAqCiAgICBkaWcgMQogICAgLwogICAgZnJhbWVfYnVyeSAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjA2CiAgICAvLyBVSW50NjQoODY0MDApICogVUludDY0KDM2NSkgKiBydF9mcmFjdGlvbi5kciAvLyBydF9mcmFjdGlvbi5kdAogICAgcHVzaGludCAzMTUzNjAwMCAvLyAzMTUzNjAwMAogICAgKgogICAgc3dhcAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjA1LTIwNwogICAgLy8gZ2xvYmFsX3llYXJseV9ibG9ja3NfcHJvZHVjZWQgPSBCaWdVSW50KAogICAgLy8gICAgIFVJbnQ2NCg4NjQwMCkgKiBVSW50NjQoMzY1KSAqIHJ0X2ZyYWN0aW9uLmRyIC8vIHJ0X2ZyYWN0aW9uLmR0CiAgICAvLyApCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMTAKICAgIC8vIGdsb2JhbF95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkICogYmFsYW5jZSAvLyB0b3RhbF9vbmxpbmVfc3Rha2UKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIGIqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMDktMjExCiAgICAvLyBvd25feWVhcmx5X2Jsb2Nrc19wcm9kdWNlZCA9ICgKICAgIC8vICAgICBnbG9iYWxfeWVhcmx5X2Jsb2Nrc19wcm9kdWNlZCAqIGJhbGFuY2UgLy8gdG90YWxfb25saW5lX3N0YWtlCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjIxMAogICAgLy8gZ2xvYmFsX3llYXJseV9ibG9ja3NfcHJvZHVjZWQgKiBiYWxhbmNlIC8vIHRvdGFsX29ubGluZV9zdGFrZQogICAgYi8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjIwOS0yMTEKICAgIC8vIG93bl95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkID0gKAogICAgLy8gICAgIGdsb2JhbF95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkICogYmFsYW5jZSAvLyB0b3RhbF9vbmxpbmVfc3Rha2UKICAgIC8vICkKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMTMKICAgIC8vIGJhc2VfcmV3YXJkcyA9IChjdXJyZW50X2Jsb2NrX3Jld2FyZHMpICogb3duX3llYXJseV9ibG9ja3NfcHJvZHVjZWQKICAgIHN3YXAKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfYnVyeSA4CiAgICBiKgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMTUKICAgIC8vIFVJbnQ2NCgxMDAwMCkgKiBiYXNlX3Jld2FyZHMgLy8gc3Rha2VkIGlmIHN0YWtlZCA+IFVJbnQ2NCgwKSBlbHNlIEJpZ1VJbnQoMCkKICAgIGZyYW1lX2RpZyAyMQogICAgYnogX3Byb2plY3RfYXByX3Rlcm5hcnlfZmFsc2VAMTYKICAgIGludGNfMyAvLyAxMDAwMAogICAgaXRvYgogICAgZnJhbWVfZGlnIDEKICAgIGIqCiAgICBmcmFtZV9kaWcgMjEKICAgIGl0b2IKICAgIGIvCiAgICBmcmFtZV9idXJ5IDAKCl9wcm9qZWN0X2Fwcl90ZXJuYXJ5X21lcmdlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjE4CiAgICAvLyBmYXJtX3Jld2FyZHMgPSAoZmFybV9hbW91bnRfYWxnbykgKiBvd25feWVhcmx5X2Jsb2Nrc19wcm9kdWNlZAogICAgZnJhbWVfZGlnIDE0CiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgOQogICAgZnJhbWVfZGlnIDUKICAgIGIqCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjIyMAogICAgLy8gVUludDY0KDEwMDAwKSAqIGZhcm1fcmV3YXJkcyAvLyBzdGFrZWQgaWYgc3Rha2VkID4gVUludDY0KDApIGVsc2UgQmlnVUludCgwKQogICAgZnJhbWVfZGlnIDIxCiAgICBieiBfcHJvamVjdF9hcHJfdGVybmFyeV9mYWxzZUAxOQogICAgaW50Y18zIC8vIDEwMDAwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMwogICAgYioKICAgIGZyYW1lX2RpZyAyMQogICAgaXRvYgogICAgYi8KICAgIGZyYW1lX2J1cnkgMgoKX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMjMKICAgIC8vIG92ZXJyaWRlX2Zhcm1fcmV3YXJkcyA9IChvdmVycmlkZV9mYXJtX2Ftb3VudF9hbGdvKSAqIG93bl95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkCiAgICBmcmFtZV9kaWcgMTUKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxMAogICAgZnJhbWVfZGlnIDUKICAgIGIqCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjIyNS0yMjcKICAgIC8vIChVSW50NjQoMTAwMDApICogb3ZlcnJpZGVfZmFybV9yZXdhcmRzIC8vIHN0YWtlZCkKICAgIC8vIGlmIHN0YWtlZCA+IFVJbnQ2NCgwKQogICAgLy8gZWxzZSBCaWdVSW50KDApCiAgICBmcmFtZV9kaWcgMjEKICAgIGJ6IF9wcm9qZWN0X2Fwcl90ZXJuYXJ5X2ZhbHNlQDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMjUKICAgIC8vIChVSW50NjQoMTAwMDApICogb3ZlcnJpZGVfZmFybV9yZXdhcmRzIC8vIHN0YWtlZCkKICAgIGludGNfMyAvLyAxMDAwMAogICAgaXRvYgogICAgZnJhbWVfZGlnIDQKICAgIGIqCiAgICBmcmFtZV9kaWcgMjEKICAgIGl0b2IKICAgIGIvCgpfcHJvamVjdF9hcHJfdGVybmFyeV9tZXJnZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjIzMgogICAgLy8gc3Rha2VkPWFyYzQuVUludDY0KHN0YWtlZCksCiAgICBmcmFtZV9kaWcgMjEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjIzOAogICAgLy8gY3VycmVudF9mYXJtX2Ftb3VudD1hcmM0LlVJbnQ2NChmYXJtX2Ftb3VudCksCiAgICBmcmFtZV9kaWcgMTMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI0MAogICAgLy8gb3ZlcnJpZGVfZmFybV9hbW91bnQ9YXJjNC5VSW50NjQob3ZlcnJpZGVfZmFybV9hbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMzQKICAgIC8vIGF2Z19yb3VuZF90aW1lPWFyYzQuVUludDY0KGF2Z19yb3VuZF90aW1lKSwKICAgIGZyYW1lX2RpZyAxMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjMzCiAgICAvLyBvbmxpbmVfc3Rha2U9YXJjNC5VSW50NjQodG90YWxfb25saW5lX3N0YWtlKSwKICAgIGZyYW1lX2RpZyAxMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBpbnRjXzIgLy8gOAogICAgYnplcm8KICAgIHN3YXAKICAgIGRpZyAxCiAgICBifAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjM1CiAgICAvLyBleHBlY3RlZF95ZWFybHlfYmxvY2tzPWFyYzQuVUludDY0KG93bl95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkKSwKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGRpZyAyCiAgICBifAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjQyCiAgICAvLyBiYXNlX2Fwcl9icHM9YXJjNC5VSW50NjQoYmFzZV9hcHJfYnBzKSwKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGRpZyAzCiAgICBifAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjQzCiAgICAvLyBmYXJtX2Fwcl9icHM9YXJjNC5VSW50NjQoZmFybV9hcHJfYnBzKSwKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGRpZyA0CiAgICBifAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjQ0CiAgICAvLyBvdmVycmlkZV9mYXJtX2Fwcl9icHM9YXJjNC5VSW50NjQob3ZlcnJpZGVfZmFybV9hcHJfYnBzKSwKICAgIHVuY292ZXIgOQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICB1bmNvdmVyIDUKICAgIGJ8CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMzAtMjQ1CiAgICAvLyByZXR1cm4gQVBSQnJlYWtkb3duKAogICAgLy8gICAgIGJhbGFuY2U9YXJjNC5VSW50NjQoYmFsYW5jZSksCiAgICAvLyAgICAgc3Rha2VkPWFyYzQuVUludDY0KHN0YWtlZCksCiAgICAvLyAgICAgb25saW5lX3N0YWtlPWFyYzQuVUludDY0KHRvdGFsX29ubGluZV9zdGFrZSksCiAgICAvLyAgICAgYXZnX3JvdW5kX3RpbWU9YXJjNC5VSW50NjQoYXZnX3JvdW5kX3RpbWUpLAogICAgLy8gICAgIGV4cGVjdGVkX3llYXJseV9ibG9ja3M9YXJjNC5VSW50NjQob3duX3llYXJseV9ibG9ja3NfcHJvZHVjZWQpLAogICAgLy8gICAgIGN1cnJlbnRfYmxvY2tfYm9udXM9YXJjNC5VSW50NjQoY3VycmVudF9ibG9ja19yZXdhcmRzKSwKICAgIC8vICAgICBjdXJyZW50X2F2Z19ibG9ja19wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY3VycmVudF9mYXJtX2Ftb3VudD1hcmM0LlVJbnQ2NChmYXJtX2Ftb3VudCksCiAgICAvLyAgICAgY3VycmVudF9mYXJtX2Ftb3VudF9hbGdvPWFyYzQuVUludDY0KGZhcm1fYW1vdW50X2FsZ28pLAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYW1vdW50PWFyYzQuVUludDY0KG92ZXJyaWRlX2Zhcm1fYW1vdW50KSwKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Ftb3VudF9hbGdvPWFyYzQuVUludDY0KG92ZXJyaWRlX2Zhcm1fYW1vdW50X2FsZ28pLAogICAgLy8gICAgIGJhc2VfYXByX2Jwcz1hcmM0LlVJbnQ2NChiYXNlX2Fwcl9icHMpLAogICAgLy8gICAgIGZhcm1fYXByX2Jwcz1hcmM0LlVJbnQ2NChmYXJtX2Fwcl9icHMpLAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYXByX2Jwcz1hcmM0LlVJbnQ2NChvdmVycmlkZV9mYXJtX2Fwcl9icHMpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDcKICAgIHVuY292ZXIgOQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgOAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMzcKICAgIC8vIGN1cnJlbnRfYXZnX2Jsb2NrX3BheW91dD1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyMzAtMjQ1CiAgICAvLyByZXR1cm4gQVBSQnJlYWtkb3duKAogICAgLy8gICAgIGJhbGFuY2U9YXJjNC5VSW50NjQoYmFsYW5jZSksCiAgICAvLyAgICAgc3Rha2VkPWFyYzQuVUludDY0KHN0YWtlZCksCiAgICAvLyAgICAgb25saW5lX3N0YWtlPWFyYzQuVUludDY0KHRvdGFsX29ubGluZV9zdGFrZSksCiAgICAvLyAgICAgYXZnX3JvdW5kX3RpbWU9YXJjNC5VSW50NjQoYXZnX3JvdW5kX3RpbWUpLAogICAgLy8gICAgIGV4cGVjdGVkX3llYXJseV9ibG9ja3M9YXJjNC5VSW50NjQob3duX3llYXJseV9ibG9ja3NfcHJvZHVjZWQpLAogICAgLy8gICAgIGN1cnJlbnRfYmxvY2tfYm9udXM9YXJjNC5VSW50NjQoY3VycmVudF9ibG9ja19yZXdhcmRzKSwKICAgIC8vICAgICBjdXJyZW50X2F2Z19ibG9ja19wYXlvdXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY3VycmVudF9mYXJtX2Ftb3VudD1hcmM0LlVJbnQ2NChmYXJtX2Ftb3VudCksCiAgICAvLyAgICAgY3VycmVudF9mYXJtX2Ftb3VudF9hbGdvPWFyYzQuVUludDY0KGZhcm1fYW1vdW50X2FsZ28pLAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYW1vdW50PWFyYzQuVUludDY0KG92ZXJyaWRlX2Zhcm1fYW1vdW50KSwKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Ftb3VudF9hbGdvPWFyYzQuVUludDY0KG92ZXJyaWRlX2Zhcm1fYW1vdW50X2FsZ28pLAogICAgLy8gICAgIGJhc2VfYXByX2Jwcz1hcmM0LlVJbnQ2NChiYXNlX2Fwcl9icHMpLAogICAgLy8gICAgIGZhcm1fYXByX2Jwcz1hcmM0LlVJbnQ2NChmYXJtX2Fwcl9icHMpLAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYXByX2Jwcz1hcmM0LlVJbnQ2NChvdmVycmlkZV9mYXJtX2Fwcl9icHMpLAogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDgKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9wcm9qZWN0X2Fwcl90ZXJuYXJ5X2ZhbHNlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjI3CiAgICAvLyBlbHNlIEJpZ1VJbnQoMCkKICAgIGJ5dGVjXzIgLy8gMHgKICAgIGIgX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMjMKCl9wcm9qZWN0X2Fwcl90ZXJuYXJ5X2ZhbHNlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjIwCiAgICAvLyBVSW50NjQoMTAwMDApICogZmFybV9yZXdhcmRzIC8vIHN0YWtlZCBpZiBzdGFrZWQgPiBVSW50NjQoMCkgZWxzZSBCaWdVSW50KDApCiAgICBieXRlY18yIC8vIDB4CiAgICBmcmFtZV9idXJ5IDIKICAgIGIgX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMjAKCl9wcm9qZWN0X2Fwcl90ZXJuYXJ5X2ZhbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjE1CiAgICAvLyBVSW50NjQoMTAwMDApICogYmFzZV9yZXdhcmRzIC8vIHN0YWtlZCBpZiBzdGFrZWQgPiBVSW50NjQoMCkgZWxzZSBCaWdVSW50KDApCiAgICBieXRlY18yIC8vIDB4CiAgICBmcmFtZV9idXJ5IDAKICAgIGIgX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMTcKCl9wcm9qZWN0X2Fwcl90ZXJuYXJ5X2ZhbHNlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTkzCiAgICAvLyBlbHNlIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMTUKICAgIGIgX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMTQKCl9wcm9qZWN0X2Fwcl90ZXJuYXJ5X2ZhbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTg1CiAgICAvLyBlbHNlIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMTQKICAgIGIgX3Byb2plY3RfYXByX3Rlcm5hcnlfbWVyZ2VAMTEKCl9wcm9qZWN0X2Fwcl9ib29sX2ZhbHNlQDU6CiAgICBpbnRjXzEgLy8gMAogICAgYiBfcHJvamVjdF9hcHJfYm9vbF9tZXJnZUA2CgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5wcm9qZWN0X2FwcihyZWNpcGllbnRfYXBwOiB1aW50NjQsIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpwcm9qZWN0X2FwcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI0Ny0yNTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBwcm9qZWN0X2FwcigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiBVSW50NjQsCiAgICAvLyApIC0+IEFQUkJyZWFrZG93bjoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjUzCiAgICAvLyByZXR1cm4gc2VsZi5fcHJvamVjdF9hcHIocmVjaXBpZW50X2FwcCwgb3ZlcnJpZGVfZmFybV9hbW91bnQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfcHJvamVjdF9hcHIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uY2FsY3VsYXRlX2FsZ29fY29zdChyZWNpcGllbnRfYXBwOiB1aW50NjQsIGZhcm1fYXNzZXQ6IHVpbnQ2NCwgZHVyYXRpb25fYmxvY2tzOiB1aW50NjQpIC0+IGJ5dGVzOgpjYWxjdWxhdGVfYWxnb19jb3N0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjU1LTI1OAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjdWxhdGVfYWxnb19jb3N0KAogICAgLy8gICAgIHNlbGYsIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLCBmYXJtX2Fzc2V0OiBBc3NldCwgZHVyYXRpb25fYmxvY2tzOiBVSW50NjQKICAgIC8vICkgLT4gQWxnb0Nvc3Q6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gaWYgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5pc19vcHRlZF9pbihmYXJtX2Fzc2V0KQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMgogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2MC0yNjIKICAgIC8vIFVJbnQ2NCgwKQogICAgLy8gaWYgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5pc19vcHRlZF9pbihmYXJtX2Fzc2V0KQogICAgLy8gZWxzZSBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICBieiBjYWxjdWxhdGVfYWxnb19jb3N0X3Rlcm5hcnlfZmFsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjYwCiAgICAvLyBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCgpjYWxjdWxhdGVfYWxnb19jb3N0X3Rlcm5hcnlfbWVyZ2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gVUludDY0KDApIGlmIHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcyBlbHNlIFVJbnQ2NCg1ICogOCAqIDQwMCArIDI1MDApCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgcHVzaGludCAxODUwMCAvLyAxODUwMAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2NC0yNjYKICAgIC8vIGJveF9tYnIgPSAoCiAgICAvLyAgICAgVUludDY0KDApIGlmIHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcyBlbHNlIFVJbnQ2NCg1ICogOCAqIDQwMCArIDI1MDApCiAgICAvLyApICAjIGJveCBzaXplIGlzIDErNCB1aW50NjRzCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gVUludDY0KDApIGlmIHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcyBlbHNlIFVJbnQ2NCg1ICogOCAqIDQwMCArIDI1MDApCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2OAogICAgLy8gaXhfY29zdCA9IHNlbGYuZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkgKiBkdXJhdGlvbl9ibG9ja3MKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI2OQogICAgLy8gdHhuX2ZlZV9jb3N0ID0gc2VsZi5nZXRfdHhuX2ZlZV9wZXJfYmxvY2soKSAqIGR1cmF0aW9uX2Jsb2NrcwogICAgY2FsbHN1YiBnZXRfdHhuX2ZlZV9wZXJfYmxvY2sKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjQ5CiAgICAvLyByZXR1cm4gc2VsZi5wbGF0X2ZlZV9wYiAqIEdsb2JhbC5taW5fdHhuX2ZlZQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwbGF0X2ZlZV9wYiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF0X2ZlZV9wYiBleGlzdHMKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gcGxhdGZvcm1fY29zdCA9IHNlbGYuZ2V0X3BsYXRmb3JtX2ZlZV9wZXJfYmxvY2soKSAqIGR1cmF0aW9uX2Jsb2NrcwogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyNzEKICAgIC8vIHRvdGFsX2Nvc3QgPSBpeF9jb3N0ICsgdHhuX2ZlZV9jb3N0ICsgcGxhdGZvcm1fY29zdAogICAgZGlnIDIKICAgIGRpZyAyCiAgICArCiAgICBkaWcgMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjc0CiAgICAvLyB0b3RhbF9jb3N0PWFyYzQuVUludDY0KHRvdGFsX2Nvc3QpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjc2CiAgICAvLyBvcHRpbl9jb3N0PWFyYzQuVUludDY0KG9wdGluX21iciksCiAgICB1bmNvdmVyIDUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gYm94X2Nvc3Q9YXJjNC5VSW50NjQoYm94X21iciksCiAgICB1bmNvdmVyIDUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gcGxhdGZvcm1fY29zdD1hcmM0LlVJbnQ2NChwbGF0Zm9ybV9jb3N0KSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjc4CiAgICAvLyBpeF9jb3N0PWFyYzQuVUludDY0KGl4X2Nvc3QpLAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyNzcKICAgIC8vIHR4bl9mZWVfY29zdD1hcmM0LlVJbnQ2NCh0eG5fZmVlX2Nvc3QpLAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyNzMtMjgwCiAgICAvLyByZXR1cm4gQWxnb0Nvc3QoCiAgICAvLyAgICAgdG90YWxfY29zdD1hcmM0LlVJbnQ2NCh0b3RhbF9jb3N0KSwKICAgIC8vICAgICBib3hfY29zdD1hcmM0LlVJbnQ2NChib3hfbWJyKSwKICAgIC8vICAgICBvcHRpbl9jb3N0PWFyYzQuVUludDY0KG9wdGluX21iciksCiAgICAvLyAgICAgdHhuX2ZlZV9jb3N0PWFyYzQuVUludDY0KHR4bl9mZWVfY29zdCksCiAgICAvLyAgICAgaXhfY29zdD1hcmM0LlVJbnQ2NChpeF9jb3N0KSwKICAgIC8vICAgICBwbGF0Zm9ybV9jb3N0PWFyYzQuVUludDY0KHBsYXRmb3JtX2Nvc3QpLAogICAgLy8gKQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCmNhbGN1bGF0ZV9hbGdvX2Nvc3RfdGVybmFyeV9mYWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjYyCiAgICAvLyBlbHNlIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgYiBjYWxjdWxhdGVfYWxnb19jb3N0X3Rlcm5hcnlfbWVyZ2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZ2V0X2FsZ29fY29zdChyZWNpcGllbnRfYXBwOiB1aW50NjQsIGZhcm1fYXNzZXQ6IHVpbnQ2NCwgZHVyYXRpb25fYmxvY2tzOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYWxnb19jb3N0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjgyLTI4NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hbGdvX2Nvc3QoCiAgICAvLyAgICAgc2VsZiwgcmVjaXBpZW50X2FwcDogQXBwbGljYXRpb24sIGZhcm1fYXNzZXQ6IEFzc2V0LCBkdXJhdGlvbl9ibG9ja3M6IFVJbnQ2NAogICAgLy8gKSAtPiBBbGdvQ29zdDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjg2CiAgICAvLyByZXR1cm4gc2VsZi5jYWxjdWxhdGVfYWxnb19jb3N0KHJlY2lwaWVudF9hcHAsIGZhcm1fYXNzZXQsIGR1cmF0aW9uX2Jsb2NrcykKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY2FsY3VsYXRlX2FsZ29fY29zdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfYWxnb19jb3N0X2FuZF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcDogdWludDY0LCBmYXJtX2Fzc2V0OiB1aW50NjQsIGR1cmF0aW9uX2Jsb2NrczogdWludDY0KSAtPiBieXRlczoKZ2V0X2FsZ29fY29zdF9hbmRfbWF4X2R1cmF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjg4LTI5MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hbGdvX2Nvc3RfYW5kX21heF9kdXJhdGlvbigKICAgIC8vICAgICBzZWxmLCByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbiwgZmFybV9hc3NldDogQXNzZXQsIGR1cmF0aW9uX2Jsb2NrczogVUludDY0CiAgICAvLyApIC0+IEFsZ29Db3N0QW5kTWF4RHVyYXRpb246CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI5MgogICAgLy8gY29zdCA9IHNlbGYuY2FsY3VsYXRlX2FsZ29fY29zdChyZWNpcGllbnRfYXBwLCBmYXJtX2Fzc2V0LCBkdXJhdGlvbl9ibG9ja3MpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9hbGdvX2Nvc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI5NAogICAgLy8gdG90YWxfY29zdD1jb3N0LnRvdGFsX2Nvc3QsCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjk2CiAgICAvLyBvcHRpbl9jb3N0PWNvc3Qub3B0aW5fY29zdCwKICAgIGRpZyAxCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gYm94X2Nvc3Q9Y29zdC5ib3hfY29zdCwKICAgIGRpZyAyCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyOTkKICAgIC8vIHBsYXRmb3JtX2Nvc3Q9Y29zdC5wbGF0Zm9ybV9jb3N0LAogICAgZGlnIDMKICAgIGV4dHJhY3QgMjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gaXhfY29zdD1jb3N0Lml4X2Nvc3QsCiAgICBkaWcgNAogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mjk3CiAgICAvLyB0eG5fZmVlX2Nvc3Q9Y29zdC50eG5fZmVlX2Nvc3QsCiAgICB1bmNvdmVyIDUKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMwMAogICAgLy8gbWF4X2R1cmF0aW9uPWFyYzQuVUludDY0KHNlbGYuZ2V0X21heF9kdXJhdGlvbihyZWNpcGllbnRfYXBwKSksCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgZ2V0X21heF9kdXJhdGlvbgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjkzLTMwMQogICAgLy8gcmV0dXJuIEFsZ29Db3N0QW5kTWF4RHVyYXRpb24oCiAgICAvLyAgICAgdG90YWxfY29zdD1jb3N0LnRvdGFsX2Nvc3QsCiAgICAvLyAgICAgYm94X2Nvc3Q9Y29zdC5ib3hfY29zdCwKICAgIC8vICAgICBvcHRpbl9jb3N0PWNvc3Qub3B0aW5fY29zdCwKICAgIC8vICAgICB0eG5fZmVlX2Nvc3Q9Y29zdC50eG5fZmVlX2Nvc3QsCiAgICAvLyAgICAgaXhfY29zdD1jb3N0Lml4X2Nvc3QsCiAgICAvLyAgICAgcGxhdGZvcm1fY29zdD1jb3N0LnBsYXRmb3JtX2Nvc3QsCiAgICAvLyAgICAgbWF4X2R1cmF0aW9uPWFyYzQuVUludDY0KHNlbGYuZ2V0X21heF9kdXJhdGlvbihyZWNpcGllbnRfYXBwKSksCiAgICAvLyApCiAgICB1bmNvdmVyIDYKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcDogdWludDY0KSAtPiB1aW50NjQ6CmdldF9tYXhfZHVyYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMDMtMzA0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9tYXhfZHVyYXRpb24oc2VsZiwgcmVjaXBpZW50X2FwcDogQXBwbGljYXRpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzA5CiAgICAvLyBkc19iYWxhbmNlID0gQmlnVUludChyZWNpcGllbnRfYXBwLmFkZHJlc3MuYmFsYW5jZSkKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gdG90YWxfb25saW5lX3N0YWtlID0gQmlnVUludChvcC5vbmxpbmVfc3Rha2UoKSkKICAgIG9ubGluZV9zdGFrZQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzExLTMxMgogICAgLy8gIyByb3VuZF90aW1lID0gKGR0ID09IHRpbWUyIC0gdGltZTEpIC8gKGRyID09IGJsb2NrMiAtIGJsb2NrMSkKICAgIC8vIHJ0X2ZyYWN0aW9uID0gcm91bmRfdGltZS5nZXRfcm91bmRfdGltZShVSW50NjQoTUlOX1JPVU5EX1NBTVBMRSkpCiAgICBwdXNoaW50IDUwMCAvLyA1MDAKICAgIGNhbGxzdWIgZ2V0X3JvdW5kX3RpbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxNS0zMTYKICAgIC8vIFVJbnQ2NCg4NjQwMCkKICAgIC8vICogVUludDY0KERFRkFVTFRfTUFYX0RVUkFUSU9OX0RBWVMpCiAgICBwdXNoaW50IDM4ODgwMDAgLy8gMzg4ODAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzE1LTMxNwogICAgLy8gVUludDY0KDg2NDAwKQogICAgLy8gKiBVSW50NjQoREVGQVVMVF9NQVhfRFVSQVRJT05fREFZUykKICAgIC8vICogcnRfZnJhY3Rpb24uZHIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxNS0zMTgKICAgIC8vIFVJbnQ2NCg4NjQwMCkKICAgIC8vICogVUludDY0KERFRkFVTFRfTUFYX0RVUkFUSU9OX0RBWVMpCiAgICAvLyAqIHJ0X2ZyYWN0aW9uLmRyCiAgICAvLyAvLyBydF9mcmFjdGlvbi5kdAogICAgc3dhcAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzEzLTMxOQogICAgLy8gIyBibG9ja3MgcHJvZHVjZWQgPSA0NSBkYXlzIGluIHNlY29uZHMgLyByb3VuZF90aW1lCiAgICAvLyBibG9ja3NfcHJvZHVjZWQgPSBCaWdVSW50KAogICAgLy8gICAgIFVJbnQ2NCg4NjQwMCkKICAgIC8vICAgICAqIFVJbnQ2NChERUZBVUxUX01BWF9EVVJBVElPTl9EQVlTKQogICAgLy8gICAgICogcnRfZnJhY3Rpb24uZHIKICAgIC8vICAgICAvLyBydF9mcmFjdGlvbi5kdAogICAgLy8gKQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzIwLTMyMgogICAgLy8gIyBtYXggZHVyYXRpb24gPSBwZXJjZW50YWdlX29mX3N0YWtlICogYmxvY2tzIHByb2R1Y2VkIGluIDQ1IGRheXMKICAgIC8vICMgPSBvd25fc3Rha2UgKiBibG9ja3NfcHJvZHVjZWQgLyB0b3RhbF9zdGFrZQogICAgLy8gbWF4X2R1cmF0aW9uID0gZHNfYmFsYW5jZSAqIGJsb2Nrc19wcm9kdWNlZCAvLyB0b3RhbF9vbmxpbmVfc3Rha2UKICAgIHVuY292ZXIgMgogICAgYioKICAgIHN3YXAKICAgIGIvCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMjQKICAgIC8vIFVJbnQ2NChERUZBVUxUX01JTl9EVVJBVElPTl9CTE9DS1MpLCBvcC5idG9pKG1heF9kdXJhdGlvbi5ieXRlcykKICAgIGJ0b2kKICAgIHB1c2hpbnQgMzAgLy8gMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo5CiAgICAvLyByZXR1cm4gYSBpZiBhID4gYiBlbHNlIGIKICAgIGRpZyAxCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMjQKICAgIC8vIFVJbnQ2NChERUZBVUxUX01JTl9EVVJBVElPTl9CTE9DS1MpLCBvcC5idG9pKG1heF9kdXJhdGlvbi5ieXRlcykKICAgIHB1c2hpbnQgMzAgLy8gMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo5CiAgICAvLyByZXR1cm4gYSBpZiBhID4gYiBlbHNlIGIKICAgIHN3YXAKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzIzLTMyNQogICAgLy8gcmV0dXJuIG1hdGgubWF4KAogICAgLy8gICAgIFVJbnQ2NChERUZBVUxUX01JTl9EVVJBVElPTl9CTE9DS1MpLCBvcC5idG9pKG1heF9kdXJhdGlvbi5ieXRlcykKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0udmFsaWRhdGVfZHVyYXRpb24ocmVjaXBpZW50X2FwcDogdWludDY0LCBkdXJhdGlvbl9ibG9ja3M6IHVpbnQ2NCkgLT4gdm9pZDoKdmFsaWRhdGVfZHVyYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMjctMzMwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHZhbGlkYXRlX2R1cmF0aW9uKAogICAgLy8gICAgIHNlbGYsIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLCBkdXJhdGlvbl9ibG9ja3M6IFVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzEKICAgIC8vIGFsbG93ZWRfZHVyYXRpb24gPSBzZWxmLmdldF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcCkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBnZXRfbWF4X2R1cmF0aW9uCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMzMgogICAgLy8gaWYgYWxsb3dlZF9kdXJhdGlvbiA8IGR1cmF0aW9uX2Jsb2NrczoKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYnogdmFsaWRhdGVfZHVyYXRpb25fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzMKICAgIC8vIGxvZyhhbGxvd2VkX2R1cmF0aW9uKQogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzM0CiAgICAvLyBsb2coIkVSUjpEVVJBVElPTiIpCiAgICBwdXNoYnl0ZXMgIkVSUjpEVVJBVElPTiIKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzM1CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgp2YWxpZGF0ZV9kdXJhdGlvbl9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmNyZWF0ZV9mYXJtKHJlY2lwaWVudF9hcHA6IHVpbnQ2NCwgZmFybV9hc3NldDogdWludDY0LCBhbW91bnRfcGVyX2Jsb2NrOiB1aW50NjQsIGR1cmF0aW9uX2Jsb2NrczogdWludDY0KSAtPiB2b2lkOgpjcmVhdGVfZmFybToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMzNy0zNDQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9mYXJtKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcDogQXBwbGljYXRpb24sCiAgICAvLyAgICAgZmFybV9hc3NldDogQXNzZXQsCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jazogVUludDY0LAogICAgLy8gICAgIGR1cmF0aW9uX2Jsb2NrczogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNDUtMzQ2CiAgICAvLyAjIHJlamVjdCBpZiBmYXJtIGV4aXN0cyBhbHJlYWR5CiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgbm90IGluIHNlbGYuZmFybXMsIFMoIkVSUjpFWElTVFMiKSkKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJ6IGNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzQ1LTM0NgogICAgLy8gIyByZWplY3QgaWYgZmFybSBleGlzdHMgYWxyZWFkeQogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXBwIG5vdCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6RVhJU1RTIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpFWElTVFMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gY3VzdG9tLmVuc3VyZShUeG4uZ3JvdXBfaW5kZXggPiAwLCBTKCJFUlI6Tk8gUEFZIikpCiAgICB0eG4gR3JvdXBJbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gY3VzdG9tLmVuc3VyZShUeG4uZ3JvdXBfaW5kZXggPiAwLCBTKCJFUlI6Tk8gUEFZIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpOTyBQQVkiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNTIKICAgIC8vIFR4bi5ncm91cF9pbmRleCAtIFVJbnQ2NCgxKSwgICMgcHJldmlvdXMgdHhuCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM1My0zNTUKICAgIC8vIHNlbGYuY2FsY3VsYXRlX2FsZ29fY29zdCgKICAgIC8vICAgICByZWNpcGllbnRfYXBwLCBmYXJtX2Fzc2V0LCBkdXJhdGlvbl9ibG9ja3MKICAgIC8vICkudG90YWxfY29zdC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9hbGdvX2Nvc3QKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzUwLTM1NgogICAgLy8gIyB2YWxpZGF0ZSBBTEdPIHBheW1lbnQuIHBvc2l0aW9uZWQgYmVmb3JlIHNvIGl0IGNhbiBjb3ZlciBvcHRpbiBhbmQgYm94IE1CUgogICAgLy8gdmFsaWRhdGUucGF5bWVudF9hbW91bnRfZXhhY3QoCiAgICAvLyAgICAgVHhuLmdyb3VwX2luZGV4IC0gVUludDY0KDEpLCAgIyBwcmV2aW91cyB0eG4KICAgIC8vICAgICBzZWxmLmNhbGN1bGF0ZV9hbGdvX2Nvc3QoCiAgICAvLyAgICAgICAgIHJlY2lwaWVudF9hcHAsIGZhcm1fYXNzZXQsIGR1cmF0aW9uX2Jsb2NrcwogICAgLy8gICAgICkudG90YWxfY29zdC5uYXRpdmUsCiAgICAvLyApCiAgICBjYWxsc3ViIHBheW1lbnRfYW1vdW50X2V4YWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNjIKICAgIC8vIFR4bi5ncm91cF9pbmRleCArIFVJbnQ2NCgxKSwgICMgbmV4dCB0eG4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzY0CiAgICAvLyBhbW91bnRfcGVyX2Jsb2NrICogZHVyYXRpb25fYmxvY2tzLAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM1OC0zNjUKICAgIC8vICMgdmFsaWRhdGUgQVNBIGRlcG9zaXQuIHBvc2l0aW9uZWQgYWZ0ZXIgYXBwIGNhbGwgc28gd2UgY2FuIG9wdCBpbiBpZiBuZWVkZWQKICAgIC8vICMgZG9uJ3QgZG8gYXMgSSBkbywgaWYgeW91IHVzZSB0aGlzIHBhdHRlcm4geW91IGNhbiBnZXQgZXhwbG9pdGVkIGlmIGFub3RoZXIgbWV0aG9kIHZhbGlkYXRlcyBhbiBhc2EgcGF5bWVudCBhdCAoLTEpCiAgICAvLyAjIGFuZCBpZiB5b3UgZG8gZG8gYXMgSSBkbywgZW5zdXJlIGFsbCB5b3VyIGF4ZmVycyBhcmUgZXhwZWN0ZWQgYXQgKzEKICAgIC8vIHZhbGlkYXRlLmF4ZmVyX2Ftb3VudF9leGFjdCgKICAgIC8vICAgICBUeG4uZ3JvdXBfaW5kZXggKyBVSW50NjQoMSksICAjIG5leHQgdHhuCiAgICAvLyAgICAgZmFybV9hc3NldCwKICAgIC8vICAgICBhbW91bnRfcGVyX2Jsb2NrICogZHVyYXRpb25fYmxvY2tzLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjYWxsc3ViIGF4ZmVyX2Ftb3VudF9leGFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzY3CiAgICAvLyBzZWxmLnZhbGlkYXRlX2R1cmF0aW9uKHJlY2lwaWVudF9hcHAsIGR1cmF0aW9uX2Jsb2NrcykKICAgIGZyYW1lX2RpZyAtNAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHZhbGlkYXRlX2R1cmF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNjktMzcwCiAgICAvLyAjIENoZWNrIHJlY2lwaWVudCBhcHAgc3RhdGUKICAgIC8vIHJlY2lwaWVudF9hc2FfaWQsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHJlY2lwaWVudF9hcHAsIGIiYXNhX2lkIikKICAgIGZyYW1lX2RpZyAtNAogICAgYnl0ZWMgMTIgLy8gMHg2MTczNjE1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM3MQogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXNhX2lkID09IGZhcm1fYXNzZXQuaWQsIFMoIkVSUjpBUFAgQVNBIikpCiAgICBmcmFtZV9kaWcgLTMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogY3JlYXRlX2Zhcm1fYWZ0ZXJfaWZfZWxzZUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzcxCiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hc2FfaWQgPT0gZmFybV9hc3NldC5pZCwgUygiRVJSOkFQUCBBU0EiKSkKICAgIHB1c2hieXRlcyAiRVJSOkFQUCBBU0EiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNzMtMzc0CiAgICAvLyAjIG9wdGluIGlmIG5lZWRlZAogICAgLy8gaWYgbm90IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuaXNfb3B0ZWRfaW4oZmFybV9hc3NldCk6CiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIC0zCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgYm56IGNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjYKICAgIC8vIGF4ZmVyKGFzc2V0LCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCBVSW50NjQoMCksIGZlZSkKICAgIGZyYW1lX2RpZyAtMwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNzUKICAgIC8vIHNlbmQub3B0aW4oZmFybV9hc3NldCwgVUludDY0KDApKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6NgogICAgLy8gYXhmZXIoYXNzZXQsIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsIFVJbnQ2NCgwKSwgZmVlKQogICAgY2FsbHN1YiBheGZlcgoKY3JlYXRlX2Zhcm1fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzc5CiAgICAvLyBmYXJtX2Fzc2V0PWFyYzQuVUludDY0KGZhcm1fYXNzZXQuaWQpLAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozODAKICAgIC8vIGFtb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoYW1vdW50X3Blcl9ibG9jayksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM4MQogICAgLy8gcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NChkdXJhdGlvbl9ibG9ja3MpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozODIKICAgIC8vIGxhc3RfYmxvY2tfcGFpZD1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQgKyAxKSwKICAgIGdsb2JhbCBSb3VuZAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM3Ny0zODMKICAgIC8vICMgY3JlYXRlIGZhcm0gYm94IGVudHJ5CiAgICAvLyBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdID0gRmFybVN0YXRlKAogICAgLy8gICAgIGZhcm1fYXNzZXQ9YXJjNC5VSW50NjQoZmFybV9hc3NldC5pZCksCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NChhbW91bnRfcGVyX2Jsb2NrKSwKICAgIC8vICAgICByZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KGR1cmF0aW9uX2Jsb2NrcyksCiAgICAvLyAgICAgbGFzdF9ibG9ja19wYWlkPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCArIDEpLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM4NS0zODYKICAgIC8vICMgYWRkIHRvIGdsb2JhbCB0eG4gZnVlbAogICAgLy8gc2VsZi50eG5fZnVlbCA9IHNlbGYudHhuX2Z1ZWwgKyBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKSAqIGR1cmF0aW9uX2Jsb2NrcwogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzEgLy8gInR4bl9mdWVsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR4bl9mdWVsIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjQxCiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdHhuX2ZlZV9wZXJfYmxvY2soKSArIHNlbGYuZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkKICAgIGNhbGxzdWIgZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrCiAgICBjYWxsc3ViIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jawogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzg1LTM4NgogICAgLy8gIyBhZGQgdG8gZ2xvYmFsIHR4biBmdWVsCiAgICAvLyBzZWxmLnR4bl9mdWVsID0gc2VsZi50eG5fZnVlbCArIHNlbGYuZ2V0X3NwZW5kX3Blcl9ibG9jaygpICogZHVyYXRpb25fYmxvY2tzCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgICsKICAgIGJ5dGVjXzEgLy8gInR4bl9mdWVsIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM4NwogICAgLy8gc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyA9IHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKyBkdXJhdGlvbl9ibG9ja3MKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgYnl0ZWNfMCAvLyAiZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5leHRlbmRfZHVyYXRpb25fYmxvY2tzKHJlY2lwaWVudF9hcHA6IHVpbnQ2NCwgZHVyYXRpb25fYmxvY2tzOiB1aW50NjQpIC0+IHZvaWQ6CmV4dGVuZF9kdXJhdGlvbl9ibG9ja3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozODktMzk0CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgZXh0ZW5kX2R1cmF0aW9uX2Jsb2NrcygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLAogICAgLy8gICAgIGR1cmF0aW9uX2Jsb2NrczogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozOTUKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGV4dGVuZF9kdXJhdGlvbl9ibG9ja3NfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozOTUKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgYnl0ZWMgNiAvLyAiRVJSOk5PIEZBUk0iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmV4dGVuZF9kdXJhdGlvbl9ibG9ja3NfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzk3CiAgICAvLyBzdGF0ZSA9IHNlbGYuZmFybXNbcmVjaXBpZW50X2FwcF0uY29weSgpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mYXJtcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM5OAogICAgLy8gZmFybV9hc3NldCA9IEFzc2V0KHN0YXRlLmZhcm1fYXNzZXQubmF0aXZlKQogICAgZHVwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQwMgogICAgLy8gVHhuLmdyb3VwX2luZGV4IC0gVUludDY0KDEpLCAgIyBwcmV2aW91cyB0eG4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDAzLTQwNQogICAgLy8gc2VsZi5jYWxjdWxhdGVfYWxnb19jb3N0KAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAsIGZhcm1fYXNzZXQsIGR1cmF0aW9uX2Jsb2NrcwogICAgLy8gKS50b3RhbF9jb3N0Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjYWxjdWxhdGVfYWxnb19jb3N0CiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQwMC00MDYKICAgIC8vICMgdmFsaWRhdGUgQUxHTyBhbmQgQVNBIHBheW1lbnRzLiBrZWVwaW5nIGNyZWF0ZV9mYXJtIGJlZm9yZS9hZnRlciBzdHJ1Y3R1cmUgZm9yIHNpbXBsaWNpdHkKICAgIC8vIHZhbGlkYXRlLnBheW1lbnRfYW1vdW50X2V4YWN0KAogICAgLy8gICAgIFR4bi5ncm91cF9pbmRleCAtIFVJbnQ2NCgxKSwgICMgcHJldmlvdXMgdHhuCiAgICAvLyAgICAgc2VsZi5jYWxjdWxhdGVfYWxnb19jb3N0KAogICAgLy8gICAgICAgICByZWNpcGllbnRfYXBwLCBmYXJtX2Fzc2V0LCBkdXJhdGlvbl9ibG9ja3MKICAgIC8vICAgICApLnRvdGFsX2Nvc3QubmF0aXZlLAogICAgLy8gKQogICAgY2FsbHN1YiBwYXltZW50X2Ftb3VudF9leGFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDA5CiAgICAvLyBUeG4uZ3JvdXBfaW5kZXggKyBVSW50NjQoMSksICAjIG5leHQgdHhuCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQxMQogICAgLy8gc3RhdGUuYW1vdW50X3Blcl9ibG9jay5uYXRpdmUgKiBkdXJhdGlvbl9ibG9ja3MsCiAgICBkaWcgMgogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQwOC00MTIKICAgIC8vIHZhbGlkYXRlLmF4ZmVyX2Ftb3VudF9leGFjdCgKICAgIC8vICAgICBUeG4uZ3JvdXBfaW5kZXggKyBVSW50NjQoMSksICAjIG5leHQgdHhuCiAgICAvLyAgICAgZmFybV9hc3NldCwKICAgIC8vICAgICBzdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLm5hdGl2ZSAqIGR1cmF0aW9uX2Jsb2NrcywKICAgIC8vICkKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgYXhmZXJfYW1vdW50X2V4YWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MTUKICAgIC8vIHJlY2lwaWVudF9hcHAsIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MubmF0aXZlICsgZHVyYXRpb25fYmxvY2tzCiAgICBkdXAKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDE0LTQxNgogICAgLy8gc2VsZi52YWxpZGF0ZV9kdXJhdGlvbigKICAgIC8vICAgICByZWNpcGllbnRfYXBwLCBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLm5hdGl2ZSArIGR1cmF0aW9uX2Jsb2NrcwogICAgLy8gKQogICAgZnJhbWVfZGlnIC0yCiAgICBkaWcgMQogICAgY2FsbHN1YiB2YWxpZGF0ZV9kdXJhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDE4LTQyMQogICAgLy8gIyBhZGp1c3QgcmVtYWluaW5nIGJsb2NrcyBpbiBzdGF0ZQogICAgLy8gc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2NrcyA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MubmF0aXZlICsgZHVyYXRpb25fYmxvY2tzCiAgICAvLyApCiAgICBpdG9iCiAgICByZXBsYWNlMiAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDIyLTQyMwogICAgLy8gIyBzYXZlIHN0YXRlCiAgICAvLyBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdID0gc3RhdGUuY29weSgpCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MjUtNDI2CiAgICAvLyAjIGFkanVzdCB0eG4gZnVlbCByZW1haW5pbmcKICAgIC8vIHNlbGYudHhuX2Z1ZWwgPSBzZWxmLnR4bl9mdWVsICsgc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkgKiBkdXJhdGlvbl9ibG9ja3MKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICJ0eG5fZnVlbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50eG5fZnVlbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY0MQogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrKCkgKyBzZWxmLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpCiAgICBjYWxsc3ViIGdldF90eG5fZmVlX3Blcl9ibG9jawogICAgY2FsbHN1YiBnZXRfaXhfcmV3YXJkc19wZXJfYmxvY2sKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQyNS00MjYKICAgIC8vICMgYWRqdXN0IHR4biBmdWVsIHJlbWFpbmluZwogICAgLy8gc2VsZi50eG5fZnVlbCA9IHNlbGYudHhuX2Z1ZWwgKyBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKSAqIGR1cmF0aW9uX2Jsb2NrcwogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICArCiAgICBieXRlY18xIC8vICJ0eG5fZnVlbCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MjgKICAgIC8vIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgPSBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzICsgZHVyYXRpb25fYmxvY2tzCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGJ5dGVjXzAgLy8gImdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZXh0ZW5kX2Ftb3VudF9wZXJfYmxvY2socmVjaXBpZW50X2FwcDogdWludDY0LCBhbW91bnRfcGVyX2Jsb2NrOiB1aW50NjQpIC0+IHZvaWQ6CmV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDMwLTQzNQogICAgLy8gQGFiaW1ldGhvZAogICAgLy8gZGVmIGV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcDogQXBwbGljYXRpb24sCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jazogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MzYKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDM2CiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGJ5dGVjIDYgLy8gIkVSUjpOTyBGQVJNIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpleHRlbmRfYW1vdW50X3Blcl9ibG9ja19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MzgKICAgIC8vIHN0YXRlID0gc2VsZi5mYXJtc1tyZWNpcGllbnRfYXBwXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZhcm1zIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDM5CiAgICAvLyBmYXJtX2Fzc2V0ID0gQXNzZXQoc3RhdGUuZmFybV9hc3NldC5uYXRpdmUpCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDQyCiAgICAvLyBUeG4uZ3JvdXBfaW5kZXggKyBVSW50NjQoMSksICAjIG5leHQgdHhuCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ0NAogICAgLy8gYW1vdW50X3Blcl9ibG9jayAqIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MubmF0aXZlLAogICAgZGlnIDIKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDQxLTQ0NQogICAgLy8gdmFsaWRhdGUuYXhmZXJfYW1vdW50X2V4YWN0KAogICAgLy8gICAgIFR4bi5ncm91cF9pbmRleCArIFVJbnQ2NCgxKSwgICMgbmV4dCB0eG4KICAgIC8vICAgICBmYXJtX2Fzc2V0LAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2sgKiBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLm5hdGl2ZSwKICAgIC8vICkKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgYXhmZXJfYW1vdW50X2V4YWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NDkKICAgIC8vIHN0YXRlLmFtb3VudF9wZXJfYmxvY2submF0aXZlICsgYW1vdW50X3Blcl9ibG9jawogICAgZHVwCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDQ3LTQ1MAogICAgLy8gIyBhZGp1c3QgYW1vdW50IHBlciBibG9jayBpbiBzdGF0ZQogICAgLy8gc3RhdGUuYW1vdW50X3Blcl9ibG9jayA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIHN0YXRlLmFtb3VudF9wZXJfYmxvY2submF0aXZlICsgYW1vdW50X3Blcl9ibG9jawogICAgLy8gKQogICAgaXRvYgogICAgcmVwbGFjZTIgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDUxLTQ1MgogICAgLy8gIyBzYXZlIHN0YXRlCiAgICAvLyBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdID0gc3RhdGUuY29weSgpCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnBheW91dChyZWNpcGllbnRfYXBwOiB1aW50NjQsIGJsb2NrX3JvdW5kOiB1aW50NjQsIGNhbGxfc3dhcDogYnl0ZXMpIC0+IHZvaWQ6CnBheW91dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ1NC00NTcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHBheW91dCgKICAgIC8vICAgICBzZWxmLCByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbiwgYmxvY2tfcm91bmQ6IFVJbnQ2NCwgY2FsbF9zd2FwOiBhcmM0LkJvb2wKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgaW50Y18xIC8vIDAKICAgIGR1cAogICAgYnl0ZWNfMiAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDU4LTQ1OQogICAgLy8gIyBlbnN1cmUgZmFybSBleGlzdHMKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHBheW91dF9hZnRlcl9pZl9lbHNlQDE5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NTgtNDU5CiAgICAvLyAjIGVuc3VyZSBmYXJtIGV4aXN0cwogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXBwIGluIHNlbGYuZmFybXMsIFMoIkVSUjpOTyBGQVJNIikpCiAgICBieXRlYyA2IC8vICJFUlI6Tk8gRkFSTSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcGF5b3V0X2FmdGVyX2lmX2Vsc2VAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NjEtNDYyCiAgICAvLyAjIGxvYWQgZmFybSBzdGF0ZQogICAgLy8gc3RhdGUgPSBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdLmNvcHkoKQogICAgZnJhbWVfZGlnIDMKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mYXJtcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ2NC00NjYKICAgIC8vICMgZW5zdXJlIHdlIGhhdmUgcmVtYWluaW5nIGJsb2NrcyB0byBwYXkgb3V0IGluIHRoaXMgZmFybQogICAgLy8gIyBpZiBub3QsIGRlbGV0ZSBmYXJtIHN0YXRlIGFuZCByZXR1cm4KICAgIC8vIGlmIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MgPT0gMDoKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIGJ6IHBheW91dF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ2NwogICAgLy8gZGVsIHNlbGYuZmFybXNbcmVjaXBpZW50X2FwcF0KICAgIGZyYW1lX2RpZyAzCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ2OC00NjkKICAgIC8vICMgVE9ETyBFbWl0IGV2ZW50PwogICAgLy8gbG9nKCJleHBpcmVkIikKICAgIHB1c2hieXRlcyAiZXhwaXJlZCIKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDcwCiAgICAvLyByZXR1cm4KICAgIHJldHN1YgoKcGF5b3V0X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ3Mi00NzMKICAgIC8vICMgZW5zdXJlIG91ciBibG9jayBpcyBhZnRlciB0aGUgbGFzdCBibG9jayB3ZSBoYXZlIHBhaWQKICAgIC8vIGN1c3RvbS5lbnN1cmUoYmxvY2tfcm91bmQgPiBzdGF0ZS5sYXN0X2Jsb2NrX3BhaWQsIFMoIkVSUjpQQVNUIikpCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgYjwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBwYXlvdXRfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDcyLTQ3MwogICAgLy8gIyBlbnN1cmUgb3VyIGJsb2NrIGlzIGFmdGVyIHRoZSBsYXN0IGJsb2NrIHdlIGhhdmUgcGFpZAogICAgLy8gY3VzdG9tLmVuc3VyZShibG9ja19yb3VuZCA+IHN0YXRlLmxhc3RfYmxvY2tfcGFpZCwgUygiRVJSOlBBU1QiKSkKICAgIHB1c2hieXRlcyAiRVJSOlBBU1QiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnBheW91dF9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDc3CiAgICAvLyBvcC5CbG9jay5ibGtfcHJvcG9zZXIoYmxvY2tfcm91bmQpID09IHJlY2lwaWVudF9hcHAuYWRkcmVzcywKICAgIGZyYW1lX2RpZyAtMgogICAgYmxvY2sgQmxrUHJvcG9zZXIKICAgIGZyYW1lX2RpZyAtMwogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBwYXlvdXRfYWZ0ZXJfaWZfZWxzZUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDc4CiAgICAvLyBTKCJFUlI6Tk9UIEJMSyBQUk9QIiksCiAgICBwdXNoYnl0ZXMgIkVSUjpOT1QgQkxLIFBST1AiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnBheW91dF9hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDg0LTQ4NQogICAgLy8gIyBjYWxsIHN3YXAgaWYgbmVlZGVkCiAgICAvLyBpZiBjYWxsX3N3YXA6CiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hieXRlcyAweDAwCiAgICAhPQogICAgYnogcGF5b3V0X2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDg2LTQ5MAogICAgLy8gYWJpX2NhbGwoCiAgICAvLyAgICAgInN3YXBfb3JfZmFpbCgpdm9pZCIsCiAgICAvLyAgICAgYXBwX2lkPXJlY2lwaWVudF9hcHAsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ4OQogICAgLy8gZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0ODYtNDkwCiAgICAvLyBhYmlfY2FsbCgKICAgIC8vICAgICAic3dhcF9vcl9mYWlsKCl2b2lkIiwKICAgIC8vICAgICBhcHBfaWQ9cmVjaXBpZW50X2FwcCwKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLAogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OTMyMzk4MDIgLy8gbWV0aG9kICJzd2FwX29yX2ZhaWwoKXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKcGF5b3V0X2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ5Mi00OTMKICAgIC8vICMgc3VidHJhY3QgdHhuIGZ1ZWwgcmVnYXJkbGVzcyBvZiBjYWxsIHN3YXAgb3Igbm90CiAgICAvLyB0eG5fZnVlbF9zcGVudCA9IHR4bl9mdWVsX3NwZW50ICsgR2xvYmFsLm1pbl90eG5fZmVlCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0OTcKICAgIC8vIEFzc2V0KHN0YXRlLmZhcm1fYXNzZXQubmF0aXZlKSwKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDk4CiAgICAvLyByZWNpcGllbnRfYXBwLmFkZHJlc3MsCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ5OQogICAgLy8gc3RhdGUuYW1vdW50X3Blcl9ibG9jay5uYXRpdmUsCiAgICBkaWcgMgogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MDAKICAgIC8vIEdsb2JhbC5taW5fdHhuX2ZlZSwKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ5NS01MDEKICAgIC8vICMgcGF5IG91dCByZXdhcmQKICAgIC8vIHNlbmQuYXhmZXIoCiAgICAvLyAgICAgQXNzZXQoc3RhdGUuZmFybV9hc3NldC5uYXRpdmUpLAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBzdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLm5hdGl2ZSwKICAgIC8vICAgICBHbG9iYWwubWluX3R4bl9mZWUsCiAgICAvLyApCiAgICBjYWxsc3ViIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MDIKICAgIC8vIHR4bl9mdWVsX3NwZW50ID0gdHhuX2Z1ZWxfc3BlbnQgKyBHbG9iYWwubWluX3R4bl9mZWUKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIHVuY292ZXIgMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTA0LTUwNQogICAgLy8gIyBzZW5kIGl4IHJld2FyZAogICAgLy8gc2VuZC5hbGdvX3BheShUeG4uc2VuZGVyLCBzZWxmLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpLCBHbG9iYWwubWluX3R4bl9mZWUpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jawogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgY2FsbHN1YiBhbGdvX3BheQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTA3CiAgICAvLyB0eG5fZnVlbF9zcGVudCArIEdsb2JhbC5taW5fdHhuX2ZlZSArIHNlbGYuZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgICsKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MDYtNTA4CiAgICAvLyB0eG5fZnVlbF9zcGVudCA9ICgKICAgIC8vICAgICB0eG5fZnVlbF9zcGVudCArIEdsb2JhbC5taW5fdHhuX2ZlZSArIHNlbGYuZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkKICAgIC8vICkKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTEwLTUxMQogICAgLy8gIyB1cGRhdGUgYm94IHN0YXRlCiAgICAvLyBzdGF0ZS5sYXN0X2Jsb2NrX3BhaWQgPSBhcmM0LlVJbnQ2NChibG9ja19yb3VuZCkKICAgIGZyYW1lX2RpZyAxCiAgICByZXBsYWNlMiAyNAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTEzCiAgICAvLyBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLm5hdGl2ZSAtIFVJbnQ2NCgxKQogICAgZHVwCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTEyLTUxNAogICAgLy8gc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2NrcyA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MubmF0aXZlIC0gVUludDY0KDEpCiAgICAvLyApCiAgICBpdG9iCiAgICByZXBsYWNlMiAxNgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUxNQogICAgLy8gaWYgc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2NrcyA9PSAwOgogICAgZXh0cmFjdCAxNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgYnogcGF5b3V0X2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MTYKICAgIC8vIGRlbCBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdCiAgICBmcmFtZV9kaWcgMwogICAgYm94X2RlbAogICAgcG9wCgpwYXlvdXRfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTIwLTUyMQogICAgLy8gIyB1cGRhdGUgZ2xvYmFsIHR4biBmdWVsIHN0YXRlCiAgICAvLyBzZWxmLnR4bl9mdWVsID0gc2VsZi50eG5fZnVlbCAtIHR4bl9mdWVsX3NwZW50CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMSAvLyAidHhuX2Z1ZWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHhuX2Z1ZWwgZXhpc3RzCiAgICBmcmFtZV9kaWcgMgogICAgLQogICAgYnl0ZWNfMSAvLyAidHhuX2Z1ZWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTIyCiAgICAvLyBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzID0gc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyAtIDEKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyBleGlzdHMKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBieXRlY18wIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCnBheW91dF9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUxOAogICAgLy8gc2VsZi5mYXJtc1tyZWNpcGllbnRfYXBwXSA9IHN0YXRlLmNvcHkoKQogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcHV0CiAgICBiIHBheW91dF9hZnRlcl9pZl9lbHNlQDgKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLndpdGhkcmF3X2ZlZXMoYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CndpdGhkcmF3X2ZlZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MjgtNTI5CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgd2l0aGRyYXdfZmVlcyhzZWxmLCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTMwCiAgICAvLyBzZWxmLmVuc3VyZV9tYW5hZ2VyX2NhbGxlcigpCiAgICBjYWxsc3ViIGVuc3VyZV9tYW5hZ2VyX2NhbGxlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTMxCiAgICAvLyBsb2NrZWRfYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgKyAoCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUzMgogICAgLy8gc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyAqIHNlbGYuZ2V0X3NwZW5kX3Blcl9ibG9jaygpCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NDEKICAgIC8vIHJldHVybiBzZWxmLmdldF90eG5fZmVlX3Blcl9ibG9jaygpICsgc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKQogICAgY2FsbHN1YiBnZXRfdHhuX2ZlZV9wZXJfYmxvY2sKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MzIKICAgIC8vIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKiBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTMxLTUzMwogICAgLy8gbG9ja2VkX2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlICsgKAogICAgLy8gICAgIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKiBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKQogICAgLy8gKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM1CiAgICAvLyBsb2NrZWRfYmFsYW5jZSArIGFtb3VudCA8PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UsCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiB3aXRoZHJhd19mZWVzX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM2CiAgICAvLyBTKCJFUlI6T1ZFUiIpLAogICAgcHVzaGJ5dGVzICJFUlI6T1ZFUiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKd2l0aGRyYXdfZmVlc19hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MzkKICAgIC8vIFR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MzgtNTQyCiAgICAvLyBzZW5kLmFsZ29fcGF5KAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50LAogICAgLy8gICAgIFVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTQxCiAgICAvLyBVSW50NjQoMCksCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM4LTU0MgogICAgLy8gc2VuZC5hbGdvX3BheSgKICAgIC8vICAgICBUeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudCwKICAgIC8vICAgICBVSW50NjQoMCksCiAgICAvLyApCiAgICBjYWxsc3ViIGFsZ29fcGF5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLm9wdG91dChhc3NldDogdWludDY0KSAtPiB2b2lkOgpvcHRvdXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NDQtNTQ1CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgb3B0b3V0KHNlbGYsIGFzc2V0OiBBc3NldCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTQ2CiAgICAvLyBzZWxmLmVuc3VyZV9tYW5hZ2VyX2NhbGxlcigpCiAgICBjYWxsc3ViIGVuc3VyZV9tYW5hZ2VyX2NhbGxlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTQ4CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGFzc2V0KSwgUygiRVJSOk5PVCBPUFRFRCIpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IG9wdG91dF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU0OAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5pc19vcHRlZF9pbihhc3NldCksIFMoIkVSUjpOT1QgT1BURUQiKQogICAgcHVzaGJ5dGVzICJFUlI6Tk9UIE9QVEVEIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpvcHRvdXRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTUxCiAgICAvLyBhc3NldC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpID09IDAsIFMoIkVSUjpCQUxBTkNFIikKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgb3B0ZWQgaW50byBhc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYnogb3B0b3V0X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTUxCiAgICAvLyBhc3NldC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpID09IDAsIFMoIkVSUjpCQUxBTkNFIikKICAgIHB1c2hieXRlcyAiRVJSOkJBTEFOQ0UiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCm9wdG91dF9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NTMKICAgIC8vIHNlbmQuYXhmZXJfY2xvc2VvdXQoYXNzZXQsIHNlbGYubWFuYWdlciwgVUludDY0KDApKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDQgLy8gIm1hbmFnZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWFuYWdlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weToyOC0zNAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9cmVjZWl2ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyAgICAgYXNzZXRfY2xvc2VfdG89cmVjZWl2ZXIsCiAgICAvLyAgICAgZmVlPWZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldENsb3NlVG8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weTozMQogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6MjgKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTUzCiAgICAvLyBzZW5kLmF4ZmVyX2Nsb3Nlb3V0KGFzc2V0LCBzZWxmLm1hbmFnZXIsIFVJbnQ2NCgwKSkKICAgIGludGNfMSAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjI4LTM0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1yZWNlaXZlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICAgICBhc3NldF9jbG9zZV90bz1yZWNlaXZlciwKICAgIC8vICAgICBmZWU9ZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0udXBkYXRlX21heF9kdXJhdGlvbl9kYXlzKG1heF9kdXJhdGlvbjogdWludDY0KSAtPiB2b2lkOgp1cGRhdGVfbWF4X2R1cmF0aW9uX2RheXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NTUtNTU2CiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgdXBkYXRlX21heF9kdXJhdGlvbl9kYXlzKHNlbGYsIG1heF9kdXJhdGlvbjogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NTcKICAgIC8vIHNlbGYuZW5zdXJlX21hbmFnZXJfY2FsbGVyKCkKICAgIGNhbGxzdWIgZW5zdXJlX21hbmFnZXJfY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NTgKICAgIC8vIHNlbGYubWF4X2R1cmF0aW9uX2RheXMgPSBtYXhfZHVyYXRpb24KICAgIGJ5dGVjIDcgLy8gIm1heF9kdXJhdGlvbl9kYXlzIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS51cGRhdGVfbWluX2R1cmF0aW9uX2Jsb2NrcyhtaW5fZHVyYXRpb246IHVpbnQ2NCkgLT4gdm9pZDoKdXBkYXRlX21pbl9kdXJhdGlvbl9ibG9ja3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NjAtNTYxCiAgICAvLyBAYWJpbWV0aG9kCiAgICAvLyBkZWYgdXBkYXRlX21pbl9kdXJhdGlvbl9ibG9ja3Moc2VsZiwgbWluX2R1cmF0aW9uOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU2MgogICAgLy8gc2VsZi5lbnN1cmVfbWFuYWdlcl9jYWxsZXIoKQogICAgY2FsbHN1YiBlbnN1cmVfbWFuYWdlcl9jYWxsZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU2MwogICAgLy8gc2VsZi5taW5fZHVyYXRpb25fYmxvY2tzID0gbWluX2R1cmF0aW9uCiAgICBieXRlYyA4IC8vICJtaW5fZHVyYXRpb25fYmxvY2tzIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfc3RhdGUocmVjaXBpZW50X2FwcDogdWludDY0KSAtPiBieXRlczoKZ2V0X3N0YXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTY1LTU2NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9zdGF0ZShzZWxmLCByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbikgLT4gRmFybVN0YXRlOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NjcKICAgIC8vIHJldHVybiBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmZhcm1zIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5sb2dfc3RhdGVzKGJveF9uYW1lczogYnl0ZXMpIC0+IHZvaWQ6CmxvZ19zdGF0ZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NjktNTcwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbG9nX3N0YXRlcyhzZWxmLCBib3hfbmFtZXM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU3MQogICAgLy8gZm9yIGsgaW4gdXJhbmdlKGJveF9uYW1lcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpsb2dfc3RhdGVzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU3MQogICAgLy8gZm9yIGsgaW4gdXJhbmdlKGJveF9uYW1lcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBsb2dfc3RhdGVzX2FmdGVyX2ZvckA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NzIKICAgIC8vIGJveF9uYW1lID0gQXBwbGljYXRpb24oYm94X25hbWVzW2tdLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTczCiAgICAvLyBpZiBib3hfbmFtZSBpbiBzZWxmLmZhcm1zOgogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogbG9nX3N0YXRlc19lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTc0CiAgICAvLyBsb2coc2VsZi5mYXJtc1tib3hfbmFtZV0pCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmFybXMgZW50cnkgZXhpc3RzCiAgICBsb2cKCmxvZ19zdGF0ZXNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTcxCiAgICAvLyBmb3IgayBpbiB1cmFuZ2UoYm94X25hbWVzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBsb2dfc3RhdGVzX2Zvcl9oZWFkZXJAMQoKbG9nX3N0YXRlc19lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU3NgogICAgLy8gbG9nKEZhcm1TdGF0ZS5mcm9tX2J5dGVzKGIiIikpCiAgICBieXRlY18yIC8vIDB4CiAgICBsb2cKICAgIGIgbG9nX3N0YXRlc19hZnRlcl9pZl9lbHNlQDUKCmxvZ19zdGF0ZXNfYWZ0ZXJfZm9yQDc6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLl9nZXRfc3RhdGVfYW5kX2FwcihhcHBfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfc3RhdGVfYW5kX2FwcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU3OC01NzkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2dldF9zdGF0ZV9hbmRfYXByKHNlbGYsIGFwcF9pZDogVUludDY0KSAtPiBGYXJtU3RhdGVBbmRBUFI6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU4MwogICAgLy8gaWYgYm94X25hbWUgaW4gc2VsZi5mYXJtcwogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTgyLTU4OQogICAgLy8gc2VsZi5mYXJtc1tib3hfbmFtZV0KICAgIC8vIGlmIGJveF9uYW1lIGluIHNlbGYuZmFybXMKICAgIC8vIGVsc2UgRmFybVN0YXRlKAogICAgLy8gICAgIGZhcm1fYXNzZXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBsYXN0X2Jsb2NrX3BhaWQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGJ6IF9nZXRfc3RhdGVfYW5kX2Fwcl90ZXJuYXJ5X2ZhbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU4MgogICAgLy8gc2VsZi5mYXJtc1tib3hfbmFtZV0KICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5mYXJtcyBlbnRyeSBleGlzdHMKCl9nZXRfc3RhdGVfYW5kX2Fwcl90ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1OTEKICAgIC8vIGFwciA9IHNlbGYuX3Byb2plY3RfYXByKEFwcGxpY2F0aW9uKGFwcF9pZCksIFVJbnQ2NCg5MDAwMDAwKSkKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA5MDAwMDAwIC8vIDkwMDAwMDAKICAgIGNhbGxzdWIgX3Byb2plY3RfYXByCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1OTMKICAgIC8vIGJhbGFuY2U9YXByLmJhbGFuY2UsCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTk0CiAgICAvLyBzdGFrZWQ9YXByLnN0YWtlZCwKICAgIGRpZyAxCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU5NQogICAgLy8gY3VycmVudF9ibG9ja19ib251cz1hcHIuY3VycmVudF9ibG9ja19ib251cywKICAgIGRpZyAyCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1OTYKICAgIC8vIGN1cnJlbnRfYXZnX2Jsb2NrX3BheW91dD1hcHIuY3VycmVudF9hdmdfYmxvY2tfcGF5b3V0LAogICAgZGlnIDMKICAgIGV4dHJhY3QgMjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU5NwogICAgLy8gY3VycmVudF9mYXJtX2Ftb3VudD1hcHIuY3VycmVudF9mYXJtX2Ftb3VudCwKICAgIGRpZyA0CiAgICBleHRyYWN0IDMyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1OTgKICAgIC8vIGN1cnJlbnRfZmFybV9hbW91bnRfYWxnbz1hcHIuY3VycmVudF9mYXJtX2Ftb3VudF9hbGdvLAogICAgZGlnIDUKICAgIGV4dHJhY3QgNDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU5OQogICAgLy8gb3ZlcnJpZGVfZmFybV9hbW91bnQ9YXByLm92ZXJyaWRlX2Zhcm1fYW1vdW50LAogICAgZGlnIDYKICAgIGV4dHJhY3QgNDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwMAogICAgLy8gb3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbz1hcHIub3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbywKICAgIGRpZyA3CiAgICBleHRyYWN0IDU2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MDEKICAgIC8vIGF2Z19yb3VuZF90aW1lPWFwci5hdmdfcm91bmRfdGltZSwKICAgIGRpZyA4CiAgICBleHRyYWN0IDY0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MDIKICAgIC8vIG9ubGluZV9zdGFrZT1hcHIub25saW5lX3N0YWtlLAogICAgZGlnIDkKICAgIGV4dHJhY3QgNzIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwMwogICAgLy8gZXhwZWN0ZWRfeWVhcmx5X2Jsb2Nrcz1hcHIuZXhwZWN0ZWRfeWVhcmx5X2Jsb2NrcywKICAgIGRpZyAxMAogICAgZXh0cmFjdCA4MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjA0CiAgICAvLyBiYXNlX2Fwcl9icHM9YXByLmJhc2VfYXByX2JwcywKICAgIGRpZyAxMQogICAgZXh0cmFjdCA4OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjA1CiAgICAvLyBmYXJtX2Fwcl9icHM9YXByLmZhcm1fYXByX2JwcywKICAgIGRpZyAxMgogICAgZXh0cmFjdCA5NiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjA2CiAgICAvLyBvdmVycmlkZV9mYXJtX2Fwcl9icHM9YXByLm92ZXJyaWRlX2Zhcm1fYXByX2JwcywKICAgIHVuY292ZXIgMTMKICAgIGV4dHJhY3QgMTA0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MDcKICAgIC8vIGZhcm1fYXNzZXQ9c3RhdGUuZmFybV9hc3NldCwKICAgIHVuY292ZXIgMTQKICAgIGR1cAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MDgKICAgIC8vIGFtb3VudF9wZXJfYmxvY2s9c3RhdGUuYW1vdW50X3Blcl9ibG9jaywKICAgIGRpZyAxCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwOQogICAgLy8gcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1zdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLAogICAgZGlnIDIKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxMAogICAgLy8gbGFzdF9ibG9ja19wYWlkPXN0YXRlLmxhc3RfYmxvY2tfcGFpZCwKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdCAyNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTkyLTYxMQogICAgLy8gcmV0dXJuIEZhcm1TdGF0ZUFuZEFQUigKICAgIC8vICAgICBiYWxhbmNlPWFwci5iYWxhbmNlLAogICAgLy8gICAgIHN0YWtlZD1hcHIuc3Rha2VkLAogICAgLy8gICAgIGN1cnJlbnRfYmxvY2tfYm9udXM9YXByLmN1cnJlbnRfYmxvY2tfYm9udXMsCiAgICAvLyAgICAgY3VycmVudF9hdmdfYmxvY2tfcGF5b3V0PWFwci5jdXJyZW50X2F2Z19ibG9ja19wYXlvdXQsCiAgICAvLyAgICAgY3VycmVudF9mYXJtX2Ftb3VudD1hcHIuY3VycmVudF9mYXJtX2Ftb3VudCwKICAgIC8vICAgICBjdXJyZW50X2Zhcm1fYW1vdW50X2FsZ289YXByLmN1cnJlbnRfZmFybV9hbW91bnRfYWxnbywKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Ftb3VudD1hcHIub3ZlcnJpZGVfZmFybV9hbW91bnQsCiAgICAvLyAgICAgb3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbz1hcHIub3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbywKICAgIC8vICAgICBhdmdfcm91bmRfdGltZT1hcHIuYXZnX3JvdW5kX3RpbWUsCiAgICAvLyAgICAgb25saW5lX3N0YWtlPWFwci5vbmxpbmVfc3Rha2UsCiAgICAvLyAgICAgZXhwZWN0ZWRfeWVhcmx5X2Jsb2Nrcz1hcHIuZXhwZWN0ZWRfeWVhcmx5X2Jsb2NrcywKICAgIC8vICAgICBiYXNlX2Fwcl9icHM9YXByLmJhc2VfYXByX2JwcywKICAgIC8vICAgICBmYXJtX2Fwcl9icHM9YXByLmZhcm1fYXByX2JwcywKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Fwcl9icHM9YXByLm92ZXJyaWRlX2Zhcm1fYXByX2JwcywKICAgIC8vICAgICBmYXJtX2Fzc2V0PXN0YXRlLmZhcm1fYXNzZXQsCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1zdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9c3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2NrcywKICAgIC8vICAgICBsYXN0X2Jsb2NrX3BhaWQ9c3RhdGUubGFzdF9ibG9ja19wYWlkLAogICAgLy8gKQogICAgdW5jb3ZlciAxNwogICAgdW5jb3ZlciAxNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDE2CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDEzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDEwCiAgICBjb25jYXQKICAgIHVuY292ZXIgOQogICAgY29uY2F0CiAgICB1bmNvdmVyIDgKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBjb25jYXQKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICByZXRzdWIKCl9nZXRfc3RhdGVfYW5kX2Fwcl90ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1ODQtNTg5CiAgICAvLyBlbHNlIEZhcm1TdGF0ZSgKICAgIC8vICAgICBmYXJtX2Fzc2V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbGFzdF9ibG9ja19wYWlkPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBiIF9nZXRfc3RhdGVfYW5kX2Fwcl90ZXJuYXJ5X21lcmdlQDMKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9zdGF0ZV9hbmRfYXByKGFwcF9pZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfc3RhdGVfYW5kX2FwcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxMy02MTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfc3RhdGVfYW5kX2FwcihzZWxmLCBhcHBfaWQ6IGFyYzQuVUludDY0KSAtPiBGYXJtU3RhdGVBbmRBUFI6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxNQogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9zdGF0ZV9hbmRfYXByKGFwcF9pZC5uYXRpdmUpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGNhbGxzdWIgX2dldF9zdGF0ZV9hbmRfYXByCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmxvZ19zdGF0ZXNfYW5kX2FwcnMoYXBwX2lkczogYnl0ZXMpIC0+IHZvaWQ6CmxvZ19zdGF0ZXNfYW5kX2FwcnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTctNjE4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbG9nX3N0YXRlc19hbmRfYXBycyhzZWxmLCBhcHBfaWRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxOQogICAgLy8gZm9yIGsgaW4gdXJhbmdlKGFwcF9pZHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKbG9nX3N0YXRlc19hbmRfYXByc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTkKICAgIC8vIGZvciBrIGluIHVyYW5nZShhcHBfaWRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGxvZ19zdGF0ZXNfYW5kX2FwcnNfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyMAogICAgLy8gbG9nKHNlbGYuX2dldF9zdGF0ZV9hbmRfYXByKGFwcF9pZHNba10ubmF0aXZlKSkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBjYWxsc3ViIF9nZXRfc3RhdGVfYW5kX2FwcgogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTkKICAgIC8vIGZvciBrIGluIHVyYW5nZShhcHBfaWRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGxvZ19zdGF0ZXNfYW5kX2FwcnNfZm9yX2hlYWRlckAxCgpsb2dfc3RhdGVzX2FuZF9hcHJzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5sb2dfYmxvY2tfcHJvcG9zZXJzKHN0YXJ0X3JvdW5kOiB1aW50NjQsIGVuZF9yb3VuZDogdWludDY0KSAtPiB2b2lkOgpsb2dfYmxvY2tfcHJvcG9zZXJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjIyLTYyMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGxvZ19ibG9ja19wcm9wb3NlcnMoc2VsZiwgc3RhcnRfcm91bmQ6IFVJbnQ2NCwgZW5kX3JvdW5kOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gZm9yIHJuZCBpbiB1cmFuZ2Uoc3RhcnRfcm91bmQsIGVuZF9yb3VuZCArIDEpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfZGlnIC0yCgpsb2dfYmxvY2tfcHJvcG9zZXJzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gZm9yIHJuZCBpbiB1cmFuZ2Uoc3RhcnRfcm91bmQsIGVuZF9yb3VuZCArIDEpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBsb2dfYmxvY2tfcHJvcG9zZXJzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MjUKICAgIC8vIGxvZyhvcC5CbG9jay5ibGtfcHJvcG9zZXIocm5kKSkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGJsb2NrIEJsa1Byb3Bvc2VyCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gZm9yIHJuZCBpbiB1cmFuZ2Uoc3RhcnRfcm91bmQsIGVuZF9yb3VuZCArIDEpOgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBsb2dfYmxvY2tfcHJvcG9zZXJzX2Zvcl9oZWFkZXJAMQoKbG9nX2Jsb2NrX3Byb3Bvc2Vyc19hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZW5zdXJlX21hbmFnZXJfY2FsbGVyKCkgLT4gdm9pZDoKZW5zdXJlX21hbmFnZXJfY2FsbGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjI3LTYyOAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBlbnN1cmVfbWFuYWdlcl9jYWxsZXIoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjI5CiAgICAvLyBjdXN0b20uZW5zdXJlKFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyLCBTKCJFUlI6VU5BVVRIIikpCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNCAvLyAibWFuYWdlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYW5hZ2VyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBlbnN1cmVfbWFuYWdlcl9jYWxsZXJfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MjkKICAgIC8vIGN1c3RvbS5lbnN1cmUoVHhuLnNlbmRlciA9PSBzZWxmLm1hbmFnZXIsIFMoIkVSUjpVTkFVVEgiKSkKICAgIHB1c2hieXRlcyAiRVJSOlVOQVVUSCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKZW5zdXJlX21hbmFnZXJfY2FsbGVyX2FmdGVyX2lmX2Vsc2VAMzoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkgLT4gdWludDY0OgpnZXRfaXhfcmV3YXJkc19wZXJfYmxvY2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NDMtNjQ0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jayhzZWxmKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY0NQogICAgLy8gcmV0dXJuIHNlbGYuaXhfcGIgKiBHbG9iYWwubWluX3R4bl9mZWUKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyA5IC8vICJpeF9wYiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5peF9wYiBleGlzdHMKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgICoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrKCkgLT4gdWludDY0OgpnZXRfdHhuX2ZlZV9wZXJfYmxvY2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NTEtNjUyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF90eG5fZmVlX3Blcl9ibG9jayhzZWxmKSAtPiBVSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY1MwogICAgLy8gcmV0dXJuIHNlbGYudHhuX2ZlZV9wYiAqIEdsb2JhbC5taW5fdHhuX2ZlZQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDExIC8vICJ0eG5fZmVlX3BiIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR4bl9mZWVfcGIgZXhpc3RzCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICAqCiAgICByZXRzdWIK","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"bareActions":{"create":["NoOp"],"call":["DeleteApplication","UpdateApplication"]}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"arcs":[],"name":"DualstakeFarm","structs":{"APRBreakdown":[{"name":"balance","type":"uint64"},{"name":"staked","type":"uint64"},{"name":"currentBlockBonus","type":"uint64"},{"name":"currentAvgBlockPayout","type":"uint64"},{"name":"currentFarmAmount","type":"uint64"},{"name":"currentFarmAmountAlgo","type":"uint64"},{"name":"overrideFarmAmount","type":"uint64"},{"name":"overrideFarmAmountAlgo","type":"uint64"},{"name":"avgRoundTime","type":"uint64"},{"name":"onlineStake","type":"uint64"},{"name":"expectedYearlyBlocks","type":"uint64"},{"name":"baseAprBps","type":"uint64"},{"name":"farmAprBps","type":"uint64"},{"name":"overrideFarmAprBps","type":"uint64"}],"AlgoCost":[{"name":"totalCost","type":"uint64"},{"name":"optinCost","type":"uint64"},{"name":"boxCost","type":"uint64"},{"name":"platformCost","type":"uint64"},{"name":"ixCost","type":"uint64"},{"name":"txnFeeCost","type":"uint64"}],"AlgoCostAndMaxDuration":[{"name":"totalCost","type":"uint64"},{"name":"optinCost","type":"uint64"},{"name":"boxCost","type":"uint64"},{"name":"platformCost","type":"uint64"},{"name":"ixCost","type":"uint64"},{"name":"txnFeeCost","type":"uint64"},{"name":"maxDuration","type":"uint64"}],"FarmState":[{"name":"farmAsset","type":"uint64"},{"name":"amountPerBlock","type":"uint64"},{"name":"remainingDurationBlocks","type":"uint64"},{"name":"lastBlockPaid","type":"uint64"}],"GlobalSnapshot":[{"name":"round","type":"uint64"},{"name":"balance","type":"uint64"},{"name":"lockedBalance","type":"uint64"},{"name":"txnFuel","type":"uint64"},{"name":"globalRemainingBlocks","type":"uint64"},{"name":"ixAccrued","type":"uint64"},{"name":"activeFarms","type":"uint64"},{"name":"blocksPaid","type":"uint64"},{"name":"farmsCreated","type":"uint64"},{"name":"farmsExtended","type":"uint64"},{"name":"farmsExpired","type":"uint64"},{"name":"ixPb","type":"uint64"},{"name":"platFeePb","type":"uint64"},{"name":"txnFeePb","type":"uint64"},{"name":"maxDurationDays","type":"uint64"},{"name":"minDurationBlocks","type":"uint64"},{"name":"avgRoundTime","type":"uint64"},{"name":"avgBlockPayout","type":"uint64"},{"name":"onlineStake","type":"uint64"}],"FarmStateAndAPR":[{"name":"balance","type":"uint64"},{"name":"staked","type":"uint64"},{"name":"currentBlockBonus","type":"uint64"},{"name":"currentAvgBlockPayout","type":"uint64"},{"name":"currentFarmAmount","type":"uint64"},{"name":"currentFarmAmountAlgo","type":"uint64"},{"name":"overrideFarmAmount","type":"uint64"},{"name":"overrideFarmAmountAlgo","type":"uint64"},{"name":"avgRoundTime","type":"uint64"},{"name":"onlineStake","type":"uint64"},{"name":"expectedYearlyBlocks","type":"uint64"},{"name":"baseAprBps","type":"uint64"},{"name":"farmAprBps","type":"uint64"},{"name":"overrideFarmAprBps","type":"uint64"},{"name":"farmAsset","type":"uint64"},{"name":"amountPerBlock","type":"uint64"},{"name":"remainingDurationBlocks","type":"uint64"},{"name":"lastBlockPaid","type":"uint64"}]},"methods":[{"name":"project_apr","args":[{"name":"recipient_app","type":"application"},{"name":"override_farm_amount","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"APRBreakdown"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"project_apr_curve","args":[{"name":"recipient_app","type":"application"},{"name":"override_farm_amounts","type":"uint64[]"}],"returns":{"type":"(uint64,uint64)[]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_algo_cost","args":[{"name":"recipient_app","type":"application"},{"name":"farm_asset","type":"asset"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64)","struct":"AlgoCost"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_algo_cost_and_max_duration","args":[{"name":"recipient_app","type":"application"},{"name":"farm_asset","type":"asset"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"AlgoCostAndMaxDuration"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"update_oracle","args":[],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"create_farm","args":[{"name":"recipient_app","type":"application"},{"name":"farm_asset","type":"asset"},{"name":"amount_per_block","type":"uint64"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"extend_duration_blocks","args":[{"name":"recipient_app","type":"application"},{"name":"duration_blocks","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"extend_amount_per_block","args":[{"name":"recipient_app","type":"application"},{"name":"amount_per_block","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"payout","args":[{"name":"recipient_app","type":"application"},{"name":"block_round","type":"uint64"},{"name":"call_swap","type":"bool"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"payout_many","args":[{"name":"recipient_app","type":"application"},{"name":"block_rounds","type":"uint64[]"},{"name":"call_swap","type":"bool"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"payout_batch","args":[{"name":"items","type":"(uint64,uint64)[]"},{"name":"call_swap","type":"bool"}],"returns":{"type":"uint64"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"record_proposals","args":[{"name":"recipient_app","type":"application"},{"name":"block_rounds","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"settle","args":[{"name":"recipient_app","type":"application"},{"name":"call_swap","type":"bool"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"noop","args":[],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"withdraw_fees","args":[{"name":"amount","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"claim_ix_rewards","args":[],"returns":{"type":"uint64"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_ix_rewards","args":[{"name":"keeper","type":"account"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"optout","args":[{"name":"asset","type":"asset"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"update_max_duration_days","args":[{"name":"max_duration","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"update_min_duration_blocks","args":[{"name":"min_duration","type":"uint64"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_state","args":[{"name":"recipient_app","type":"application"}],"returns":{"type":"(uint64,uint64,uint64,uint64)","struct":"FarmState"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_pending_blocks","args":[{"name":"recipient_app","type":"application"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_global_snapshot","args":[],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"GlobalSnapshot"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_states","args":[{"name":"box_names","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_state_and_apr","args":[{"name":"app_id","type":"uint64"}],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)","struct":"FarmStateAndAPR"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_states_and_aprs","args":[{"name":"app_ids","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_states_and_aprs_override","args":[{"name":"app_ids","type":"uint64[]"},{"name":"override_farm_amount","type":"uint64"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_block_proposers","args":[{"name":"start_round","type":"uint64"},{"name":"end_round","type":"uint64"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_farm_proposals","args":[{"name":"app_ids","type":"uint64[]"},{"name":"start_round","type":"uint64"},{"name":"end_round","type":"uint64"}],"returns":{"type":"uint64[]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}}],"state":{"schema":{"global":{"ints":40,"bytes":24},"local":{"ints":0,"bytes":0}},"keys":{"global":{"avg_block_payout":{"key":"YXZnX2Jsb2NrX3BheW91dA==","keyType":"AVMString","valueType":"AVMUint64"},"avg_round_time":{"key":"YXZnX3JvdW5kX3RpbWU=","keyType":"AVMString","valueType":"AVMUint64"},"blocks_funded":{"key":"YmxvY2tzX2Z1bmRlZA==","keyType":"AVMString","valueType":"AVMUint64"},"farms_created":{"key":"ZmFybXNfY3JlYXRlZA==","keyType":"AVMString","valueType":"AVMUint64"},"farms_expired":{"key":"ZmFybXNfZXhwaXJlZA==","keyType":"AVMString","valueType":"AVMUint64"},"farms_extended":{"key":"ZmFybXNfZXh0ZW5kZWQ=","keyType":"AVMString","valueType":"AVMUint64"},"global_remaining_blocks":{"key":"Z2xvYmFsX3JlbWFpbmluZ19ibG9ja3M=","keyType":"AVMString","valueType":"AVMUint64"},"ix_accrued":{"key":"aXhfYWNjcnVlZA==","keyType":"AVMString","valueType":"AVMUint64"},"ix_pb":{"key":"aXhfcGI=","keyType":"AVMString","valueType":"AVMUint64"},"ix_recorded_blocks":{"key":"aXhfcmVjb3JkZWRfYmxvY2tz","keyType":"AVMString","valueType":"AVMUint64"},"manager":{"key":"bWFuYWdlcg==","keyType":"AVMString","valueType":"AVMBytes"},"max_duration_days":{"key":"bWF4X2R1cmF0aW9uX2RheXM=","keyType":"AVMString","valueType":"AVMUint64"},"min_duration_blocks":{"key":"bWluX2R1cmF0aW9uX2Jsb2Nrcw==","keyType":"AVMString","valueType":"AVMUint64"},"oracle_round":{"key":"b3JhY2xlX3JvdW5k","keyType":"AVMString","valueType":"AVMUint64"},"plat_fee_pb":{"key":"cGxhdF9mZWVfcGI=","keyType":"AVMString","valueType":"AVMUint64"},"txn_fee_pb":{"key":"dHhuX2ZlZV9wYg==","keyType":"AVMString","valueType":"AVMUint64"},"txn_fuel":{"key":"dHhuX2Z1ZWw=","keyType":"AVMString","valueType":"AVMUint64"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAxNiAxMDAwMCAxMDAwIDEwMDEgMTg5MDAgOTAwMDAwMAogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4ICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIgInR4bl9mdWVsIiAiRVJSOk5PIEZBUk0iICJpeF9hY2NydWVkIiAweDAwMDAgImZhcm1zX2V4dGVuZGVkIiAiaXhfcmVjb3JkZWRfYmxvY2tzIiAweDZiICJhdmdfYmxvY2tfcGF5b3V0IiAiZmFybXNfY3JlYXRlZCIgMHgwMDAwMDAwMCAiRVJSOkJMS1MiICJmYXJtc19leHBpcmVkIiAiYXZnX3JvdW5kX3RpbWUiICJtYW5hZ2VyIiAibWF4X2R1cmF0aW9uX2RheXMiICJtaW5fZHVyYXRpb25fYmxvY2tzIiAiaXhfcGIiICJwbGF0X2ZlZV9wYiIgInR4bl9mZWVfcGIiICJvcmFjbGVfcm91bmQiICJFUlI6Tk8gQkxLUyIgMHgwMDAwMDAwMDAwMDAwMDAwICJibG9ja3NfZnVuZGVkIiAweDc0NmQzMjVmNjE3MDcwNWY2OTY0IDB4NmM3MDVmNjk2NCAweDczNzQ2MTZiNjU2NCAiRVJSOkRTIFNUVCIgMHg2MTczNjE1ZjY5NjQgMHg2ZWQ2YmE1YwogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MjgyCiAgICAvLyBzZWxmLm1hbmFnZXIgPSBUeG4uc2VuZGVyCiAgICBieXRlYyAxNiAvLyAibWFuYWdlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyODQKICAgIC8vIHNlbGYudHhuX2Z1ZWwgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzMgLy8gInR4bl9mdWVsIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyODUKICAgIC8vIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gImdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyOTQKICAgIC8vIHNlbGYubWF4X2R1cmF0aW9uX2RheXMgPSBVSW50NjQoREVGQVVMVF9NQVhfRFVSQVRJT05fREFZUykKICAgIGJ5dGVjIDE3IC8vICJtYXhfZHVyYXRpb25fZGF5cyIKICAgIHB1c2hpbnQgNDUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyOTUKICAgIC8vIHNlbGYubWluX2R1cmF0aW9uX2Jsb2NrcyA9IFVJbnQ2NChERUZBVUxUX01JTl9EVVJBVElPTl9CTE9DS1MpCiAgICBieXRlYyAxOCAvLyAibWluX2R1cmF0aW9uX2Jsb2NrcyIKICAgIHB1c2hpbnQgMzAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyOTcKICAgIC8vIHNlbGYuaXhfcGIgPSBVSW50NjQoSVhfUkVXQVJEU19QRVJfQkxPQ0spCiAgICBieXRlYyAxOSAvLyAiaXhfcGIiCiAgICBwdXNoaW50IDEwMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gc2VsZi5wbGF0X2ZlZV9wYiA9IFVJbnQ2NChQTEFURk9STV9GRUVfUEVSX0JMT0NLKQogICAgYnl0ZWMgMjAgLy8gInBsYXRfZmVlX3BiIgogICAgcHVzaGludCA5NwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI5OQogICAgLy8gc2VsZi50eG5fZmVlX3BiID0gVUludDY0KFRYTl9GRUVfUEVSX0JMT0NLKQogICAgYnl0ZWMgMjEgLy8gInR4bl9mZWVfcGIiCiAgICBwdXNoaW50IDMKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjI3Ni0yODAKICAgIC8vIGNsYXNzIER1YWxzdGFrZUZhcm0oCiAgICAvLyAgICAgQVJDNENvbnRyYWN0LAogICAgLy8gICAgIGF2bV92ZXJzaW9uPTExLAogICAgLy8gICAgIHN0YXRlX3RvdGFscz1TdGF0ZVRvdGFscyhnbG9iYWxfdWludHM9NDAsIGdsb2JhbF9ieXRlcz0yNCksCiAgICAvLyApOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDM4CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIHB1c2hieXRlc3MgMHhmM2RiMDRkOSAweGQ5ZWM3MmNkIDB4MDgzNjIxNzggMHg1ZDY0Y2JkMCAweDViODlmNDAzIDB4NzQ1ODVkY2UgMHgwMjkwYjgyMCAweDA5Mjg5N2QzIDB4OWExNGE4NGYgMHhjYTY2NjlmNCAweDczZjZmY2IzIDB4OWRhOWY5NWEgMHgxODUwOWVhOSAweGU4M2E4N2FiIDB4MGQxMzE3NTEgMHg2N2JlMzdiZCAweDBkODFlNjAzIDB4N2NjYmU3MjYgMHhlOWQ4MjdjYyAweGUwODA0OGZjIDB4MTVkNjllZmMgMHg0MDM0NzBlMyAweDBmY2UzNmVlIDB4YzhhMDY1NGIgMHhjMDVkMDdlYyAweDViZWYxYjkyIDB4MGUxODQ5ODEgMHhkMjk5ZjJhMCAweDdjY2NmNThkIC8vIG1ldGhvZCAicHJvamVjdF9hcHIoYXBwbGljYXRpb24sdWludDY0KSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAicHJvamVjdF9hcHJfY3VydmUoYXBwbGljYXRpb24sdWludDY0W10pKHVpbnQ2NCx1aW50NjQpW10iLCBtZXRob2QgImdldF9hbGdvX2Nvc3QoYXBwbGljYXRpb24sYXNzZXQsdWludDY0KSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9hbGdvX2Nvc3RfYW5kX21heF9kdXJhdGlvbihhcHBsaWNhdGlvbixhc3NldCx1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgInVwZGF0ZV9vcmFjbGUoKXZvaWQiLCBtZXRob2QgImNyZWF0ZV9mYXJtKGFwcGxpY2F0aW9uLGFzc2V0LHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAiZXh0ZW5kX2R1cmF0aW9uX2Jsb2NrcyhhcHBsaWNhdGlvbix1aW50NjQpdm9pZCIsIG1ldGhvZCAiZXh0ZW5kX2Ftb3VudF9wZXJfYmxvY2soYXBwbGljYXRpb24sdWludDY0KXZvaWQiLCBtZXRob2QgInBheW91dChhcHBsaWNhdGlvbix1aW50NjQsYm9vbCl2b2lkIiwgbWV0aG9kICJwYXlvdXRfbWFueShhcHBsaWNhdGlvbix1aW50NjRbXSxib29sKXZvaWQiLCBtZXRob2QgInBheW91dF9iYXRjaCgodWludDY0LHVpbnQ2NClbXSxib29sKXVpbnQ2NCIsIG1ldGhvZCAicmVjb3JkX3Byb3Bvc2FscyhhcHBsaWNhdGlvbix1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJzZXR0bGUoYXBwbGljYXRpb24sYm9vbCl2b2lkIiwgbWV0aG9kICJub29wKCl2b2lkIiwgbWV0aG9kICJ3aXRoZHJhd19mZWVzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjbGFpbV9peF9yZXdhcmRzKCl1aW50NjQiLCBtZXRob2QgImdldF9peF9yZXdhcmRzKGFjY291bnQpdWludDY0IiwgbWV0aG9kICJvcHRvdXQoYXNzZXQpdm9pZCIsIG1ldGhvZCAidXBkYXRlX21heF9kdXJhdGlvbl9kYXlzKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ1cGRhdGVfbWluX2R1cmF0aW9uX2Jsb2Nrcyh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X3N0YXRlKGFwcGxpY2F0aW9uKSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfcGVuZGluZ19ibG9ja3MoYXBwbGljYXRpb24pdWludDY0IiwgbWV0aG9kICJnZXRfZ2xvYmFsX3NuYXBzaG90KCkodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAibG9nX3N0YXRlcyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfc3RhdGVfYW5kX2Fwcih1aW50NjQpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAibG9nX3N0YXRlc19hbmRfYXBycyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJsb2dfc3RhdGVzX2FuZF9hcHJzX292ZXJyaWRlKHVpbnQ2NFtdLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJsb2dfYmxvY2tfcHJvcG9zZXJzKHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAibG9nX2Zhcm1fcHJvcG9zYWxzKHVpbnQ2NFtdLHVpbnQ2NCx1aW50NjQpdWludDY0W10iCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBwcm9qZWN0X2FwciBwcm9qZWN0X2Fwcl9jdXJ2ZSBnZXRfYWxnb19jb3N0IGdldF9hbGdvX2Nvc3RfYW5kX21heF9kdXJhdGlvbiB1cGRhdGVfb3JhY2xlIGNyZWF0ZV9mYXJtIGV4dGVuZF9kdXJhdGlvbl9ibG9ja3MgZXh0ZW5kX2Ftb3VudF9wZXJfYmxvY2sgcGF5b3V0IHBheW91dF9tYW55IHBheW91dF9iYXRjaCByZWNvcmRfcHJvcG9zYWxzIHNldHRsZSBtYWluX25vb3Bfcm91dGVAMTkgd2l0aGRyYXdfZmVlcyBjbGFpbV9peF9yZXdhcmRzIGdldF9peF9yZXdhcmRzIG9wdG91dCB1cGRhdGVfbWF4X2R1cmF0aW9uX2RheXMgdXBkYXRlX21pbl9kdXJhdGlvbl9ibG9ja3MgZ2V0X3N0YXRlIGdldF9wZW5kaW5nX2Jsb2NrcyBnZXRfZ2xvYmFsX3NuYXBzaG90IGxvZ19zdGF0ZXMgZ2V0X3N0YXRlX2FuZF9hcHIgbG9nX3N0YXRlc19hbmRfYXBycyBsb2dfc3RhdGVzX2FuZF9hcHJzX292ZXJyaWRlIGxvZ19ibG9ja19wcm9wb3NlcnMgbG9nX2Zhcm1fcHJvcG9zYWxzCgptYWluX2FmdGVyX2lmX2Vsc2VANDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyNzYtMjgwCiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIGVycgoKbWFpbl9ub29wX3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE1MAogICAgLy8gQGFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMzg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToyNzYtMjgwCiAgICAvLyBjbGFzcyBEdWFsc3Rha2VGYXJtKAogICAgLy8gICAgIEFSQzRDb250cmFjdCwKICAgIC8vICAgICBhdm1fdmVyc2lvbj0xMSwKICAgIC8vICAgICBzdGF0ZV90b3RhbHM9U3RhdGVUb3RhbHMoZ2xvYmFsX3VpbnRzPTQwLCBnbG9iYWxfYnl0ZXM9MjQpLAogICAgLy8gKToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHN3aXRjaCBtYWluX19fYWxnb3B5X2RlZmF1bHRfY3JlYXRlQDM5IG1haW5fYWZ0ZXJfaWZfZWxzZUA0MyBtYWluX2FmdGVyX2lmX2Vsc2VANDMgbWFpbl9hZnRlcl9pZl9lbHNlQDQzIG1haW5fdXBkYXRlQDQwIG1haW5fZGVsZXRlQDQxCiAgICBlcnIKCm1haW5fZGVsZXRlQDQxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzE5CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMyMQogICAgLy8gc2VsZi5lbnN1cmVfbWFuYWdlcl9jYWxsZXIoKQogICAgY2FsbHN1YiBlbnN1cmVfbWFuYWdlcl9jYWxsZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPSgiRGVsZXRlQXBwbGljYXRpb24iLCkpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZUA0MDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPSgiVXBkYXRlQXBwbGljYXRpb24iLCkpCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMTcKICAgIC8vIHNlbGYuZW5zdXJlX21hbmFnZXJfY2FsbGVyKCkKICAgIGNhbGxzdWIgZW5zdXJlX21hbmFnZXJfY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMTUKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz0oIlVwZGF0ZUFwcGxpY2F0aW9uIiwpKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUAzOToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY29tbW9uLnNlbmQuYXhmZXIoYXNzZXQ6IHVpbnQ2NCwgcmVjZWl2ZXI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCwgZmVlOiB1aW50NjQpIC0+IHZvaWQ6CmF4ZmVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjE4LTE5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGF4ZmVyKGFzc2V0OiBBc3NldCwgcmVjZWl2ZXI6IEFjY291bnQsIGFtb3VudDogVUludDY0LCBmZWU6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjIwLTIyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwgYXNzZXRfcmVjZWl2ZXI9cmVjZWl2ZXIsIGFzc2V0X2Ftb3VudD1hbW91bnQsIGZlZT1mZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtNAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weToyMAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6MjAtMjIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LCBhc3NldF9yZWNlaXZlcj1yZWNlaXZlciwgYXNzZXRfYW1vdW50PWFtb3VudCwgZmVlPWZlZQogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weToyMwogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29tbW9uLnNlbmQuYWxnb19wYXkocmVjZWl2ZXI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCwgZmVlOiB1aW50NjQpIC0+IHZvaWQ6CmFsZ29fcGF5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjM4LTM5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFsZ29fcGF5KHJlY2VpdmVyOiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCwgZmVlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weTo0MAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPXJlY2VpdmVyLCBhbW91bnQ9YW1vdW50LCBmZWU9ZmVlKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjQxCiAgICAvLyByZXR1cm4KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb21tb24udmFsaWRhdGUuYXhmZXJfYW1vdW50X2V4YWN0KGF4ZmVyX3R4bl9pZDogdWludDY0LCBleHBlY3RlZF9hc3NldDogdWludDY0LCBleHBlY3RlZF9hbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKYXhmZXJfYW1vdW50X2V4YWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weToyNi0yOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBheGZlcl9hbW91bnRfZXhhY3QoCiAgICAvLyAgICAgYXhmZXJfdHhuX2lkOiBVSW50NjQsIGV4cGVjdGVkX2Fzc2V0OiBBc3NldCwgZXhwZWN0ZWRfYW1vdW50OiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weToxNwogICAgLy8gYXhmZXJfdHhuID0gZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24oYXhmZXJfdHhuX2lkeCkKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgVHlwZUVudW0KICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjE4CiAgICAvLyBjdXN0b20uZW5zdXJlKGF4ZmVyX3R4bi54ZmVyX2Fzc2V0ID09IGV4cGVjdGVkX2Fzc2V0LCBTKCJFUlI6QVhGRVIgSUQiKSkKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogYXhmZXJfYW1vdW50X2V4YWN0X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weToxOAogICAgLy8gY3VzdG9tLmVuc3VyZShheGZlcl90eG4ueGZlcl9hc3NldCA9PSBleHBlY3RlZF9hc3NldCwgUygiRVJSOkFYRkVSIElEIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpBWEZFUiBJRCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYXhmZXJfYW1vdW50X2V4YWN0X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6MjAKICAgIC8vIGF4ZmVyX3R4bi5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBheGZlcl9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjIxCiAgICAvLyBTKCJFUlI6QVhGRVIgUkNWIiksCiAgICBwdXNoYnl0ZXMgIkVSUjpBWEZFUiBSQ1YiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmF4ZmVyX2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjIzCiAgICAvLyByZXR1cm4gYXhmZXJfdHhuLmFzc2V0X2Ftb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTozMQogICAgLy8gYXhmZXIoYXhmZXJfdHhuX2lkLCBleHBlY3RlZF9hc3NldCkgPj0gZXhwZWN0ZWRfYW1vdW50LCBTKCJFUlI6QVhGRVIgQU1UIikKICAgIGZyYW1lX2RpZyAtMQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBheGZlcl9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTozMQogICAgLy8gYXhmZXIoYXhmZXJfdHhuX2lkLCBleHBlY3RlZF9hc3NldCkgPj0gZXhwZWN0ZWRfYW1vdW50LCBTKCJFUlI6QVhGRVIgQU1UIikKICAgIHB1c2hieXRlcyAiRVJSOkFYRkVSIEFNVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYXhmZXJfYW1vdW50X2V4YWN0X2FmdGVyX2lmX2Vsc2VAMTE6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29tbW9uLnZhbGlkYXRlLnBheW1lbnRfYW1vdW50X2V4YWN0KHBheW1lbnRfdHhuX2lkeDogdWludDY0LCBleHBlY3RlZF9hbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKcGF5bWVudF9hbW91bnRfZXhhY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjUwLTUxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHBheW1lbnRfYW1vdW50X2V4YWN0KHBheW1lbnRfdHhuX2lkeDogVUludDY0LCBleHBlY3RlZF9hbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi92YWxpZGF0ZS5weTozNwogICAgLy8gcGF5X3R4biA9IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKHR4bl9pZHgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjM5CiAgICAvLyBwYXlfdHhuLnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBwYXltZW50X2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vdmFsaWRhdGUucHk6NDAKICAgIC8vIFMoIkVSUjpQQVkgUkNWIiksCiAgICBwdXNoYnl0ZXMgIkVSUjpQQVkgUkNWIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpwYXltZW50X2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjQyCiAgICAvLyByZXR1cm4gcGF5X3R4bi5hbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjUyCiAgICAvLyBjdXN0b20uZW5zdXJlKHBheW1lbnQocGF5bWVudF90eG5faWR4KSA9PSBleHBlY3RlZF9hbW91bnQsIFMoIkVSUjpQQVkgQU1UIikpCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcGF5bWVudF9hbW91bnRfZXhhY3RfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3ZhbGlkYXRlLnB5OjUyCiAgICAvLyBjdXN0b20uZW5zdXJlKHBheW1lbnQocGF5bWVudF90eG5faWR4KSA9PSBleHBlY3RlZF9hbW91bnQsIFMoIkVSUjpQQVkgQU1UIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpQQVkgQU1UIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpwYXltZW50X2Ftb3VudF9leGFjdF9hZnRlcl9pZl9lbHNlQDc6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29tbW9uLm1hdGguc2FmZV9zdWJ0cmFjdChhOiB1aW50NjQsIGI6IHVpbnQ2NCwgZGVmYXVsdDogdWludDY0KSAtPiB1aW50NjQ6CnNhZmVfc3VidHJhY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6MjMtMjQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgc2FmZV9zdWJ0cmFjdChhOiBVSW50NjQsIGI6IFVJbnQ2NCwgZGVmYXVsdDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weToyNQogICAgLy8gcmV0dXJuIGEgLSBiIGlmIGEgPiBiIGVsc2UgZGVmYXVsdAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgID4KICAgIGJ6IHNhZmVfc3VidHJhY3RfdGVybmFyeV9mYWxzZUAyCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgLQogICAgcmV0c3ViCgpzYWZlX3N1YnRyYWN0X3Rlcm5hcnlfZmFsc2VAMjoKICAgIGZyYW1lX2RpZyAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjI1CiAgICAvLyByZXR1cm4gYSAtIGIgaWYgYSA+IGIgZWxzZSBkZWZhdWx0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnByb2plY3RfYXByW3JvdXRpbmddKCkgLT4gdm9pZDoKcHJvamVjdF9hcHI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NDkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM2NQogICAgLy8gZmFybV9hbW91bnQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNjYKICAgIC8vIGlmIHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtczoKICAgIGl0b2IKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogcHJvamVjdF9hcHJfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNjcKICAgIC8vIGZhcm1fYW1vdW50ID0gc2VsZi5sb2FkX2Zhcm0ocmVjaXBpZW50X2FwcCkuYW1vdW50X3Blcl9ibG9jay5hc191aW50NjQoKQogICAgZGlnIDIKICAgIGNhbGxzdWIgbG9hZF9mYXJtCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ1cnkgMQoKcHJvamVjdF9hcHJfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzcwCiAgICAvLyByZWNpcGllbnRfYXBwLCBmYXJtX2Ftb3VudCwgb3ZlcnJpZGVfZmFybV9hbW91bnQsIHNlbGYuZ2V0X2Fwcl9jb250ZXh0KCkKICAgIGNhbGxzdWIgZ2V0X2Fwcl9jb250ZXh0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNjktMzcxCiAgICAvLyByZXR1cm4gc2VsZi5fcHJvamVjdF9hcHJfaW5fY29udGV4dCgKICAgIC8vICAgICByZWNpcGllbnRfYXBwLCBmYXJtX2Ftb3VudCwgb3ZlcnJpZGVfZmFybV9hbW91bnQsIHNlbGYuZ2V0X2Fwcl9jb250ZXh0KCkKICAgIC8vICkKICAgIGRpZyA3CiAgICBkaWcgNgogICAgZGlnIDgKICAgIGNvdmVyIDcKICAgIGNvdmVyIDcKICAgIGNvdmVyIDcKICAgIGNhbGxzdWIgX3Byb2plY3RfYXByX2luX2NvbnRleHQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ0OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0ucHJvamVjdF9hcHJfY3VydmVbcm91dGluZ10oKSAtPiB2b2lkOgpwcm9qZWN0X2Fwcl9jdXJ2ZToKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDU3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NjkKICAgIC8vIG92ZXJyaWRlX2Zhcm1fYW1vdW50cy5sZW5ndGggPD0gVUludDY0KE1BWF9BUFJfQ1VSVkVfUE9JTlRTKSwKICAgIHB1c2hpbnQgNjMKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcHJvamVjdF9hcHJfY3VydmVfYWZ0ZXJfaWZfZWxzZUAxOQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDcwCiAgICAvLyBTKCJFUlI6UE9JTlRTIiksCiAgICBwdXNoYnl0ZXMgIkVSUjpQT0lOVFMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnByb2plY3RfYXByX2N1cnZlX2FmdGVyX2lmX2Vsc2VAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NzIKICAgIC8vIHRtMl9hcHBfaWQsIGV4aXN0czEgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X3VpbnQ2NChyZWNpcGllbnRfYXBwLCBiInRtMl9hcHBfaWQiKQogICAgZGlnIDIKICAgIGR1cAogICAgYnl0ZWMgMjYgLy8gMHg3NDZkMzI1ZjYxNzA3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGNvdmVyIDIKICAgIGJ1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDczCiAgICAvLyB0bTJfbHBfYWRkciwgZXhpc3RzMiA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMocmVjaXBpZW50X2FwcCwgYiJscF9pZCIpCiAgICBkdXAKICAgIGJ5dGVjIDI3IC8vIDB4NmM3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGJ1cnkgMTUKICAgIGJ1cnkgMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ3NAogICAgLy8gc3Rha2VkLCBleGlzdHMzID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocmVjaXBpZW50X2FwcCwgYiJzdGFrZWQiKQogICAgYnl0ZWMgMjggLy8gMHg3Mzc0NjE2YjY1NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEzCiAgICBidXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ3NQogICAgLy8gY3VzdG9tLmVuc3VyZShleGlzdHMxIGFuZCBleGlzdHMyIGFuZCBleGlzdHMzLCBTKCJFUlI6RFMgU1RUIikpCiAgICBieiBwcm9qZWN0X2Fwcl9jdXJ2ZV9ib29sX2ZhbHNlQDUKICAgIGRpZyAxMQogICAgYnogcHJvamVjdF9hcHJfY3VydmVfYm9vbF9mYWxzZUA1CiAgICBkaWcgMTAKICAgIGJ6IHByb2plY3RfYXByX2N1cnZlX2Jvb2xfZmFsc2VANQogICAgaW50Y18xIC8vIDEKCnByb2plY3RfYXByX2N1cnZlX2Jvb2xfbWVyZ2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBwcm9qZWN0X2Fwcl9jdXJ2ZV9hZnRlcl9pZl9lbHNlQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NzUKICAgIC8vIGN1c3RvbS5lbnN1cmUoZXhpc3RzMSBhbmQgZXhpc3RzMiBhbmQgZXhpc3RzMywgUygiRVJSOkRTIFNUVCIpKQogICAgYnl0ZWMgMjkgLy8gIkVSUjpEUyBTVFQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnByb2plY3RfYXByX2N1cnZlX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NzcKICAgIC8vIGN0eCA9IHNlbGYuZ2V0X2Fwcl9jb250ZXh0KCkKICAgIGNhbGxzdWIgZ2V0X2Fwcl9jb250ZXh0CiAgICBjb3ZlciA0CiAgICBwb3BuIDMKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ3OAogICAgLy8gcG9vbCA9IHNlbGYucmVhZF90aW55bWFuX3Bvb2woQXBwbGljYXRpb24odG0yX2FwcF9pZCksIEFjY291bnQodG0yX2xwX2FkZHIpKQogICAgZGlnIDE0CiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgZGlnIDYKICAgIHN3YXAKICAgIGNhbGxzdWIgcmVhZF90aW55bWFuX3Bvb2wKICAgIGJ1cnkgMTAKICAgIGJ1cnkgMTAKICAgIGJ1cnkgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gY3R4LnllYXJseV9ibG9ja3MsIHJlY2lwaWVudF9hcHAuYWRkcmVzcy5iYWxhbmNlLCBjdHgub25saW5lX3N0YWtlCiAgICBkaWcgNAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo0MC00MQogICAgLy8gIyBmbG9vcihhICogYiAvIGMpLiBmYWlscyBpZiB0aGUgcmVzdWx0IGRvZXMgbm90IGZpdAogICAgLy8gaGksIGxvID0gb3AubXVsdyhhLCBiKQogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQyCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaSwgbG8sIGMpCiAgICB1bmNvdmVyIDIKICAgIGRpdncKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDgzCiAgICAvLyBjdXJ2ZSA9IGFyYzQuRHluYW1pY0FycmF5W0FQUkN1cnZlUG9pbnRdKCkKICAgIGJ5dGVjIDYgLy8gMHgwMDAwCiAgICBidXJ5IDE0CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAxMAoKcHJvamVjdF9hcHJfY3VydmVfZm9yX2hlYWRlckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDg0CiAgICAvLyBmb3IgYW1vdW50IGluIG92ZXJyaWRlX2Zhcm1fYW1vdW50czoKICAgIGRpZyA5CiAgICBkaWcgMQogICAgPAogICAgYnogcHJvamVjdF9hcHJfY3VydmVfYWZ0ZXJfZm9yQDEwCiAgICBkaWcgMQogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDg1CiAgICAvLyBmYXJtX2Ftb3VudF9hbGdvID0gc2VsZi5nZXRfdGlueW1hbl9hbGdvX3ByaWNlKHBvb2wsIGFtb3VudC5hc191aW50NjQoKSkKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgOQogICAgZGlnIDkKICAgIGRpZyA5CiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgZ2V0X3RpbnltYW5fYWxnb19wcmljZQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDg2LTQ4OAogICAgLy8gZmFybV9hcHJfYnBzID0gc2VsZi5nZXRfYXByX2JwcygKICAgIC8vICAgICBmYXJtX2Ftb3VudF9hbGdvLCBvd25feWVhcmx5X2Jsb2Nrc19wcm9kdWNlZCwgc3Rha2VkCiAgICAvLyApCiAgICBkdXAKICAgIGRpZyAxMQogICAgZGlnIDgKICAgIGNhbGxzdWIgZ2V0X2Fwcl9icHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gZmFybV9hbW91bnRfYWxnbz1hcmM0LlVJbnQ2NChmYXJtX2Ftb3VudF9hbGdvKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ5MgogICAgLy8gZmFybV9hcHJfYnBzPWFyYzQuVUludDY0KGZhcm1fYXByX2JwcyksCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0OTAtNDkzCiAgICAvLyBBUFJDdXJ2ZVBvaW50KAogICAgLy8gICAgIGZhcm1fYW1vdW50X2FsZ289YXJjNC5VSW50NjQoZmFybV9hbW91bnRfYWxnbyksCiAgICAvLyAgICAgZmFybV9hcHJfYnBzPWFyYzQuVUludDY0KGZhcm1fYXByX2JwcyksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ4OS00OTQKICAgIC8vIGN1cnZlLmFwcGVuZCgKICAgIC8vICAgICBBUFJDdXJ2ZVBvaW50KAogICAgLy8gICAgICAgICBmYXJtX2Ftb3VudF9hbGdvPWFyYzQuVUludDY0KGZhcm1fYW1vdW50X2FsZ28pLAogICAgLy8gICAgICAgICBmYXJtX2Fwcl9icHM9YXJjNC5VSW50NjQoZmFybV9hcHJfYnBzKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBkaWcgMTUKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQgLy8gb24gZXJyb3I6IG1heCBhcnJheSBsZW5ndGggZXhjZWVkZWQKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICByZXBsYWNlMiAwCiAgICBidXJ5IDE1CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxMAogICAgYiBwcm9qZWN0X2Fwcl9jdXJ2ZV9mb3JfaGVhZGVyQDcKCnByb2plY3RfYXByX2N1cnZlX2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ1NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBkaWcgMTQKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpwcm9qZWN0X2Fwcl9jdXJ2ZV9ib29sX2ZhbHNlQDU6CiAgICBpbnRjXzAgLy8gMAogICAgYiBwcm9qZWN0X2Fwcl9jdXJ2ZV9ib29sX21lcmdlQDYKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9hbGdvX2Nvc3Rbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWxnb19jb3N0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTIyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUyNgogICAgLy8gcmV0dXJuIHNlbGYuY2FsY3VsYXRlX2FsZ29fY29zdChyZWNpcGllbnRfYXBwLCBmYXJtX2Fzc2V0LCBkdXJhdGlvbl9ibG9ja3MpCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9hbGdvX2Nvc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUyMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZ2V0X2FsZ29fY29zdF9hbmRfbWF4X2R1cmF0aW9uW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FsZ29fY29zdF9hbmRfbWF4X2R1cmF0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTI4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUzMgogICAgLy8gY29zdCA9IHNlbGYuY2FsY3VsYXRlX2FsZ29fY29zdChyZWNpcGllbnRfYXBwLCBmYXJtX2Fzc2V0LCBkdXJhdGlvbl9ibG9ja3MpCiAgICBkaWcgMgogICAgY292ZXIgMgogICAgY2FsbHN1YiBjYWxjdWxhdGVfYWxnb19jb3N0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MzQKICAgIC8vIHRvdGFsX2Nvc3Q9Y29zdC50b3RhbF9jb3N0LAogICAgZHVwCiAgICBleHRyYWN0IDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM1CiAgICAvLyBib3hfY29zdD1jb3N0LmJveF9jb3N0LAogICAgZGlnIDEKICAgIGV4dHJhY3QgMTYgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM2CiAgICAvLyBvcHRpbl9jb3N0PWNvc3Qub3B0aW5fY29zdCwKICAgIGRpZyAyCiAgICBleHRyYWN0IDggOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM3CiAgICAvLyB0eG5fZmVlX2Nvc3Q9Y29zdC50eG5fZmVlX2Nvc3QsCiAgICBkaWcgMwogICAgZXh0cmFjdCA0MCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MzgKICAgIC8vIGl4X2Nvc3Q9Y29zdC5peF9jb3N0LAogICAgZGlnIDQKICAgIGV4dHJhY3QgMzIgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTM5CiAgICAvLyBwbGF0Zm9ybV9jb3N0PWNvc3QucGxhdGZvcm1fY29zdCwKICAgIHVuY292ZXIgNQogICAgZXh0cmFjdCAyNCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NDAKICAgIC8vIG1heF9kdXJhdGlvbj1hcmM0LlVJbnQ2NChzZWxmLmdldF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcCkpLAogICAgdW5jb3ZlciA2CiAgICBjYWxsc3ViIGdldF9tYXhfZHVyYXRpb24KICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUzMy01NDEKICAgIC8vIHJldHVybiBBbGdvQ29zdEFuZE1heER1cmF0aW9uKAogICAgLy8gICAgIHRvdGFsX2Nvc3Q9Y29zdC50b3RhbF9jb3N0LAogICAgLy8gICAgIGJveF9jb3N0PWNvc3QuYm94X2Nvc3QsCiAgICAvLyAgICAgb3B0aW5fY29zdD1jb3N0Lm9wdGluX2Nvc3QsCiAgICAvLyAgICAgdHhuX2ZlZV9jb3N0PWNvc3QudHhuX2ZlZV9jb3N0LAogICAgLy8gICAgIGl4X2Nvc3Q9Y29zdC5peF9jb3N0LAogICAgLy8gICAgIHBsYXRmb3JtX2Nvc3Q9Y29zdC5wbGF0Zm9ybV9jb3N0LAogICAgLy8gICAgIG1heF9kdXJhdGlvbj1hcmM0LlVJbnQ2NChzZWxmLmdldF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcCkpLAogICAgLy8gKQogICAgdW5jb3ZlciA2CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTI4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS51cGRhdGVfb3JhY2xlW3JvdXRpbmddKCkgLT4gdm9pZDoKdXBkYXRlX29yYWNsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weToyOQogICAgLy8gcmV0dXJuIFR4bi5maXJzdF92YWxpZCAtIFVJbnQ2NCgxKQogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1ODMKICAgIC8vIGlmIHJvdW5kX3RpbWUubGFzdF9hY2Nlc3NpYmxlX3JvdW5kKCkgPj0gc2VsZi5vcmFjbGVfcm91bmQuZ2V0KAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIyIC8vICJvcmFjbGVfcm91bmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTg0CiAgICAvLyBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1ODMtNTg1CiAgICAvLyBpZiByb3VuZF90aW1lLmxhc3RfYWNjZXNzaWJsZV9yb3VuZCgpID49IHNlbGYub3JhY2xlX3JvdW5kLmdldCgKICAgIC8vICAgICBVSW50NjQoMCkKICAgIC8vICkgKyBVSW50NjQoT1JBQ0xFX1VQREFURV9ST1VORFMpOgogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1ODUKICAgIC8vICkgKyBVSW50NjQoT1JBQ0xFX1VQREFURV9ST1VORFMpOgogICAgcHVzaGludCAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU4My01ODUKICAgIC8vIGlmIHJvdW5kX3RpbWUubGFzdF9hY2Nlc3NpYmxlX3JvdW5kKCkgPj0gc2VsZi5vcmFjbGVfcm91bmQuZ2V0KAogICAgLy8gICAgIFVJbnQ2NCgwKQogICAgLy8gKSArIFVJbnQ2NChPUkFDTEVfVVBEQVRFX1JPVU5EUyk6CiAgICArCiAgICA+PQogICAgYnogdXBkYXRlX29yYWNsZV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU4NgogICAgLy8gc2VsZi5mb2xkX29yYWNsZSgpCiAgICBjYWxsc3ViIGZvbGRfb3JhY2xlCgp1cGRhdGVfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU3NgogICAgLy8gQGFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uY3JlYXRlX2Zhcm1bcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGVfZmFybToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYzOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgc3dhcAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBzd2FwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY0Ni02NDcKICAgIC8vICMgcmVqZWN0IGlmIGZhcm0gZXhpc3RzIGFscmVhZHkKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBub3QgaW4gc2VsZi5mYXJtcywgUygiRVJSOkVYSVNUUyIpKQogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJ6IGNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjQ2LTY0NwogICAgLy8gIyByZWplY3QgaWYgZmFybSBleGlzdHMgYWxyZWFkeQogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXBwIG5vdCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6RVhJU1RTIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpFWElTVFMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gY3VzdG9tLmVuc3VyZShUeG4uZ3JvdXBfaW5kZXggPiAwLCBTKCJFUlI6Tk8gUEFZIikpCiAgICB0eG4gR3JvdXBJbmRleAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gY3VzdG9tLmVuc3VyZShUeG4uZ3JvdXBfaW5kZXggPiAwLCBTKCJFUlI6Tk8gUEFZIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpOTyBQQVkiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBkaWcgMQogICAgYm56IGNyZWF0ZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY1MC02NTEKICAgIC8vICMgYSBmYXJtIGVuZHMgd2hlbiBpdHMgbGFzdCBibG9jayBpcyBwYWlkLCB3aGljaCBkZWxldGVzIGl0cyBib3gKICAgIC8vIGN1c3RvbS5lbnN1cmUoZHVyYXRpb25fYmxvY2tzID4gMCwgUygiRVJSOk5PIEJMS1MiKSkKICAgIGJ5dGVjIDIzIC8vICJFUlI6Tk8gQkxLUyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKY3JlYXRlX2Zhcm1fYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY1NQogICAgLy8gVHhuLmdyb3VwX2luZGV4IC0gVUludDY0KDEpLCAgIyBwcmV2aW91cyB0eG4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjU2LTY1OAogICAgLy8gc2VsZi5jYWxjdWxhdGVfYWxnb19jb3N0KAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAsIGZhcm1fYXNzZXQsIGR1cmF0aW9uX2Jsb2NrcwogICAgLy8gKS50b3RhbF9jb3N0LmFzX3VpbnQ2NCgpLAogICAgZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgZGlnIDgKICAgIGR1cAogICAgY292ZXIgMwogICAgZGlnIDYKICAgIGR1cAogICAgY292ZXIgNAogICAgY2FsbHN1YiBjYWxjdWxhdGVfYWxnb19jb3N0CiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY1My02NTkKICAgIC8vICMgdmFsaWRhdGUgQUxHTyBwYXltZW50LiBwb3NpdGlvbmVkIGJlZm9yZSBzbyBpdCBjYW4gY292ZXIgb3B0aW4gYW5kIGJveCBNQlIKICAgIC8vIHZhbGlkYXRlLnBheW1lbnRfYW1vdW50X2V4YWN0KAogICAgLy8gICAgIFR4bi5ncm91cF9pbmRleCAtIFVJbnQ2NCgxKSwgICMgcHJldmlvdXMgdHhuCiAgICAvLyAgICAgc2VsZi5jYWxjdWxhdGVfYWxnb19jb3N0KAogICAgLy8gICAgICAgICByZWNpcGllbnRfYXBwLCBmYXJtX2Fzc2V0LCBkdXJhdGlvbl9ibG9ja3MKICAgIC8vICAgICApLnRvdGFsX2Nvc3QuYXNfdWludDY0KCksCiAgICAvLyApCiAgICBjYWxsc3ViIHBheW1lbnRfYW1vdW50X2V4YWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NjUKICAgIC8vIFR4bi5ncm91cF9pbmRleCArIFVJbnQ2NCgxKSwgICMgbmV4dCB0eG4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjY3CiAgICAvLyBhbW91bnRfcGVyX2Jsb2NrICogZHVyYXRpb25fYmxvY2tzLAogICAgZGlnIDcKICAgIGRpZyAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NjEtNjY4CiAgICAvLyAjIHZhbGlkYXRlIEFTQSBkZXBvc2l0LiBwb3NpdGlvbmVkIGFmdGVyIGFwcCBjYWxsIHNvIHdlIGNhbiBvcHQgaW4gaWYgbmVlZGVkCiAgICAvLyAjIGRvbid0IGRvIGFzIEkgZG8sIGlmIHlvdSB1c2UgdGhpcyBwYXR0ZXJuIHlvdSBjYW4gZ2V0IGV4cGxvaXRlZCBpZiBhbm90aGVyIG1ldGhvZCB2YWxpZGF0ZXMgYW4gYXNhIHBheW1lbnQgYXQgKC0xKQogICAgLy8gIyBhbmQgaWYgeW91IGRvIGRvIGFzIEkgZG8sIGVuc3VyZSBhbGwgeW91ciBheGZlcnMgYXJlIGV4cGVjdGVkIGF0ICsxCiAgICAvLyB2YWxpZGF0ZS5heGZlcl9hbW91bnRfZXhhY3QoCiAgICAvLyAgICAgVHhuLmdyb3VwX2luZGV4ICsgVUludDY0KDEpLCAgIyBuZXh0IHR4bgogICAgLy8gICAgIGZhcm1fYXNzZXQsCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jayAqIGR1cmF0aW9uX2Jsb2NrcywKICAgIC8vICkKICAgIGRpZyAzCiAgICBzd2FwCiAgICBjYWxsc3ViIGF4ZmVyX2Ftb3VudF9leGFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjcwCiAgICAvLyBzZWxmLnZhbGlkYXRlX2R1cmF0aW9uKHJlY2lwaWVudF9hcHAsIGR1cmF0aW9uX2Jsb2NrcykKICAgIGRpZyAyCiAgICBzd2FwCiAgICBjYWxsc3ViIHZhbGlkYXRlX2R1cmF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NzItNjczCiAgICAvLyAjIENoZWNrIHJlY2lwaWVudCBhcHAgc3RhdGUKICAgIC8vIHJlY2lwaWVudF9hc2FfaWQsIGV4aXN0cyA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHJlY2lwaWVudF9hcHAsIGIiYXNhX2lkIikKICAgIHN3YXAKICAgIGJ5dGVjIDMwIC8vIDB4NjE3MzYxNWY2OTY0CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NzQKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FzYV9pZCA9PSBmYXJtX2Fzc2V0LmlkLCBTKCJFUlI6QVBQIEFTQSIpKQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBjcmVhdGVfZmFybV9hZnRlcl9pZl9lbHNlQDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NzQKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FzYV9pZCA9PSBmYXJtX2Fzc2V0LmlkLCBTKCJFUlI6QVBQIEFTQSIpKQogICAgcHVzaGJ5dGVzICJFUlI6QVBQIEFTQSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKY3JlYXRlX2Zhcm1fYWZ0ZXJfaWZfZWxzZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY3Ni02NzcKICAgIC8vICMgb3B0aW4gaWYgbmVlZGVkCiAgICAvLyBpZiBub3QgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5pc19vcHRlZF9pbihmYXJtX2Fzc2V0KToKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBkaWcgNgogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGJueiBjcmVhdGVfZmFybV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weTo2CiAgICAvLyBheGZlcihhc3NldCwgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgVUludDY0KDApLCBmZWUpCiAgICBkaWcgNQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2NzgKICAgIC8vIHNlbmQub3B0aW4oZmFybV9hc3NldCwgVUludDY0KDApKQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3NlbmQucHk6NgogICAgLy8gYXhmZXIoYXNzZXQsIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsIFVJbnQ2NCgwKSwgZmVlKQogICAgY2FsbHN1YiBheGZlcgoKY3JlYXRlX2Zhcm1fYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Njg0CiAgICAvLyBmYXJtX2Fzc2V0PWFyYzQuVUludDY0KGZhcm1fYXNzZXQuaWQpLAogICAgZGlnIDUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY4NgogICAgLy8gcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1zZWxmLnRvX3UzMihkdXJhdGlvbl9ibG9ja3MpLAogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgY2FsbHN1YiB0b191MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY4NwogICAgLy8gbGFzdF9ibG9ja19wYWlkPXNlbGYudG9fdTMyKEdsb2JhbC5yb3VuZCArIDEpLAogICAgZ2xvYmFsIFJvdW5kCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgY2FsbHN1YiB0b191MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY4My02ODkKICAgIC8vIEZhcm1Cb3goCiAgICAvLyAgICAgZmFybV9hc3NldD1hcmM0LlVJbnQ2NChmYXJtX2Fzc2V0LmlkKSwKICAgIC8vICAgICBhbW91bnRfcGVyX2Jsb2NrPWFyYzQuVUludDY0KGFtb3VudF9wZXJfYmxvY2spLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9c2VsZi50b191MzIoZHVyYXRpb25fYmxvY2tzKSwKICAgIC8vICAgICBsYXN0X2Jsb2NrX3BhaWQ9c2VsZi50b191MzIoR2xvYmFsLnJvdW5kICsgMSksCiAgICAvLyAgICAgcGVuZGluZ19ibG9ja3M9YXJjNC5VSW50MTYoMCksCiAgICAvLyApLAogICAgZGlnIDIKICAgIGRpZyA5CiAgICBkdXAKICAgIGNvdmVyIDYKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Njg4CiAgICAvLyBwZW5kaW5nX2Jsb2Nrcz1hcmM0LlVJbnQxNigwKSwKICAgIGJ5dGVjIDYgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2ODMtNjg5CiAgICAvLyBGYXJtQm94KAogICAgLy8gICAgIGZhcm1fYXNzZXQ9YXJjNC5VSW50NjQoZmFybV9hc3NldC5pZCksCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NChhbW91bnRfcGVyX2Jsb2NrKSwKICAgIC8vICAgICByZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzPXNlbGYudG9fdTMyKGR1cmF0aW9uX2Jsb2NrcyksCiAgICAvLyAgICAgbGFzdF9ibG9ja19wYWlkPXNlbGYudG9fdTMyKEdsb2JhbC5yb3VuZCArIDEpLAogICAgLy8gICAgIHBlbmRpbmdfYmxvY2tzPWFyYzQuVUludDE2KDApLAogICAgLy8gKSwKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjgwLTY5MAogICAgLy8gIyBjcmVhdGUgZmFybSBib3ggZW50cnkKICAgIC8vIHNlbGYuc3RvcmVfZmFybSgKICAgIC8vICAgICByZWNpcGllbnRfYXBwLAogICAgLy8gICAgIEZhcm1Cb3goCiAgICAvLyAgICAgICAgIGZhcm1fYXNzZXQ9YXJjNC5VSW50NjQoZmFybV9hc3NldC5pZCksCiAgICAvLyAgICAgICAgIGFtb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoYW1vdW50X3Blcl9ibG9jayksCiAgICAvLyAgICAgICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9c2VsZi50b191MzIoZHVyYXRpb25fYmxvY2tzKSwKICAgIC8vICAgICAgICAgbGFzdF9ibG9ja19wYWlkPXNlbGYudG9fdTMyKEdsb2JhbC5yb3VuZCArIDEpLAogICAgLy8gICAgICAgICBwZW5kaW5nX2Jsb2Nrcz1hcmM0LlVJbnQxNigwKSwKICAgIC8vICAgICApLAogICAgLy8gKQogICAgZGlnIDEwCiAgICBzd2FwCiAgICBjYWxsc3ViIHN0b3JlX2Zhcm0KICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjkxCiAgICAvLyBzZWxmLmZhcm1zX2NyZWF0ZWQudmFsdWUgPSBzZWxmLmZhcm1zX2NyZWF0ZWQuZ2V0KFVJbnQ2NCgwKSkgKyAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gImZhcm1zX2NyZWF0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDExIC8vICJmYXJtc19jcmVhdGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY5MgogICAgLy8gc2VsZi5mdW5kX2Jsb2NrcyhkdXJhdGlvbl9ibG9ja3MpCiAgICBkaWcgMQogICAgY2FsbHN1YiBmdW5kX2Jsb2NrcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Njk0LTY5NQogICAgLy8gIyBhZGQgdG8gZ2xvYmFsIHR4biBmdWVsCiAgICAvLyBzZWxmLnR4bl9mdWVsID0gc2VsZi50eG5fZnVlbCArIHNlbGYuZ2V0X3NwZW5kX3Blcl9ibG9jaygpICogZHVyYXRpb25fYmxvY2tzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidHhuX2Z1ZWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHhuX2Z1ZWwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDc3CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfdHhuX2ZlZV9wZXJfYmxvY2soKSArIHNlbGYuZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkKICAgIGNhbGxzdWIgZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrCiAgICBjYWxsc3ViIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jawogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Njk0LTY5NQogICAgLy8gIyBhZGQgdG8gZ2xvYmFsIHR4biBmdWVsCiAgICAvLyBzZWxmLnR4bl9mdWVsID0gc2VsZi50eG5fZnVlbCArIHNlbGYuZ2V0X3NwZW5kX3Blcl9ibG9jaygpICogZHVyYXRpb25fYmxvY2tzCiAgICBkaWcgMwogICAgKgogICAgKwogICAgYnl0ZWNfMyAvLyAidHhuX2Z1ZWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Njk2CiAgICAvLyBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzID0gc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyArIGR1cmF0aW9uX2Jsb2NrcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIGV4aXN0cwogICAgdW5jb3ZlciAyCiAgICArCiAgICBieXRlY18yIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3MDQKICAgIC8vIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Njk5LTcwNQogICAgLy8gRmFybUNyZWF0ZWQoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcD1hcmM0LlVJbnQ2NChyZWNpcGllbnRfYXBwLmlkKSwKICAgIC8vICAgICBmYXJtX2Fzc2V0PWFyYzQuVUludDY0KGZhcm1fYXNzZXQuaWQpLAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoYW1vdW50X3Blcl9ibG9jayksCiAgICAvLyAgICAgZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KGR1cmF0aW9uX2Jsb2NrcyksCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyApCiAgICBkaWcgMwogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjY5OC03MDYKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBGYXJtQ3JlYXRlZCgKICAgIC8vICAgICAgICAgcmVjaXBpZW50X2FwcD1hcmM0LlVJbnQ2NChyZWNpcGllbnRfYXBwLmlkKSwKICAgIC8vICAgICAgICAgZmFybV9hc3NldD1hcmM0LlVJbnQ2NChmYXJtX2Fzc2V0LmlkKSwKICAgIC8vICAgICAgICAgYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NChhbW91bnRfcGVyX2Jsb2NrKSwKICAgIC8vICAgICAgICAgZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KGR1cmF0aW9uX2Jsb2NrcyksCiAgICAvLyAgICAgICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGEzMWYxZGQ3IC8vIG1ldGhvZCAiRmFybUNyZWF0ZWQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYzOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5leHRlbmRfZHVyYXRpb25fYmxvY2tzW3JvdXRpbmddKCkgLT4gdm9pZDoKZXh0ZW5kX2R1cmF0aW9uX2Jsb2NrczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjcwOAogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3MTQKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBleHRlbmRfZHVyYXRpb25fYmxvY2tzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzE0CiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGJ5dGVjIDQgLy8gIkVSUjpOTyBGQVJNIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpleHRlbmRfZHVyYXRpb25fYmxvY2tzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjcxNgogICAgLy8gc3RhdGUgPSBzZWxmLmxvYWRfZmFybShyZWNpcGllbnRfYXBwKQogICAgZGlnIDMKICAgIGR1cAogICAgY2FsbHN1YiBsb2FkX2Zhcm0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjcxNwogICAgLy8gZmFybV9hc3NldCA9IEFzc2V0KHN0YXRlLmZhcm1fYXNzZXQuYXNfdWludDY0KCkpCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzIxCiAgICAvLyBUeG4uZ3JvdXBfaW5kZXggLSBVSW50NjQoMSksICAjIHByZXZpb3VzIHR4bgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3MjItNzI0CiAgICAvLyBzZWxmLmNhbGN1bGF0ZV9hbGdvX2Nvc3QoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcCwgZmFybV9hc3NldCwgZHVyYXRpb25fYmxvY2tzCiAgICAvLyApLnRvdGFsX2Nvc3QuYXNfdWludDY0KCksCiAgICBkaWcgMwogICAgZGlnIDIKICAgIGRpZyA3CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGNhbGxzdWIgY2FsY3VsYXRlX2FsZ29fY29zdAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3MTktNzI1CiAgICAvLyAjIHZhbGlkYXRlIEFMR08gYW5kIEFTQSBwYXltZW50cy4ga2VlcGluZyBjcmVhdGVfZmFybSBiZWZvcmUvYWZ0ZXIgc3RydWN0dXJlIGZvciBzaW1wbGljaXR5CiAgICAvLyB2YWxpZGF0ZS5wYXltZW50X2Ftb3VudF9leGFjdCgKICAgIC8vICAgICBUeG4uZ3JvdXBfaW5kZXggLSBVSW50NjQoMSksICAjIHByZXZpb3VzIHR4bgogICAgLy8gICAgIHNlbGYuY2FsY3VsYXRlX2FsZ29fY29zdCgKICAgIC8vICAgICAgICAgcmVjaXBpZW50X2FwcCwgZmFybV9hc3NldCwgZHVyYXRpb25fYmxvY2tzCiAgICAvLyAgICAgKS50b3RhbF9jb3N0LmFzX3VpbnQ2NCgpLAogICAgLy8gKQogICAgY2FsbHN1YiBwYXltZW50X2Ftb3VudF9leGFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzI4CiAgICAvLyBUeG4uZ3JvdXBfaW5kZXggKyBVSW50NjQoMSksICAjIG5leHQgdHhuCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjczMAogICAgLy8gc3RhdGUuYW1vdW50X3Blcl9ibG9jay5hc191aW50NjQoKSAqIGR1cmF0aW9uX2Jsb2NrcywKICAgIGRpZyAzCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3MjctNzMxCiAgICAvLyB2YWxpZGF0ZS5heGZlcl9hbW91bnRfZXhhY3QoCiAgICAvLyAgICAgVHhuLmdyb3VwX2luZGV4ICsgVUludDY0KDEpLCAgIyBuZXh0IHR4bgogICAgLy8gICAgIGZhcm1fYXNzZXQsCiAgICAvLyAgICAgc3RhdGUuYW1vdW50X3Blcl9ibG9jay5hc191aW50NjQoKSAqIGR1cmF0aW9uX2Jsb2NrcywKICAgIC8vICkKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGF4ZmVyX2Ftb3VudF9leGFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzM0CiAgICAvLyByZWNpcGllbnRfYXBwLCBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpICsgZHVyYXRpb25fYmxvY2tzCiAgICBkaWcgMQogICAgaW50Y18zIC8vIDE2CiAgICBleHRyYWN0X3VpbnQzMgogICAgZGlnIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjczMy03MzUKICAgIC8vIHNlbGYudmFsaWRhdGVfZHVyYXRpb24oCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcCwgc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKSArIGR1cmF0aW9uX2Jsb2NrcwogICAgLy8gKQogICAgZGlnIDMKICAgIGRpZyAxCiAgICBjYWxsc3ViIHZhbGlkYXRlX2R1cmF0aW9uCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3MzctNzQwCiAgICAvLyAjIGFkanVzdCByZW1haW5pbmcgYmxvY2tzIGluIHN0YXRlCiAgICAvLyBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzID0gc2VsZi50b191MzIoCiAgICAvLyAgICAgc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKSArIGR1cmF0aW9uX2Jsb2NrcwogICAgLy8gKQogICAgY2FsbHN1YiB0b191MzIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgcmVwbGFjZTIgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc0MS03NDIKICAgIC8vICMgc2F2ZSBzdGF0ZQogICAgLy8gc2VsZi5zdG9yZV9mYXJtKHJlY2lwaWVudF9hcHAsIHN0YXRlKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjYWxsc3ViIHN0b3JlX2Zhcm0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc0MwogICAgLy8gc2VsZi5mYXJtc19leHRlbmRlZC52YWx1ZSA9IHNlbGYuZmFybXNfZXh0ZW5kZWQuZ2V0KFVJbnQ2NCgwKSkgKyAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAiZmFybXNfZXh0ZW5kZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDcgLy8gImZhcm1zX2V4dGVuZGVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc0NC03NDUKICAgIC8vICMgZm9sZGVkIGFmdGVyIHZhbGlkYXRpb24gc28gdGhlIGR1cmF0aW9uIGNoZWNrIG1hdGNoZXMgYSBwcmlvciBxdW90ZQogICAgLy8gc2VsZi5mb2xkX29yYWNsZSgpCiAgICBjYWxsc3ViIGZvbGRfb3JhY2xlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NDctNzQ4CiAgICAvLyAjIGFkanVzdCB0eG4gZnVlbCByZW1haW5pbmcKICAgIC8vIHNlbGYudHhuX2Z1ZWwgPSBzZWxmLnR4bl9mdWVsICsgc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkgKiBkdXJhdGlvbl9ibG9ja3MKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0eG5fZnVlbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50eG5fZnVlbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NzcKICAgIC8vIHJldHVybiBzZWxmLmdldF90eG5fZmVlX3Blcl9ibG9jaygpICsgc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKQogICAgY2FsbHN1YiBnZXRfdHhuX2ZlZV9wZXJfYmxvY2sKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NDctNzQ4CiAgICAvLyAjIGFkanVzdCB0eG4gZnVlbCByZW1haW5pbmcKICAgIC8vIHNlbGYudHhuX2Z1ZWwgPSBzZWxmLnR4bl9mdWVsICsgc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkgKiBkdXJhdGlvbl9ibG9ja3MKICAgIGRpZyAzCiAgICAqCiAgICArCiAgICBieXRlY18zIC8vICJ0eG5fZnVlbCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NTAKICAgIC8vIHNlbGYuZnVuZF9ibG9ja3MoZHVyYXRpb25fYmxvY2tzKQogICAgZGlnIDEKICAgIGNhbGxzdWIgZnVuZF9ibG9ja3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc1MQogICAgLy8gc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyA9IHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKyBkdXJhdGlvbl9ibG9ja3MKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgYnl0ZWNfMiAvLyAiZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzU4CiAgICAvLyBhbW91bnRfcGVyX2Jsb2NrPXN0YXRlLmFtb3VudF9wZXJfYmxvY2ssCiAgICBkdXAKICAgIGV4dHJhY3QgOCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NjAKICAgIC8vIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIHN3YXAKICAgIGludGNfMyAvLyAxNgogICAgZXh0cmFjdF91aW50MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc1OS03NjEKICAgIC8vIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKQogICAgLy8gKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc1NC03NjIKICAgIC8vIEZhcm1FeHRlbmRlZCgKICAgIC8vICAgICByZWNpcGllbnRfYXBwPWFyYzQuVUludDY0KHJlY2lwaWVudF9hcHAuaWQpLAogICAgLy8gICAgIGFkZGVkX2Ftb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYWRkZWRfZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KGR1cmF0aW9uX2Jsb2NrcyksCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1zdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICAgICApLAogICAgLy8gKQogICAgZGlnIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc1NgogICAgLy8gYWRkZWRfYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDI0IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzU0LTc2MgogICAgLy8gRmFybUV4dGVuZGVkKAogICAgLy8gICAgIHJlY2lwaWVudF9hcHA9YXJjNC5VSW50NjQocmVjaXBpZW50X2FwcC5pZCksCiAgICAvLyAgICAgYWRkZWRfYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBhZGRlZF9kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoZHVyYXRpb25fYmxvY2tzKSwKICAgIC8vICAgICBhbW91bnRfcGVyX2Jsb2NrPXN0YXRlLmFtb3VudF9wZXJfYmxvY2ssCiAgICAvLyAgICAgcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKQogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjb25jYXQKICAgIGRpZyA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc1My03NjMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBGYXJtRXh0ZW5kZWQoCiAgICAvLyAgICAgICAgIHJlY2lwaWVudF9hcHA9YXJjNC5VSW50NjQocmVjaXBpZW50X2FwcC5pZCksCiAgICAvLyAgICAgICAgIGFkZGVkX2Ftb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgICAgIGFkZGVkX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NChkdXJhdGlvbl9ibG9ja3MpLAogICAgLy8gICAgICAgICBhbW91bnRfcGVyX2Jsb2NrPXN0YXRlLmFtb3VudF9wZXJfYmxvY2ssCiAgICAvLyAgICAgICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgICAgICBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpCiAgICAvLyAgICAgICAgICksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgYnl0ZWMgMzEgLy8gbWV0aG9kICJGYXJtRXh0ZW5kZWQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzA4CiAgICAvLyBAYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5leHRlbmRfYW1vdW50X3Blcl9ibG9ja1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzY1CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc3MQogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXBwIGluIHNlbGYuZmFybXMsIFMoIkVSUjpOTyBGQVJNIikpCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGV4dGVuZF9hbW91bnRfcGVyX2Jsb2NrX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzcxCiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGJ5dGVjIDQgLy8gIkVSUjpOTyBGQVJNIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpleHRlbmRfYW1vdW50X3Blcl9ibG9ja19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NzMKICAgIC8vIHN0YXRlID0gc2VsZi5sb2FkX2Zhcm0ocmVjaXBpZW50X2FwcCkKICAgIGRpZyAzCiAgICBkdXAKICAgIGNhbGxzdWIgbG9hZF9mYXJtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NzQKICAgIC8vIGZhcm1fYXNzZXQgPSBBc3NldChzdGF0ZS5mYXJtX2Fzc2V0LmFzX3VpbnQ2NCgpKQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc3NwogICAgLy8gVHhuLmdyb3VwX2luZGV4ICsgVUludDY0KDEpLCAgIyBuZXh0IHR4bgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NzkKICAgIC8vIGFtb3VudF9wZXJfYmxvY2sgKiBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpLAogICAgZGlnIDIKICAgIGludGNfMyAvLyAxNgogICAgZXh0cmFjdF91aW50MzIKICAgIGRpZyA2CiAgICBkdXAKICAgIGNvdmVyIDQKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc3Ni03ODAKICAgIC8vIHZhbGlkYXRlLmF4ZmVyX2Ftb3VudF9leGFjdCgKICAgIC8vICAgICBUeG4uZ3JvdXBfaW5kZXggKyBVSW50NjQoMSksICAjIG5leHQgdHhuCiAgICAvLyAgICAgZmFybV9hc3NldCwKICAgIC8vICAgICBhbW91bnRfcGVyX2Jsb2NrICogc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgYXhmZXJfYW1vdW50X2V4YWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3ODQKICAgIC8vIHN0YXRlLmFtb3VudF9wZXJfYmxvY2suYXNfdWludDY0KCkgKyBhbW91bnRfcGVyX2Jsb2NrCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3ODItNzg1CiAgICAvLyAjIGFkanVzdCBhbW91bnQgcGVyIGJsb2NrIGluIHN0YXRlCiAgICAvLyBzdGF0ZS5hbW91bnRfcGVyX2Jsb2NrID0gYXJjNC5VSW50NjQoCiAgICAvLyAgICAgc3RhdGUuYW1vdW50X3Blcl9ibG9jay5hc191aW50NjQoKSArIGFtb3VudF9wZXJfYmxvY2sKICAgIC8vICkKICAgIGl0b2IKICAgIHJlcGxhY2UyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc4Ni03ODcKICAgIC8vICMgc2F2ZSBzdGF0ZQogICAgLy8gc2VsZi5zdG9yZV9mYXJtKHJlY2lwaWVudF9hcHAsIHN0YXRlKQogICAgY2FsbHN1YiBzdG9yZV9mYXJtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3ODgKICAgIC8vIHNlbGYuZmFybXNfZXh0ZW5kZWQudmFsdWUgPSBzZWxmLmZhcm1zX2V4dGVuZGVkLmdldChVSW50NjQoMCkpICsgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gImZhcm1zX2V4dGVuZGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA3IC8vICJmYXJtc19leHRlbmRlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3ODktNzkwCiAgICAvLyAjIGZvbGRlZCBhZnRlciB2YWxpZGF0aW9uIHNvIHRoZSBkdXJhdGlvbiBjaGVjayBtYXRjaGVzIGEgcHJpb3IgcXVvdGUKICAgIC8vIHNlbGYuZm9sZF9vcmFjbGUoKQogICAgY2FsbHN1YiBmb2xkX29yYWNsZQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Nzk3CiAgICAvLyBhbW91bnRfcGVyX2Jsb2NrPXN0YXRlLmFtb3VudF9wZXJfYmxvY2ssCiAgICBkdXAKICAgIGV4dHJhY3QgOCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3OTkKICAgIC8vIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIHN3YXAKICAgIGludGNfMyAvLyAxNgogICAgZXh0cmFjdF91aW50MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc5OC04MDAKICAgIC8vIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgc3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKQogICAgLy8gKSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojc5My04MDEKICAgIC8vIEZhcm1FeHRlbmRlZCgKICAgIC8vICAgICByZWNpcGllbnRfYXBwPWFyYzQuVUludDY0KHJlY2lwaWVudF9hcHAuaWQpLAogICAgLy8gICAgIGFkZGVkX2Ftb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoYW1vdW50X3Blcl9ibG9jayksCiAgICAvLyAgICAgYWRkZWRfZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2s9c3RhdGUuYW1vdW50X3Blcl9ibG9jaywKICAgIC8vICAgICByZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KAogICAgLy8gICAgICAgICBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIGRpZyAyCiAgICBkaWcgNQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3OTYKICAgIC8vIGFkZGVkX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDI0IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NzkzLTgwMQogICAgLy8gRmFybUV4dGVuZGVkKAogICAgLy8gICAgIHJlY2lwaWVudF9hcHA9YXJjNC5VSW50NjQocmVjaXBpZW50X2FwcC5pZCksCiAgICAvLyAgICAgYWRkZWRfYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NChhbW91bnRfcGVyX2Jsb2NrKSwKICAgIC8vICAgICBhZGRlZF9kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1zdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICAgICApLAogICAgLy8gKQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3OTItODAyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgRmFybUV4dGVuZGVkKAogICAgLy8gICAgICAgICByZWNpcGllbnRfYXBwPWFyYzQuVUludDY0KHJlY2lwaWVudF9hcHAuaWQpLAogICAgLy8gICAgICAgICBhZGRlZF9hbW91bnRfcGVyX2Jsb2NrPWFyYzQuVUludDY0KGFtb3VudF9wZXJfYmxvY2spLAogICAgLy8gICAgICAgICBhZGRlZF9kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgICAgIGFtb3VudF9wZXJfYmxvY2s9c3RhdGUuYW1vdW50X3Blcl9ibG9jaywKICAgIC8vICAgICAgICAgcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICAgICAgICAgKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBieXRlYyAzMSAvLyBtZXRob2QgIkZhcm1FeHRlbmRlZCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo3NjUKICAgIC8vIEBhYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnBheW91dFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnBheW91dDoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgc3dhcAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjkyMC05MjEKICAgIC8vICMgZW5zdXJlIGZhcm0gZXhpc3RzCiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGl0b2IKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHBheW91dF9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MjAtOTIxCiAgICAvLyAjIGVuc3VyZSBmYXJtIGV4aXN0cwogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXBwIGluIHNlbGYuZmFybXMsIFMoIkVSUjpOTyBGQVJNIikpCiAgICBieXRlYyA0IC8vICJFUlI6Tk8gRkFSTSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcGF5b3V0X2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MjMtOTI0CiAgICAvLyAjIGxvYWQgZmFybSBzdGF0ZQogICAgLy8gZmFybSA9IHNlbGYubG9hZF9mYXJtKHJlY2lwaWVudF9hcHApCiAgICBkaWcgMgogICAgY2FsbHN1YiBsb2FkX2Zhcm0KICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MjYtOTI4CiAgICAvLyAjIGVuc3VyZSB3ZSBoYXZlIHJlbWFpbmluZyBibG9ja3MgdG8gcGF5IG91dCBpbiB0aGlzIGZhcm0KICAgIC8vICMgaWYgbm90LCBkZWxldGUgZmFybSBzdGF0ZSBhbmQgcmV0dXJuCiAgICAvLyBpZiBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MgPT0gMDoKICAgIGV4dHJhY3QgMTYgNAogICAgYnl0ZWMgMTIgLy8gMHgwMDAwMDAwMAogICAgYj09CiAgICBieiBwYXlvdXRfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MjkKICAgIC8vIHNlbGYuZGVsZXRlX2Zhcm0ocmVjaXBpZW50X2FwcCwgZmFybSkKICAgIGRpZyAyCiAgICBkaWcgNAogICAgY2FsbHN1YiBkZWxldGVfZmFybQogICAgcG9wCgpwYXlvdXRfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnBheW91dEA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTE2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnBheW91dF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MzQKICAgIC8vIGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkKICAgIGRpZyAzCiAgICBkdXAKICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MzUKICAgIC8vIDwgZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpLAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTI2LTkyOAogICAgLy8gIyBlbnN1cmUgd2UgaGF2ZSByZW1haW5pbmcgYmxvY2tzIHRvIHBheSBvdXQgaW4gdGhpcyBmYXJtCiAgICAvLyAjIGlmIG5vdCwgZGVsZXRlIGZhcm0gc3RhdGUgYW5kIHJldHVybgogICAgLy8gaWYgZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzID09IDA6CiAgICBpbnRjXzMgLy8gMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjkzNQogICAgLy8gPCBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCksCiAgICBleHRyYWN0X3VpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTM0LTkzNQogICAgLy8gZmFybS5wZW5kaW5nX2Jsb2Nrcy5hc191aW50NjQoKQogICAgLy8gPCBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCksCiAgICA8CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcGF5b3V0X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTM2CiAgICAvLyBTKCJFUlI6QkxLUyIpLAogICAgYnl0ZWMgMTMgLy8gIkVSUjpCTEtTIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpwYXlvdXRfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTQwCiAgICAvLyByZWNpcGllbnRfYXBwLCBibG9ja19yb3VuZCwgZmFybS5sYXN0X2Jsb2NrX3BhaWQuYXNfdWludDY0KCkKICAgIGRpZyAzCiAgICBkdXAKICAgIHB1c2hpbnQgMjAKICAgIGV4dHJhY3RfdWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MzktOTQxCiAgICAvLyBzZWxmLmVuc3VyZV9ibG9ja19wcm9wb3NlcigKICAgIC8vICAgICByZWNpcGllbnRfYXBwLCBibG9ja19yb3VuZCwgZmFybS5sYXN0X2Jsb2NrX3BhaWQuYXNfdWludDY0KCkKICAgIC8vICkKICAgIGRpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyA1CiAgICBkdXAKICAgIGNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBlbnN1cmVfYmxvY2tfcHJvcG9zZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk0NAogICAgLy8gcmVjaXBpZW50X2FwcCwgZmFybSwgVUludDY0KDEpLCBibG9ja19yb3VuZCwgY2FsbF9zd2FwLm5hdGl2ZQogICAgZGlnIDMKICAgIGludGNfMCAvLyAwCiAgICBnZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk0My05NDUKICAgIC8vIHNlbGYucGF5X2Zhcm1fYmxvY2tzKAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAsIGZhcm0sIFVJbnQ2NCgxKSwgYmxvY2tfcm91bmQsIGNhbGxfc3dhcC5uYXRpdmUKICAgIC8vICkKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTQ0CiAgICAvLyByZWNpcGllbnRfYXBwLCBmYXJtLCBVSW50NjQoMSksIGJsb2NrX3JvdW5kLCBjYWxsX3N3YXAubmF0aXZlCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTQzLTk0NQogICAgLy8gc2VsZi5wYXlfZmFybV9ibG9ja3MoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcCwgZmFybSwgVUludDY0KDEpLCBibG9ja19yb3VuZCwgY2FsbF9zd2FwLm5hdGl2ZQogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDQKICAgIGNhbGxzdWIgcGF5X2Zhcm1fYmxvY2tzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk0NgogICAgLy8gc2VsZi5hY2NydWVfaXhfcmV3YXJkcyhzZWxmLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpKQogICAgY2FsbHN1YiBnZXRfaXhfcmV3YXJkc19wZXJfYmxvY2sKICAgIGNhbGxzdWIgYWNjcnVlX2l4X3Jld2FyZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk0NwogICAgLy8gc2VsZi5hY2NvdW50X3BhaWRfYmxvY2tzKFVJbnQ2NCgxKSwgVUludDY0KDApKQogICAgaW50Y18xIC8vIDEKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGFjY291bnRfcGFpZF9ibG9ja3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjkxNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBiIHBheW91dF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0ucGF5b3V0QDQKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnBheW91dF9tYW55W3JvdXRpbmddKCkgLT4gdm9pZDoKcGF5b3V0X21hbnk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5NDkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ4CiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIGR1cAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDY0PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBsZW4KICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmJvb2wKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk2MC05NjEKICAgIC8vICMgZW5zdXJlIGZhcm0gZXhpc3RzCiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGl0b2IKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHBheW91dF9tYW55X2FmdGVyX2lmX2Vsc2VAMTkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk2MC05NjEKICAgIC8vICMgZW5zdXJlIGZhcm0gZXhpc3RzCiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGJ5dGVjIDQgLy8gIkVSUjpOTyBGQVJNIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpwYXlvdXRfbWFueV9hZnRlcl9pZl9lbHNlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTYzLTk2NAogICAgLy8gIyBsb2FkIGZhcm0gc3RhdGUKICAgIC8vIGZhcm0gPSBzZWxmLmxvYWRfZmFybShyZWNpcGllbnRfYXBwKQogICAgZGlnIDMKICAgIGNhbGxzdWIgbG9hZF9mYXJtCiAgICBkdXAKICAgIGJ1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTY2CiAgICAvLyBpZiBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MgPT0gMDoKICAgIGV4dHJhY3QgMTYgNAogICAgYnl0ZWMgMTIgLy8gMHgwMDAwMDAwMAogICAgYj09CiAgICBieiBwYXlvdXRfbWFueV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk2NwogICAgLy8gc2VsZi5kZWxldGVfZmFybShyZWNpcGllbnRfYXBwLCBmYXJtKQogICAgZGlnIDMKICAgIGRpZyA3CiAgICBjYWxsc3ViIGRlbGV0ZV9mYXJtCiAgICBwb3AKCnBheW91dF9tYW55X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5wYXlvdXRfbWFueUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTQ5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCnBheW91dF9tYW55X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGRpZyAxCiAgICBibnogcGF5b3V0X21hbnlfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTcxCiAgICAvLyBjdXN0b20uZW5zdXJlKG51bV9ibG9ja3MgPiAwLCBTKCJFUlI6Tk8gQkxLUyIpKQogICAgYnl0ZWMgMjMgLy8gIkVSUjpOTyBCTEtTIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpwYXlvdXRfbWFueV9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTczCiAgICAvLyBmYXJtLnBlbmRpbmdfYmxvY2tzLmFzX3VpbnQ2NCgpICsgbnVtX2Jsb2NrcwogICAgZGlnIDYKICAgIGR1cAogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAzCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5NzQKICAgIC8vIDw9IGZhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKSwKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk2NgogICAgLy8gaWYgZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzID09IDA6CiAgICBpbnRjXzMgLy8gMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk3NAogICAgLy8gPD0gZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpLAogICAgZXh0cmFjdF91aW50MzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk3My05NzQKICAgIC8vIGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkgKyBudW1fYmxvY2tzCiAgICAvLyA8PSBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCksCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHBheW91dF9tYW55X2FmdGVyX2lmX2Vsc2VAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk3NQogICAgLy8gUygiRVJSOkJMS1MiKSwKICAgIGJ5dGVjIDEzIC8vICJFUlI6QkxLUyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcGF5b3V0X21hbnlfYWZ0ZXJfaWZfZWxzZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk3OC05NzkKICAgIC8vICMgdmVyaWZ5IGV2ZXJ5IHByb3Bvc2VyIGluIG9uZSBwYXNzLiBlYWNoIHJvdW5kIG11c3QgYmUgYWZ0ZXIgdGhlIHByZXZpb3VzIG9uZQogICAgLy8gbGFzdF9ibG9ja19yb3VuZCA9IGZhcm0ubGFzdF9ibG9ja19wYWlkLmFzX3VpbnQ2NCgpCiAgICBkaWcgNgogICAgcHVzaGludCAyMAogICAgZXh0cmFjdF91aW50MzIKICAgIGJ1cnkgNQogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNgoKcGF5b3V0X21hbnlfZm9yX2hlYWRlckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTgwCiAgICAvLyBmb3IgYmxvY2tfcm91bmQgaW4gYmxvY2tfcm91bmRzOgogICAgZGlnIDUKICAgIGRpZyAyCiAgICA8CiAgICBieiBwYXlvdXRfbWFueV9hZnRlcl9mb3JANwogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTgyCiAgICAvLyByZWNpcGllbnRfYXBwLCBibG9ja19yb3VuZC5hc191aW50NjQoKSwgbGFzdF9ibG9ja19yb3VuZAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk4MS05ODMKICAgIC8vIHNlbGYuZW5zdXJlX2Jsb2NrX3Byb3Bvc2VyKAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAsIGJsb2NrX3JvdW5kLmFzX3VpbnQ2NCgpLCBsYXN0X2Jsb2NrX3JvdW5kCiAgICAvLyApCiAgICBkaWcgNQogICAgZGlnIDEKICAgIGRpZyA4CiAgICBjYWxsc3ViIGVuc3VyZV9ibG9ja19wcm9wb3NlcgogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgNwogICAgYnVyeSA1CiAgICBiIHBheW91dF9tYW55X2Zvcl9oZWFkZXJANAoKcGF5b3V0X21hbnlfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5ODcKICAgIC8vIHJlY2lwaWVudF9hcHAsIGZhcm0sIG51bV9ibG9ja3MsIGxhc3RfYmxvY2tfcm91bmQsIGNhbGxfc3dhcC5uYXRpdmUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTg2LTk4OAogICAgLy8gc2VsZi5wYXlfZmFybV9ibG9ja3MoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcCwgZmFybSwgbnVtX2Jsb2NrcywgbGFzdF9ibG9ja19yb3VuZCwgY2FsbF9zd2FwLm5hdGl2ZQogICAgLy8gKQogICAgZGlnIDQKICAgIGRpZyA4CiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciA0CiAgICBkaWcgOQogICAgdW5jb3ZlciA0CiAgICBjYWxsc3ViIHBheV9mYXJtX2Jsb2NrcwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5ODkKICAgIC8vIHNlbGYuYWNjcnVlX2l4X3Jld2FyZHMoc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKSAqIG51bV9ibG9ja3MpCiAgICBjYWxsc3ViIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jawogICAgZGlnIDEKICAgICoKICAgIGNhbGxzdWIgYWNjcnVlX2l4X3Jld2FyZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk5MAogICAgLy8gc2VsZi5hY2NvdW50X3BhaWRfYmxvY2tzKG51bV9ibG9ja3MsIFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGFjY291bnRfcGFpZF9ibG9ja3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojk0OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBiIHBheW91dF9tYW55X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5wYXlvdXRfbWFueUA4CgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5wYXlvdXRfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgpwYXlvdXRfYmF0Y2g6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5OTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMTYKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8c21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuUGF5b3V0SXRlbT4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5ib29sCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDAzCiAgICAvLyB0b3RhbF9ibG9ja3MgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDA1LTEwMDcKICAgIC8vICMgZmFybSBjdXJyZW50bHkgYmVpbmcgYWNjdW11bGF0ZWQKICAgIC8vIGFwcF9pZCA9IFVJbnQ2NCgwKQogICAgLy8gZXhpc3RzID0gRmFsc2UKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAwOC0xMDE0CiAgICAvLyBmYXJtID0gRmFybUJveCgKICAgIC8vICAgICBmYXJtX2Fzc2V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQzMigwKSwKICAgIC8vICAgICBsYXN0X2Jsb2NrX3BhaWQ9YXJjNC5VSW50MzIoMCksCiAgICAvLyAgICAgcGVuZGluZ19ibG9ja3M9YXJjNC5VSW50MTYoMCksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDE1CiAgICAvLyBudW1fYmxvY2tzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAxNgogICAgLy8gbGFzdF9ibG9ja19yb3VuZCA9IFVJbnQ2NCgwKQogICAgZHVwbiAyCgpwYXlvdXRfYmF0Y2hfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAxOAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGl0ZW1zLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyA5CiAgICA8CiAgICBieiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfZm9yQDE4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDE5CiAgICAvLyBpdGVtID0gaXRlbXNbaV0uY29weSgpCiAgICBkaWcgOQogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBpbnRjXzMgLy8gMTYKICAgICoKICAgIGludGNfMyAvLyAxNgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGJ1cnkgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwMTktMTAyMAogICAgLy8gaXRlbSA9IGl0ZW1zW2ldLmNvcHkoKQogICAgLy8gaWYgaXRlbS5yZWNpcGllbnRfYXBwLmFzX3VpbnQ2NCgpICE9IGFwcF9pZDoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDIwCiAgICAvLyBpZiBpdGVtLnJlY2lwaWVudF9hcHAuYXNfdWludDY0KCkgIT0gYXBwX2lkOgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnVyeSAxMwogICAgZGlnIDYKICAgICE9CiAgICBieiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAyMS0xMDIyCiAgICAvLyAjIGZsdXNoIHByZXZpb3VzIGZhcm0gYmVmb3JlIHN3aXRjaGluZwogICAgLy8gaWYgbnVtX2Jsb2NrcyA+IDA6CiAgICBkaWcgMgogICAgYnogcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAyOAogICAgLy8gY2FsbF9zd2FwLm5hdGl2ZSwKICAgIGRpZyA3CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDIzLTEwMjkKICAgIC8vIHNlbGYucGF5X2Zhcm1fYmxvY2tzKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKGFwcF9pZCksCiAgICAvLyAgICAgZmFybSwKICAgIC8vICAgICBudW1fYmxvY2tzLAogICAgLy8gICAgIGxhc3RfYmxvY2tfcm91bmQsCiAgICAvLyAgICAgY2FsbF9zd2FwLm5hdGl2ZSwKICAgIC8vICkKICAgIGRpZyA2CiAgICBkaWcgNQogICAgZGlnIDUKICAgIGR1cAogICAgY292ZXIgNAogICAgZGlnIDYKICAgIHVuY292ZXIgNAogICAgY2FsbHN1YiBwYXlfZmFybV9ibG9ja3MKICAgIGJ1cnkgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAzMAogICAgLy8gdG90YWxfYmxvY2tzICs9IG51bV9ibG9ja3MKICAgIGRpZyA3CiAgICArCiAgICBidXJ5IDcKCnBheW91dF9iYXRjaF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDMzCiAgICAvLyBudW1fYmxvY2tzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDM0CiAgICAvLyBleGlzdHMgPSBBcHBsaWNhdGlvbihhcHBfaWQpIGluIHNlbGYuZmFybXMKICAgIGRpZyAxMQogICAgaXRvYgogICAgYm94X2xlbgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDcKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAzNQogICAgLy8gaWYgZXhpc3RzOgogICAgYnogcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwMzYKICAgIC8vIGZhcm0gPSBzZWxmLmxvYWRfZmFybShBcHBsaWNhdGlvbihhcHBfaWQpKQogICAgZGlnIDExCiAgICBjYWxsc3ViIGxvYWRfZmFybQogICAgZHVwCiAgICBidXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwMzcKICAgIC8vIGxhc3RfYmxvY2tfcm91bmQgPSBmYXJtLmxhc3RfYmxvY2tfcGFpZC5hc191aW50NjQoKQogICAgZHVwCiAgICBwdXNoaW50IDIwCiAgICBleHRyYWN0X3VpbnQzMgogICAgYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDM4CiAgICAvLyBpZiBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MgPT0gMDoKICAgIGV4dHJhY3QgMTYgNAogICAgYnl0ZWMgMTIgLy8gMHgwMDAwMDAwMAogICAgYj09CiAgICBieiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTAzOQogICAgLy8gc2VsZi5kZWxldGVfZmFybShBcHBsaWNhdGlvbihhcHBfaWQpLCBmYXJtKQogICAgZGlnIDExCiAgICBkaWcgNAogICAgY2FsbHN1YiBkZWxldGVfZmFybQogICAgYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDQwCiAgICAvLyBleGlzdHMgPSBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNQoKcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICBkaWcgMTEKICAgIGJ1cnkgNgoKcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDQzLTEwNDgKICAgIC8vIGV4aXN0cwogICAgLy8gYW5kIGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkgKyBudW1fYmxvY2tzCiAgICAvLyA8IGZhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKQogICAgLy8gYW5kIHNlbGYuaXNfYmxvY2tfcGF5YWJsZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbihhcHBfaWQpLCBpdGVtLmJsb2NrX3JvdW5kLmFzX3VpbnQ2NCgpLCBsYXN0X2Jsb2NrX3JvdW5kCiAgICAvLyApCiAgICBkaWcgNAogICAgYnogcGF5b3V0X2JhdGNoX2Vsc2VfYm9keUAxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA0NAogICAgLy8gYW5kIGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkgKyBudW1fYmxvY2tzCiAgICBkaWcgMwogICAgZHVwCiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwNDUKICAgIC8vIDwgZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3RfdWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDQ0LTEwNDUKICAgIC8vIGFuZCBmYXJtLnBlbmRpbmdfYmxvY2tzLmFzX3VpbnQ2NCgpICsgbnVtX2Jsb2NrcwogICAgLy8gPCBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwNDMtMTA0OAogICAgLy8gZXhpc3RzCiAgICAvLyBhbmQgZmFybS5wZW5kaW5nX2Jsb2Nrcy5hc191aW50NjQoKSArIG51bV9ibG9ja3MKICAgIC8vIDwgZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpCiAgICAvLyBhbmQgc2VsZi5pc19ibG9ja19wYXlhYmxlKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKGFwcF9pZCksIGl0ZW0uYmxvY2tfcm91bmQuYXNfdWludDY0KCksIGxhc3RfYmxvY2tfcm91bmQKICAgIC8vICkKICAgIGJ6IHBheW91dF9iYXRjaF9lbHNlX2JvZHlAMTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwNDcKICAgIC8vIEFwcGxpY2F0aW9uKGFwcF9pZCksIGl0ZW0uYmxvY2tfcm91bmQuYXNfdWludDY0KCksIGxhc3RfYmxvY2tfcm91bmQKICAgIGRpZyAxMgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjgyNQogICAgLy8gaWYgYmxvY2tfcm91bmQgPD0gbGFzdF9ibG9ja19wYWlkOgogICAgZGlnIDIKICAgIDw9CiAgICBieiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAyNQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODI2CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMCAvLyAwCgpwYXlvdXRfYmF0Y2hfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmlzX2Jsb2NrX3BheWFibGVAMzI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDQzLTEwNDgKICAgIC8vIGV4aXN0cwogICAgLy8gYW5kIGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkgKyBudW1fYmxvY2tzCiAgICAvLyA8IGZhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKQogICAgLy8gYW5kIHNlbGYuaXNfYmxvY2tfcGF5YWJsZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbihhcHBfaWQpLCBpdGVtLmJsb2NrX3JvdW5kLmFzX3VpbnQ2NCgpLCBsYXN0X2Jsb2NrX3JvdW5kCiAgICAvLyApCiAgICBieiBwYXlvdXRfYmF0Y2hfZWxzZV9ib2R5QDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDUwCiAgICAvLyBudW1fYmxvY2tzICs9IDEKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAzCiAgICBkaWcgMTAKICAgIGJ1cnkgMgoKcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDE4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoaXRlbXMubGVuZ3RoKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMQogICAgYiBwYXlvdXRfYmF0Y2hfZm9yX2hlYWRlckAyCgpwYXlvdXRfYmF0Y2hfZWxzZV9ib2R5QDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA1MwogICAgLy8gbG9nKGIiU0tJUCIsIGl0ZW0pCiAgICBwdXNoYnl0ZXMgMHg1MzRiNDk1MAogICAgZGlnIDEzCiAgICBjb25jYXQKICAgIGxvZwogICAgYiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAxNgoKcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VAMjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MjQKICAgIC8vIHJldHVybiBtYXRoLnNhZmVfc3VidHJhY3QoVHhuLmxhc3RfdmFsaWQsIFVJbnQ2NCgxMDAxKSwgVUludDY0KDEpKQogICAgdHhuIExhc3RWYWxpZAogICAgaW50YyA2IC8vIDEwMDEKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIHNhZmVfc3VidHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTozNC0zNQogICAgLy8gIyBibG9jayBmaWVsZHMgb2Ygcm5kIGNhbiBiZSByZWFkIHdpdGhvdXQgZmFpbGluZyB0aGUgcHJvZ3JhbQogICAgLy8gcmV0dXJuIGZpcnN0X2FjY2Vzc2libGVfcm91bmQoKSA8PSBybmQgYW5kIHJuZCA8PSBsYXN0X2FjY2Vzc2libGVfcm91bmQoKQogICAgZGlnIDExCiAgICA8PQogICAgYnogcGF5b3V0X2JhdGNoX2Jvb2xfZmFsc2VAMjgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weToyOQogICAgLy8gcmV0dXJuIFR4bi5maXJzdF92YWxpZCAtIFVJbnQ2NCgxKQogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6MzQtMzUKICAgIC8vICMgYmxvY2sgZmllbGRzIG9mIHJuZCBjYW4gYmUgcmVhZCB3aXRob3V0IGZhaWxpbmcgdGhlIHByb2dyYW0KICAgIC8vIHJldHVybiBmaXJzdF9hY2Nlc3NpYmxlX3JvdW5kKCkgPD0gcm5kIGFuZCBybmQgPD0gbGFzdF9hY2Nlc3NpYmxlX3JvdW5kKCkKICAgIGRpZyAxMQogICAgPj0KICAgIGJ6IHBheW91dF9iYXRjaF9ib29sX2ZhbHNlQDI4CiAgICBpbnRjXzEgLy8gMQoKcGF5b3V0X2JhdGNoX2Jvb2xfbWVyZ2VAMjk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4MjcKICAgIC8vIGlmIG5vdCByb3VuZF90aW1lLmlzX2FjY2Vzc2libGUoYmxvY2tfcm91bmQpOgogICAgYm56IHBheW91dF9iYXRjaF9hZnRlcl9pZl9lbHNlQDMxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4MjgKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwNDYtMTA0OAogICAgLy8gYW5kIHNlbGYuaXNfYmxvY2tfcGF5YWJsZSgKICAgIC8vICAgICBBcHBsaWNhdGlvbihhcHBfaWQpLCBpdGVtLmJsb2NrX3JvdW5kLmFzX3VpbnQ2NCgpLCBsYXN0X2Jsb2NrX3JvdW5kCiAgICAvLyApCiAgICBiIHBheW91dF9iYXRjaF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uaXNfYmxvY2tfcGF5YWJsZUAzMgoKcGF5b3V0X2JhdGNoX2FmdGVyX2lmX2Vsc2VAMzE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4MjkKICAgIC8vIHJldHVybiBvcC5CbG9jay5ibGtfcHJvcG9zZXIoYmxvY2tfcm91bmQpID09IHJlY2lwaWVudF9hcHAuYWRkcmVzcwogICAgZGlnIDEwCiAgICBibG9jayBCbGtQcm9wb3NlcgogICAgZGlnIDYKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDQ2LTEwNDgKICAgIC8vIGFuZCBzZWxmLmlzX2Jsb2NrX3BheWFibGUoCiAgICAvLyAgICAgQXBwbGljYXRpb24oYXBwX2lkKSwgaXRlbS5ibG9ja19yb3VuZC5hc191aW50NjQoKSwgbGFzdF9ibG9ja19yb3VuZAogICAgLy8gKQogICAgYiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmlzX2Jsb2NrX3BheWFibGVAMzIKCnBheW91dF9iYXRjaF9ib29sX2ZhbHNlQDI4OgogICAgaW50Y18wIC8vIDAKICAgIGIgcGF5b3V0X2JhdGNoX2Jvb2xfbWVyZ2VAMjkKCnBheW91dF9iYXRjaF9hZnRlcl9mb3JAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDU1CiAgICAvLyBpZiBudW1fYmxvY2tzID4gMDoKICAgIGRpZyAyCiAgICBieiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAyMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA2MQogICAgLy8gY2FsbF9zd2FwLm5hdGl2ZSwKICAgIGRpZyA3CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDU2LTEwNjIKICAgIC8vIHNlbGYucGF5X2Zhcm1fYmxvY2tzKAogICAgLy8gICAgIEFwcGxpY2F0aW9uKGFwcF9pZCksCiAgICAvLyAgICAgZmFybSwKICAgIC8vICAgICBudW1fYmxvY2tzLAogICAgLy8gICAgIGxhc3RfYmxvY2tfcm91bmQsCiAgICAvLyAgICAgY2FsbF9zd2FwLm5hdGl2ZSwKICAgIC8vICkKICAgIGRpZyA2CiAgICBkaWcgNQogICAgZGlnIDUKICAgIGR1cAogICAgY292ZXIgNAogICAgZGlnIDYKICAgIHVuY292ZXIgNAogICAgY2FsbHN1YiBwYXlfZmFybV9ibG9ja3MKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA2MwogICAgLy8gdG90YWxfYmxvY2tzICs9IG51bV9ibG9ja3MKICAgIGRpZyA3CiAgICArCiAgICBidXJ5IDcKCnBheW91dF9iYXRjaF9hZnRlcl9pZl9lbHNlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA2NQogICAgLy8gaWYgdG90YWxfYmxvY2tzID4gMDoKICAgIGRpZyA2CiAgICBieiBwYXlvdXRfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUAyMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA2NgogICAgLy8gc2VsZi5hY2NydWVfaXhfcmV3YXJkcyhzZWxmLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpICogdG90YWxfYmxvY2tzKQogICAgY2FsbHN1YiBnZXRfaXhfcmV3YXJkc19wZXJfYmxvY2sKICAgIGRpZyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgICoKICAgIGNhbGxzdWIgYWNjcnVlX2l4X3Jld2FyZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwNjcKICAgIC8vIHNlbGYuYWNjb3VudF9wYWlkX2Jsb2Nrcyh0b3RhbF9ibG9ja3MsIFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGFjY291bnRfcGFpZF9ibG9ja3MKCnBheW91dF9iYXRjaF9hZnRlcl9pZl9lbHNlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA2OQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHRvdGFsX2Jsb2NrcykKICAgIGRpZyA2CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5OTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0ucmVjb3JkX3Byb3Bvc2Fsc1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlY29yZF9wcm9wb3NhbHM6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDcxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwODQKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZWNvcmRfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwODQKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgYnl0ZWMgNCAvLyAiRVJSOk5PIEZBUk0iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnJlY29yZF9wcm9wb3NhbHNfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwODYKICAgIC8vIGZhcm0gPSBzZWxmLmxvYWRfZmFybShyZWNpcGllbnRfYXBwKQogICAgZGlnIDMKICAgIGNhbGxzdWIgbG9hZF9mYXJtCiAgICBkdXAKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA4NwogICAgLy8gcGVuZGluZyA9IGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkgKyBibG9ja19yb3VuZHMubGVuZ3RoCiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgKwogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVjb3JkX3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDE0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDg5CiAgICAvLyBjdXN0b20uZW5zdXJlKG51bV9ibG9ja3MgPiAwLCBTKCJFUlI6Tk8gQkxLUyIpKQogICAgYnl0ZWMgMjMgLy8gIkVSUjpOTyBCTEtTIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZWNvcmRfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDkxCiAgICAvLyBwZW5kaW5nIDw9IGZhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKSwKICAgIGRpZyA3CiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3RfdWludDMyCiAgICBkaWcgNQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZWNvcmRfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwOTIKICAgIC8vIFMoIkVSUjpCTEtTIiksCiAgICBieXRlYyAxMyAvLyAiRVJSOkJMS1MiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnJlY29yZF9wcm9wb3NhbHNfYWZ0ZXJfaWZfZWxzZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIGN1c3RvbS5lbnN1cmUocGVuZGluZyA8PSBVSW50NjQoTUFYX1VJTlQxNiksIFMoIkVSUjpQRU5EIikpCiAgICBkaWcgNAogICAgcHVzaGludCA2NTUzNQogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZWNvcmRfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMjIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwOTQKICAgIC8vIGN1c3RvbS5lbnN1cmUocGVuZGluZyA8PSBVSW50NjQoTUFYX1VJTlQxNiksIFMoIkVSUjpQRU5EIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpQRU5EIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZWNvcmRfcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMDk2CiAgICAvLyBsYXN0X2Jsb2NrX3JvdW5kID0gZmFybS5sYXN0X2Jsb2NrX3BhaWQuYXNfdWludDY0KCkKICAgIGRpZyA3CiAgICBwdXNoaW50IDIwCiAgICBleHRyYWN0X3VpbnQzMgogICAgYnVyeSA2CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA3CgpyZWNvcmRfcHJvcG9zYWxzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwOTcKICAgIC8vIGZvciBibG9ja19yb3VuZCBpbiBibG9ja19yb3VuZHM6CiAgICBkaWcgNgogICAgZGlnIDIKICAgIDwKICAgIGJ6IHJlY29yZF9wcm9wb3NhbHNfYWZ0ZXJfZm9yQDUKICAgIGRpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEwOTkKICAgIC8vIHJlY2lwaWVudF9hcHAsIGJsb2NrX3JvdW5kLmFzX3VpbnQ2NCgpLCBsYXN0X2Jsb2NrX3JvdW5kCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA5OC0xMTAwCiAgICAvLyBzZWxmLmVuc3VyZV9ibG9ja19wcm9wb3NlcigKICAgIC8vICAgICByZWNpcGllbnRfYXBwLCBibG9ja19yb3VuZC5hc191aW50NjQoKSwgbGFzdF9ibG9ja19yb3VuZAogICAgLy8gKQogICAgZGlnIDUKICAgIGRpZyAxCiAgICBkaWcgOQogICAgY2FsbHN1YiBlbnN1cmVfYmxvY2tfcHJvcG9zZXIKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDgKICAgIGJ1cnkgNgogICAgYiByZWNvcmRfcHJvcG9zYWxzX2Zvcl9oZWFkZXJAMgoKcmVjb3JkX3Byb3Bvc2Fsc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExMDMKICAgIC8vIGZhcm0ubGFzdF9ibG9ja19wYWlkID0gc2VsZi50b191MzIobGFzdF9ibG9ja19yb3VuZCkKICAgIGRpZyA1CiAgICBkdXAKICAgIGNhbGxzdWIgdG9fdTMyCiAgICBkaWcgOQogICAgc3dhcAogICAgcmVwbGFjZTIgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExMDQKICAgIC8vIGZhcm0ucGVuZGluZ19ibG9ja3MgPSBhcmM0LlVJbnQxNihwZW5kaW5nKQogICAgZGlnIDYKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGR1cAogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgcmVwbGFjZTIgMjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExMDUKICAgIC8vIHNlbGYuc3RvcmVfZmFybShyZWNpcGllbnRfYXBwLCBmYXJtKQogICAgZGlnIDYKICAgIHN3YXAKICAgIGNhbGxzdWIgc3RvcmVfZmFybQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDg1CiAgICAvLyByZXR1cm4gc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKSAqIFJFQ09SRF9JWF9SRVdBUkRTX1NIQVJFIC8vIDEwMAogICAgY2FsbHN1YiBnZXRfaXhfcmV3YXJkc19wZXJfYmxvY2sKICAgIHB1c2hpbnQgNTAKICAgICoKICAgIHB1c2hpbnQgMTAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTA3CiAgICAvLyBhbW91bnQgPSBzZWxmLmdldF9yZWNvcmRfaXhfcmV3YXJkc19wZXJfYmxvY2soKSAqIG51bV9ibG9ja3MKICAgIGRpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExMDgKICAgIC8vIHNlbGYuYWNjcnVlX2l4X3Jld2FyZHMoYW1vdW50KQogICAgZHVwCiAgICBjYWxsc3ViIGFjY3J1ZV9peF9yZXdhcmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTA5CiAgICAvLyBzZWxmLnR4bl9mdWVsID0gc2VsZi50eG5fZnVlbCAtIGFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInR4bl9mdWVsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR4bl9mdWVsIGV4aXN0cwogICAgc3dhcAogICAgLQogICAgYnl0ZWNfMyAvLyAidHhuX2Z1ZWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTExMQogICAgLy8gc2VsZi5peF9yZWNvcmRlZF9ibG9ja3MuZ2V0KFVJbnQ2NCgwKSkgKyBudW1fYmxvY2tzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAiaXhfcmVjb3JkZWRfYmxvY2tzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTEwCiAgICAvLyBzZWxmLml4X3JlY29yZGVkX2Jsb2Nrcy52YWx1ZSA9ICgKICAgIGJ5dGVjIDggLy8gIml4X3JlY29yZGVkX2Jsb2NrcyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExMTAtMTExMgogICAgLy8gc2VsZi5peF9yZWNvcmRlZF9ibG9ja3MudmFsdWUgPSAoCiAgICAvLyAgICAgc2VsZi5peF9yZWNvcmRlZF9ibG9ja3MuZ2V0KFVJbnQ2NCgwKSkgKyBudW1fYmxvY2tzCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTExNwogICAgLy8gYmxvY2tfcm91bmQ9YXJjNC5VSW50NjQobGFzdF9ibG9ja19yb3VuZCksCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExMTgKICAgIC8vIG51bV9ibG9ja3M9YXJjNC5VSW50NjQobnVtX2Jsb2NrcyksCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTIwCiAgICAvLyBrZWVwZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTExNS0xMTIxCiAgICAvLyBGYXJtUHJvcG9zYWxzUmVjb3JkZWQoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcD1hcmM0LlVJbnQ2NChyZWNpcGllbnRfYXBwLmlkKSwKICAgIC8vICAgICBibG9ja19yb3VuZD1hcmM0LlVJbnQ2NChsYXN0X2Jsb2NrX3JvdW5kKSwKICAgIC8vICAgICBudW1fYmxvY2tzPWFyYzQuVUludDY0KG51bV9ibG9ja3MpLAogICAgLy8gICAgIHBlbmRpbmdfYmxvY2tzPWFyYzQuVUludDY0KHBlbmRpbmcpLAogICAgLy8gICAgIGtlZXBlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyApCiAgICBkaWcgNAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTE0LTExMjIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBGYXJtUHJvcG9zYWxzUmVjb3JkZWQoCiAgICAvLyAgICAgICAgIHJlY2lwaWVudF9hcHA9YXJjNC5VSW50NjQocmVjaXBpZW50X2FwcC5pZCksCiAgICAvLyAgICAgICAgIGJsb2NrX3JvdW5kPWFyYzQuVUludDY0KGxhc3RfYmxvY2tfcm91bmQpLAogICAgLy8gICAgICAgICBudW1fYmxvY2tzPWFyYzQuVUludDY0KG51bV9ibG9ja3MpLAogICAgLy8gICAgICAgICBwZW5kaW5nX2Jsb2Nrcz1hcmM0LlVJbnQ2NChwZW5kaW5nKSwKICAgIC8vICAgICAgICAga2VlcGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhkNWYxNjMwYiAvLyBtZXRob2QgIkZhcm1Qcm9wb3NhbHNSZWNvcmRlZCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTA3MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5zZXR0bGVbcm91dGluZ10oKSAtPiB2b2lkOgpzZXR0bGU6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTEyNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuYm9vbAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTEzMQogICAgLy8gY3VzdG9tLmVuc3VyZShyZWNpcGllbnRfYXBwIGluIHNlbGYuZmFybXMsIFMoIkVSUjpOTyBGQVJNIikpCiAgICBpdG9iCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBzZXR0bGVfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTMxCiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGJ5dGVjIDQgLy8gIkVSUjpOTyBGQVJNIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpzZXR0bGVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTEzMwogICAgLy8gZmFybSA9IHNlbGYubG9hZF9mYXJtKHJlY2lwaWVudF9hcHApCiAgICBkaWcgMQogICAgY2FsbHN1YiBsb2FkX2Zhcm0KICAgIGR1cAogICAgYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTM0CiAgICAvLyBwZW5kaW5nID0gZmFybS5wZW5kaW5nX2Jsb2Nrcy5hc191aW50NjQoKQogICAgcHVzaGludCAyNAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgYnVyeSA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogc2V0dGxlX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTEzNQogICAgLy8gY3VzdG9tLmVuc3VyZShwZW5kaW5nID4gMCwgUygiRVJSOk5PIFBFTkQiKSkKICAgIHB1c2hieXRlcyAiRVJSOk5PIFBFTkQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnNldHRsZV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTM3CiAgICAvLyBmYXJtLnBlbmRpbmdfYmxvY2tzID0gYXJjNC5VSW50MTYoMCkKICAgIGRpZyAzCiAgICBieXRlYyA2IC8vIDB4MDAwMAogICAgcmVwbGFjZTIgMjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNDIKICAgIC8vIGZhcm0ubGFzdF9ibG9ja19wYWlkLmFzX3VpbnQ2NCgpLAogICAgZHVwCiAgICBwdXNoaW50IDIwCiAgICBleHRyYWN0X3VpbnQzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE0MwogICAgLy8gY2FsbF9zd2FwLm5hdGl2ZSwKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTM4LTExNDQKICAgIC8vIHNlbGYucGF5X2Zhcm1fYmxvY2tzKAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAsCiAgICAvLyAgICAgZmFybSwKICAgIC8vICAgICBwZW5kaW5nLAogICAgLy8gICAgIGZhcm0ubGFzdF9ibG9ja19wYWlkLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIGNhbGxfc3dhcC5uYXRpdmUsCiAgICAvLyApCiAgICBkaWcgNAogICAgdW5jb3ZlciAzCiAgICBkaWcgNgogICAgZHVwCiAgICBjb3ZlciA1CiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgY2FsbHN1YiBwYXlfZmFybV9ibG9ja3MKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ4NQogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkgKiBSRUNPUkRfSVhfUkVXQVJEU19TSEFSRSAvLyAxMDAKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICBwdXNoaW50IDUwCiAgICAqCiAgICBwdXNoaW50IDEwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE0NQogICAgLy8gcHJlcGFpZCA9IHNlbGYuZ2V0X3JlY29yZF9peF9yZXdhcmRzX3Blcl9ibG9jaygpICogcGVuZGluZwogICAgZGlnIDEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNDYKICAgIC8vIHNlbGYuYWNjcnVlX2l4X3Jld2FyZHMoc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKSAqIHBlbmRpbmcgLSBwcmVwYWlkKQogICAgY2FsbHN1YiBnZXRfaXhfcmV3YXJkc19wZXJfYmxvY2sKICAgIGRpZyAyCiAgICAqCiAgICBkaWcgMQogICAgLQogICAgY2FsbHN1YiBhY2NydWVfaXhfcmV3YXJkcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE0NwogICAgLy8gc2VsZi5peF9yZWNvcmRlZF9ibG9ja3MudmFsdWUgPSBzZWxmLml4X3JlY29yZGVkX2Jsb2Nrcy5nZXQoVUludDY0KDApKSAtIHBlbmRpbmcKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJpeF9yZWNvcmRlZF9ibG9ja3MiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDIKICAgIC0KICAgIGJ5dGVjIDggLy8gIml4X3JlY29yZGVkX2Jsb2NrcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTQ4CiAgICAvLyBzZWxmLmFjY291bnRfcGFpZF9ibG9ja3MocGVuZGluZywgcHJlcGFpZCkKICAgIGNhbGxzdWIgYWNjb3VudF9wYWlkX2Jsb2NrcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTEyNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS53aXRoZHJhd19mZWVzW3JvdXRpbmddKCkgLT4gdm9pZDoKd2l0aGRyYXdfZmVlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNTQKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE1NgogICAgLy8gc2VsZi5lbnN1cmVfbWFuYWdlcl9jYWxsZXIoKQogICAgY2FsbHN1YiBlbnN1cmVfbWFuYWdlcl9jYWxsZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNTgKICAgIC8vIHNlbGYuZ2V0X2xvY2tlZF9iYWxhbmNlKCkgKyBhbW91bnQKICAgIGNhbGxzdWIgZ2V0X2xvY2tlZF9iYWxhbmNlCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTU5CiAgICAvLyA8PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNTgtMTE1OQogICAgLy8gc2VsZi5nZXRfbG9ja2VkX2JhbGFuY2UoKSArIGFtb3VudAogICAgLy8gPD0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlLAogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiB3aXRoZHJhd19mZWVzX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE2MAogICAgLy8gUygiRVJSOk9WRVIiKSwKICAgIHB1c2hieXRlcyAiRVJSOk9WRVIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCndpdGhkcmF3X2ZlZXNfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE2MwogICAgLy8gVHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNjItMTE2NgogICAgLy8gc2VuZC5hbGdvX3BheSgKICAgIC8vICAgICBUeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudCwKICAgIC8vICAgICBVSW50NjQoMCksCiAgICAvLyApCiAgICBkaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE2NQogICAgLy8gVUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNjItMTE2NgogICAgLy8gc2VuZC5hbGdvX3BheSgKICAgIC8vICAgICBUeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudCwKICAgIC8vICAgICBVSW50NjQoMCksCiAgICAvLyApCiAgICBjYWxsc3ViIGFsZ29fcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTY4CiAgICAvLyBGZWVzV2l0aGRyYXduKGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLCByZWNlaXZlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikpCiAgICBkaWcgMQogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTY3LTExNjkKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBGZWVzV2l0aGRyYXduKGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLCByZWNlaXZlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikpCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhkMzYzNTE1NSAvLyBtZXRob2QgIkZlZXNXaXRoZHJhd24odWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNTQKICAgIC8vIEBhYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmNsYWltX2l4X3Jld2FyZHNbcm91dGluZ10oKSAtPiB2b2lkOgpjbGFpbV9peF9yZXdhcmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE3OAogICAgLy8gYWNjcnVlZCwgZXhpc3RzID0gc2VsZi5peF9yZXdhcmRzLm1heWJlKFR4bi5zZW5kZXIpCiAgICBieXRlYyA5IC8vIDB4NmIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGNsYWltX2l4X3Jld2FyZHNfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTc5CiAgICAvLyBjdXN0b20uZW5zdXJlKGV4aXN0cywgUygiRVJSOk5PIFJXRCIpKQogICAgcHVzaGJ5dGVzICJFUlI6Tk8gUldEIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpjbGFpbV9peF9yZXdhcmRzX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExODAKICAgIC8vIGRlbCBzZWxmLml4X3Jld2FyZHNbVHhuLnNlbmRlcl0KICAgIGJ5dGVjIDkgLy8gMHg2YgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExODEKICAgIC8vIHNlbGYuaXhfYWNjcnVlZC52YWx1ZSA9IHNlbGYuaXhfYWNjcnVlZC5nZXQoVUludDY0KDApKSAtIGFjY3J1ZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJpeF9hY2NydWVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC0KICAgIGJ5dGVjIDUgLy8gIml4X2FjY3J1ZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE4MwogICAgLy8gYW1vdW50ID0gYWNjcnVlZCArIElYX1JFV0FSRFNfQk9YX01CUgogICAgaW50YyA3IC8vIDE4OTAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTg0CiAgICAvLyBzZW5kLmFsZ29fcGF5KFR4bi5zZW5kZXIsIGFtb3VudCwgVUludDY0KDApKQogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGFsZ29fcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTg3CiAgICAvLyBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwga2VlcGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE4Ni0xMTg4CiAgICAvLyBJWFJld2FyZHNDbGFpbWVkKAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLCBrZWVwZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICAvLyApCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExODcKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLCBrZWVwZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTg2LTExODgKICAgIC8vIElYUmV3YXJkc0NsYWltZWQoCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksIGtlZXBlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE4NS0xMTg5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgSVhSZXdhcmRzQ2xhaW1lZCgKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksIGtlZXBlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg0Y2I4ZTU2ZSAvLyBtZXRob2QgIklYUmV3YXJkc0NsYWltZWQodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExNzEKICAgIC8vIEBhYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9peF9yZXdhcmRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2l4X3Jld2FyZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTkyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMTk1CiAgICAvLyBhY2NydWVkLCBleGlzdHMgPSBzZWxmLml4X3Jld2FyZHMubWF5YmUoa2VlcGVyKQogICAgYnl0ZWMgOSAvLyAweDZiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExOTYKICAgIC8vIHJldHVybiBhY2NydWVkICsgSVhfUkVXQVJEU19CT1hfTUJSIGlmIGV4aXN0cyBlbHNlIFVJbnQ2NCgwKQogICAgYnogZ2V0X2l4X3Jld2FyZHNfdGVybmFyeV9mYWxzZUAzCiAgICBkdXAKICAgIGludGMgNyAvLyAxODkwMAogICAgKwoKZ2V0X2l4X3Jld2FyZHNfdGVybmFyeV9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE5MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X2l4X3Jld2FyZHNfdGVybmFyeV9mYWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTE5NgogICAgLy8gcmV0dXJuIGFjY3J1ZWQgKyBJWF9SRVdBUkRTX0JPWF9NQlIgaWYgZXhpc3RzIGVsc2UgVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYiBnZXRfaXhfcmV3YXJkc190ZXJuYXJ5X21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLm9wdG91dFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm9wdG91dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExOTgKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMDAKICAgIC8vIHNlbGYuZW5zdXJlX21hbmFnZXJfY2FsbGVyKCkKICAgIGNhbGxzdWIgZW5zdXJlX21hbmFnZXJfY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjAyCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGFzc2V0KSwgUygiRVJSOk5PVCBPUFRFRCIpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgc3dhcAogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBvcHRvdXRfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjAyCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGFzc2V0KSwgUygiRVJSOk5PVCBPUFRFRCIpCiAgICBwdXNoYnl0ZXMgIkVSUjpOT1QgT1BURUQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCm9wdG91dF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjA1CiAgICAvLyBhc3NldC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpID09IDAsIFMoIkVSUjpCQUxBTkNFIikKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBkaWcgMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBieiBvcHRvdXRfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjA1CiAgICAvLyBhc3NldC5iYWxhbmNlKEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MpID09IDAsIFMoIkVSUjpCQUxBTkNFIikKICAgIHB1c2hieXRlcyAiRVJSOkJBTEFOQ0UiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCm9wdG91dF9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjA3CiAgICAvLyBzZW5kLmF4ZmVyX2Nsb3Nlb3V0KGFzc2V0LCBzZWxmLm1hbmFnZXIsIFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAibWFuYWdlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYW5hZ2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjI4LTM0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1yZWNlaXZlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICAgICBhc3NldF9jbG9zZV90bz1yZWNlaXZlciwKICAgIC8vICAgICBmZWU9ZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0Q2xvc2VUbwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjMxCiAgICAvLyBhc3NldF9hbW91bnQ9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vc2VuZC5weToyOAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjA3CiAgICAvLyBzZW5kLmF4ZmVyX2Nsb3Nlb3V0KGFzc2V0LCBzZWxmLm1hbmFnZXIsIFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9zZW5kLnB5OjI4LTM0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1yZWNlaXZlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICAgICBhc3NldF9jbG9zZV90bz1yZWNlaXZlciwKICAgIC8vICAgICBmZWU9ZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjExOTgKICAgIC8vIEBhYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnVwZGF0ZV9tYXhfZHVyYXRpb25fZGF5c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CnVwZGF0ZV9tYXhfZHVyYXRpb25fZGF5czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMDkKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMTEKICAgIC8vIHNlbGYuZW5zdXJlX21hbmFnZXJfY2FsbGVyKCkKICAgIGNhbGxzdWIgZW5zdXJlX21hbmFnZXJfY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjEyCiAgICAvLyBzZWxmLm1heF9kdXJhdGlvbl9kYXlzID0gbWF4X2R1cmF0aW9uCiAgICBieXRlYyAxNyAvLyAibWF4X2R1cmF0aW9uX2RheXMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTIwOQogICAgLy8gQGFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0udXBkYXRlX21pbl9kdXJhdGlvbl9ibG9ja3Nbcm91dGluZ10oKSAtPiB2b2lkOgp1cGRhdGVfbWluX2R1cmF0aW9uX2Jsb2NrczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMTQKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMTYKICAgIC8vIHNlbGYuZW5zdXJlX21hbmFnZXJfY2FsbGVyKCkKICAgIGNhbGxzdWIgZW5zdXJlX21hbmFnZXJfY2FsbGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjE3CiAgICAvLyBzZWxmLm1pbl9kdXJhdGlvbl9ibG9ja3MgPSBtaW5fZHVyYXRpb24KICAgIGJ5dGVjIDE4IC8vICJtaW5fZHVyYXRpb25fYmxvY2tzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMTQKICAgIC8vIEBhYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9zdGF0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9zdGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMTkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50OAogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjIxCiAgICAvLyByZXR1cm4gc2VsZi5mYXJtX3N0YXRlKHNlbGYubG9hZF9mYXJtKHJlY2lwaWVudF9hcHApKQogICAgY2FsbHN1YiBsb2FkX2Zhcm0KICAgIGNhbGxzdWIgZmFybV9zdGF0ZQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjE5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfcGVuZGluZ19ibG9ja3Nbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcGVuZGluZ19ibG9ja3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjIzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDgKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjI1CiAgICAvLyBjdXN0b20uZW5zdXJlKHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcywgUygiRVJSOk5PIEZBUk0iKSkKICAgIGl0b2IKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGdldF9wZW5kaW5nX2Jsb2Nrc19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMjUKICAgIC8vIGN1c3RvbS5lbnN1cmUocmVjaXBpZW50X2FwcCBpbiBzZWxmLmZhcm1zLCBTKCJFUlI6Tk8gRkFSTSIpKQogICAgYnl0ZWMgNCAvLyAiRVJSOk5PIEZBUk0iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmdldF9wZW5kaW5nX2Jsb2Nrc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjI2CiAgICAvLyByZXR1cm4gc2VsZi5sb2FkX2Zhcm0ocmVjaXBpZW50X2FwcCkucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkKICAgIGR1cAogICAgY2FsbHN1YiBsb2FkX2Zhcm0KICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjIzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfZ2xvYmFsX3NuYXBzaG90W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2dsb2JhbF9zbmFwc2hvdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMzIKICAgIC8vIHJvdW5kXz1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpLAogICAgZ2xvYmFsIFJvdW5kCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjMzCiAgICAvLyBiYWxhbmNlPWFyYzQuVUludDY0KEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZSksCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMzQKICAgIC8vIGxvY2tlZF9iYWxhbmNlPWFyYzQuVUludDY0KHNlbGYuZ2V0X2xvY2tlZF9iYWxhbmNlKCkpLAogICAgY2FsbHN1YiBnZXRfbG9ja2VkX2JhbGFuY2UKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyMzUKICAgIC8vIHR4bl9mdWVsPWFyYzQuVUludDY0KHNlbGYudHhuX2Z1ZWwpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInR4bl9mdWVsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR4bl9mdWVsIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTIzNgogICAgLy8gZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3M9YXJjNC5VSW50NjQoc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjM3CiAgICAvLyBpeF9hY2NydWVkPWFyYzQuVUludDY0KHNlbGYuaXhfYWNjcnVlZC5nZXQoVUludDY0KDApKSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiaXhfYWNjcnVlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjQxCiAgICAvLyBzZWxmLmZhcm1zX2NyZWF0ZWQuZ2V0KFVJbnQ2NCgwKSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gImZhcm1zX2NyZWF0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI0MgogICAgLy8gc2VsZi5mYXJtc19leHBpcmVkLmdldChVSW50NjQoMCkpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJmYXJtc19leHBpcmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNDMKICAgIC8vIFVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjQwLTEyNDQKICAgIC8vIG1hdGguc2FmZV9zdWJ0cmFjdCgKICAgIC8vICAgICBzZWxmLmZhcm1zX2NyZWF0ZWQuZ2V0KFVJbnQ2NCgwKSksCiAgICAvLyAgICAgc2VsZi5mYXJtc19leHBpcmVkLmdldChVSW50NjQoMCkpLAogICAgLy8gICAgIFVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNhbGxzdWIgc2FmZV9zdWJ0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTIzOC0xMjQ1CiAgICAvLyAjIGZhcm1zIGZyb20gYmVmb3JlIHRoZSBjb3VudGVycyBleGlzdGVkIGFyZSBub3QgY291bnRlZAogICAgLy8gYWN0aXZlX2Zhcm1zPWFyYzQuVUludDY0KAogICAgLy8gICAgIG1hdGguc2FmZV9zdWJ0cmFjdCgKICAgIC8vICAgICAgICAgc2VsZi5mYXJtc19jcmVhdGVkLmdldChVSW50NjQoMCkpLAogICAgLy8gICAgICAgICBzZWxmLmZhcm1zX2V4cGlyZWQuZ2V0KFVJbnQ2NCgwKSksCiAgICAvLyAgICAgICAgIFVJbnQ2NCgwKSwKICAgIC8vICAgICApCiAgICAvLyApLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI0NwogICAgLy8gc2VsZi5ibG9ja3NfZnVuZGVkLmdldChzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI1IC8vICJibG9ja3NfZnVuZGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGRpZyAyCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNDctMTI0OAogICAgLy8gc2VsZi5ibG9ja3NfZnVuZGVkLmdldChzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzKQogICAgLy8gLSBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjQ2LTEyNDkKICAgIC8vIGJsb2Nrc19wYWlkPWFyYzQuVUludDY0KAogICAgLy8gICAgIHNlbGYuYmxvY2tzX2Z1bmRlZC5nZXQoc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcykKICAgIC8vICAgICAtIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MKICAgIC8vICksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjUwCiAgICAvLyBmYXJtc19jcmVhdGVkPWFyYzQuVUludDY0KHNlbGYuZmFybXNfY3JlYXRlZC5nZXQoVUludDY0KDApKSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gImZhcm1zX2NyZWF0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI1MQogICAgLy8gZmFybXNfZXh0ZW5kZWQ9YXJjNC5VSW50NjQoc2VsZi5mYXJtc19leHRlbmRlZC5nZXQoVUludDY0KDApKSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAiZmFybXNfZXh0ZW5kZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI1MgogICAgLy8gZmFybXNfZXhwaXJlZD1hcmM0LlVJbnQ2NChzZWxmLmZhcm1zX2V4cGlyZWQuZ2V0KFVJbnQ2NCgwKSkpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJmYXJtc19leHBpcmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNTMKICAgIC8vIGl4X3BiPWFyYzQuVUludDY0KHNlbGYuaXhfcGIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vICJpeF9wYiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5peF9wYiBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNTQKICAgIC8vIHBsYXRfZmVlX3BiPWFyYzQuVUludDY0KHNlbGYucGxhdF9mZWVfcGIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vICJwbGF0X2ZlZV9wYiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF0X2ZlZV9wYiBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNTUKICAgIC8vIHR4bl9mZWVfcGI9YXJjNC5VSW50NjQoc2VsZi50eG5fZmVlX3BiKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMSAvLyAidHhuX2ZlZV9wYiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50eG5fZmVlX3BiIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI1NgogICAgLy8gbWF4X2R1cmF0aW9uX2RheXM9YXJjNC5VSW50NjQoc2VsZi5tYXhfZHVyYXRpb25fZGF5cyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gIm1heF9kdXJhdGlvbl9kYXlzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9kdXJhdGlvbl9kYXlzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI1NwogICAgLy8gbWluX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NChzZWxmLm1pbl9kdXJhdGlvbl9ibG9ja3MpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJtaW5fZHVyYXRpb25fYmxvY2tzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1pbl9kdXJhdGlvbl9ibG9ja3MgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjU4CiAgICAvLyBhdmdfcm91bmRfdGltZT1hcmM0LlVJbnQ2NChzZWxmLmdldF9hdmdfcm91bmRfdGltZSgpKSwKICAgIGNhbGxzdWIgZ2V0X2F2Z19yb3VuZF90aW1lCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjU5CiAgICAvLyBhdmdfYmxvY2tfcGF5b3V0PWFyYzQuVUludDY0KHNlbGYuYXZnX2Jsb2NrX3BheW91dC5nZXQoVUludDY0KDApKSksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImF2Z19ibG9ja19wYXlvdXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI2MAogICAgLy8gb25saW5lX3N0YWtlPWFyYzQuVUludDY0KG9wLm9ubGluZV9zdGFrZSgpKSwKICAgIG9ubGluZV9zdGFrZQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTIzMS0xMjYxCiAgICAvLyByZXR1cm4gR2xvYmFsU25hcHNob3QoCiAgICAvLyAgICAgcm91bmRfPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCksCiAgICAvLyAgICAgYmFsYW5jZT1hcmM0LlVJbnQ2NChHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UpLAogICAgLy8gICAgIGxvY2tlZF9iYWxhbmNlPWFyYzQuVUludDY0KHNlbGYuZ2V0X2xvY2tlZF9iYWxhbmNlKCkpLAogICAgLy8gICAgIHR4bl9mdWVsPWFyYzQuVUludDY0KHNlbGYudHhuX2Z1ZWwpLAogICAgLy8gICAgIGdsb2JhbF9yZW1haW5pbmdfYmxvY2tzPWFyYzQuVUludDY0KHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MpLAogICAgLy8gICAgIGl4X2FjY3J1ZWQ9YXJjNC5VSW50NjQoc2VsZi5peF9hY2NydWVkLmdldChVSW50NjQoMCkpKSwKICAgIC8vICAgICAjIGZhcm1zIGZyb20gYmVmb3JlIHRoZSBjb3VudGVycyBleGlzdGVkIGFyZSBub3QgY291bnRlZAogICAgLy8gICAgIGFjdGl2ZV9mYXJtcz1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgbWF0aC5zYWZlX3N1YnRyYWN0KAogICAgLy8gICAgICAgICAgICAgc2VsZi5mYXJtc19jcmVhdGVkLmdldChVSW50NjQoMCkpLAogICAgLy8gICAgICAgICAgICAgc2VsZi5mYXJtc19leHBpcmVkLmdldChVSW50NjQoMCkpLAogICAgLy8gICAgICAgICAgICAgVUludDY0KDApLAogICAgLy8gICAgICAgICApCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBibG9ja3NfcGFpZD1hcmM0LlVJbnQ2NCgKICAgIC8vICAgICAgICAgc2VsZi5ibG9ja3NfZnVuZGVkLmdldChzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzKQogICAgLy8gICAgICAgICAtIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MKICAgIC8vICAgICApLAogICAgLy8gICAgIGZhcm1zX2NyZWF0ZWQ9YXJjNC5VSW50NjQoc2VsZi5mYXJtc19jcmVhdGVkLmdldChVSW50NjQoMCkpKSwKICAgIC8vICAgICBmYXJtc19leHRlbmRlZD1hcmM0LlVJbnQ2NChzZWxmLmZhcm1zX2V4dGVuZGVkLmdldChVSW50NjQoMCkpKSwKICAgIC8vICAgICBmYXJtc19leHBpcmVkPWFyYzQuVUludDY0KHNlbGYuZmFybXNfZXhwaXJlZC5nZXQoVUludDY0KDApKSksCiAgICAvLyAgICAgaXhfcGI9YXJjNC5VSW50NjQoc2VsZi5peF9wYiksCiAgICAvLyAgICAgcGxhdF9mZWVfcGI9YXJjNC5VSW50NjQoc2VsZi5wbGF0X2ZlZV9wYiksCiAgICAvLyAgICAgdHhuX2ZlZV9wYj1hcmM0LlVJbnQ2NChzZWxmLnR4bl9mZWVfcGIpLAogICAgLy8gICAgIG1heF9kdXJhdGlvbl9kYXlzPWFyYzQuVUludDY0KHNlbGYubWF4X2R1cmF0aW9uX2RheXMpLAogICAgLy8gICAgIG1pbl9kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoc2VsZi5taW5fZHVyYXRpb25fYmxvY2tzKSwKICAgIC8vICAgICBhdmdfcm91bmRfdGltZT1hcmM0LlVJbnQ2NChzZWxmLmdldF9hdmdfcm91bmRfdGltZSgpKSwKICAgIC8vICAgICBhdmdfYmxvY2tfcGF5b3V0PWFyYzQuVUludDY0KHNlbGYuYXZnX2Jsb2NrX3BheW91dC5nZXQoVUludDY0KDApKSksCiAgICAvLyAgICAgb25saW5lX3N0YWtlPWFyYzQuVUludDY0KG9wLm9ubGluZV9zdGFrZSgpKSwKICAgIC8vICkKICAgIHVuY292ZXIgMTgKICAgIHVuY292ZXIgMTgKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDE2CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTUKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDEzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDEwCiAgICBjb25jYXQKICAgIHVuY292ZXIgOQogICAgY29uY2F0CiAgICB1bmNvdmVyIDgKICAgIGNvbmNhdAogICAgdW5jb3ZlciA3CiAgICBjb25jYXQKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjI4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5sb2dfc3RhdGVzW3JvdXRpbmddKCkgLT4gdm9pZDoKbG9nX3N0YXRlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNjMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjY5CiAgICAvLyBmb3IgayBpbiB1cmFuZ2UoYm94X25hbWVzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAoKbG9nX3N0YXRlc19mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjY5CiAgICAvLyBmb3IgayBpbiB1cmFuZ2UoYm94X25hbWVzLmxlbmd0aCk6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiBsb2dfc3RhdGVzX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjcwLTEyNzEKICAgIC8vICMgZmFybSBib3gga2V5cyBhcmUgdGhlIDggYnl0ZSBhcHAgaWQsIGFzIHRoZSBhcmM0LlVJbnQ2NCBlbmNvZGVzIGl0CiAgICAvLyBkYXRhLCBfZXhpc3RzID0gb3AuQm94LmdldChib3hfbmFtZXNba10uYnl0ZXMpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNzIKICAgIC8vIGxvZyhkYXRhKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjY5CiAgICAvLyBmb3IgayBpbiB1cmFuZ2UoYm94X25hbWVzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGxvZ19zdGF0ZXNfZm9yX2hlYWRlckAyCgpsb2dfc3RhdGVzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI2MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZ2V0X3N0YXRlX2FuZF9hcHJbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfc3RhdGVfYW5kX2FwcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMTMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMTYKICAgIC8vIGFwcF9pZC5hc191aW50NjQoKSwKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMTgKICAgIC8vIHNlbGYuZ2V0X2Fwcl9jb250ZXh0KCksCiAgICBjYWxsc3ViIGdldF9hcHJfY29udGV4dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMxNS0xMzE5CiAgICAvLyByZXR1cm4gc2VsZi5fZ2V0X3N0YXRlX2FuZF9hcHIoCiAgICAvLyAgICAgYXBwX2lkLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIFVJbnQ2NChERUZBVUxUX09WRVJSSURFX0ZBUk1fQU1PVU5UKSwKICAgIC8vICAgICBzZWxmLmdldF9hcHJfY29udGV4dCgpLAogICAgLy8gKQogICAgdW5jb3ZlciA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzE3CiAgICAvLyBVSW50NjQoREVGQVVMVF9PVkVSUklERV9GQVJNX0FNT1VOVCksCiAgICBpbnRjIDggLy8gOTAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMxNS0xMzE5CiAgICAvLyByZXR1cm4gc2VsZi5fZ2V0X3N0YXRlX2FuZF9hcHIoCiAgICAvLyAgICAgYXBwX2lkLmFzX3VpbnQ2NCgpLAogICAgLy8gICAgIFVJbnQ2NChERUZBVUxUX09WRVJSSURFX0ZBUk1fQU1PVU5UKSwKICAgIC8vICAgICBzZWxmLmdldF9hcHJfY29udGV4dCgpLAogICAgLy8gKQogICAgY292ZXIgNgogICAgY292ZXIgNgogICAgY2FsbHN1YiBfZ2V0X3N0YXRlX2FuZF9hcHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMTMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmxvZ19zdGF0ZXNfYW5kX2FwcnNbcm91dGluZ10oKSAtPiB2b2lkOgpsb2dfc3RhdGVzX2FuZF9hcHJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMzMAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDY0PgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMzMgogICAgLy8gc2VsZi5fbG9nX3N0YXRlc19hbmRfYXBycyhhcHBfaWRzLCBVSW50NjQoREVGQVVMVF9PVkVSUklERV9GQVJNX0FNT1VOVCkpCiAgICBpbnRjIDggLy8gOTAwMDAwMAogICAgY2FsbHN1YiBfbG9nX3N0YXRlc19hbmRfYXBycwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzMwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5sb2dfc3RhdGVzX2FuZF9hcHJzX292ZXJyaWRlW3JvdXRpbmddKCkgLT4gdm9pZDoKbG9nX3N0YXRlc19hbmRfYXByc19vdmVycmlkZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBwdXNoaW50IDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNDQKICAgIC8vIHNlbGYuX2xvZ19zdGF0ZXNfYW5kX2FwcnMoYXBwX2lkcywgb3ZlcnJpZGVfZmFybV9hbW91bnQpCiAgICBjYWxsc3ViIF9sb2dfc3RhdGVzX2FuZF9hcHJzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmxvZ19ibG9ja19wcm9wb3NlcnNbcm91dGluZ10oKSAtPiB2b2lkOgpsb2dfYmxvY2tfcHJvcG9zZXJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM0NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM0OAogICAgLy8gZm9yIHJuZCBpbiB1cmFuZ2Uoc3RhcnRfcm91bmQsIGVuZF9yb3VuZCArIDEpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIHN3YXAKCmxvZ19ibG9ja19wcm9wb3NlcnNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM0OAogICAgLy8gZm9yIHJuZCBpbiB1cmFuZ2Uoc3RhcnRfcm91bmQsIGVuZF9yb3VuZCArIDEpOgogICAgZHVwCiAgICBkaWcgMgogICAgPAogICAgYnogbG9nX2Jsb2NrX3Byb3Bvc2Vyc19hZnRlcl9mb3JANQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM0OQogICAgLy8gbG9nKG9wLkJsb2NrLmJsa19wcm9wb3NlcihybmQpKQogICAgZHVwbiAyCiAgICBibG9jayBCbGtQcm9wb3NlcgogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzQ4CiAgICAvLyBmb3Igcm5kIGluIHVyYW5nZShzdGFydF9yb3VuZCwgZW5kX3JvdW5kICsgMSk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGxvZ19ibG9ja19wcm9wb3NlcnNfZm9yX2hlYWRlckAyCgpsb2dfYmxvY2tfcHJvcG9zZXJzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM0NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0ubG9nX2Zhcm1fcHJvcG9zYWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKbG9nX2Zhcm1fcHJvcG9zYWxzOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM1MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNjMKICAgIC8vIGVzY3Jvd3MgPSBCeXRlcygpCiAgICBieXRlY18xIC8vIDB4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzY0CiAgICAvLyBjb3VudHMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZWMgNiAvLyAweDAwMDAKICAgIGludGNfMCAvLyAwCgpsb2dfZmFybV9wcm9wb3NhbHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM2NQogICAgLy8gZm9yIGFwcF9pZCBpbiBhcHBfaWRzOgogICAgZHVwCiAgICBkaWcgNgogICAgPAogICAgYnogbG9nX2Zhcm1fcHJvcG9zYWxzX2FmdGVyX2ZvckA1CiAgICBkaWcgNgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzY2CiAgICAvLyBlc2Nyb3dzICs9IEFwcGxpY2F0aW9uKGFwcF9pZC5hc191aW50NjQoKSkuYWRkcmVzcy5ieXRlcwogICAgZXh0cmFjdF91aW50NjQKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIGRpZyA0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM2NwogICAgLy8gY291bnRzLmFwcGVuZChhcmM0LlVJbnQ2NCgwKSkKICAgIGRpZyAyCiAgICBkdXAKICAgIGJ5dGVjIDI0IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIGxvZ19mYXJtX3Byb3Bvc2Fsc19mb3JfaGVhZGVyQDIKCmxvZ19mYXJtX3Byb3Bvc2Fsc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNjkKICAgIC8vIGZvciBybmQgaW4gdXJhbmdlKHN0YXJ0X3JvdW5kLCBlbmRfcm91bmQgKyAxKToKICAgIGRpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA4CiAgICBkaWcgNAogICAgYnVyeSA5Cgpsb2dfZmFybV9wcm9wb3NhbHNfZm9yX2hlYWRlckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM2OQogICAgLy8gZm9yIHJuZCBpbiB1cmFuZ2Uoc3RhcnRfcm91bmQsIGVuZF9yb3VuZCArIDEpOgogICAgZGlnIDgKICAgIGRpZyA4CiAgICA8CiAgICBieiBsb2dfZmFybV9wcm9wb3NhbHNfYWZ0ZXJfZm9yQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzcwCiAgICAvLyBwcm9wb3NlciA9IG9wLkJsb2NrLmJsa19wcm9wb3NlcihybmQpLmJ5dGVzCiAgICBkaWcgOAogICAgYmxvY2sgQmxrUHJvcG9zZXIKICAgIGJ1cnkgMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNzEKICAgIC8vIGZvciBpZHggaW4gdXJhbmdlKGFwcF9pZHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCiAgICBidXJ5IDEwCgpsb2dfZmFybV9wcm9wb3NhbHNfZm9yX2hlYWRlckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM3MQogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UoYXBwX2lkcy5sZW5ndGgpOgogICAgZGlnIDkKICAgIGRpZyA2CiAgICA8CiAgICBieiBsb2dfZmFybV9wcm9wb3NhbHNfYWZ0ZXJfZm9yQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzcyCiAgICAvLyBpZiBvcC5leHRyYWN0KGVzY3Jvd3MsIGlkeCAqIFVJbnQ2NCgzMiksIFVJbnQ2NCgzMikpID09IHByb3Bvc2VyOgogICAgZGlnIDkKICAgIHB1c2hpbnQgMzIKICAgICoKICAgIGRpZyAzCiAgICBzd2FwCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0MwogICAgZGlnIDExCiAgICA9PQogICAgYnogbG9nX2Zhcm1fcHJvcG9zYWxzX2FmdGVyX2lmX2Vsc2VAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNzUKICAgIC8vIGJsb2NrX3JvdW5kPWFyYzQuVUludDY0KHJuZCksIGFwcF9pbmRleD1hcmM0LlVJbnQxNihpZHgpCiAgICBkaWcgOAogICAgaXRvYgogICAgZGlnIDEwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzc0LTEzNzYKICAgIC8vIFByb3Bvc2FsTWF0Y2goCiAgICAvLyAgICAgYmxvY2tfcm91bmQ9YXJjNC5VSW50NjQocm5kKSwgYXBwX2luZGV4PWFyYzQuVUludDE2KGlkeCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM3My0xMzc3CiAgICAvLyBsb2coCiAgICAvLyAgICAgUHJvcG9zYWxNYXRjaCgKICAgIC8vICAgICAgICAgYmxvY2tfcm91bmQ9YXJjNC5VSW50NjQocm5kKSwgYXBwX2luZGV4PWFyYzQuVUludDE2KGlkeCkKICAgIC8vICAgICApCiAgICAvLyApCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNzgKICAgIC8vIGNvdW50c1tpZHhdID0gYXJjNC5VSW50NjQoY291bnRzW2lkeF0uYXNfdWludDY0KCkgKyBVSW50NjQoMSkpCiAgICBkaWcgMgogICAgZHVwCiAgICBleHRyYWN0IDIgMAogICAgdW5jb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgc3dhcAogICAgZGlnIDEKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgc3dhcAogICAgcHVzaGludCAyCiAgICArCiAgICBzd2FwCiAgICByZXBsYWNlMyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ1cnkgMgoKbG9nX2Zhcm1fcHJvcG9zYWxzX2FmdGVyX2ZvckAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzNjkKICAgIC8vIGZvciBybmQgaW4gdXJhbmdlKHN0YXJ0X3JvdW5kLCBlbmRfcm91bmQgKyAxKToKICAgIGRpZyA4CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSA5CiAgICBiIGxvZ19mYXJtX3Byb3Bvc2Fsc19mb3JfaGVhZGVyQDYKCmxvZ19mYXJtX3Byb3Bvc2Fsc19hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM3MQogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UoYXBwX2lkcy5sZW5ndGgpOgogICAgZGlnIDkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEwCiAgICBiIGxvZ19mYXJtX3Byb3Bvc2Fsc19mb3JfaGVhZGVyQDgKCmxvZ19mYXJtX3Byb3Bvc2Fsc19hZnRlcl9mb3JAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzUxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0ucmVhZF90aW55bWFuX3Bvb2wodG0yOiB1aW50NjQsIHRtYTogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CnJlYWRfdGlueW1hbl9wb29sOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzI5LTMzMAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWFkX3RpbnltYW5fcG9vbChzZWxmLCB0bTI6IEFwcGxpY2F0aW9uLCB0bWE6IEFjY291bnQpIC0+IFRpbnltYW5Qb29sOgogICAgcHJvdG8gMiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzEKICAgIC8vIGFpZDEsIGV4aXN0czEgPSBvcC5BcHBMb2NhbC5nZXRfZXhfdWludDY0KHRtYSwgdG0yLCBiImFzc2V0XzFfaWQiKQogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hieXRlcyAweDYxNzM3MzY1NzQ1ZjMxNWY2OTY0CiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzIKICAgIC8vIGExLCBleGlzdHMyID0gb3AuQXBwTG9jYWwuZ2V0X2V4X3VpbnQ2NCh0bWEsIHRtMiwgYiJhc3NldF8xX3Jlc2VydmVzIikKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoYnl0ZXMgMHg2MTczNzM2NTc0NWYzMTVmNzI2NTczNjU3Mjc2NjU3MwogICAgYXBwX2xvY2FsX2dldF9leAogICAgY292ZXIgMgogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzMzCiAgICAvLyBhMiwgZXhpc3RzMyA9IG9wLkFwcExvY2FsLmdldF9leF91aW50NjQodG1hLCB0bTIsIGIiYXNzZXRfMl9yZXNlcnZlcyIpCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGJ5dGVzIDB4NjE3MzczNjU3NDVmMzI1ZjcyNjU3MzY1NzI3NjY1NzMKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMzNAogICAgLy8gY3VzdG9tLmVuc3VyZShleGlzdHMxIGFuZCBleGlzdHMyIGFuZCBleGlzdHMzLCBTKCJFUlI6VE0gU1RUIikpCiAgICBieiByZWFkX3RpbnltYW5fcG9vbF9ib29sX2ZhbHNlQDQKICAgIGZyYW1lX2RpZyAxCiAgICBieiByZWFkX3RpbnltYW5fcG9vbF9ib29sX2ZhbHNlQDQKICAgIGZyYW1lX2RpZyAzCiAgICBieiByZWFkX3RpbnltYW5fcG9vbF9ib29sX2ZhbHNlQDQKICAgIGludGNfMSAvLyAxCgpyZWFkX3RpbnltYW5fcG9vbF9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVhZF90aW55bWFuX3Bvb2xfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzQKICAgIC8vIGN1c3RvbS5lbnN1cmUoZXhpc3RzMSBhbmQgZXhpc3RzMiBhbmQgZXhpc3RzMywgUygiRVJSOlRNIFNUVCIpKQogICAgcHVzaGJ5dGVzICJFUlI6VE0gU1RUIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZWFkX3RpbnltYW5fcG9vbF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzUKICAgIC8vIHJldHVybiBUaW55bWFuUG9vbChhc3NldF8xX2lkPWFpZDEsIGFzc2V0XzFfcmVzZXJ2ZXM9YTEsIGFzc2V0XzJfcmVzZXJ2ZXM9YTIpCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnJlYWRfdGlueW1hbl9wb29sX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIHJlYWRfdGlueW1hbl9wb29sX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZ2V0X3RpbnltYW5fYWxnb19wcmljZShwb29sLmFzc2V0XzFfaWQ6IHVpbnQ2NCwgcG9vbC5hc3NldF8xX3Jlc2VydmVzOiB1aW50NjQsIHBvb2wuYXNzZXRfMl9yZXNlcnZlczogdWludDY0LCBmYXJtX2Ftb3VudDogdWludDY0KSAtPiB1aW50NjQ6CmdldF90aW55bWFuX2FsZ29fcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMzctMzM4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF90aW55bWFuX2FsZ29fcHJpY2Uoc2VsZiwgcG9vbDogVGlueW1hblBvb2wsIGZhcm1fYW1vdW50OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzM5CiAgICAvLyBpZiBmYXJtX2Ftb3VudCA9PSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJueiBnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzQwCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgcmV0c3ViCgpnZXRfdGlueW1hbl9hbGdvX3ByaWNlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM0NAogICAgLy8gaWYgcG9vbC5hc3NldF8xX2lkICE9IFVJbnQ2NCgwKToKICAgIGZyYW1lX2RpZyAtNAogICAgYnogZ2V0X3RpbnltYW5fYWxnb19wcmljZV9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzEKICAgIC8vIHJldHVybiBhbXQgLSBtYXRoLm11bF9kaXYoVUludDY0KDMwKSwgYW10LCBVSW50NjQoMTAwMDApKQogICAgcHVzaGludCAzMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQwLTQxCiAgICAvLyAjIGZsb29yKGEgKiBiIC8gYykuIGZhaWxzIGlmIHRoZSByZXN1bHQgZG9lcyBub3QgZml0CiAgICAvLyBoaSwgbG8gPSBvcC5tdWx3KGEsIGIpCiAgICBmcmFtZV9kaWcgLTEKICAgIG11bHcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxCiAgICAvLyByZXR1cm4gYW10IC0gbWF0aC5tdWxfZGl2KFVJbnQ2NCgzMCksIGFtdCwgVUludDY0KDEwMDAwKSkKICAgIGludGMgNCAvLyAxMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQyCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaSwgbG8sIGMpCiAgICBkaXZ3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMQogICAgLy8gcmV0dXJuIGFtdCAtIG1hdGgubXVsX2RpdihVSW50NjQoMzApLCBhbXQsIFVJbnQ2NCgxMDAwMCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMyNwogICAgLy8gcmV0dXJuIG1hdGgubXVsX2RpdihhMSwgYTIsIHYgKyBnZXRfdG0yX25ldF9hbXQoYW1vdW50KSkKICAgIGZyYW1lX2RpZyAtMwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQwLTQxCiAgICAvLyAjIGZsb29yKGEgKiBiIC8gYykuIGZhaWxzIGlmIHRoZSByZXN1bHQgZG9lcyBub3QgZml0CiAgICAvLyBoaSwgbG8gPSBvcC5tdWx3KGEsIGIpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQyCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaSwgbG8sIGMpCiAgICB1bmNvdmVyIDIKICAgIGRpdncKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gcmV0ID0gYTIgLSBzZWxmLmNhbGNfdG1fZGVub20oYTEsIGEyLCBhMSwgZmFybV9hbW91bnQpIC0gVUludDY0KDEpCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIC0KICAgIGludGNfMSAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNDgKICAgIC8vIHJldHVybiByZXQKICAgIHJldHN1YgoKZ2V0X3RpbnltYW5fYWxnb19wcmljZV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjMxCiAgICAvLyByZXR1cm4gYW10IC0gbWF0aC5tdWxfZGl2KFVJbnQ2NCgzMCksIGFtdCwgVUludDY0KDEwMDAwKSkKICAgIHB1c2hpbnQgMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo0MC00MQogICAgLy8gIyBmbG9vcihhICogYiAvIGMpLiBmYWlscyBpZiB0aGUgcmVzdWx0IGRvZXMgbm90IGZpdAogICAgLy8gaGksIGxvID0gb3AubXVsdyhhLCBiKQogICAgZnJhbWVfZGlnIC0xCiAgICBtdWx3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMQogICAgLy8gcmV0dXJuIGFtdCAtIG1hdGgubXVsX2RpdihVSW50NjQoMzApLCBhbXQsIFVJbnQ2NCgxMDAwMCkpCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo0MgogICAgLy8gcmV0dXJuIG9wLmRpdncoaGksIGxvLCBjKQogICAgZGl2dwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzEKICAgIC8vIHJldHVybiBhbXQgLSBtYXRoLm11bF9kaXYoVUludDY0KDMwKSwgYW10LCBVSW50NjQoMTAwMDApKQogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozMjcKICAgIC8vIHJldHVybiBtYXRoLm11bF9kaXYoYTEsIGEyLCB2ICsgZ2V0X3RtMl9uZXRfYW10KGFtb3VudCkpCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo0MC00MQogICAgLy8gIyBmbG9vcihhICogYiAvIGMpLiBmYWlscyBpZiB0aGUgcmVzdWx0IGRvZXMgbm90IGZpdAogICAgLy8gaGksIGxvID0gb3AubXVsdyhhLCBiKQogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIG11bHcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo0MgogICAgLy8gcmV0dXJuIG9wLmRpdncoaGksIGxvLCBjKQogICAgdW5jb3ZlciAyCiAgICBkaXZ3CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNDcKICAgIC8vIHJldCA9IGExIC0gc2VsZi5jYWxjX3RtX2Rlbm9tKGExLCBhMiwgYTIsIGZhcm1fYW1vdW50KSAtIFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICAtCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzQ4CiAgICAvLyByZXR1cm4gcmV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9hcHJfY29udGV4dCgpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQsIHVpbnQ2NCwgdWludDY0OgpnZXRfYXByX2NvbnRleHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNTIKICAgIC8vIGF2Z19yb3VuZF90aW1lID0gc2VsZi5nZXRfYXZnX3JvdW5kX3RpbWUoKQogICAgY2FsbHN1YiBnZXRfYXZnX3JvdW5kX3RpbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM1NAogICAgLy8gb25saW5lX3N0YWtlPW9wLm9ubGluZV9zdGFrZSgpLAogICAgb25saW5lX3N0YWtlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNTUKICAgIC8vIGJsb2NrX2JvbnVzPW9wLkJsb2NrLmJsa19ib251cyhUeG4uZmlyc3RfdmFsaWQgLSBVSW50NjQoMSkpLAogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBibG9jayBCbGtCb251cwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzU2CiAgICAvLyBhdmdfYmxvY2tfcGF5b3V0PXNlbGYuYXZnX2Jsb2NrX3BheW91dC5nZXQoVUludDY0KDApKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAiYXZnX2Jsb2NrX3BheW91dCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozNTgKICAgIC8vIHllYXJseV9ibG9ja3M9VUludDY0KDg2NDAwKSAqIFVJbnQ2NCgzNjUpICogVUludDY0KDEwMDAwKSAvLyBhdmdfcm91bmRfdGltZSwKICAgIHB1c2hpbnQgMzE1MzYwMDAwMDAwCiAgICBkaWcgNAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzUzLTM1OQogICAgLy8gcmV0dXJuIEFQUkNvbnRleHQoCiAgICAvLyAgICAgb25saW5lX3N0YWtlPW9wLm9ubGluZV9zdGFrZSgpLAogICAgLy8gICAgIGJsb2NrX2JvbnVzPW9wLkJsb2NrLmJsa19ib251cyhUeG4uZmlyc3RfdmFsaWQgLSBVSW50NjQoMSkpLAogICAgLy8gICAgIGF2Z19ibG9ja19wYXlvdXQ9c2VsZi5hdmdfYmxvY2tfcGF5b3V0LmdldChVSW50NjQoMCkpLAogICAgLy8gICAgIGF2Z19yb3VuZF90aW1lPWF2Z19yb3VuZF90aW1lLAogICAgLy8gICAgIHllYXJseV9ibG9ja3M9VUludDY0KDg2NDAwKSAqIFVJbnQ2NCgzNjUpICogVUludDY0KDEwMDAwKSAvLyBhdmdfcm91bmRfdGltZSwKICAgIC8vICkKICAgIGNvdmVyIDMKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciA0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLl9wcm9qZWN0X2Fwcl9pbl9jb250ZXh0KHJlY2lwaWVudF9hcHA6IHVpbnQ2NCwgZmFybV9hbW91bnQ6IHVpbnQ2NCwgb3ZlcnJpZGVfZmFybV9hbW91bnQ6IHVpbnQ2NCwgY3R4Lm9ubGluZV9zdGFrZTogdWludDY0LCBjdHguYmxvY2tfYm9udXM6IHVpbnQ2NCwgY3R4LmF2Z19ibG9ja19wYXlvdXQ6IHVpbnQ2NCwgY3R4LmF2Z19yb3VuZF90aW1lOiB1aW50NjQsIGN0eC55ZWFybHlfYmxvY2tzOiB1aW50NjQpIC0+IGJ5dGVzOgpfcHJvamVjdF9hcHJfaW5fY29udGV4dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM3My0zODAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3Byb2plY3RfYXByX2luX2NvbnRleHQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbiwKICAgIC8vICAgICBmYXJtX2Ftb3VudDogVUludDY0LAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiBVSW50NjQsCiAgICAvLyAgICAgY3R4OiBBUFJDb250ZXh0LAogICAgLy8gKSAtPiBBUFJCcmVha2Rvd246CiAgICBwcm90byA4IDEKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzg1CiAgICAvLyB0bTJfYXBwX2lkLCBleGlzdHMyID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocmVjaXBpZW50X2FwcCwgYiJ0bTJfYXBwX2lkIikKICAgIGZyYW1lX2RpZyAtOAogICAgYnl0ZWMgMjYgLy8gMHg3NDZkMzI1ZjYxNzA3MDVmNjk2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM4NgogICAgLy8gdG0yX2xwX2FkZHIsIGV4aXN0czMgPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKHJlY2lwaWVudF9hcHAsIGIibHBfaWQiKQogICAgZnJhbWVfZGlnIC04CiAgICBieXRlYyAyNyAvLyAweDZjNzA1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozODgKICAgIC8vIGFzYV9pZCwgZXhpc3RzMSA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfdWludDY0KHJlY2lwaWVudF9hcHAsIGIiYXNhX2lkIikKICAgIGZyYW1lX2RpZyAtOAogICAgYnl0ZWMgMzAgLy8gMHg2MTczNjE1ZjY5NjQKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gc3Rha2VkLCBleGlzdHM0ID0gb3AuQXBwR2xvYmFsLmdldF9leF91aW50NjQocmVjaXBpZW50X2FwcCwgYiJzdGFrZWQiKQogICAgZnJhbWVfZGlnIC04CiAgICBieXRlYyAyOCAvLyAweDczNzQ2MTZiNjU2NAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM5MAogICAgLy8gY3VzdG9tLmVuc3VyZShleGlzdHMxIGFuZCBleGlzdHMyIGFuZCBleGlzdHMzIGFuZCBleGlzdHM0LCBTKCJFUlI6RFMgU1RUIikpCiAgICBieiBfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX2ZhbHNlQDUKICAgIGZyYW1lX2RpZyAyCiAgICBieiBfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX2ZhbHNlQDUKICAgIGZyYW1lX2RpZyA0CiAgICBieiBfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX2ZhbHNlQDUKICAgIGZyYW1lX2RpZyA2CiAgICBieiBfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX2ZhbHNlQDUKICAgIGludGNfMSAvLyAxCgpfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX21lcmdlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogX3Byb2plY3RfYXByX2luX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzkwCiAgICAvLyBjdXN0b20uZW5zdXJlKGV4aXN0czEgYW5kIGV4aXN0czIgYW5kIGV4aXN0czMgYW5kIGV4aXN0czQsIFMoIkVSUjpEUyBTVFQiKSkKICAgIGJ5dGVjIDI5IC8vICJFUlI6RFMgU1RUIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpfcHJvamVjdF9hcHJfaW5fY29udGV4dF9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MzkyCiAgICAvLyBmYXJtX2Ftb3VudF9hbGdvID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozOTMKICAgIC8vIG92ZXJyaWRlX2Zhcm1fYW1vdW50X2FsZ28gPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjM5NAogICAgLy8gaWYgZmFybV9hbW91bnQgPiBVSW50NjQoMCkgb3Igb3ZlcnJpZGVfZmFybV9hbW91bnQgPiBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTcKICAgIGJueiBfcHJvamVjdF9hcHJfaW5fY29udGV4dF9pZl9ib2R5QDgKICAgIGZyYW1lX2RpZyAtNgogICAgYnogX3Byb2plY3RfYXByX2luX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUA5CgpfcHJvamVjdF9hcHJfaW5fY29udGV4dF9pZl9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTozOTUtMzk2CiAgICAvLyAjIHJlYWQgcG9vbCByZXNlcnZlcyBvbmNlIGZvciBib3RoIHByaWNlcwogICAgLy8gcG9vbCA9IHNlbGYucmVhZF90aW55bWFuX3Bvb2woQXBwbGljYXRpb24odG0yX2FwcF9pZCksIEFjY291bnQodG0yX2xwX2FkZHIpKQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICBmcmFtZV9kaWcgMwogICAgc3dhcAogICAgY2FsbHN1YiByZWFkX3RpbnltYW5fcG9vbAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzk3CiAgICAvLyBmYXJtX2Ftb3VudF9hbGdvID0gc2VsZi5nZXRfdGlueW1hbl9hbGdvX3ByaWNlKHBvb2wsIGZhcm1fYW1vdW50KQogICAgZGlnIDIKICAgIGRpZyAyCiAgICBkaWcgMgogICAgZnJhbWVfZGlnIC03CiAgICBjYWxsc3ViIGdldF90aW55bWFuX2FsZ29fcHJpY2UKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6Mzk4LTQwMAogICAgLy8gb3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbyA9IHNlbGYuZ2V0X3RpbnltYW5fYWxnb19wcmljZSgKICAgIC8vICAgICBwb29sLCBvdmVycmlkZV9mYXJtX2Ftb3VudAogICAgLy8gKQogICAgZnJhbWVfZGlnIC02CiAgICBjYWxsc3ViIGdldF90aW55bWFuX2FsZ29fcHJpY2UKICAgIGZyYW1lX2J1cnkgMQoKX3Byb2plY3RfYXByX2luX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDAyLTQwMwogICAgLy8gIyBiYWxhbmNlIGlzIHN0YWtlZCtmZWVzLiBVc2UgdGhpcyB0byBjYWxjdWxhdGUgYmxvY2tzIChub20gaW4gJSBvZiBvbmxpbmUpCiAgICAvLyBiYWxhbmNlID0gcmVjaXBpZW50X2FwcC5hZGRyZXNzLmJhbGFuY2UKICAgIGZyYW1lX2RpZyAtOAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo0MC00MQogICAgLy8gIyBmbG9vcihhICogYiAvIGMpLiBmYWlscyBpZiB0aGUgcmVzdWx0IGRvZXMgbm90IGZpdAogICAgLy8gaGksIGxvID0gb3AubXVsdyhhLCBiKQogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQyCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaSwgbG8sIGMpCiAgICBmcmFtZV9kaWcgLTUKICAgIGRpdncKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQxMS00MTMKICAgIC8vIGJhc2VfYXByX2JwcyA9IHNlbGYuZ2V0X2Fwcl9icHMoCiAgICAvLyAgICAgY3VycmVudF9ibG9ja19yZXdhcmRzLCBvd25feWVhcmx5X2Jsb2Nrc19wcm9kdWNlZCwgc3Rha2VkCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciA0CiAgICBjYWxsc3ViIGdldF9hcHJfYnBzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MTQtNDE2CiAgICAvLyBmYXJtX2Fwcl9icHMgPSBzZWxmLmdldF9hcHJfYnBzKAogICAgLy8gICAgIGZhcm1fYW1vdW50X2FsZ28sIG93bl95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkLCBzdGFrZWQKICAgIC8vICkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGRpZyAyCiAgICBkaWcgNAogICAgY2FsbHN1YiBnZXRfYXByX2JwcwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDE3LTQxOQogICAgLy8gb3ZlcnJpZGVfZmFybV9hcHJfYnBzID0gc2VsZi5nZXRfYXByX2JwcygKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Ftb3VudF9hbGdvLCBvd25feWVhcmx5X2Jsb2Nrc19wcm9kdWNlZCwgc3Rha2VkCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciA1CiAgICBkaWcgMwogICAgZGlnIDUKICAgIGNhbGxzdWIgZ2V0X2Fwcl9icHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQyMgogICAgLy8gYmFsYW5jZT1hcmM0LlVJbnQ2NChiYWxhbmNlKSwKICAgIHVuY292ZXIgNwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDIzCiAgICAvLyBzdGFrZWQ9YXJjNC5VSW50NjQoc3Rha2VkKSwKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDI0CiAgICAvLyBvbmxpbmVfc3Rha2U9YXJjNC5VSW50NjQoY3R4Lm9ubGluZV9zdGFrZSksCiAgICBmcmFtZV9kaWcgLTUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQyNQogICAgLy8gYXZnX3JvdW5kX3RpbWU9YXJjNC5VSW50NjQoY3R4LmF2Z19yb3VuZF90aW1lKSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDI2CiAgICAvLyBleHBlY3RlZF95ZWFybHlfYmxvY2tzPWFyYzQuVUludDY0KG93bl95ZWFybHlfYmxvY2tzX3Byb2R1Y2VkKSwKICAgIHVuY292ZXIgNwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDI3CiAgICAvLyBjdXJyZW50X2Jsb2NrX2JvbnVzPWFyYzQuVUludDY0KGN1cnJlbnRfYmxvY2tfcmV3YXJkcyksCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQyOAogICAgLy8gY3VycmVudF9hdmdfYmxvY2tfcGF5b3V0PWFyYzQuVUludDY0KGN0eC5hdmdfYmxvY2tfcGF5b3V0KSwKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDI5CiAgICAvLyBjdXJyZW50X2Zhcm1fYW1vdW50PWFyYzQuVUludDY0KGZhcm1fYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtNwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDMwCiAgICAvLyBjdXJyZW50X2Zhcm1fYW1vdW50X2FsZ289YXJjNC5VSW50NjQoZmFybV9hbW91bnRfYWxnbyksCiAgICB1bmNvdmVyIDEyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MzEKICAgIC8vIG92ZXJyaWRlX2Zhcm1fYW1vdW50PWFyYzQuVUludDY0KG92ZXJyaWRlX2Zhcm1fYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtNgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDMyCiAgICAvLyBvdmVycmlkZV9mYXJtX2Ftb3VudF9hbGdvPWFyYzQuVUludDY0KG92ZXJyaWRlX2Zhcm1fYW1vdW50X2FsZ28pLAogICAgdW5jb3ZlciAxMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDMzCiAgICAvLyBiYXNlX2Fwcl9icHM9YXJjNC5VSW50NjQoYmFzZV9hcHJfYnBzKSwKICAgIHVuY292ZXIgMTMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQzNAogICAgLy8gZmFybV9hcHJfYnBzPWFyYzQuVUludDY0KGZhcm1fYXByX2JwcyksCiAgICB1bmNvdmVyIDEzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0MzUKICAgIC8vIG92ZXJyaWRlX2Zhcm1fYXByX2Jwcz1hcmM0LlVJbnQ2NChvdmVycmlkZV9mYXJtX2Fwcl9icHMpLAogICAgdW5jb3ZlciAxMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDIxLTQzNgogICAgLy8gcmV0dXJuIEFQUkJyZWFrZG93bigKICAgIC8vICAgICBiYWxhbmNlPWFyYzQuVUludDY0KGJhbGFuY2UpLAogICAgLy8gICAgIHN0YWtlZD1hcmM0LlVJbnQ2NChzdGFrZWQpLAogICAgLy8gICAgIG9ubGluZV9zdGFrZT1hcmM0LlVJbnQ2NChjdHgub25saW5lX3N0YWtlKSwKICAgIC8vICAgICBhdmdfcm91bmRfdGltZT1hcmM0LlVJbnQ2NChjdHguYXZnX3JvdW5kX3RpbWUpLAogICAgLy8gICAgIGV4cGVjdGVkX3llYXJseV9ibG9ja3M9YXJjNC5VSW50NjQob3duX3llYXJseV9ibG9ja3NfcHJvZHVjZWQpLAogICAgLy8gICAgIGN1cnJlbnRfYmxvY2tfYm9udXM9YXJjNC5VSW50NjQoY3VycmVudF9ibG9ja19yZXdhcmRzKSwKICAgIC8vICAgICBjdXJyZW50X2F2Z19ibG9ja19wYXlvdXQ9YXJjNC5VSW50NjQoY3R4LmF2Z19ibG9ja19wYXlvdXQpLAogICAgLy8gICAgIGN1cnJlbnRfZmFybV9hbW91bnQ9YXJjNC5VSW50NjQoZmFybV9hbW91bnQpLAogICAgLy8gICAgIGN1cnJlbnRfZmFybV9hbW91bnRfYWxnbz1hcmM0LlVJbnQ2NChmYXJtX2Ftb3VudF9hbGdvKSwKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Ftb3VudD1hcmM0LlVJbnQ2NChvdmVycmlkZV9mYXJtX2Ftb3VudCksCiAgICAvLyAgICAgb3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbz1hcmM0LlVJbnQ2NChvdmVycmlkZV9mYXJtX2Ftb3VudF9hbGdvKSwKICAgIC8vICAgICBiYXNlX2Fwcl9icHM9YXJjNC5VSW50NjQoYmFzZV9hcHJfYnBzKSwKICAgIC8vICAgICBmYXJtX2Fwcl9icHM9YXJjNC5VSW50NjQoZmFybV9hcHJfYnBzKSwKICAgIC8vICAgICBvdmVycmlkZV9mYXJtX2Fwcl9icHM9YXJjNC5VSW50NjQob3ZlcnJpZGVfZmFybV9hcHJfYnBzKSwKICAgIC8vICkKICAgIHVuY292ZXIgMTMKICAgIHVuY292ZXIgMTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX2ZhbHNlQDU6CiAgICBpbnRjXzAgLy8gMAogICAgYiBfcHJvamVjdF9hcHJfaW5fY29udGV4dF9ib29sX21lcmdlQDYKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9hcHJfYnBzKHJld2FyZF9wZXJfYmxvY2s6IHVpbnQ2NCwgeWVhcmx5X2Jsb2NrczogdWludDY0LCBzdGFrZWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfYXByX2JwczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQzOC00NDEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X2Fwcl9icHMoCiAgICAvLyAgICAgc2VsZiwgcmV3YXJkX3Blcl9ibG9jazogVUludDY0LCB5ZWFybHlfYmxvY2tzOiBVSW50NjQsIHN0YWtlZDogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NDMKICAgIC8vIGlmIHN0YWtlZCA9PSBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJueiBnZXRfYXByX2Jwc19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ0NAogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfYXByX2Jwc19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6NDctNDgKICAgIC8vICMgKGZsb29yKGEgKiBiIC8gYyksIGEgKiBiICUgYykuIGZhaWxzIGlmIHRoZSBxdW90aWVudCBkb2VzIG5vdCBmaXQKICAgIC8vIGhpLCBsbyA9IG9wLm11bHcoYSwgYikKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBtdWx3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6NDkKICAgIC8vIHFfaGksIHFfbG8sIHJfaGksIHJfbG8gPSBvcC5kaXZtb2R3KGhpLCBsbywgVUludDY0KDApLCBjKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2RpZyAtMQogICAgZGl2bW9kdwogICAgZnJhbWVfYnVyeSAxCiAgICBwb3AKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYnogZ2V0X2Fwcl9icHNfYWZ0ZXJfaWZfZWxzZUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6NTAKICAgIC8vIGN1c3RvbS5lbnN1cmUocV9oaSA9PSAwLCBTKCJFUlI6TVVMRElWIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpNVUxESVYiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmdldF9hcHJfYnBzX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjQ0NgogICAgLy8gVUludDY0KDEwMDAwKSwgcmV3YXJkX3Blcl9ibG9jaywgeWVhcmx5X2Jsb2Nrcywgc3Rha2VkCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo2NgogICAgLy8gcmV0dXJuIHNjYWxlICogcSArIG11bF9kaXYoc2NhbGUsIHIsIGMpCiAgICBmcmFtZV9kaWcgMAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NDQ2CiAgICAvLyBVSW50NjQoMTAwMDApLCByZXdhcmRfcGVyX2Jsb2NrLCB5ZWFybHlfYmxvY2tzLCBzdGFrZWQKICAgIGludGMgNCAvLyAxMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQwLTQxCiAgICAvLyAjIGZsb29yKGEgKiBiIC8gYykuIGZhaWxzIGlmIHRoZSByZXN1bHQgZG9lcyBub3QgZml0CiAgICAvLyBoaSwgbG8gPSBvcC5tdWx3KGEsIGIpCiAgICBmcmFtZV9kaWcgMQogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQyCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaSwgbG8sIGMpCiAgICBmcmFtZV9kaWcgLTEKICAgIGRpdncKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTo2NgogICAgLy8gcmV0dXJuIHNjYWxlICogcSArIG11bF9kaXYoc2NhbGUsIHIsIGMpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0NDUtNDQ3CiAgICAvLyByZXR1cm4gbWF0aC5zY2FsZWRfbXVsX2RpdigKICAgIC8vICAgICBVSW50NjQoMTAwMDApLCByZXdhcmRfcGVyX2Jsb2NrLCB5ZWFybHlfYmxvY2tzLCBzdGFrZWQKICAgIC8vICkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5jYWxjdWxhdGVfYWxnb19jb3N0KHJlY2lwaWVudF9hcHA6IHVpbnQ2NCwgZmFybV9hc3NldDogdWludDY0LCBkdXJhdGlvbl9ibG9ja3M6IHVpbnQ2NCkgLT4gYnl0ZXM6CmNhbGN1bGF0ZV9hbGdvX2Nvc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo0OTctNTAwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGN1bGF0ZV9hbGdvX2Nvc3QoCiAgICAvLyAgICAgc2VsZiwgcmVjaXBpZW50X2FwcDogQXBwbGljYXRpb24sIGZhcm1fYXNzZXQ6IEFzc2V0LCBkdXJhdGlvbl9ibG9ja3M6IFVJbnQ2NAogICAgLy8gKSAtPiBBbGdvQ29zdDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTAzCiAgICAvLyBpZiBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGZhcm1fYXNzZXQpCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIC0yCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTAyLTUwNAogICAgLy8gVUludDY0KDApCiAgICAvLyBpZiBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGZhcm1fYXNzZXQpCiAgICAvLyBlbHNlIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgIGJ6IGNhbGN1bGF0ZV9hbGdvX2Nvc3RfdGVybmFyeV9mYWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MDIKICAgIC8vIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKCmNhbGN1bGF0ZV9hbGdvX2Nvc3RfdGVybmFyeV9tZXJnZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTA2CiAgICAvLyBib3hfbWJyID0gVUludDY0KDApIGlmIHJlY2lwaWVudF9hcHAgaW4gc2VsZi5mYXJtcyBlbHNlIFVJbnQ2NChGQVJNX0JPWF9NQlIpCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgcHVzaGludCAxNjEwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MDgKICAgIC8vIGl4X2Nvc3QgPSBzZWxmLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpICogZHVyYXRpb25fYmxvY2tzCiAgICBjYWxsc3ViIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jawogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MDkKICAgIC8vIHR4bl9mZWVfY29zdCA9IHNlbGYuZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrKCkgKiBkdXJhdGlvbl9ibG9ja3MKICAgIGNhbGxzdWIgZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0ODkKICAgIC8vIHJldHVybiBzZWxmLnBsYXRfZmVlX3BiICogR2xvYmFsLm1pbl90eG5fZmVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjAgLy8gInBsYXRfZmVlX3BiIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXRfZmVlX3BiIGV4aXN0cwogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTEwCiAgICAvLyBwbGF0Zm9ybV9jb3N0ID0gc2VsZi5nZXRfcGxhdGZvcm1fZmVlX3Blcl9ibG9jaygpICogZHVyYXRpb25fYmxvY2tzCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUxMQogICAgLy8gdG90YWxfY29zdCA9IGl4X2Nvc3QgKyB0eG5fZmVlX2Nvc3QgKyBwbGF0Zm9ybV9jb3N0CiAgICBkaWcgMgogICAgZGlnIDIKICAgICsKICAgIGRpZyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MTQKICAgIC8vIHRvdGFsX2Nvc3Q9YXJjNC5VSW50NjQodG90YWxfY29zdCksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MTUKICAgIC8vIGJveF9jb3N0PWFyYzQuVUludDY0KGJveF9tYnIpLAogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MTYKICAgIC8vIG9wdGluX2Nvc3Q9YXJjNC5VSW50NjQob3B0aW5fbWJyKSwKICAgIHVuY292ZXIgNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTE3CiAgICAvLyB0eG5fZmVlX2Nvc3Q9YXJjNC5VSW50NjQodHhuX2ZlZV9jb3N0KSwKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTE4CiAgICAvLyBpeF9jb3N0PWFyYzQuVUludDY0KGl4X2Nvc3QpLAogICAgdW5jb3ZlciA1CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1MTkKICAgIC8vIHBsYXRmb3JtX2Nvc3Q9YXJjNC5VSW50NjQocGxhdGZvcm1fY29zdCksCiAgICB1bmNvdmVyIDUKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUxMy01MjAKICAgIC8vIHJldHVybiBBbGdvQ29zdCgKICAgIC8vICAgICB0b3RhbF9jb3N0PWFyYzQuVUludDY0KHRvdGFsX2Nvc3QpLAogICAgLy8gICAgIGJveF9jb3N0PWFyYzQuVUludDY0KGJveF9tYnIpLAogICAgLy8gICAgIG9wdGluX2Nvc3Q9YXJjNC5VSW50NjQob3B0aW5fbWJyKSwKICAgIC8vICAgICB0eG5fZmVlX2Nvc3Q9YXJjNC5VSW50NjQodHhuX2ZlZV9jb3N0KSwKICAgIC8vICAgICBpeF9jb3N0PWFyYzQuVUludDY0KGl4X2Nvc3QpLAogICAgLy8gICAgIHBsYXRmb3JtX2Nvc3Q9YXJjNC5VSW50NjQocGxhdGZvcm1fY29zdCksCiAgICAvLyApCiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgpjYWxjdWxhdGVfYWxnb19jb3N0X3Rlcm5hcnlfZmFsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjUwNAogICAgLy8gZWxzZSBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICBnbG9iYWwgQXNzZXRPcHRJbk1pbkJhbGFuY2UKICAgIGIgY2FsY3VsYXRlX2FsZ29fY29zdF90ZXJuYXJ5X21lcmdlQDMKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcDogdWludDY0KSAtPiB1aW50NjQ6CmdldF9tYXhfZHVyYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NDMtNTQ0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9tYXhfZHVyYXRpb24oc2VsZiwgcmVjaXBpZW50X2FwcDogQXBwbGljYXRpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTU0CiAgICAvLyAvLyBzZWxmLmdldF9hdmdfcm91bmRfdGltZSgpCiAgICBjYWxsc3ViIGdldF9hdmdfcm91bmRfdGltZQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTUxLTU1MwogICAgLy8gVUludDY0KDg2NDAwKQogICAgLy8gKiBVSW50NjQoREVGQVVMVF9NQVhfRFVSQVRJT05fREFZUykKICAgIC8vICogVUludDY0KDEwMDAwKQogICAgcHVzaGludCAzODg4MDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTUxLTU1NAogICAgLy8gVUludDY0KDg2NDAwKQogICAgLy8gKiBVSW50NjQoREVGQVVMVF9NQVhfRFVSQVRJT05fREFZUykKICAgIC8vICogVUludDY0KDEwMDAwKQogICAgLy8gLy8gc2VsZi5nZXRfYXZnX3JvdW5kX3RpbWUoKQogICAgc3dhcAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTU5CiAgICAvLyByZWNpcGllbnRfYXBwLmFkZHJlc3MuYmFsYW5jZSwgYmxvY2tzX3Byb2R1Y2VkLCBvcC5vbmxpbmVfc3Rha2UoKQogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgb25saW5lX3N0YWtlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6NDAtNDEKICAgIC8vICMgZmxvb3IoYSAqIGIgLyBjKS4gZmFpbHMgaWYgdGhlIHJlc3VsdCBkb2VzIG5vdCBmaXQKICAgIC8vIGhpLCBsbyA9IG9wLm11bHcoYSwgYikKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgbXVsdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjQyCiAgICAvLyByZXR1cm4gb3AuZGl2dyhoaSwgbG8sIGMpCiAgICB1bmNvdmVyIDIKICAgIGRpdncKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU2MQogICAgLy8gcmV0dXJuIG1hdGgubWF4X3U2NChVSW50NjQoREVGQVVMVF9NSU5fRFVSQVRJT05fQkxPQ0tTKSwgbWF4X2R1cmF0aW9uKQogICAgcHVzaGludCAzMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjE1CiAgICAvLyByZXR1cm4gYSBpZiBhID4gYiBlbHNlIGIKICAgIGRpZyAxCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NjEKICAgIC8vIHJldHVybiBtYXRoLm1heF91NjQoVUludDY0KERFRkFVTFRfTUlOX0RVUkFUSU9OX0JMT0NLUyksIG1heF9kdXJhdGlvbikKICAgIHB1c2hpbnQgMzAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weToxNQogICAgLy8gcmV0dXJuIGEgaWYgYSA+IGIgZWxzZSBiCiAgICBzd2FwCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU2MQogICAgLy8gcmV0dXJuIG1hdGgubWF4X3U2NChVSW50NjQoREVGQVVMVF9NSU5fRFVSQVRJT05fQkxPQ0tTKSwgbWF4X2R1cmF0aW9uKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfYXZnX3JvdW5kX3RpbWUoKSAtPiB1aW50NjQ6CmdldF9hdmdfcm91bmRfdGltZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU2My01NjQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X2F2Z19yb3VuZF90aW1lKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NjkKICAgIC8vIGF2Z19yb3VuZF90aW1lID0gc2VsZi5hdmdfcm91bmRfdGltZS5nZXQoVUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vICJhdmdfcm91bmRfdGltZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU3MAogICAgLy8gaWYgYXZnX3JvdW5kX3RpbWUgPiBVSW50NjQoMCk6CiAgICBieiBnZXRfYXZnX3JvdW5kX3RpbWVfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NzEKICAgIC8vIHJldHVybiBhdmdfcm91bmRfdGltZQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfYXZnX3JvdW5kX3RpbWVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjI0CiAgICAvLyByZXR1cm4gbWF0aC5zYWZlX3N1YnRyYWN0KFR4bi5sYXN0X3ZhbGlkLCBVSW50NjQoMTAwMSksIFVJbnQ2NCgxKSkKICAgIHR4biBMYXN0VmFsaWQKICAgIGludGMgNiAvLyAxMDAxCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBzYWZlX3N1YnRyYWN0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjI5CiAgICAvLyByZXR1cm4gVHhuLmZpcnN0X3ZhbGlkIC0gVUludDY0KDEpCiAgICB0eG4gRmlyc3RWYWxpZAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjQyCiAgICAvLyBpZiBmaXJzdF9hY2Nlc3NpYmxlID4gVUludDY0KDEpOgogICAgaW50Y18xIC8vIDEKICAgID4KICAgIGJ6IGdldF9hdmdfcm91bmRfdGltZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo0NAogICAgLy8gbGFzdF9hY2Nlc3NpYmxlIC0gZmlyc3RfYWNjZXNzaWJsZSA+PSBtaW5fcm91bmRfc2FtcGxlLAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1NzItNTczCiAgICAvLyAjIHJvdW5kX3RpbWUgPSAoZHQgPT0gdGltZTIgLSB0aW1lMSkgLyAoZHIgPT0gYmxvY2syIC0gYmxvY2sxKQogICAgLy8gcnRfZnJhY3Rpb24gPSByb3VuZF90aW1lLmdldF9yb3VuZF90aW1lKFVJbnQ2NChNSU5fUk9VTkRfU0FNUExFKSkKICAgIHB1c2hpbnQgNTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6NDQKICAgIC8vIGxhc3RfYWNjZXNzaWJsZSAtIGZpcnN0X2FjY2Vzc2libGUgPj0gbWluX3JvdW5kX3NhbXBsZSwKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogZ2V0X2F2Z19yb3VuZF90aW1lX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjQ1CiAgICAvLyBTKCJFUlI6QkxLIFJOR0UiKSwKICAgIHB1c2hieXRlcyAiRVJSOkJMSyBSTkdFIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpnZXRfYXZnX3JvdW5kX3RpbWVfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjQ3CiAgICAvLyBibG9ja19kZWx0YSA9IGxhc3RfYWNjZXNzaWJsZSAtIGZpcnN0X2FjY2Vzc2libGUKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo0OAogICAgLy8gdHNfZGVsdGEgPSBvcC5CbG9jay5ibGtfdGltZXN0YW1wKGxhc3RfYWNjZXNzaWJsZSkgLSBvcC5CbG9jay5ibGtfdGltZXN0YW1wKAogICAgc3dhcAogICAgYmxvY2sgQmxrVGltZXN0YW1wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6NDgtNTAKICAgIC8vIHRzX2RlbHRhID0gb3AuQmxvY2suYmxrX3RpbWVzdGFtcChsYXN0X2FjY2Vzc2libGUpIC0gb3AuQmxvY2suYmxrX3RpbWVzdGFtcCgKICAgIC8vICAgICBmaXJzdF9hY2Nlc3NpYmxlCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGJsb2NrIEJsa1RpbWVzdGFtcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTc0CiAgICAvLyByZXR1cm4gVUludDY0KDEwMDAwKSAqIHJ0X2ZyYWN0aW9uLmR0IC8vIHJ0X2ZyYWN0aW9uLmRyCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgICoKICAgIHN3YXAKICAgIC8KICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5mb2xkX29yYWNsZSgpIC0+IHZvaWQ6CmZvbGRfb3JhY2xlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTg4LTU4OQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBmb2xkX29yYWNsZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo1OTYKICAgIC8vIG9yYWNsZV9yb3VuZCA9IHNlbGYub3JhY2xlX3JvdW5kLmdldChVSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gIm9yYWNsZV9yb3VuZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weToyOQogICAgLy8gcmV0dXJuIFR4bi5maXJzdF92YWxpZCAtIFVJbnQ2NCgxKQogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NTk4CiAgICAvLyBpZiBsYXN0X3JvdW5kIDw9IG9yYWNsZV9yb3VuZDoKICAgIDw9CiAgICBieiBmb2xkX29yYWNsZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjU5OQogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCmZvbGRfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weToyNAogICAgLy8gcmV0dXJuIG1hdGguc2FmZV9zdWJ0cmFjdChUeG4ubGFzdF92YWxpZCwgVUludDY0KDEwMDEpLCBVSW50NjQoMSkpCiAgICB0eG4gTGFzdFZhbGlkCiAgICBpbnRjIDYgLy8gMTAwMQogICAgaW50Y18xIC8vIDEKICAgIGNhbGxzdWIgc2FmZV9zdWJ0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjE1CiAgICAvLyByZXR1cm4gYSBpZiBhID4gYiBlbHNlIGIKICAgIGR1cAogICAgZnJhbWVfZGlnIDExCiAgICBkdXAKICAgIGNvdmVyIDIKICAgID4KICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weToyOQogICAgLy8gcmV0dXJuIFR4bi5maXJzdF92YWxpZCAtIFVJbnQ2NCgxKQogICAgdHhuIEZpcnN0VmFsaWQKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjU5CiAgICAvLyBpZiBmaXJzdF9hY2Nlc3NpYmxlID49IGxhc3RfYWNjZXNzaWJsZToKICAgID49CiAgICBieiBmb2xkX29yYWNsZV9hZnRlcl9pZl9lbHNlQDI3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6NjAKICAgIC8vIHJldHVybiBSb3VuZFRpbWVGcmFjdGlvbihkdD1VSW50NjQoMCksIGRyPVVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgZnJhbWVfYnVyeSA4Cgpmb2xkX29yYWNsZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jb21tb24ucm91bmRfdGltZS5nZXRfcm91bmRfdGltZV9zaW5jZUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwMgogICAgLy8gaWYgcnRfZnJhY3Rpb24uZHIgPiBVSW50NjQoMCk6CiAgICBmcmFtZV9kaWcgNwogICAgYnogZm9sZF9vcmFjbGVfYWZ0ZXJfaWZfZWxzZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjIwCiAgICAvLyByZXR1cm4gYSBpZiBhIDwgYiBlbHNlIGIKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwMwogICAgLy8gd2VpZ2h0ID0gbWF0aC5taW5fdTY0KHJ0X2ZyYWN0aW9uLmRyLCBVSW50NjQoT1JBQ0xFX1JPVU5EX1dJTkRPVykpCiAgICBpbnRjIDUgLy8gMTAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjIwCiAgICAvLyByZXR1cm4gYSBpZiBhIDwgYiBlbHNlIGIKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwMwogICAgLy8gd2VpZ2h0ID0gbWF0aC5taW5fdTY0KHJ0X2ZyYWN0aW9uLmRyLCBVSW50NjQoT1JBQ0xFX1JPVU5EX1dJTkRPVykpCiAgICBpbnRjIDUgLy8gMTAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjIwCiAgICAvLyByZXR1cm4gYSBpZiBhIDwgYiBlbHNlIGIKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfYnVyeSAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjA0CiAgICAvLyBzYW1wbGUgPSBVSW50NjQoMTAwMDApICogcnRfZnJhY3Rpb24uZHQgLy8gcnRfZnJhY3Rpb24uZHIKICAgIGludGMgNCAvLyAxMDAwMAogICAgZnJhbWVfZGlnIDgKICAgICoKICAgIHN3YXAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwNQogICAgLy8gYXZnX3JvdW5kX3RpbWUgPSBzZWxmLmF2Z19yb3VuZF90aW1lLmdldChVSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gImF2Z19yb3VuZF90aW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MDYKICAgIC8vIGlmIGF2Z19yb3VuZF90aW1lID09IFVJbnQ2NCgwKToKICAgIGJueiBmb2xkX29yYWNsZV9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjA3CiAgICAvLyBzZWxmLmF2Z19yb3VuZF90aW1lLnZhbHVlID0gc2FtcGxlCiAgICBieXRlYyAxNSAvLyAiYXZnX3JvdW5kX3RpbWUiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKZm9sZF9vcmFjbGVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjI0CiAgICAvLyByZXR1cm4gbWF0aC5zYWZlX3N1YnRyYWN0KFR4bi5sYXN0X3ZhbGlkLCBVSW50NjQoMTAwMSksIFVJbnQ2NCgxKSkKICAgIHR4biBMYXN0VmFsaWQKICAgIGludGMgNiAvLyAxMDAxCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBzYWZlX3N1YnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6NjktNzIKICAgIC8vICMgbWVhbiBwcm9wb3NlciBwYXlvdXQgb2YgdGhlIGFjY2Vzc2libGUgcm91bmRzIGFmdGVyIHNpbmNlX3JvdW5kIHRoYXQgYXJlCiAgICAvLyAjIG11bHRpcGxlcyBvZiBzdHJpZGUsIHNvIHRoZSBzYW1wbGVkIHJvdW5kcyBkbyBub3QgZGVwZW5kIG9uIHRoZSBjYWxsZXIncwogICAgLy8gIyB2YWxpZGl0eSB3aW5kb3cuIDAgaWYgbm9uZSBvZiB0aGVtIHBhaWQgb3V0CiAgICAvLyBmaXJzdF9hY2Nlc3NpYmxlID0gbWF0aC5tYXhfdTY0KGZpcnN0X2FjY2Vzc2libGVfcm91bmQoKSwgc2luY2Vfcm91bmQgKyAxKQogICAgZnJhbWVfZGlnIDExCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9tYXRoLnB5OjE1CiAgICAvLyByZXR1cm4gYSBpZiBhID4gYiBlbHNlIGIKICAgIGR1cDIKICAgID4KICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjI5CiAgICAvLyByZXR1cm4gVHhuLmZpcnN0X3ZhbGlkIC0gVUludDY0KDEpCiAgICB0eG4gRmlyc3RWYWxpZAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5Ojc0CiAgICAvLyBybmQgPSBmaXJzdF9hY2Nlc3NpYmxlICsgKHN0cmlkZSAtIGZpcnN0X2FjY2Vzc2libGUgJSBzdHJpZGUpICUgc3RyaWRlCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxNQogICAgLy8gb3JhY2xlX3JvdW5kLCBVSW50NjQoT1JBQ0xFX1BBWU9VVF9TVFJJREUpCiAgICBwdXNoaW50IDEwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5Ojc0CiAgICAvLyBybmQgPSBmaXJzdF9hY2Nlc3NpYmxlICsgKHN0cmlkZSAtIGZpcnN0X2FjY2Vzc2libGUgJSBzdHJpZGUpICUgc3RyaWRlCiAgICAlCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTUKICAgIC8vIG9yYWNsZV9yb3VuZCwgVUludDY0KE9SQUNMRV9QQVlPVVRfU1RSSURFKQogICAgcHVzaGludCAxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo3NAogICAgLy8gcm5kID0gZmlyc3RfYWNjZXNzaWJsZSArIChzdHJpZGUgLSBmaXJzdF9hY2Nlc3NpYmxlICUgc3RyaWRlKSAlIHN0cmlkZQogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjE1CiAgICAvLyBvcmFjbGVfcm91bmQsIFVJbnQ2NChPUkFDTEVfUEFZT1VUX1NUUklERSkKICAgIHB1c2hpbnQgMTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6NzQKICAgIC8vIHJuZCA9IGZpcnN0X2FjY2Vzc2libGUgKyAoc3RyaWRlIC0gZmlyc3RfYWNjZXNzaWJsZSAlIHN0cmlkZSkgJSBzdHJpZGUKICAgICUKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5Ojc1CiAgICAvLyBudW1fcGF5b3V0cyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5Ojc2CiAgICAvLyBzdW1fcGF5b3V0cyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgOQoKZm9sZF9vcmFjbGVfd2hpbGVfdG9wQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5Ojc3CiAgICAvLyB3aGlsZSBybmQgPD0gbGFzdF9hY2Nlc3NpYmxlOgogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2RpZyAzCiAgICA8PQogICAgYnogZm9sZF9vcmFjbGVfYWZ0ZXJfd2hpbGVAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo3OAogICAgLy8gcGF5b3V0ID0gb3AuQmxvY2suYmxrX3Byb3Bvc2VyX3BheW91dChybmQpCiAgICBmcmFtZV9kaWcgNgogICAgYmxvY2sgQmxrUHJvcG9zZXJQYXlvdXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6NzkKICAgIC8vIGlmIHBheW91dCA+IFVJbnQ2NCgwKToKICAgIGJ6IGZvbGRfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo4MAogICAgLy8gbnVtX3BheW91dHMgPSBudW1fcGF5b3V0cyArIFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo4MQogICAgLy8gc3VtX3BheW91dHMgPSBzdW1fcGF5b3V0cyArIHBheW91dAogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA1CiAgICArCiAgICBmcmFtZV9idXJ5IDkKCmZvbGRfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6ODIKICAgIC8vIHJuZCA9IHJuZCArIHN0cmlkZQogICAgZnJhbWVfZGlnIDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxNQogICAgLy8gb3JhY2xlX3JvdW5kLCBVSW50NjQoT1JBQ0xFX1BBWU9VVF9TVFJJREUpCiAgICBwdXNoaW50IDEwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjgyCiAgICAvLyBybmQgPSBybmQgKyBzdHJpZGUKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgYiBmb2xkX29yYWNsZV93aGlsZV90b3BAMTQKCmZvbGRfb3JhY2xlX2FmdGVyX3doaWxlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjgzCiAgICAvLyByZXR1cm4gc3VtX3BheW91dHMgLy8gbnVtX3BheW91dHMgaWYgbnVtX3BheW91dHMgPiBVSW50NjQoMCkgZWxzZSBVSW50NjQoMCkKICAgIGZyYW1lX2RpZyA0CiAgICBieiBmb2xkX29yYWNsZV90ZXJuYXJ5X2ZhbHNlQDIwCiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfZGlnIDQKICAgIC8KICAgIGZyYW1lX2J1cnkgNQoKZm9sZF9vcmFjbGVfdGVybmFyeV9tZXJnZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxNwogICAgLy8gaWYgcGF5b3V0ID4gVUludDY0KDApOgogICAgZnJhbWVfZGlnIDUKICAgIGJ6IGZvbGRfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxOAogICAgLy8gYXZnX2Jsb2NrX3BheW91dCA9IHNlbGYuYXZnX2Jsb2NrX3BheW91dC5nZXQoVUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJhdmdfYmxvY2tfcGF5b3V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MTkKICAgIC8vIGlmIGF2Z19ibG9ja19wYXlvdXQgPT0gVUludDY0KDApOgogICAgYm56IGZvbGRfb3JhY2xlX2Vsc2VfYm9keUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MjAKICAgIC8vIHNlbGYuYXZnX2Jsb2NrX3BheW91dC52YWx1ZSA9IHBheW91dAogICAgYnl0ZWMgMTAgLy8gImF2Z19ibG9ja19wYXlvdXQiCiAgICBmcmFtZV9kaWcgNQogICAgYXBwX2dsb2JhbF9wdXQKCmZvbGRfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MjYKICAgIC8vIHNlbGYub3JhY2xlX3JvdW5kLnZhbHVlID0gbGFzdF9yb3VuZAogICAgYnl0ZWMgMjIgLy8gIm9yYWNsZV9yb3VuZCIKICAgIGZyYW1lX2RpZyAxMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKZm9sZF9vcmFjbGVfZWxzZV9ib2R5QDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MjMKICAgIC8vIGF2Z19ibG9ja19wYXlvdXQsIHBheW91dCwgd2VpZ2h0LCBVSW50NjQoT1JBQ0xFX1JPVU5EX1dJTkRPVykKICAgIGludGMgNSAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6MzAtMzEKICAgIC8vICMgZXhwb25lbnRpYWwgbW92aW5nIGF2ZXJhZ2Ugc3RlcDogc2FtcGxlIGNvdW50cyB3ZWlnaHQvd2luZG93LCBwcmV2IHRoZSByZXN0CiAgICAvLyByZXR1cm4gKHByZXYgKiAod2luZG93IC0gd2VpZ2h0KSArIHNhbXBsZSAqIHdlaWdodCkgLy8gd2luZG93CiAgICBmcmFtZV9kaWcgMTAKICAgIGR1cAogICAgY292ZXIgMgogICAgLQogICAgZnJhbWVfZGlnIDAKICAgICoKICAgIGZyYW1lX2RpZyA1CiAgICB1bmNvdmVyIDIKICAgICoKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gYXZnX2Jsb2NrX3BheW91dCwgcGF5b3V0LCB3ZWlnaHQsIFVJbnQ2NChPUkFDTEVfUk9VTkRfV0lORE9XKQogICAgaW50YyA1IC8vIDEwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vbWF0aC5weTozMC0zMQogICAgLy8gIyBleHBvbmVudGlhbCBtb3ZpbmcgYXZlcmFnZSBzdGVwOiBzYW1wbGUgY291bnRzIHdlaWdodC93aW5kb3csIHByZXYgdGhlIHJlc3QKICAgIC8vIHJldHVybiAocHJldiAqICh3aW5kb3cgLSB3ZWlnaHQpICsgc2FtcGxlICogd2VpZ2h0KSAvLyB3aW5kb3cKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyMgogICAgLy8gc2VsZi5hdmdfYmxvY2tfcGF5b3V0LnZhbHVlID0gbWF0aC5lbWEoCiAgICBieXRlYyAxMCAvLyAiYXZnX2Jsb2NrX3BheW91dCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYyMi02MjQKICAgIC8vIHNlbGYuYXZnX2Jsb2NrX3BheW91dC52YWx1ZSA9IG1hdGguZW1hKAogICAgLy8gICAgIGF2Z19ibG9ja19wYXlvdXQsIHBheW91dCwgd2VpZ2h0LCBVSW50NjQoT1JBQ0xFX1JPVU5EX1dJTkRPVykKICAgIC8vICkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIGZvbGRfb3JhY2xlX2FmdGVyX2lmX2Vsc2VAMTIKCmZvbGRfb3JhY2xlX3Rlcm5hcnlfZmFsc2VAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL3JvdW5kX3RpbWUucHk6ODMKICAgIC8vIHJldHVybiBzdW1fcGF5b3V0cyAvLyBudW1fcGF5b3V0cyBpZiBudW1fcGF5b3V0cyA+IFVJbnQ2NCgwKSBlbHNlIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNQogICAgYiBmb2xkX29yYWNsZV90ZXJuYXJ5X21lcmdlQDIxCgpmb2xkX29yYWNsZV9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxMAogICAgLy8gYXZnX3JvdW5kX3RpbWUsIHNhbXBsZSwgd2VpZ2h0LCBVSW50NjQoT1JBQ0xFX1JPVU5EX1dJTkRPVykKICAgIGludGMgNSAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6MzAtMzEKICAgIC8vICMgZXhwb25lbnRpYWwgbW92aW5nIGF2ZXJhZ2Ugc3RlcDogc2FtcGxlIGNvdW50cyB3ZWlnaHQvd2luZG93LCBwcmV2IHRoZSByZXN0CiAgICAvLyByZXR1cm4gKHByZXYgKiAod2luZG93IC0gd2VpZ2h0KSArIHNhbXBsZSAqIHdlaWdodCkgLy8gd2luZG93CiAgICBmcmFtZV9kaWcgMTAKICAgIGR1cAogICAgY292ZXIgMgogICAgLQogICAgZnJhbWVfZGlnIDEKICAgICoKICAgIGNvdmVyIDIKICAgICoKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYxMAogICAgLy8gYXZnX3JvdW5kX3RpbWUsIHNhbXBsZSwgd2VpZ2h0LCBVSW50NjQoT1JBQ0xFX1JPVU5EX1dJTkRPVykKICAgIGludGMgNSAvLyAxMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL21hdGgucHk6MzAtMzEKICAgIC8vICMgZXhwb25lbnRpYWwgbW92aW5nIGF2ZXJhZ2Ugc3RlcDogc2FtcGxlIGNvdW50cyB3ZWlnaHQvd2luZG93LCBwcmV2IHRoZSByZXN0CiAgICAvLyByZXR1cm4gKHByZXYgKiAod2luZG93IC0gd2VpZ2h0KSArIHNhbXBsZSAqIHdlaWdodCkgLy8gd2luZG93CiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MDkKICAgIC8vIHNlbGYuYXZnX3JvdW5kX3RpbWUudmFsdWUgPSBtYXRoLmVtYSgKICAgIGJ5dGVjIDE1IC8vICJhdmdfcm91bmRfdGltZSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYwOS02MTEKICAgIC8vIHNlbGYuYXZnX3JvdW5kX3RpbWUudmFsdWUgPSBtYXRoLmVtYSgKICAgIC8vICAgICBhdmdfcm91bmRfdGltZSwgc2FtcGxlLCB3ZWlnaHQsIFVJbnQ2NChPUkFDTEVfUk9VTkRfV0lORE9XKQogICAgLy8gKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgZm9sZF9vcmFjbGVfYWZ0ZXJfaWZfZWxzZUA2Cgpmb2xkX29yYWNsZV9hZnRlcl9pZl9lbHNlQDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjYxCiAgICAvLyB0c19kZWx0YSA9IG9wLkJsb2NrLmJsa190aW1lc3RhbXAobGFzdF9hY2Nlc3NpYmxlKSAtIG9wLkJsb2NrLmJsa190aW1lc3RhbXAoCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBibG9jayBCbGtUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vcm91bmRfdGltZS5weTo2MS02MwogICAgLy8gdHNfZGVsdGEgPSBvcC5CbG9jay5ibGtfdGltZXN0YW1wKGxhc3RfYWNjZXNzaWJsZSkgLSBvcC5CbG9jay5ibGtfdGltZXN0YW1wKAogICAgLy8gICAgIGZpcnN0X2FjY2Vzc2libGUKICAgIC8vICkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJsb2NrIEJsa1RpbWVzdGFtcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9yb3VuZF90aW1lLnB5OjY0CiAgICAvLyByZXR1cm4gUm91bmRUaW1lRnJhY3Rpb24oZHQ9dHNfZGVsdGEsIGRyPWxhc3RfYWNjZXNzaWJsZSAtIGZpcnN0X2FjY2Vzc2libGUpCiAgICBjb3ZlciAyCiAgICAtCiAgICBmcmFtZV9idXJ5IDcKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjAxCiAgICAvLyBydF9mcmFjdGlvbiA9IHJvdW5kX3RpbWUuZ2V0X3JvdW5kX3RpbWVfc2luY2Uob3JhY2xlX3JvdW5kKQogICAgYiBmb2xkX29yYWNsZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jb21tb24ucm91bmRfdGltZS5nZXRfcm91bmRfdGltZV9zaW5jZUAyOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0udmFsaWRhdGVfZHVyYXRpb24ocmVjaXBpZW50X2FwcDogdWludDY0LCBkdXJhdGlvbl9ibG9ja3M6IHVpbnQ2NCkgLT4gdm9pZDoKdmFsaWRhdGVfZHVyYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MjgtNjMxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHZhbGlkYXRlX2R1cmF0aW9uKAogICAgLy8gICAgIHNlbGYsIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLCBkdXJhdGlvbl9ibG9ja3M6IFVJbnQ2NAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MzIKICAgIC8vIGFsbG93ZWRfZHVyYXRpb24gPSBzZWxmLmdldF9tYXhfZHVyYXRpb24ocmVjaXBpZW50X2FwcCkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBnZXRfbWF4X2R1cmF0aW9uCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjYzMwogICAgLy8gaWYgYWxsb3dlZF9kdXJhdGlvbiA8IGR1cmF0aW9uX2Jsb2NrczoKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYnogdmFsaWRhdGVfZHVyYXRpb25fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo2MzQKICAgIC8vIGxvZyhhbGxvd2VkX2R1cmF0aW9uKQogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjM1CiAgICAvLyBsb2coIkVSUjpEVVJBVElPTiIpCiAgICBwdXNoYnl0ZXMgIkVSUjpEVVJBVElPTiIKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6NjM2CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgp2YWxpZGF0ZV9kdXJhdGlvbl9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmVuc3VyZV9ibG9ja19wcm9wb3NlcihyZWNpcGllbnRfYXBwOiB1aW50NjQsIGJsb2NrX3JvdW5kOiB1aW50NjQsIGxhc3RfYmxvY2tfcGFpZDogdWludDY0KSAtPiB2b2lkOgplbnN1cmVfYmxvY2tfcHJvcG9zZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4MDQtODA3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGVuc3VyZV9ibG9ja19wcm9wb3NlcigKICAgIC8vICAgICBzZWxmLCByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbiwgYmxvY2tfcm91bmQ6IFVJbnQ2NCwgbGFzdF9ibG9ja19wYWlkOiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODA4LTgwOQogICAgLy8gIyBlbnN1cmUgb3VyIGJsb2NrIGlzIGFmdGVyIHRoZSBsYXN0IGJsb2NrIHdlIGhhdmUgcGFpZAogICAgLy8gY3VzdG9tLmVuc3VyZShibG9ja19yb3VuZCA+IGxhc3RfYmxvY2tfcGFpZCwgUygiRVJSOlBBU1QiKSkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogZW5zdXJlX2Jsb2NrX3Byb3Bvc2VyX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODA4LTgwOQogICAgLy8gIyBlbnN1cmUgb3VyIGJsb2NrIGlzIGFmdGVyIHRoZSBsYXN0IGJsb2NrIHdlIGhhdmUgcGFpZAogICAgLy8gY3VzdG9tLmVuc3VyZShibG9ja19yb3VuZCA+IGxhc3RfYmxvY2tfcGFpZCwgUygiRVJSOlBBU1QiKSkKICAgIHB1c2hieXRlcyAiRVJSOlBBU1QiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmVuc3VyZV9ibG9ja19wcm9wb3Nlcl9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4MTMKICAgIC8vIG9wLkJsb2NrLmJsa19wcm9wb3NlcihibG9ja19yb3VuZCkgPT0gcmVjaXBpZW50X2FwcC5hZGRyZXNzLAogICAgZnJhbWVfZGlnIC0yCiAgICBibG9jayBCbGtQcm9wb3NlcgogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGVuc3VyZV9ibG9ja19wcm9wb3Nlcl9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjgxNAogICAgLy8gUygiRVJSOk5PVCBCTEsgUFJPUCIpLAogICAgcHVzaGJ5dGVzICJFUlI6Tk9UIEJMSyBQUk9QIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTIKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEzCiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgplbnN1cmVfYmxvY2tfcHJvcG9zZXJfYWZ0ZXJfaWZfZWxzZUA3OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5wYXlfZmFybV9ibG9ja3MocmVjaXBpZW50X2FwcDogdWludDY0LCBmYXJtOiBieXRlcywgbnVtX2Jsb2NrczogdWludDY0LCBsYXN0X2Jsb2NrX3JvdW5kOiB1aW50NjQsIGNhbGxfc3dhcDogdWludDY0KSAtPiBieXRlczoKcGF5X2Zhcm1fYmxvY2tzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODMxLTgzOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBwYXlfZmFybV9ibG9ja3MoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZWNpcGllbnRfYXBwOiBBcHBsaWNhdGlvbiwKICAgIC8vICAgICBmYXJtOiBGYXJtQm94LAogICAgLy8gICAgIG51bV9ibG9ja3M6IFVJbnQ2NCwKICAgIC8vICAgICBsYXN0X2Jsb2NrX3JvdW5kOiBVSW50NjQsCiAgICAvLyAgICAgY2FsbF9zd2FwOiBib29sLCAgIyBub3FhOiBGQlQwMDEKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDUgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODQ2LTg0NwogICAgLy8gIyBjYWxsIHN3YXAgaWYgbmVlZGVkCiAgICAvLyBpZiBjYWxsX3N3YXA6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IHBheV9mYXJtX2Jsb2Nrc19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg0OC04NTIKICAgIC8vIGFiaV9jYWxsKAogICAgLy8gICAgICJzd2FwX29yX2ZhaWwoKXZvaWQiLAogICAgLy8gICAgIGFwcF9pZD1yZWNpcGllbnRfYXBwLAogICAgLy8gICAgIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsCiAgICAvLyApCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4NTEKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICBmcmFtZV9kaWcgLTUKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODQ4LTg1MgogICAgLy8gYWJpX2NhbGwoCiAgICAvLyAgICAgInN3YXBfb3JfZmFpbCgpdm9pZCIsCiAgICAvLyAgICAgYXBwX2lkPXJlY2lwaWVudF9hcHAsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDkzMjM5ODAyIC8vIG1ldGhvZCAic3dhcF9vcl9mYWlsKCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCnBheV9mYXJtX2Jsb2Nrc19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4NTQtODU1CiAgICAvLyAjIHBheSBvdXQgcmV3YXJkCiAgICAvLyBhbW91bnQgPSBmYXJtLmFtb3VudF9wZXJfYmxvY2suYXNfdWludDY0KCkgKiBudW1fYmxvY2tzCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0zCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4NTcKICAgIC8vIEFzc2V0KGZhcm0uZmFybV9hc3NldC5hc191aW50NjQoKSksCiAgICBmcmFtZV9kaWcgLTQKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODU4CiAgICAvLyByZWNpcGllbnRfYXBwLmFkZHJlc3MsCiAgICBmcmFtZV9kaWcgLTUKICAgIGFwcF9wYXJhbXNfZ2V0IEFwcEFkZHJlc3MKICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg2MAogICAgLy8gR2xvYmFsLm1pbl90eG5fZmVlLAogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODU2LTg2MQogICAgLy8gc2VuZC5heGZlcigKICAgIC8vICAgICBBc3NldChmYXJtLmZhcm1fYXNzZXQuYXNfdWludDY0KCkpLAogICAgLy8gICAgIHJlY2lwaWVudF9hcHAuYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQsCiAgICAvLyAgICAgR2xvYmFsLm1pbl90eG5fZmVlLAogICAgLy8gKQogICAgY292ZXIgMgogICAgZGlnIDMKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODY0CiAgICAvLyByZWNpcGllbnRfYXBwPWFyYzQuVUludDY0KHJlY2lwaWVudF9hcHAuaWQpLAogICAgZnJhbWVfZGlnIC01CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4NjUKICAgIC8vIGJsb2NrX3JvdW5kPWFyYzQuVUludDY0KGxhc3RfYmxvY2tfcm91bmQpLAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4NjYKICAgIC8vIG51bV9ibG9ja3M9YXJjNC5VSW50NjQobnVtX2Jsb2NrcyksCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg2NwogICAgLy8gYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICB1bmNvdmVyIDMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg2OAogICAgLy8ga2VlcGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg2My04NjkKICAgIC8vIEZhcm1QYXlvdXQoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcD1hcmM0LlVJbnQ2NChyZWNpcGllbnRfYXBwLmlkKSwKICAgIC8vICAgICBibG9ja19yb3VuZD1hcmM0LlVJbnQ2NChsYXN0X2Jsb2NrX3JvdW5kKSwKICAgIC8vICAgICBudW1fYmxvY2tzPWFyYzQuVUludDY0KG51bV9ibG9ja3MpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIGtlZXBlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODYyLTg3MAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEZhcm1QYXlvdXQoCiAgICAvLyAgICAgICAgIHJlY2lwaWVudF9hcHA9YXJjNC5VSW50NjQocmVjaXBpZW50X2FwcC5pZCksCiAgICAvLyAgICAgICAgIGJsb2NrX3JvdW5kPWFyYzQuVUludDY0KGxhc3RfYmxvY2tfcm91bmQpLAogICAgLy8gICAgICAgICBudW1fYmxvY2tzPWFyYzQuVUludDY0KG51bV9ibG9ja3MpLAogICAgLy8gICAgICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICAgICAga2VlcGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwOTBmMzQ4MyAvLyBtZXRob2QgIkZhcm1QYXlvdXQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg3NAogICAgLy8gbmV3X2Zhcm0ubGFzdF9ibG9ja19wYWlkID0gc2VsZi50b191MzIobGFzdF9ibG9ja19yb3VuZCkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiB0b191MzIKICAgIGZyYW1lX2RpZyAtNAogICAgc3dhcAogICAgcmVwbGFjZTIgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg3NgogICAgLy8gZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpIC0gbnVtX2Jsb2NrcwogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3RfdWludDMyCiAgICBmcmFtZV9kaWcgLTMKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg3NS04NzcKICAgIC8vIG5ld19mYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MgPSBhcmM0LlVJbnQzMigKICAgIC8vICAgICBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkgLSBudW1fYmxvY2tzCiAgICAvLyApCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCAzMgogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA0IDQKICAgIHJlcGxhY2UyIDE2CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg3OAogICAgLy8gaWYgbmV3X2Zhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2NrcyA9PSAwOgogICAgZXh0cmFjdCAxNiA0CiAgICBieXRlYyAxMiAvLyAweDAwMDAwMDAwCiAgICBiPT0KICAgIGJ6IHBheV9mYXJtX2Jsb2Nrc19lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODc5CiAgICAvLyBzZWxmLmRlbGV0ZV9mYXJtKHJlY2lwaWVudF9hcHAsIG5ld19mYXJtKQogICAgZnJhbWVfZGlnIC01CiAgICBzd2FwCiAgICBjYWxsc3ViIGRlbGV0ZV9mYXJtCiAgICBwb3AKCnBheV9mYXJtX2Jsb2Nrc19hZnRlcl9pZl9lbHNlQDY6CiAgICBmcmFtZV9kaWcgLTQKICAgIHJldHN1YgoKcGF5X2Zhcm1fYmxvY2tzX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODgxCiAgICAvLyBzZWxmLnN0b3JlX2Zhcm0ocmVjaXBpZW50X2FwcCwgbmV3X2Zhcm0pCiAgICBmcmFtZV9kaWcgLTUKICAgIHN3YXAKICAgIGNhbGxzdWIgc3RvcmVfZmFybQogICAgcG9wCiAgICBiIHBheV9mYXJtX2Jsb2Nrc19hZnRlcl9pZl9lbHNlQDYKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmFjY3J1ZV9peF9yZXdhcmRzKGFtb3VudDogdWludDY0KSAtPiB2b2lkOgphY2NydWVfaXhfcmV3YXJkczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg4My04ODQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYWNjcnVlX2l4X3Jld2FyZHMoc2VsZiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg4NS04ODcKICAgIC8vICMgY3JlZGl0IHRoZSBjYWxsZXIgdGhlIGl4IHJld2FyZCBmb3IgdGhlIGJsb2NrcyBwcm92ZW4gaW4gdGhpcyBjYWxsLgogICAgLy8gIyBtb3ZlcyBpdCBmcm9tIHR4biBmdWVsIHRvIGl4X2FjY3J1ZWQgb25jZSB0aGUgYmxvY2tzIGFyZSBhY2NvdW50ZWQgZm9yCiAgICAvLyBhY2NydWVkLCBleGlzdHMgPSBzZWxmLml4X3Jld2FyZHMubWF5YmUoVHhuLnNlbmRlcikKICAgIGJ5dGVjIDkgLy8gMHg2YgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4ODgKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBibnogYWNjcnVlX2l4X3Jld2FyZHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4ODktODkwCiAgICAvLyAjIHRoZSBuZXcgYm94IE1CUiBpcyBmdW5kZWQgZnJvbSB0aGlzIHJld2FyZAogICAgLy8gY3VzdG9tLmVuc3VyZShhbW91bnQgPj0gSVhfUkVXQVJEU19CT1hfTUJSLCBTKCJFUlI6SVggTUJSIikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGMgNyAvLyAxODkwMAogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBhY2NydWVfaXhfcmV3YXJkc19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5Ojg4OS04OTAKICAgIC8vICMgdGhlIG5ldyBib3ggTUJSIGlzIGZ1bmRlZCBmcm9tIHRoaXMgcmV3YXJkCiAgICAvLyBjdXN0b20uZW5zdXJlKGFtb3VudCA+PSBJWF9SRVdBUkRTX0JPWF9NQlIsIFMoIkVSUjpJWCBNQlIiKSkKICAgIHB1c2hieXRlcyAiRVJSOklYIE1CUiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjEyCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMwogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYWNjcnVlX2l4X3Jld2FyZHNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODkxCiAgICAvLyBhbW91bnQgLT0gSVhfUkVXQVJEU19CT1hfTUJSCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGMgNyAvLyAxODkwMAogICAgLQogICAgZnJhbWVfYnVyeSAtMQoKYWNjcnVlX2l4X3Jld2FyZHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODkyCiAgICAvLyBzZWxmLml4X3Jld2FyZHNbVHhuLnNlbmRlcl0gPSBhY2NydWVkICsgYW1vdW50CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBieXRlYyA5IC8vIDB4NmIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6ODkzCiAgICAvLyBzZWxmLml4X2FjY3J1ZWQudmFsdWUgPSBzZWxmLml4X2FjY3J1ZWQuZ2V0KFVJbnQ2NCgwKSkgKyBhbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJpeF9hY2NydWVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgYnl0ZWMgNSAvLyAiaXhfYWNjcnVlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmZ1bmRfYmxvY2tzKG51bV9ibG9ja3M6IHVpbnQ2NCkgLT4gdm9pZDoKZnVuZF9ibG9ja3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo4OTUtODk2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGZ1bmRfYmxvY2tzKHNlbGYsIG51bV9ibG9ja3M6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTAyCiAgICAvLyBzZWxmLmJsb2Nrc19mdW5kZWQuZ2V0KHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MpICsgbnVtX2Jsb2NrcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI1IC8vICJibG9ja3NfZnVuZGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MDEKICAgIC8vIHNlbGYuYmxvY2tzX2Z1bmRlZC52YWx1ZSA9ICgKICAgIGJ5dGVjIDI1IC8vICJibG9ja3NfZnVuZGVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTAxLTkwMwogICAgLy8gc2VsZi5ibG9ja3NfZnVuZGVkLnZhbHVlID0gKAogICAgLy8gICAgIHNlbGYuYmxvY2tzX2Z1bmRlZC5nZXQoc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcykgKyBudW1fYmxvY2tzCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5hY2NvdW50X3BhaWRfYmxvY2tzKG51bV9ibG9ja3M6IHVpbnQ2NCwgcHJlcGFpZDogdWludDY0KSAtPiB2b2lkOgphY2NvdW50X3BhaWRfYmxvY2tzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6OTA1LTkwNgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhY2NvdW50X3BhaWRfYmxvY2tzKHNlbGYsIG51bV9ibG9ja3M6IFVJbnQ2NCwgcHJlcGFpZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MTIKICAgIC8vIHNlbGYudHhuX2Z1ZWwgKyBwcmVwYWlkIC0gc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkgKiBudW1fYmxvY2tzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAidHhuX2Z1ZWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHhuX2Z1ZWwgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NzcKICAgIC8vIHJldHVybiBzZWxmLmdldF90eG5fZmVlX3Blcl9ibG9jaygpICsgc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKQogICAgY2FsbHN1YiBnZXRfdHhuX2ZlZV9wZXJfYmxvY2sKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MTIKICAgIC8vIHNlbGYudHhuX2Z1ZWwgKyBwcmVwYWlkIC0gc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkgKiBudW1fYmxvY2tzCiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjkwNy05MTEKICAgIC8vICMgdXBkYXRlIGdsb2JhbCB0eG4gZnVlbCBzdGF0ZQogICAgLy8gIyBzdWJ0cmFjdCB0aGUgdHhuIGZ1ZWwgcmVzZXJ2ZWQgcGVyIGJsb2NrIHJlZ2FyZGxlc3Mgb2YgY2FsbCBzd2FwIG9yIG5vdC4KICAgIC8vICMgYmF0Y2hlZCBwYXlvdXRzIHNlbmQgZmV3ZXIgaW5uZXIgdHhucywgdGhlIGRpZmZlcmVuY2Ugc3RheXMgd2l0aCB0aGUgcGxhdGZvcm0uCiAgICAvLyAjIHByZXBhaWQgSVggcmV3YXJkcyBsZWZ0IHR4biBmdWVsIHdoZW4gdGhlIGJsb2NrcyB3ZXJlIHJlY29yZGVkCiAgICAvLyBzZWxmLnR4bl9mdWVsID0gKAogICAgYnl0ZWNfMyAvLyAidHhuX2Z1ZWwiCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weTo5MDctOTEzCiAgICAvLyAjIHVwZGF0ZSBnbG9iYWwgdHhuIGZ1ZWwgc3RhdGUKICAgIC8vICMgc3VidHJhY3QgdGhlIHR4biBmdWVsIHJlc2VydmVkIHBlciBibG9jayByZWdhcmRsZXNzIG9mIGNhbGwgc3dhcCBvciBub3QuCiAgICAvLyAjIGJhdGNoZWQgcGF5b3V0cyBzZW5kIGZld2VyIGlubmVyIHR4bnMsIHRoZSBkaWZmZXJlbmNlIHN0YXlzIHdpdGggdGhlIHBsYXRmb3JtLgogICAgLy8gIyBwcmVwYWlkIElYIHJld2FyZHMgbGVmdCB0eG4gZnVlbCB3aGVuIHRoZSBibG9ja3Mgd2VyZSByZWNvcmRlZAogICAgLy8gc2VsZi50eG5fZnVlbCA9ICgKICAgIC8vICAgICBzZWxmLnR4bl9mdWVsICsgcHJlcGFpZCAtIHNlbGYuZ2V0X3NwZW5kX3Blcl9ibG9jaygpICogbnVtX2Jsb2NrcwogICAgLy8gKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjkxNAogICAgLy8gc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyA9IHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgLSBudW1fYmxvY2tzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIGJ5dGVjXzIgLy8gImdsb2JhbF9yZW1haW5pbmdfYmxvY2tzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uX2dldF9zdGF0ZV9hbmRfYXByKGFwcF9pZDogdWludDY0LCBvdmVycmlkZV9mYXJtX2Ftb3VudDogdWludDY0LCBjdHgub25saW5lX3N0YWtlOiB1aW50NjQsIGN0eC5ibG9ja19ib251czogdWludDY0LCBjdHguYXZnX2Jsb2NrX3BheW91dDogdWludDY0LCBjdHguYXZnX3JvdW5kX3RpbWU6IHVpbnQ2NCwgY3R4LnllYXJseV9ibG9ja3M6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfc3RhdGVfYW5kX2FwcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyNzQtMTI3NwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZ2V0X3N0YXRlX2FuZF9hcHIoCiAgICAvLyAgICAgc2VsZiwgYXBwX2lkOiBVSW50NjQsIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiBVSW50NjQsIGN0eDogQVBSQ29udGV4dAogICAgLy8gKSAtPiBGYXJtU3RhdGVBbmRBUFI6CiAgICBwcm90byA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyODEKICAgIC8vIGlmIGJveF9uYW1lIGluIHNlbGYuZmFybXMKICAgIGZyYW1lX2RpZyAtNwogICAgaXRvYgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjgwLTEyODcKICAgIC8vIHNlbGYuZmFybV9zdGF0ZShzZWxmLmxvYWRfZmFybShib3hfbmFtZSkpCiAgICAvLyBpZiBib3hfbmFtZSBpbiBzZWxmLmZhcm1zCiAgICAvLyBlbHNlIEZhcm1TdGF0ZSgKICAgIC8vICAgICBmYXJtX2Fzc2V0PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2s9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgbGFzdF9ibG9ja19wYWlkPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBieiBfZ2V0X3N0YXRlX2FuZF9hcHJfdGVybmFyeV9mYWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjgwCiAgICAvLyBzZWxmLmZhcm1fc3RhdGUoc2VsZi5sb2FkX2Zhcm0oYm94X25hbWUpKQogICAgZnJhbWVfZGlnIC03CiAgICBjYWxsc3ViIGxvYWRfZmFybQogICAgY2FsbHN1YiBmYXJtX3N0YXRlCiAgICBwb3AKCl9nZXRfc3RhdGVfYW5kX2Fwcl90ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjkwCiAgICAvLyBib3hfbmFtZSwgc3RhdGUuYW1vdW50X3Blcl9ibG9jay5hc191aW50NjQoKSwgb3ZlcnJpZGVfZmFybV9hbW91bnQsIGN0eAogICAgZHVwCiAgICBleHRyYWN0IDggOAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI4OS0xMjkxCiAgICAvLyBhcHIgPSBzZWxmLl9wcm9qZWN0X2Fwcl9pbl9jb250ZXh0KAogICAgLy8gICAgIGJveF9uYW1lLCBzdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLmFzX3VpbnQ2NCgpLCBvdmVycmlkZV9mYXJtX2Ftb3VudCwgY3R4CiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTcKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtNgogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX3Byb2plY3RfYXByX2luX2NvbnRleHQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyOTMKICAgIC8vIGJhbGFuY2U9YXByLmJhbGFuY2UsCiAgICBkdXAKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjk0CiAgICAvLyBzdGFrZWQ9YXByLnN0YWtlZCwKICAgIGRpZyAxCiAgICBleHRyYWN0IDggOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI5NQogICAgLy8gY3VycmVudF9ibG9ja19ib251cz1hcHIuY3VycmVudF9ibG9ja19ib251cywKICAgIGRpZyAyCiAgICBleHRyYWN0IDE2IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyOTYKICAgIC8vIGN1cnJlbnRfYXZnX2Jsb2NrX3BheW91dD1hcHIuY3VycmVudF9hdmdfYmxvY2tfcGF5b3V0LAogICAgZGlnIDMKICAgIGV4dHJhY3QgMjQgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI5NwogICAgLy8gY3VycmVudF9mYXJtX2Ftb3VudD1hcHIuY3VycmVudF9mYXJtX2Ftb3VudCwKICAgIGRpZyA0CiAgICBleHRyYWN0IDMyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEyOTgKICAgIC8vIGN1cnJlbnRfZmFybV9hbW91bnRfYWxnbz1hcHIuY3VycmVudF9mYXJtX2Ftb3VudF9hbGdvLAogICAgZGlnIDUKICAgIGV4dHJhY3QgNDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTI5OQogICAgLy8gb3ZlcnJpZGVfZmFybV9hbW91bnQ9YXByLm92ZXJyaWRlX2Zhcm1fYW1vdW50LAogICAgZGlnIDYKICAgIGV4dHJhY3QgNDggOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMwMAogICAgLy8gb3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbz1hcHIub3ZlcnJpZGVfZmFybV9hbW91bnRfYWxnbywKICAgIGRpZyA3CiAgICBleHRyYWN0IDU2IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMDEKICAgIC8vIGF2Z19yb3VuZF90aW1lPWFwci5hdmdfcm91bmRfdGltZSwKICAgIGRpZyA4CiAgICBleHRyYWN0IDY0IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMDIKICAgIC8vIG9ubGluZV9zdGFrZT1hcHIub25saW5lX3N0YWtlLAogICAgZGlnIDkKICAgIGV4dHJhY3QgNzIgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMwMwogICAgLy8gZXhwZWN0ZWRfeWVhcmx5X2Jsb2Nrcz1hcHIuZXhwZWN0ZWRfeWVhcmx5X2Jsb2NrcywKICAgIGRpZyAxMAogICAgZXh0cmFjdCA4MCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzA0CiAgICAvLyBiYXNlX2Fwcl9icHM9YXByLmJhc2VfYXByX2JwcywKICAgIGRpZyAxMQogICAgZXh0cmFjdCA4OCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzA1CiAgICAvLyBmYXJtX2Fwcl9icHM9YXByLmZhcm1fYXByX2JwcywKICAgIGRpZyAxMgogICAgZXh0cmFjdCA5NiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzA2CiAgICAvLyBvdmVycmlkZV9mYXJtX2Fwcl9icHM9YXByLm92ZXJyaWRlX2Zhcm1fYXByX2JwcywKICAgIHVuY292ZXIgMTMKICAgIGV4dHJhY3QgMTA0IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMDcKICAgIC8vIGZhcm1fYXNzZXQ9c3RhdGUuZmFybV9hc3NldCwKICAgIGRpZyAxNQogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMDkKICAgIC8vIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9c3RhdGUucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2NrcywKICAgIGRpZyAxNgogICAgZXh0cmFjdCAxNiA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzEwCiAgICAvLyBsYXN0X2Jsb2NrX3BhaWQ9c3RhdGUubGFzdF9ibG9ja19wYWlkLAogICAgdW5jb3ZlciAxNwogICAgZXh0cmFjdCAyNCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjkyLTEzMTEKICAgIC8vIHJldHVybiBGYXJtU3RhdGVBbmRBUFIoCiAgICAvLyAgICAgYmFsYW5jZT1hcHIuYmFsYW5jZSwKICAgIC8vICAgICBzdGFrZWQ9YXByLnN0YWtlZCwKICAgIC8vICAgICBjdXJyZW50X2Jsb2NrX2JvbnVzPWFwci5jdXJyZW50X2Jsb2NrX2JvbnVzLAogICAgLy8gICAgIGN1cnJlbnRfYXZnX2Jsb2NrX3BheW91dD1hcHIuY3VycmVudF9hdmdfYmxvY2tfcGF5b3V0LAogICAgLy8gICAgIGN1cnJlbnRfZmFybV9hbW91bnQ9YXByLmN1cnJlbnRfZmFybV9hbW91bnQsCiAgICAvLyAgICAgY3VycmVudF9mYXJtX2Ftb3VudF9hbGdvPWFwci5jdXJyZW50X2Zhcm1fYW1vdW50X2FsZ28sCiAgICAvLyAgICAgb3ZlcnJpZGVfZmFybV9hbW91bnQ9YXByLm92ZXJyaWRlX2Zhcm1fYW1vdW50LAogICAgLy8gICAgIG92ZXJyaWRlX2Zhcm1fYW1vdW50X2FsZ289YXByLm92ZXJyaWRlX2Zhcm1fYW1vdW50X2FsZ28sCiAgICAvLyAgICAgYXZnX3JvdW5kX3RpbWU9YXByLmF2Z19yb3VuZF90aW1lLAogICAgLy8gICAgIG9ubGluZV9zdGFrZT1hcHIub25saW5lX3N0YWtlLAogICAgLy8gICAgIGV4cGVjdGVkX3llYXJseV9ibG9ja3M9YXByLmV4cGVjdGVkX3llYXJseV9ibG9ja3MsCiAgICAvLyAgICAgYmFzZV9hcHJfYnBzPWFwci5iYXNlX2Fwcl9icHMsCiAgICAvLyAgICAgZmFybV9hcHJfYnBzPWFwci5mYXJtX2Fwcl9icHMsCiAgICAvLyAgICAgb3ZlcnJpZGVfZmFybV9hcHJfYnBzPWFwci5vdmVycmlkZV9mYXJtX2Fwcl9icHMsCiAgICAvLyAgICAgZmFybV9hc3NldD1zdGF0ZS5mYXJtX2Fzc2V0LAogICAgLy8gICAgIGFtb3VudF9wZXJfYmxvY2s9c3RhdGUuYW1vdW50X3Blcl9ibG9jaywKICAgIC8vICAgICByZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzPXN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MsCiAgICAvLyAgICAgbGFzdF9ibG9ja19wYWlkPXN0YXRlLmxhc3RfYmxvY2tfcGFpZCwKICAgIC8vICkKICAgIHVuY292ZXIgMTYKICAgIHVuY292ZXIgMTYKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDE0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMTMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDExCiAgICBjb25jYXQKICAgIHVuY292ZXIgMTAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgOAogICAgY29uY2F0CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCl9nZXRfc3RhdGVfYW5kX2Fwcl90ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMjgyLTEyODcKICAgIC8vIGVsc2UgRmFybVN0YXRlKAogICAgLy8gICAgIGZhcm1fYXNzZXQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBsYXN0X2Jsb2NrX3BhaWQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcz1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGIgX2dldF9zdGF0ZV9hbmRfYXByX3Rlcm5hcnlfbWVyZ2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uX2xvZ19zdGF0ZXNfYW5kX2FwcnMoYXBwX2lkczogYnl0ZXMsIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpfbG9nX3N0YXRlc19hbmRfYXByczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMjEtMTMyNAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfbG9nX3N0YXRlc19hbmRfYXBycygKICAgIC8vICAgICBzZWxmLCBhcHBfaWRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0sIG92ZXJyaWRlX2Zhcm1fYW1vdW50OiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMyNS0xMzI2CiAgICAvLyAjIGNoYWluIHdpZGUgaW5wdXRzIGFyZSBjb21wdXRlZCBvbmNlLCB0aGUgbG9vcCBvbmx5IGRvZXMgcGVyIGZhcm0gd29yawogICAgLy8gY3R4ID0gc2VsZi5nZXRfYXByX2NvbnRleHQoKQogICAgY2FsbHN1YiBnZXRfYXByX2NvbnRleHQKICAgIGNvdmVyIDQKICAgIGNvdmVyIDMKICAgIGNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjEzMjcKICAgIC8vIGZvciBhcHBfaWQgaW4gYXBwX2lkczoKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMCAvLyAwCgpfbG9nX3N0YXRlc19hbmRfYXByc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzI3CiAgICAvLyBmb3IgYXBwX2lkIGluIGFwcF9pZHM6CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDUKICAgIDwKICAgIGJ6IF9sb2dfc3RhdGVzX2FuZF9hcHJzX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTMyOAogICAgLy8gbG9nKHNlbGYuX2dldF9zdGF0ZV9hbmRfYXByKGFwcF9pZC5hc191aW50NjQoKSwgb3ZlcnJpZGVfZmFybV9hbW91bnQsIGN0eCkpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgX2dldF9zdGF0ZV9hbmRfYXByCiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDYKICAgIGIgX2xvZ19zdGF0ZXNfYW5kX2FwcnNfZm9yX2hlYWRlckAxCgpfbG9nX3N0YXRlc19hbmRfYXByc19hZnRlcl9mb3JANDoKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmxvYWRfZmFybShyZWNpcGllbnRfYXBwOiB1aW50NjQpIC0+IGJ5dGVzOgpsb2FkX2Zhcm06CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzgzLTEzODQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hZF9mYXJtKHNlbGYsIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uKSAtPiBGYXJtQm94OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzg5CiAgICAvLyBkYXRhID0gc2VsZi5mYXJtc1tyZWNpcGllbnRfYXBwXQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZmFybXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzkwCiAgICAvLyBpZiBkYXRhLmxlbmd0aCAhPSBVSW50NjQoTEVHQUNZX0ZBUk1fQk9YX1NJWkUpOgogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICAhPQogICAgYnogbG9hZF9mYXJtX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM5MQogICAgLy8gcmV0dXJuIEZhcm1Cb3guZnJvbV9ieXRlcyhkYXRhKQogICAgcmV0c3ViCgpsb2FkX2Zhcm1fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM5NQogICAgLy8gZmFybV9hc3NldD1zdGF0ZS5mYXJtX2Fzc2V0LAogICAgZHVwCiAgICBleHRyYWN0IDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM5NgogICAgLy8gYW1vdW50X3Blcl9ibG9jaz1zdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLAogICAgZGlnIDEKICAgIGV4dHJhY3QgOCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxMzk4CiAgICAvLyBzdGF0ZS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpCiAgICBkaWcgMgogICAgaW50Y18zIC8vIDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM5Ny0xMzk5CiAgICAvLyByZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzPXNlbGYudG9fdTMyKAogICAgLy8gICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICksCiAgICBjYWxsc3ViIHRvX3UzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQwMAogICAgLy8gbGFzdF9ibG9ja19wYWlkPXNlbGYudG9fdTMyKHN0YXRlLmxhc3RfYmxvY2tfcGFpZC5hc191aW50NjQoKSksCiAgICB1bmNvdmVyIDMKICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBjYWxsc3ViIHRvX3UzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM5NC0xNDAyCiAgICAvLyByZXR1cm4gRmFybUJveCgKICAgIC8vICAgICBmYXJtX2Fzc2V0PXN0YXRlLmZhcm1fYXNzZXQsCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1zdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9c2VsZi50b191MzIoCiAgICAvLyAgICAgICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICAgICApLAogICAgLy8gICAgIGxhc3RfYmxvY2tfcGFpZD1zZWxmLnRvX3UzMihzdGF0ZS5sYXN0X2Jsb2NrX3BhaWQuYXNfdWludDY0KCkpLAogICAgLy8gICAgIHBlbmRpbmdfYmxvY2tzPWFyYzQuVUludDE2KDApLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQwMQogICAgLy8gcGVuZGluZ19ibG9ja3M9YXJjNC5VSW50MTYoMCksCiAgICBieXRlYyA2IC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTM5NC0xNDAyCiAgICAvLyByZXR1cm4gRmFybUJveCgKICAgIC8vICAgICBmYXJtX2Fzc2V0PXN0YXRlLmZhcm1fYXNzZXQsCiAgICAvLyAgICAgYW1vdW50X3Blcl9ibG9jaz1zdGF0ZS5hbW91bnRfcGVyX2Jsb2NrLAogICAgLy8gICAgIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9c2VsZi50b191MzIoCiAgICAvLyAgICAgICAgIHN0YXRlLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICAgICApLAogICAgLy8gICAgIGxhc3RfYmxvY2tfcGFpZD1zZWxmLnRvX3UzMihzdGF0ZS5sYXN0X2Jsb2NrX3BhaWQuYXNfdWludDY0KCkpLAogICAgLy8gICAgIHBlbmRpbmdfYmxvY2tzPWFyYzQuVUludDE2KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmZhcm1fc3RhdGUoZmFybTogYnl0ZXMpIC0+IGJ5dGVzLCBieXRlczoKZmFybV9zdGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MDQtMTQwNQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBmYXJtX3N0YXRlKHNlbGYsIGZhcm06IEZhcm1Cb3gpIC0+IEZhcm1TdGF0ZToKICAgIHByb3RvIDEgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQwNwogICAgLy8gZmFybV9hc3NldD1mYXJtLmZhcm1fYXNzZXQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDA4CiAgICAvLyBhbW91bnRfcGVyX2Jsb2NrPWZhcm0uYW1vdW50X3Blcl9ibG9jaywKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MTAKICAgIC8vIGZhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3RfdWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDA5LTE0MTEKICAgIC8vIHJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3M9YXJjNC5VSW50NjQoCiAgICAvLyAgICAgZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpCiAgICAvLyApLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQxMgogICAgLy8gbGFzdF9ibG9ja19wYWlkPWFyYzQuVUludDY0KGZhcm0ubGFzdF9ibG9ja19wYWlkLmFzX3VpbnQ2NCgpKSwKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyMAogICAgZXh0cmFjdF91aW50MzIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MDYtMTQxMwogICAgLy8gcmV0dXJuIEZhcm1TdGF0ZSgKICAgIC8vICAgICBmYXJtX2Fzc2V0PWZhcm0uZmFybV9hc3NldCwKICAgIC8vICAgICBhbW91bnRfcGVyX2Jsb2NrPWZhcm0uYW1vdW50X3Blcl9ibG9jaywKICAgIC8vICAgICByZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzPWFyYzQuVUludDY0KAogICAgLy8gICAgICAgICBmYXJtLnJlbWFpbmluZ19kdXJhdGlvbl9ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vICAgICApLAogICAgLy8gICAgIGxhc3RfYmxvY2tfcGFpZD1hcmM0LlVJbnQ2NChmYXJtLmxhc3RfYmxvY2tfcGFpZC5hc191aW50NjQoKSksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uc3RvcmVfZmFybShyZWNpcGllbnRfYXBwOiB1aW50NjQsIGZhcm06IGJ5dGVzKSAtPiBieXRlczoKc3RvcmVfZmFybToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MTUtMTQxNgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBzdG9yZV9mYXJtKHNlbGYsIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLCBmYXJtOiBGYXJtQm94KSAtPiBOb25lOgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQxOQogICAgLy8gZmFybS5wZW5kaW5nX2Jsb2Nrcy5hc191aW50NjQoKQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDI0CiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQyMAogICAgLy8gPD0gZmFybS5yZW1haW5pbmdfZHVyYXRpb25fYmxvY2tzLmFzX3VpbnQ2NCgpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzMgLy8gMTYKICAgIGV4dHJhY3RfdWludDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDE5LTE0MjAKICAgIC8vIGZhcm0ucGVuZGluZ19ibG9ja3MuYXNfdWludDY0KCkKICAgIC8vIDw9IGZhcm0ucmVtYWluaW5nX2R1cmF0aW9uX2Jsb2Nrcy5hc191aW50NjQoKSwKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMQogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogc3RvcmVfZmFybV9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MjEKICAgIC8vIFMoIkVSUjpCTEtTIiksCiAgICBieXRlYyAxMyAvLyAiRVJSOkJMS1MiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnN0b3JlX2Zhcm1fYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQyNC0xNDI1CiAgICAvLyAjIGJveF9wdXQgY2FuIG5vdCBjaGFuZ2UgdGhlIHNpemUgb2YgYW4gZXhpc3RpbmcgYm94CiAgICAvLyBsZW5ndGgsIGV4aXN0cyA9IG9wLkJveC5sZW5ndGgob3AuaXRvYihyZWNpcGllbnRfYXBwLmlkKSkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQyNgogICAgLy8gaWYgZXhpc3RzIGFuZCBsZW5ndGggIT0gZGF0YS5sZW5ndGg6CiAgICBieiBzdG9yZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMwogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGZyYW1lX2RpZyAxCiAgICAhPQogICAgYnogc3RvcmVfZmFybV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MjcKICAgIC8vIGRlbCBzZWxmLmZhcm1zW3JlY2lwaWVudF9hcHBdCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2RlbAogICAgcG9wCgpzdG9yZV9mYXJtX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MjgKICAgIC8vIHNlbGYuZmFybXNbcmVjaXBpZW50X2FwcF0gPSBkYXRhCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3B1dAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kdWFsc3Rha2VmYXJtLmNvbnRyYWN0LkR1YWxzdGFrZUZhcm0uZGVsZXRlX2Zhcm0ocmVjaXBpZW50X2FwcDogdWludDY0LCBmYXJtOiBieXRlcykgLT4gYnl0ZXM6CmRlbGV0ZV9mYXJtOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQzMC0xNDMxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGRlbGV0ZV9mYXJtKHNlbGYsIHJlY2lwaWVudF9hcHA6IEFwcGxpY2F0aW9uLCBmYXJtOiBGYXJtQm94KSAtPiBOb25lOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDMzCiAgICAvLyBkZWwgc2VsZi5mYXJtc1tyZWNpcGllbnRfYXBwXQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQzNAogICAgLy8gc2VsZi5mYXJtc19leHBpcmVkLnZhbHVlID0gc2VsZi5mYXJtc19leHBpcmVkLmdldChVSW50NjQoMCkpICsgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJmYXJtc19leHBpcmVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyAxNCAvLyAiZmFybXNfZXhwaXJlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDM4CiAgICAvLyBmYXJtX2Fzc2V0PWZhcm0uZmFybV9hc3NldCwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0MzYtMTQzOQogICAgLy8gRmFybUV4cGlyZWQoCiAgICAvLyAgICAgcmVjaXBpZW50X2FwcD1hcmM0LlVJbnQ2NChyZWNpcGllbnRfYXBwLmlkKSwKICAgIC8vICAgICBmYXJtX2Fzc2V0PWZhcm0uZmFybV9hc3NldCwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQzNS0xNDQwCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgRmFybUV4cGlyZWQoCiAgICAvLyAgICAgICAgIHJlY2lwaWVudF9hcHA9YXJjNC5VSW50NjQocmVjaXBpZW50X2FwcC5pZCksCiAgICAvLyAgICAgICAgIGZhcm1fYXNzZXQ9ZmFybS5mYXJtX2Fzc2V0LAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDU1NDdmOTliIC8vIG1ldGhvZCAiRmFybUV4cGlyZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLnRvX3UzMih2YWx1ZTogdWludDY0KSAtPiBieXRlczoKdG9fdTMyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ0Mi0xNDQzCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHRvX3UzMihzZWxmLCB2YWx1ZTogVUludDY0KSAtPiBhcmM0LlVJbnQzMjoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ0NC0xNDQ1CiAgICAvLyAjIGFyYzQuVUludDMyIHRydW5jYXRlcyBzaWxlbnRseQogICAgLy8gY3VzdG9tLmVuc3VyZSh2YWx1ZSA8PSBVSW50NjQoTUFYX1VJTlQzMiksIFMoIkVSUjpVMzIiKSkKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA0Mjk0OTY3Mjk1CiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTEKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHRvX3UzMl9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NDQtMTQ0NQogICAgLy8gIyBhcmM0LlVJbnQzMiB0cnVuY2F0ZXMgc2lsZW50bHkKICAgIC8vIGN1c3RvbS5lbnN1cmUodmFsdWUgPD0gVUludDY0KE1BWF9VSU5UMzIpLCBTKCJFUlI6VTMyIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpVMzIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnRvX3UzMl9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDQ2CiAgICAvLyByZXR1cm4gYXJjNC5VSW50MzIodmFsdWUpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDQgNAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmR1YWxzdGFrZWZhcm0uY29udHJhY3QuRHVhbHN0YWtlRmFybS5nZXRfbG9ja2VkX2JhbGFuY2UoKSAtPiB1aW50NjQ6CmdldF9sb2NrZWRfYmFsYW5jZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NTYKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ1NwogICAgLy8gKyBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzICogc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJnbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nbG9iYWxfcmVtYWluaW5nX2Jsb2NrcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NzcKICAgIC8vIHJldHVybiBzZWxmLmdldF90eG5fZmVlX3Blcl9ibG9jaygpICsgc2VsZi5nZXRfaXhfcmV3YXJkc19wZXJfYmxvY2soKQogICAgY2FsbHN1YiBnZXRfdHhuX2ZlZV9wZXJfYmxvY2sKICAgIGNhbGxzdWIgZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDU3CiAgICAvLyArIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKiBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ1Ni0xNDU3CiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICAvLyArIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKiBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ1OAogICAgLy8gKyBzZWxmLml4X2FjY3J1ZWQuZ2V0KFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJpeF9hY2NydWVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NTYtMTQ1OAogICAgLy8gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLy8gKyBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzICogc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkKICAgIC8vICsgc2VsZi5peF9hY2NydWVkLmdldChVSW50NjQoMCkpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDU5CiAgICAvLyAtIHNlbGYuaXhfcmVjb3JkZWRfYmxvY2tzLmdldChVSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAiaXhfcmVjb3JkZWRfYmxvY2tzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0ODUKICAgIC8vIHJldHVybiBzZWxmLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpICogUkVDT1JEX0lYX1JFV0FSRFNfU0hBUkUgLy8gMTAwCiAgICBjYWxsc3ViIGdldF9peF9yZXdhcmRzX3Blcl9ibG9jawogICAgcHVzaGludCA1MAogICAgKgogICAgcHVzaGludCAxMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NTktMTQ2MAogICAgLy8gLSBzZWxmLml4X3JlY29yZGVkX2Jsb2Nrcy5nZXQoVUludDY0KDApKQogICAgLy8gKiBzZWxmLmdldF9yZWNvcmRfaXhfcmV3YXJkc19wZXJfYmxvY2soKQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ1Ni0xNDYwCiAgICAvLyBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICAvLyArIHNlbGYuZ2xvYmFsX3JlbWFpbmluZ19ibG9ja3MgKiBzZWxmLmdldF9zcGVuZF9wZXJfYmxvY2soKQogICAgLy8gKyBzZWxmLml4X2FjY3J1ZWQuZ2V0KFVJbnQ2NCgwKSkKICAgIC8vIC0gc2VsZi5peF9yZWNvcmRlZF9ibG9ja3MuZ2V0KFVJbnQ2NCgwKSkKICAgIC8vICogc2VsZi5nZXRfcmVjb3JkX2l4X3Jld2FyZHNfcGVyX2Jsb2NrKCkKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NTUtMTQ2MQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICAvLyAgICAgKyBzZWxmLmdsb2JhbF9yZW1haW5pbmdfYmxvY2tzICogc2VsZi5nZXRfc3BlbmRfcGVyX2Jsb2NrKCkKICAgIC8vICAgICArIHNlbGYuaXhfYWNjcnVlZC5nZXQoVUludDY0KDApKQogICAgLy8gICAgIC0gc2VsZi5peF9yZWNvcmRlZF9ibG9ja3MuZ2V0KFVJbnQ2NCgwKSkKICAgIC8vICAgICAqIHNlbGYuZ2V0X3JlY29yZF9peF9yZXdhcmRzX3Blcl9ibG9jaygpCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmVuc3VyZV9tYW5hZ2VyX2NhbGxlcigpIC0+IHZvaWQ6CmVuc3VyZV9tYW5hZ2VyX2NhbGxlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kdWFsc3Rha2VmYXJtL2NvbnRyYWN0LnB5OjE0NjUKICAgIC8vIGN1c3RvbS5lbnN1cmUoVHhuLnNlbmRlciA9PSBzZWxmLm1hbmFnZXIsIFMoIkVSUjpVTkFVVEgiKSkKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAibWFuYWdlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYW5hZ2VyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21tb24vY3VzdG9tLnB5OjExCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBlbnN1cmVfbWFuYWdlcl9jYWxsZXJfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZHVhbHN0YWtlZmFybS9jb250cmFjdC5weToxNDY1CiAgICAvLyBjdXN0b20uZW5zdXJlKFR4bi5zZW5kZXIgPT0gc2VsZi5tYW5hZ2VyLCBTKCJFUlI6VU5BVVRIIikpCiAgICBwdXNoYnl0ZXMgIkVSUjpVTkFVVEgiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tbW9uL2N1c3RvbS5weToxMgogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbW1vbi9jdXN0b20ucHk6MTMKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmVuc3VyZV9tYW5hZ2VyX2NhbGxlcl9hZnRlcl9pZl9lbHNlQDM6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF9peF9yZXdhcmRzX3Blcl9ibG9jaygpIC0+IHVpbnQ2NDoKZ2V0X2l4X3Jld2FyZHNfcGVyX2Jsb2NrOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ4MQogICAgLy8gcmV0dXJuIHNlbGYuaXhfcGIgKiBHbG9iYWwubWluX3R4bl9mZWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOSAvLyAiaXhfcGIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXhfcGIgZXhpc3RzCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICAqCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuZHVhbHN0YWtlZmFybS5jb250cmFjdC5EdWFsc3Rha2VGYXJtLmdldF90eG5fZmVlX3Blcl9ibG9jaygpIC0+IHVpbnQ2NDoKZ2V0X3R4bl9mZWVfcGVyX2Jsb2NrOgogICAgLy8gc21hcnRfY29udHJhY3RzL2R1YWxzdGFrZWZhcm0vY29udHJhY3QucHk6MTQ5MwogICAgLy8gcmV0dXJuIHNlbGYudHhuX2ZlZV9wYiAqIEdsb2JhbC5taW5fdHhuX2ZlZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vICJ0eG5fZmVlX3BiIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnR4bl9mZWVfcGIgZXhpc3RzCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICAqCiAgICByZXRzdWIK","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"bareActions":{"create":["NoOp"],"call":["DeleteApplication","UpdateApplication"]}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -140,6 +140,36 @@ export function FarmStateFromTuple(abiTuple: [bigint, bigint, bigint, bigint]) {
   return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.FarmState, APP_SPEC.structs) as FarmState
 }
 
+export type GlobalSnapshot = {
+  round: bigint,
+  balance: bigint,
+  lockedBalance: bigint,
+  txnFuel: bigint,
+  globalRemainingBlocks: bigint,
+  ixAccrued: bigint,
+  activeFarms: bigint,
+  blocksPaid: bigint,
+  farmsCreated: bigint,
+  farmsExtended: bigint,
+  farmsExpired: bigint,
+  ixPb: bigint,
+  platFeePb: bigint,
+  txnFeePb: bigint,
+  maxDurationDays: bigint,
+  minDurationBlocks: bigint,
+  avgRoundTime: bigint,
+  avgBlockPayout: bigint,
+  onlineStake: bigint
+}
+
+
+/**
+ * Converts the ABI tuple representation of a GlobalSnapshot to the struct representation
+ */
+export function GlobalSnapshotFromTuple(abiTuple: [bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.GlobalSnapshot, APP_SPEC.structs) as GlobalSnapshot
+}
+
 export type FarmStateAndApr = {
   balance: bigint,
   staked: bigint,
@@ -181,6 +211,10 @@ export type DualstakeFarmArgs = {
       recipientApp: bigint
       overrideFarmAmount: bigint | number
     }
+    'project_apr_curve(application,uint64[])(uint64,uint64)[]': {
+      recipientApp: bigint
+      overrideFarmAmounts: bigint[] | number[]
+    }
     'get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)': {
       recipientApp: bigint
       farmAsset: bigint
@@ -191,6 +225,7 @@ export type DualstakeFarmArgs = {
       farmAsset: bigint
       durationBlocks: bigint | number
     }
+    'update_oracle()void': Record<string, never>
     'create_farm(application,asset,uint64,uint64)void': {
       recipientApp: bigint
       farmAsset: bigint
@@ -210,10 +245,31 @@ export type DualstakeFarmArgs = {
       blockRound: bigint | number
       callSwap: boolean
     }
+    'payout_many(application,uint64[],bool)void': {
+      recipientApp: bigint
+      blockRounds: bigint[] | number[]
+      callSwap: boolean
+    }
+    'payout_batch((uint64,uint64)[],bool)uint64': {
+      items: [bigint | number, bigint | number][]
+      callSwap: boolean
+    }
+    'record_proposals(application,uint64[])void': {
+      recipientApp: bigint
+      blockRounds: bigint[] | number[]
+    }
+    'settle(application,bool)void': {
+      recipientApp: bigint
+      callSwap: boolean
+    }
     'noop()void': Record<string, never>
     'withdraw_fees(uint64)void': {
       amount: bigint | number
     }
+    'claim_ix_rewards()uint64': Record<string, never>
+    'get_ix_rewards(account)uint64': {
+      keeper: string | Uint8Array
+    }
     'optout(asset)void': {
       asset: bigint
     }
@@ -226,6 +282,10 @@ export type DualstakeFarmArgs = {
     'get_state(application)(uint64,uint64,uint64,uint64)': {
       recipientApp: bigint
     }
+    'get_pending_blocks(application)uint64': {
+      recipientApp: bigint
+    }
+    'get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': Record<string, never>
     'log_states(uint64[])void': {
       boxNames: bigint[] | number[]
     }
@@ -235,32 +295,53 @@ export type DualstakeFarmArgs = {
     'log_states_and_aprs(uint64[])void': {
       appIds: bigint[] | number[]
     }
+    'log_states_and_aprs_override(uint64[],uint64)void': {
+      appIds: bigint[] | number[]
+      overrideFarmAmount: bigint | number
+    }
     'log_block_proposers(uint64,uint64)void': {
       startRound: bigint | number
       endRound: bigint | number
     }
+    'log_farm_proposals(uint64[],uint64,uint64)uint64[]': {
+      appIds: bigint[] | number[]
+      startRound: bigint | number
+      endRound: bigint | number
+    }
   }
   /**
    * The tuple representation of the arguments for each method
    */
   tuple: {
     'project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': [recipientApp: bigint, overrideFarmAmount: bigint | number]
+    'project_apr_curve(application,uint64[])(uint64,uint64)[]': [recipientApp: bigint, overrideFarmAmounts: bigint[] | number[]]
     'get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)': [recipientApp: bigint, farmAsset: bigint, durationBlocks: bigint | number]
     'get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)': [recipientApp: bigint, farmAsset: bigint, durationBlocks: bigint | number]
+    'update_oracle()void': []
     'create_farm(application,asset,uint64,uint64)void': [recipientApp: bigint, farmAsset: bigint, amountPerBlock: bigint | number, durationBlocks: bigint | number]
     'extend_duration_blocks(application,uint64)void': [recipientApp: bigint, durationBlocks: bigint | number]
     'extend_amount_per_block(application,uint64)void': [recipientApp: bigint, amountPerBlock: bigint | number]
     'payout(application,uint64,bool)void': [recipientApp: bigint, blockRound: bigint | number, callSwap: boolean]
+    'payout_many(application,uint64[],bool)void': [recipientApp: bigint, blockRounds: bigint[] | number[], callSwap: boolean]
+    'payout_batch((uint64,uint64)[],bool)uint64': [items: [bigint | number, bigint | number][], callSwap: boolean]
+    'record_proposals(application,uint64[])void': [recipientApp: bigint, blockRounds: bigint[] | number[]]
+    'settle(application,bool)void': [recipientApp: bigint, callSwap: boolean]
     'noop()void': []
     'withdraw_fees(uint64)void': [amount: bigint | number]
+    'claim_ix_rewards()uint64': []
+    'get_ix_rewards(account)uint64': [keeper: string | Uint8Array]
     'optout(asset)void': [asset: bigint]
     'update_max_duration_days(uint64)void': [maxDuration: bigint | number]
     'update_min_duration_blocks(uint64)void': [minDuration: bigint | number]
     'get_state(application)(uint64,uint64,uint64,uint64)': [recipientApp: bigint]
+    'get_pending_blocks(application)uint64': [recipientApp: bigint]
+    'get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': []
     'log_states(uint64[])void': [boxNames: bigint[] | number[]]
     'get_state_and_apr(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': [appId: bigint | number]
     'log_states_and_aprs(uint64[])void': [appIds: bigint[] | number[]]
+    'log_states_and_aprs_override(uint64[],uint64)void': [appIds: bigint[] | number[], overrideFarmAmount: bigint | number]
     'log_block_proposers(uint64,uint64)void': [startRound: bigint | number, endRound: bigint | number]
+    'log_farm_proposals(uint64[],uint64,uint64)uint64[]': [appIds: bigint[] | number[], startRound: bigint | number, endRound: bigint | number]
   }
 }
 
@@ -269,22 +350,34 @@ export type DualstakeFarmArgs = {
  */
 export type DualstakeFarmReturns = {
   'project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': AprBreakdown
+  'project_apr_curve(application,uint64[])(uint64,uint64)[]': [bigint, bigint][]
   'get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)': AlgoCost
   'get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)': AlgoCostAndMaxDuration
+  'update_oracle()void': void
   'create_farm(application,asset,uint64,uint64)void': void
   'extend_duration_blocks(application,uint64)void': void
   'extend_amount_per_block(application,uint64)void': void
   'payout(application,uint64,bool)void': void
+  'payout_many(application,uint64[],bool)void': void
+  'payout_batch((uint64,uint64)[],bool)uint64': bigint
+  'record_proposals(application,uint64[])void': void
+  'settle(application,bool)void': void
   'noop()void': void
   'withdraw_fees(uint64)void': void
+  'claim_ix_rewards()uint64': bigint
+  'get_ix_rewards(account)uint64': bigint
   'optout(asset)void': void
   'update_max_duration_days(uint64)void': void
   'update_min_duration_blocks(uint64)void': void
   'get_state(application)(uint64,uint64,uint64,uint64)': FarmState
+  'get_pending_blocks(application)uint64': bigint
+  'get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': GlobalSnapshot
   'log_states(uint64[])void': void
   'get_state_and_apr(uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)': FarmStateAndApr
   'log_states_and_aprs(uint64[])void': void
+  'log_states_and_aprs_override(uint64[],uint64)void': void
   'log_block_proposers(uint64,uint64)void': void
+  'log_farm_proposals(uint64[],uint64,uint64)uint64[]': bigint[]
 }
 
 /**
@@ -300,6 +393,11 @@ export type DualstakeFarmTypes = {
       argsTuple: DualstakeFarmArgs['tuple']['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
       returns: DualstakeFarmReturns['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
     }>
+    & Record<'project_apr_curve(application,uint64[])(uint64,uint64)[]' | 'project_apr_curve', {
+      argsObj: DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]']
+      argsTuple: DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']
+      returns: DualstakeFarmReturns['project_apr_curve(application,uint64[])(uint64,uint64)[]']
+    }>
     & Record<'get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)' | 'get_algo_cost', {
       argsObj: DualstakeFarmArgs['obj']['get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)']
       argsTuple: DualstakeFarmArgs['tuple']['get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)']
@@ -310,6 +408,11 @@ export type DualstakeFarmTypes = {
       argsTuple: DualstakeFarmArgs['tuple']['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
       returns: DualstakeFarmReturns['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
     }>
+    & Record<'update_oracle()void' | 'update_oracle', {
+      argsObj: DualstakeFarmArgs['obj']['update_oracle()void']
+      argsTuple: DualstakeFarmArgs['tuple']['update_oracle()void']
+      returns: DualstakeFarmReturns['update_oracle()void']
+    }>
     & Record<'create_farm(application,asset,uint64,uint64)void' | 'create_farm', {
       argsObj: DualstakeFarmArgs['obj']['create_farm(application,asset,uint64,uint64)void']
       argsTuple: DualstakeFarmArgs['tuple']['create_farm(application,asset,uint64,uint64)void']
@@ -330,6 +433,26 @@ export type DualstakeFarmTypes = {
       argsTuple: DualstakeFarmArgs['tuple']['payout(application,uint64,bool)void']
       returns: DualstakeFarmReturns['payout(application,uint64,bool)void']
     }>
+    & Record<'payout_many(application,uint64[],bool)void' | 'payout_many', {
+      argsObj: DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void']
+      argsTuple: DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']
+      returns: DualstakeFarmReturns['payout_many(application,uint64[],bool)void']
+    }>
+    & Record<'payout_batch((uint64,uint64)[],bool)uint64' | 'payout_batch', {
+      argsObj: DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64']
+      argsTuple: DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']
+      returns: DualstakeFarmReturns['payout_batch((uint64,uint64)[],bool)uint64']
+    }>
+    & Record<'record_proposals(application,uint64[])void' | 'record_proposals', {
+      argsObj: DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void']
+      argsTuple: DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']
+      returns: DualstakeFarmReturns['record_proposals(application,uint64[])void']
+    }>
+    & Record<'settle(application,bool)void' | 'settle', {
+      argsObj: DualstakeFarmArgs['obj']['settle(application,bool)void']
+      argsTuple: DualstakeFarmArgs['tuple']['settle(application,bool)void']
+      returns: DualstakeFarmReturns['settle(application,bool)void']
+    }>
     & Record<'noop()void' | 'noop', {
       argsObj: DualstakeFarmArgs['obj']['noop()void']
       argsTuple: DualstakeFarmArgs['tuple']['noop()void']
@@ -340,6 +463,16 @@ export type DualstakeFarmTypes = {
       argsTuple: DualstakeFarmArgs['tuple']['withdraw_fees(uint64)void']
       returns: DualstakeFarmReturns['withdraw_fees(uint64)void']
     }>
+    & Record<'claim_ix_rewards()uint64' | 'claim_ix_rewards', {
+      argsObj: DualstakeFarmArgs['obj']['claim_ix_rewards()uint64']
+      argsTuple: DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']
+      returns: DualstakeFarmReturns['claim_ix_rewards()uint64']
+    }>
+    & Record<'get_ix_rewards(account)uint64' | 'get_ix_rewards', {
+      argsObj: DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64']
+      argsTuple: DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']
+      returns: DualstakeFarmReturns['get_ix_rewards(account)uint64']
+    }>
     & Record<'optout(asset)void' | 'optout', {
       argsObj: DualstakeFarmArgs['obj']['optout(asset)void']
       argsTuple: DualstakeFarmArgs['tuple']['optout(asset)void']
@@ -360,6 +493,16 @@ export type DualstakeFarmTypes = {
       argsTuple: DualstakeFarmArgs['tuple']['get_state(application)(uint64,uint64,uint64,uint64)']
       returns: DualstakeFarmReturns['get_state(application)(uint64,uint64,uint64,uint64)']
     }>
+    & Record<'get_pending_blocks(application)uint64' | 'get_pending_blocks', {
+      argsObj: DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64']
+      argsTuple: DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']
+      returns: DualstakeFarmReturns['get_pending_blocks(application)uint64']
+    }>
+    & Record<'get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)' | 'get_global_snapshot', {
+      argsObj: DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+      argsTuple: DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+      returns: DualstakeFarmReturns['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+    }>
     & Record<'log_states(uint64[])void' | 'log_states', {
       argsObj: DualstakeFarmArgs['obj']['log_states(uint64[])void']
       argsTuple: DualstakeFarmArgs['tuple']['log_states(uint64[])void']
@@ -375,22 +518,41 @@ export type DualstakeFarmTypes = {
       argsTuple: DualstakeFarmArgs['tuple']['log_states_and_aprs(uint64[])void']
       returns: DualstakeFarmReturns['log_states_and_aprs(uint64[])void']
     }>
+    & Record<'log_states_and_aprs_override(uint64[],uint64)void' | 'log_states_and_aprs_override', {
+      argsObj: DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void']
+      argsTuple: DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']
+      returns: DualstakeFarmReturns['log_states_and_aprs_override(uint64[],uint64)void']
+    }>
     & Record<'log_block_proposers(uint64,uint64)void' | 'log_block_proposers', {
       argsObj: DualstakeFarmArgs['obj']['log_block_proposers(uint64,uint64)void']
       argsTuple: DualstakeFarmArgs['tuple']['log_block_proposers(uint64,uint64)void']
       returns: DualstakeFarmReturns['log_block_proposers(uint64,uint64)void']
     }>
+    & Record<'log_farm_proposals(uint64[],uint64,uint64)uint64[]' | 'log_farm_proposals', {
+      argsObj: DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']
+      argsTuple: DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']
+      returns: DualstakeFarmReturns['log_farm_proposals(uint64[],uint64,uint64)uint64[]']
+    }>
   /**
    * Defines the shape of the state of the application.
    */
   state: {
     global: {
       keys: {
+        avgBlockPayout: bigint
+        avgRoundTime: bigint
+        blocksFunded: bigint
+        farmsCreated: bigint
+        farmsExpired: bigint
+        farmsExtended: bigint
         globalRemainingBlocks: bigint
+        ixAccrued: bigint
         ixPb: bigint
+        ixRecordedBlocks: bigint
         manager: BinaryState
         maxDurationDays: bigint
         minDurationBlocks: bigint
+        oracleRound: bigint
         platFeePb: bigint
         txnFeePb: bigint
         txnFuel: bigint
@@ -484,6 +646,19 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.overrideFarmAmount],
     }
   }
+  /**
+   * Constructs a no op call for the project_apr_curve(application,uint64[])(uint64,uint64)[] ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static projectAprCurve(params: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'project_apr_curve(application,uint64[])(uint64,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.overrideFarmAmounts],
+    }
+  }
   /**
    * Constructs a no op call for the get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64) ABI method
    *
@@ -510,6 +685,19 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.farmAsset, params.args.durationBlocks],
     }
   }
+  /**
+   * Constructs a no op call for the update_oracle()void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static updateOracle(params: CallParams<DualstakeFarmArgs['obj']['update_oracle()void'] | DualstakeFarmArgs['tuple']['update_oracle()void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'update_oracle()void' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
   /**
    * Constructs a no op call for the create_farm(application,asset,uint64,uint64)void ABI method
    *
@@ -562,6 +750,58 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.blockRound, params.args.callSwap],
     }
   }
+  /**
+   * Constructs a no op call for the payout_many(application,uint64[],bool)void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static payoutMany(params: CallParams<DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void'] | DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'payout_many(application,uint64[],bool)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.blockRounds, params.args.callSwap],
+    }
+  }
+  /**
+   * Constructs a no op call for the payout_batch((uint64,uint64)[],bool)uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static payoutBatch(params: CallParams<DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64'] | DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'payout_batch((uint64,uint64)[],bool)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.items, params.args.callSwap],
+    }
+  }
+  /**
+   * Constructs a no op call for the record_proposals(application,uint64[])void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static recordProposals(params: CallParams<DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void'] | DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'record_proposals(application,uint64[])void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.blockRounds],
+    }
+  }
+  /**
+   * Constructs a no op call for the settle(application,bool)void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static settle(params: CallParams<DualstakeFarmArgs['obj']['settle(application,bool)void'] | DualstakeFarmArgs['tuple']['settle(application,bool)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'settle(application,bool)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.recipientApp, params.args.callSwap],
+    }
+  }
   /**
    * Constructs a no op call for the noop()void ABI method
    *
@@ -588,6 +828,32 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.amount],
     }
   }
+  /**
+   * Constructs a no op call for the claim_ix_rewards()uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static claimIxRewards(params: CallParams<DualstakeFarmArgs['obj']['claim_ix_rewards()uint64'] | DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'claim_ix_rewards()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_ix_rewards(account)uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getIxRewards(params: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_ix_rewards(account)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.keeper],
+    }
+  }
   /**
    * Constructs a no op call for the optout(asset)void ABI method
    *
@@ -640,6 +906,32 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.recipientApp],
     }
   }
+  /**
+   * Constructs a no op call for the get_pending_blocks(application)uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getPendingBlocks(params: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_pending_blocks(application)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.recipientApp],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64) ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getGlobalSnapshot(params: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
   /**
    * Constructs a no op call for the log_states(uint64[])void ABI method
    *
@@ -679,6 +971,19 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.appIds],
     }
   }
+  /**
+   * Constructs a no op call for the log_states_and_aprs_override(uint64[],uint64)void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static logStatesAndAprsOverride(params: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'log_states_and_aprs_override(uint64[],uint64)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.appIds, params.args.overrideFarmAmount],
+    }
+  }
   /**
    * Constructs a no op call for the log_block_proposers(uint64,uint64)void ABI method
    *
@@ -692,6 +997,19 @@ export abstract class DualstakeFarmParamsFactory {
       args: Array.isArray(params.args) ? params.args : [params.args.startRound, params.args.endRound],
     }
   }
+  /**
+   * Constructs a no op call for the log_farm_proposals(uint64[],uint64,uint64)uint64[] ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static logFarmProposals(params: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'log_farm_proposals(uint64[],uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.appIds, params.args.startRound, params.args.endRound],
+    }
+  }
 }
 
 /**
@@ -1004,6 +1322,18 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.projectApr(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `project_apr_curve(application,uint64[])(uint64,uint64)[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    projectAprCurve: (params: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.projectAprCurve(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
      * 
@@ -1028,6 +1358,16 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.getAlgoCostAndMaxDuration(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `update_oracle()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    updateOracle: (params: CallParams<DualstakeFarmArgs['obj']['update_oracle()void'] | DualstakeFarmArgs['tuple']['update_oracle()void']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.updateOracle(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `create_farm(application,asset,uint64,uint64)void` ABI method.
      *
@@ -1068,6 +1408,46 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.payout(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `payout_many(application,uint64[],bool)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    payoutMany: (params: CallParams<DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void'] | DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.payoutMany(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `payout_batch((uint64,uint64)[],bool)uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    payoutBatch: (params: CallParams<DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64'] | DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.payoutBatch(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `record_proposals(application,uint64[])void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    recordProposals: (params: CallParams<DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void'] | DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.recordProposals(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `settle(application,bool)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    settle: (params: CallParams<DualstakeFarmArgs['obj']['settle(application,bool)void'] | DualstakeFarmArgs['tuple']['settle(application,bool)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.settle(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `noop()void` ABI method.
      *
@@ -1088,6 +1468,28 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.withdrawFees(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `claim_ix_rewards()uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    claimIxRewards: (params: CallParams<DualstakeFarmArgs['obj']['claim_ix_rewards()uint64'] | DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.claimIxRewards(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_ix_rewards(account)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getIxRewards: (params: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.getIxRewards(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `optout(asset)void` ABI method.
      *
@@ -1130,6 +1532,30 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.getState(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_pending_blocks(application)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getPendingBlocks: (params: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.getPendingBlocks(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getGlobalSnapshot: (params: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.getGlobalSnapshot(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `log_states(uint64[])void` ABI method.
      * 
@@ -1166,6 +1592,18 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.logStatesAndAprs(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `log_states_and_aprs_override(uint64[],uint64)void` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    logStatesAndAprsOverride: (params: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.logStatesAndAprsOverride(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `log_block_proposers(uint64,uint64)void` ABI method.
      * 
@@ -1178,6 +1616,18 @@ export class DualstakeFarmClient {
       return this.appClient.params.call(DualstakeFarmParamsFactory.logBlockProposers(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `log_farm_proposals(uint64[],uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    logFarmProposals: (params: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(DualstakeFarmParamsFactory.logFarmProposals(params))
+    },
+
   }
 
   /**
@@ -1237,19 +1687,31 @@ export class DualstakeFarmClient {
     },
 
     /**
-     * Makes a call to the DualstakeFarm smart contract using the `get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     * Makes a call to the DualstakeFarm smart contract using the `project_apr_curve(application,uint64[])(uint64,uint64)[]` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getAlgoCost: (params: CallParams<DualstakeFarmArgs['obj']['get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getAlgoCost(params))
+    projectAprCurve: (params: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.projectAprCurve(params))
     },
 
     /**
-     * Makes a call to the DualstakeFarm smart contract using the `get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     * Makes a call to the DualstakeFarm smart contract using the `get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getAlgoCost: (params: CallParams<DualstakeFarmArgs['obj']['get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getAlgoCost(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
@@ -1260,6 +1722,16 @@ export class DualstakeFarmClient {
       return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getAlgoCostAndMaxDuration(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `update_oracle()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    updateOracle: (params: CallParams<DualstakeFarmArgs['obj']['update_oracle()void'] | DualstakeFarmArgs['tuple']['update_oracle()void']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.updateOracle(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `create_farm(application,asset,uint64,uint64)void` ABI method.
      *
@@ -1300,6 +1772,46 @@ export class DualstakeFarmClient {
       return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.payout(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `payout_many(application,uint64[],bool)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    payoutMany: (params: CallParams<DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void'] | DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.payoutMany(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `payout_batch((uint64,uint64)[],bool)uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    payoutBatch: (params: CallParams<DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64'] | DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.payoutBatch(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `record_proposals(application,uint64[])void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    recordProposals: (params: CallParams<DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void'] | DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.recordProposals(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `settle(application,bool)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    settle: (params: CallParams<DualstakeFarmArgs['obj']['settle(application,bool)void'] | DualstakeFarmArgs['tuple']['settle(application,bool)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.settle(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `noop()void` ABI method.
      *
@@ -1320,6 +1832,28 @@ export class DualstakeFarmClient {
       return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.withdrawFees(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `claim_ix_rewards()uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    claimIxRewards: (params: CallParams<DualstakeFarmArgs['obj']['claim_ix_rewards()uint64'] | DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.claimIxRewards(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_ix_rewards(account)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getIxRewards: (params: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getIxRewards(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `optout(asset)void` ABI method.
      *
@@ -1362,6 +1896,30 @@ export class DualstakeFarmClient {
       return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getState(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_pending_blocks(application)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getPendingBlocks: (params: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getPendingBlocks(params))
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getGlobalSnapshot: (params: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.getGlobalSnapshot(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `log_states(uint64[])void` ABI method.
      * 
@@ -1398,6 +1956,18 @@ export class DualstakeFarmClient {
       return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.logStatesAndAprs(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `log_states_and_aprs_override(uint64[],uint64)void` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    logStatesAndAprsOverride: (params: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.logStatesAndAprsOverride(params))
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `log_block_proposers(uint64,uint64)void` ABI method.
      * 
@@ -1410,6 +1980,18 @@ export class DualstakeFarmClient {
       return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.logBlockProposers(params))
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `log_farm_proposals(uint64[],uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    logFarmProposals: (params: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(DualstakeFarmParamsFactory.logFarmProposals(params))
+    },
+
   }
 
   /**
@@ -1469,6 +2051,19 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `project_apr_curve(application,uint64[])(uint64,uint64)[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    projectAprCurve: async (params: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.projectAprCurve(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['project_apr_curve(application,uint64[])(uint64,uint64)[]'])}
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
      * 
@@ -1495,6 +2090,17 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `update_oracle()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    updateOracle: async (params: CallParams<DualstakeFarmArgs['obj']['update_oracle()void'] | DualstakeFarmArgs['tuple']['update_oracle()void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.updateOracle(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['update_oracle()void'])}
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `create_farm(application,asset,uint64,uint64)void` ABI method.
      *
@@ -1539,6 +2145,50 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['payout(application,uint64,bool)void'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `payout_many(application,uint64[],bool)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    payoutMany: async (params: CallParams<DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void'] | DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.payoutMany(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['payout_many(application,uint64[],bool)void'])}
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `payout_batch((uint64,uint64)[],bool)uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    payoutBatch: async (params: CallParams<DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64'] | DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.payoutBatch(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['payout_batch((uint64,uint64)[],bool)uint64'])}
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `record_proposals(application,uint64[])void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    recordProposals: async (params: CallParams<DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void'] | DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.recordProposals(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['record_proposals(application,uint64[])void'])}
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `settle(application,bool)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    settle: async (params: CallParams<DualstakeFarmArgs['obj']['settle(application,bool)void'] | DualstakeFarmArgs['tuple']['settle(application,bool)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.settle(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['settle(application,bool)void'])}
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `noop()void` ABI method.
      *
@@ -1561,6 +2211,30 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['withdraw_fees(uint64)void'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `claim_ix_rewards()uint64` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    claimIxRewards: async (params: CallParams<DualstakeFarmArgs['obj']['claim_ix_rewards()uint64'] | DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.claimIxRewards(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['claim_ix_rewards()uint64'])}
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_ix_rewards(account)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getIxRewards: async (params: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.getIxRewards(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['get_ix_rewards(account)uint64'])}
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `optout(asset)void` ABI method.
      *
@@ -1607,6 +2281,32 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['get_state(application)(uint64,uint64,uint64,uint64)'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_pending_blocks(application)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getPendingBlocks: async (params: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.getPendingBlocks(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['get_pending_blocks(application)uint64'])}
+    },
+
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getGlobalSnapshot: async (params: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.getGlobalSnapshot(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'])}
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `log_states(uint64[])void` ABI method.
      * 
@@ -1646,6 +2346,19 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['log_states_and_aprs(uint64[])void'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `log_states_and_aprs_override(uint64[],uint64)void` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    logStatesAndAprsOverride: async (params: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.logStatesAndAprsOverride(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['log_states_and_aprs_override(uint64[],uint64)void'])}
+    },
+
     /**
      * Makes a call to the DualstakeFarm smart contract using the `log_block_proposers(uint64,uint64)void` ABI method.
      * 
@@ -1659,6 +2372,19 @@ export class DualstakeFarmClient {
       return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['log_block_proposers(uint64,uint64)void'])}
     },
 
+    /**
+     * Makes a call to the DualstakeFarm smart contract using the `log_farm_proposals(uint64[],uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    logFarmProposals: async (params: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(DualstakeFarmParamsFactory.logFarmProposals(params))
+      return {...result, return: result.return as unknown as (undefined | DualstakeFarmReturns['log_farm_proposals(uint64[],uint64,uint64)uint64[]'])}
+    },
+
   }
 
   /**
@@ -1684,6 +2410,19 @@ export class DualstakeFarmClient {
     return result.return as unknown as DualstakeFarmReturns['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `project_apr_curve(application,uint64[])(uint64,uint64)[]` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async projectAprCurve(params: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']>) {
+    const result = await this.appClient.send.call(DualstakeFarmParamsFactory.projectAprCurve(params))
+    return result.return as unknown as DualstakeFarmReturns['project_apr_curve(application,uint64[])(uint64,uint64)[]']
+  }
+
   /**
    * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
    * 
@@ -1710,6 +2449,19 @@ export class DualstakeFarmClient {
     return result.return as unknown as DualstakeFarmReturns['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `get_ix_rewards(account)uint64` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getIxRewards(params: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']>) {
+    const result = await this.appClient.send.call(DualstakeFarmParamsFactory.getIxRewards(params))
+    return result.return as unknown as DualstakeFarmReturns['get_ix_rewards(account)uint64']
+  }
+
   /**
    * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `get_state(application)(uint64,uint64,uint64,uint64)` ABI method.
    * 
@@ -1723,6 +2475,32 @@ export class DualstakeFarmClient {
     return result.return as unknown as DualstakeFarmReturns['get_state(application)(uint64,uint64,uint64,uint64)']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `get_pending_blocks(application)uint64` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getPendingBlocks(params: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']>) {
+    const result = await this.appClient.send.call(DualstakeFarmParamsFactory.getPendingBlocks(params))
+    return result.return as unknown as DualstakeFarmReturns['get_pending_blocks(application)uint64']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getGlobalSnapshot(params: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> = {args: []}) {
+    const result = await this.appClient.send.call(DualstakeFarmParamsFactory.getGlobalSnapshot(params))
+    return result.return as unknown as DualstakeFarmReturns['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']
+  }
+
   /**
    * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `log_states(uint64[])void` ABI method.
    * 
@@ -1762,6 +2540,19 @@ export class DualstakeFarmClient {
     return result.return as unknown as DualstakeFarmReturns['log_states_and_aprs(uint64[])void']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `log_states_and_aprs_override(uint64[],uint64)void` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async logStatesAndAprsOverride(params: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']>) {
+    const result = await this.appClient.send.call(DualstakeFarmParamsFactory.logStatesAndAprsOverride(params))
+    return result.return as unknown as DualstakeFarmReturns['log_states_and_aprs_override(uint64[],uint64)void']
+  }
+
   /**
    * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `log_block_proposers(uint64,uint64)void` ABI method.
    * 
@@ -1775,6 +2566,19 @@ export class DualstakeFarmClient {
     return result.return as unknown as DualstakeFarmReturns['log_block_proposers(uint64,uint64)void']
   }
 
+  /**
+   * Makes a readonly (simulated) call to the DualstakeFarm smart contract using the `log_farm_proposals(uint64[],uint64,uint64)uint64[]` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async logFarmProposals(params: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(DualstakeFarmParamsFactory.logFarmProposals(params))
+    return result.return as unknown as DualstakeFarmReturns['log_farm_proposals(uint64[],uint64,uint64)uint64[]']
+  }
+
   /**
    * Methods to access state for the current DualstakeFarm app
    */
@@ -1789,24 +2593,65 @@ export class DualstakeFarmClient {
       getAll: async (): Promise<Partial<Expand<GlobalKeysState>>> => {
         const result = await this.appClient.state.global.getAll()
         return {
+          avgBlockPayout: result.avg_block_payout,
+          avgRoundTime: result.avg_round_time,
+          blocksFunded: result.blocks_funded,
+          farmsCreated: result.farms_created,
+          farmsExpired: result.farms_expired,
+          farmsExtended: result.farms_extended,
           globalRemainingBlocks: result.global_remaining_blocks,
+          ixAccrued: result.ix_accrued,
           ixPb: result.ix_pb,
+          ixRecordedBlocks: result.ix_recorded_blocks,
           manager: new BinaryStateValue(result.manager),
           maxDurationDays: result.max_duration_days,
           minDurationBlocks: result.min_duration_blocks,
+          oracleRound: result.oracle_round,
           platFeePb: result.plat_fee_pb,
           txnFeePb: result.txn_fee_pb,
           txnFuel: result.txn_fuel,
         }
       },
+      /**
+       * Get the current value of the avg_block_payout key in global state
+       */
+      avgBlockPayout: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("avgBlockPayout")) as bigint | undefined },
+      /**
+       * Get the current value of the avg_round_time key in global state
+       */
+      avgRoundTime: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("avgRoundTime")) as bigint | undefined },
+      /**
+       * Get the current value of the blocks_funded key in global state
+       */
+      blocksFunded: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("blocksFunded")) as bigint | undefined },
+      /**
+       * Get the current value of the farms_created key in global state
+       */
+      farmsCreated: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("farmsCreated")) as bigint | undefined },
+      /**
+       * Get the current value of the farms_expired key in global state
+       */
+      farmsExpired: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("farmsExpired")) as bigint | undefined },
+      /**
+       * Get the current value of the farms_extended key in global state
+       */
+      farmsExtended: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("farmsExtended")) as bigint | undefined },
       /**
        * Get the current value of the global_remaining_blocks key in global state
        */
       globalRemainingBlocks: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("globalRemainingBlocks")) as bigint | undefined },
+      /**
+       * Get the current value of the ix_accrued key in global state
+       */
+      ixAccrued: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("ixAccrued")) as bigint | undefined },
       /**
        * Get the current value of the ix_pb key in global state
        */
       ixPb: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("ixPb")) as bigint | undefined },
+      /**
+       * Get the current value of the ix_recorded_blocks key in global state
+       */
+      ixRecordedBlocks: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("ixRecordedBlocks")) as bigint | undefined },
       /**
        * Get the current value of the manager key in global state
        */
@@ -1819,6 +2664,10 @@ export class DualstakeFarmClient {
        * Get the current value of the min_duration_blocks key in global state
        */
       minDurationBlocks: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("minDurationBlocks")) as bigint | undefined },
+      /**
+       * Get the current value of the oracle_round key in global state
+       */
+      oracleRound: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("oracleRound")) as bigint | undefined },
       /**
        * Get the current value of the plat_fee_pb key in global state
        */
@@ -1848,6 +2697,14 @@ export class DualstakeFarmClient {
         resultMappers.push((v) => client.decodeReturnValue('project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)', v))
         return this
       },
+      /**
+       * Add a project_apr_curve(application,uint64[])(uint64,uint64)[] method call against the DualstakeFarm contract
+       */
+      projectAprCurve(params: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.projectAprCurve(params)))
+        resultMappers.push((v) => client.decodeReturnValue('project_apr_curve(application,uint64[])(uint64,uint64)[]', v))
+        return this
+      },
       /**
        * Add a get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64) method call against the DualstakeFarm contract
        */
@@ -1864,6 +2721,14 @@ export class DualstakeFarmClient {
         resultMappers.push((v) => client.decodeReturnValue('get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)', v))
         return this
       },
+      /**
+       * Add a update_oracle()void method call against the DualstakeFarm contract
+       */
+      updateOracle(params: CallParams<DualstakeFarmArgs['obj']['update_oracle()void'] | DualstakeFarmArgs['tuple']['update_oracle()void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.updateOracle(params)))
+        resultMappers.push(undefined)
+        return this
+      },
       /**
        * Add a create_farm(application,asset,uint64,uint64)void method call against the DualstakeFarm contract
        */
@@ -1896,6 +2761,38 @@ export class DualstakeFarmClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a payout_many(application,uint64[],bool)void method call against the DualstakeFarm contract
+       */
+      payoutMany(params: CallParams<DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void'] | DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.payoutMany(params)))
+        resultMappers.push(undefined)
+        return this
+      },
+      /**
+       * Add a payout_batch((uint64,uint64)[],bool)uint64 method call against the DualstakeFarm contract
+       */
+      payoutBatch(params: CallParams<DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64'] | DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.payoutBatch(params)))
+        resultMappers.push((v) => client.decodeReturnValue('payout_batch((uint64,uint64)[],bool)uint64', v))
+        return this
+      },
+      /**
+       * Add a record_proposals(application,uint64[])void method call against the DualstakeFarm contract
+       */
+      recordProposals(params: CallParams<DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void'] | DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.recordProposals(params)))
+        resultMappers.push(undefined)
+        return this
+      },
+      /**
+       * Add a settle(application,bool)void method call against the DualstakeFarm contract
+       */
+      settle(params: CallParams<DualstakeFarmArgs['obj']['settle(application,bool)void'] | DualstakeFarmArgs['tuple']['settle(application,bool)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.settle(params)))
+        resultMappers.push(undefined)
+        return this
+      },
       /**
        * Add a noop()void method call against the DualstakeFarm contract
        */
@@ -1912,6 +2809,22 @@ export class DualstakeFarmClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a claim_ix_rewards()uint64 method call against the DualstakeFarm contract
+       */
+      claimIxRewards(params: CallParams<DualstakeFarmArgs['obj']['claim_ix_rewards()uint64'] | DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.claimIxRewards(params)))
+        resultMappers.push((v) => client.decodeReturnValue('claim_ix_rewards()uint64', v))
+        return this
+      },
+      /**
+       * Add a get_ix_rewards(account)uint64 method call against the DualstakeFarm contract
+       */
+      getIxRewards(params: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getIxRewards(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_ix_rewards(account)uint64', v))
+        return this
+      },
       /**
        * Add a optout(asset)void method call against the DualstakeFarm contract
        */
@@ -1944,6 +2857,22 @@ export class DualstakeFarmClient {
         resultMappers.push((v) => client.decodeReturnValue('get_state(application)(uint64,uint64,uint64,uint64)', v))
         return this
       },
+      /**
+       * Add a get_pending_blocks(application)uint64 method call against the DualstakeFarm contract
+       */
+      getPendingBlocks(params: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getPendingBlocks(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_pending_blocks(application)uint64', v))
+        return this
+      },
+      /**
+       * Add a get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64) method call against the DualstakeFarm contract
+       */
+      getGlobalSnapshot(params: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getGlobalSnapshot(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)', v))
+        return this
+      },
       /**
        * Add a log_states(uint64[])void method call against the DualstakeFarm contract
        */
@@ -1968,6 +2897,14 @@ export class DualstakeFarmClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a log_states_and_aprs_override(uint64[],uint64)void method call against the DualstakeFarm contract
+       */
+      logStatesAndAprsOverride(params: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.logStatesAndAprsOverride(params)))
+        resultMappers.push(undefined)
+        return this
+      },
       /**
        * Add a log_block_proposers(uint64,uint64)void method call against the DualstakeFarm contract
        */
@@ -1976,6 +2913,14 @@ export class DualstakeFarmClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a log_farm_proposals(uint64[],uint64,uint64)uint64[] method call against the DualstakeFarm contract
+       */
+      logFarmProposals(params: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.logFarmProposals(params)))
+        resultMappers.push((v) => client.decodeReturnValue('log_farm_proposals(uint64[],uint64,uint64)uint64[]', v))
+        return this
+      },
       get update() {
         return {
           bare: (params?: AppClientBareCallParams & AppClientCompilationParams ) => {
@@ -2036,6 +2981,15 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   projectApr(params?: CallParams<DualstakeFarmArgs['obj']['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['project_apr(application,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | undefined]>
 
+  /**
+   * Calls the project_apr_curve(application,uint64[])(uint64,uint64)[] ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  projectAprCurve(params?: CallParams<DualstakeFarmArgs['obj']['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | DualstakeFarmArgs['tuple']['project_apr_curve(application,uint64[])(uint64,uint64)[]']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['project_apr_curve(application,uint64[])(uint64,uint64)[]'] | undefined]>
+
   /**
    * Calls the get_algo_cost(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64) ABI method.
    *
@@ -2054,6 +3008,15 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   getAlgoCostAndMaxDuration(params?: CallParams<DualstakeFarmArgs['obj']['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['get_algo_cost_and_max_duration(application,asset,uint64)(uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | undefined]>
 
+  /**
+   * Calls the update_oracle()void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  updateOracle(params?: CallParams<DualstakeFarmArgs['obj']['update_oracle()void'] | DualstakeFarmArgs['tuple']['update_oracle()void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['update_oracle()void'] | undefined]>
+
   /**
    * Calls the create_farm(application,asset,uint64,uint64)void ABI method.
    *
@@ -2090,6 +3053,42 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   payout(params?: CallParams<DualstakeFarmArgs['obj']['payout(application,uint64,bool)void'] | DualstakeFarmArgs['tuple']['payout(application,uint64,bool)void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['payout(application,uint64,bool)void'] | undefined]>
 
+  /**
+   * Calls the payout_many(application,uint64[],bool)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  payoutMany(params?: CallParams<DualstakeFarmArgs['obj']['payout_many(application,uint64[],bool)void'] | DualstakeFarmArgs['tuple']['payout_many(application,uint64[],bool)void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['payout_many(application,uint64[],bool)void'] | undefined]>
+
+  /**
+   * Calls the payout_batch((uint64,uint64)[],bool)uint64 ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  payoutBatch(params?: CallParams<DualstakeFarmArgs['obj']['payout_batch((uint64,uint64)[],bool)uint64'] | DualstakeFarmArgs['tuple']['payout_batch((uint64,uint64)[],bool)uint64']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['payout_batch((uint64,uint64)[],bool)uint64'] | undefined]>
+
+  /**
+   * Calls the record_proposals(application,uint64[])void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  recordProposals(params?: CallParams<DualstakeFarmArgs['obj']['record_proposals(application,uint64[])void'] | DualstakeFarmArgs['tuple']['record_proposals(application,uint64[])void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['record_proposals(application,uint64[])void'] | undefined]>
+
+  /**
+   * Calls the settle(application,bool)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  settle(params?: CallParams<DualstakeFarmArgs['obj']['settle(application,bool)void'] | DualstakeFarmArgs['tuple']['settle(application,bool)void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['settle(application,bool)void'] | undefined]>
+
   /**
    * Calls the noop()void ABI method.
    *
@@ -2108,6 +3107,24 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   withdrawFees(params?: CallParams<DualstakeFarmArgs['obj']['withdraw_fees(uint64)void'] | DualstakeFarmArgs['tuple']['withdraw_fees(uint64)void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['withdraw_fees(uint64)void'] | undefined]>
 
+  /**
+   * Calls the claim_ix_rewards()uint64 ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  claimIxRewards(params?: CallParams<DualstakeFarmArgs['obj']['claim_ix_rewards()uint64'] | DualstakeFarmArgs['tuple']['claim_ix_rewards()uint64']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['claim_ix_rewards()uint64'] | undefined]>
+
+  /**
+   * Calls the get_ix_rewards(account)uint64 ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getIxRewards(params?: CallParams<DualstakeFarmArgs['obj']['get_ix_rewards(account)uint64'] | DualstakeFarmArgs['tuple']['get_ix_rewards(account)uint64']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['get_ix_rewards(account)uint64'] | undefined]>
+
   /**
    * Calls the optout(asset)void ABI method.
    *
@@ -2144,6 +3161,24 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   getState(params?: CallParams<DualstakeFarmArgs['obj']['get_state(application)(uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_state(application)(uint64,uint64,uint64,uint64)']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['get_state(application)(uint64,uint64,uint64,uint64)'] | undefined]>
 
+  /**
+   * Calls the get_pending_blocks(application)uint64 ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPendingBlocks(params?: CallParams<DualstakeFarmArgs['obj']['get_pending_blocks(application)uint64'] | DualstakeFarmArgs['tuple']['get_pending_blocks(application)uint64']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['get_pending_blocks(application)uint64'] | undefined]>
+
+  /**
+   * Calls the get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64) ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getGlobalSnapshot(params?: CallParams<DualstakeFarmArgs['obj']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | DualstakeFarmArgs['tuple']['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['get_global_snapshot()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)'] | undefined]>
+
   /**
    * Calls the log_states(uint64[])void ABI method.
    *
@@ -2171,6 +3206,15 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   logStatesAndAprs(params?: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs(uint64[])void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs(uint64[])void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['log_states_and_aprs(uint64[])void'] | undefined]>
 
+  /**
+   * Calls the log_states_and_aprs_override(uint64[],uint64)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  logStatesAndAprsOverride(params?: CallParams<DualstakeFarmArgs['obj']['log_states_and_aprs_override(uint64[],uint64)void'] | DualstakeFarmArgs['tuple']['log_states_and_aprs_override(uint64[],uint64)void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['log_states_and_aprs_override(uint64[],uint64)void'] | undefined]>
+
   /**
    * Calls the log_block_proposers(uint64,uint64)void ABI method.
    *
@@ -2180,6 +3224,15 @@ export type DualstakeFarmComposer<TReturns extends [...any[]] = []> = {
    */
   logBlockProposers(params?: CallParams<DualstakeFarmArgs['obj']['log_block_proposers(uint64,uint64)void'] | DualstakeFarmArgs['tuple']['log_block_proposers(uint64,uint64)void']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['log_block_proposers(uint64,uint64)void'] | undefined]>
 
+  /**
+   * Calls the log_farm_proposals(uint64[],uint64,uint64)uint64[] ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  logFarmProposals(params?: CallParams<DualstakeFarmArgs['obj']['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | DualstakeFarmArgs['tuple']['log_farm_proposals(uint64[],uint64,uint64)uint64[]']>): DualstakeFarmComposer<[...TReturns, DualstakeFarmReturns['log_farm_proposals(uint64[],uint64,uint64)uint64[]'] | undefined]>
+
   /**
    * Gets available delete methods
    */
@@ -1,14 +1,66 @@
 from algopy import (
+    String,
     UInt64,
+    op,
     subroutine,
 )
 
+from . import custom
+
+S = String
+
 
 @subroutine
-def max(a: UInt64, b: UInt64) -> UInt64:
+def max_u64(a: UInt64, b: UInt64) -> UInt64:
     return a if a > b else b
 
 
+@subroutine
+def min_u64(a: UInt64, b: UInt64) -> UInt64:
+    return a if a < b else b
+
+
 @subroutine
 def safe_subtract(a: UInt64, b: UInt64, default: UInt64) -> UInt64:
     return a - b if a > b else default
+
+
+@subroutine
+def ema(prev: UInt64, sample: UInt64, weight: UInt64, window: UInt64) -> UInt64:
+    # exponential moving average step: sample counts weight/window, prev the rest
+    return (prev * (window - weight) + sample * weight) // window
+
+
+# a * b is formed as a 128 bit product with mulw, so only the result has to fit
+# in a uint64. all of these fail on division by zero, like BigUInt division
+
+
+@subroutine
+def mul_div(a: UInt64, b: UInt64, c: UInt64) -> UInt64:
+    # floor(a * b / c). fails if the result does not fit
+    hi, lo = op.mulw(a, b)
+    return op.divw(hi, lo, c)
+
+
+@subroutine
+def mul_divmod(a: UInt64, b: UInt64, c: UInt64) -> tuple[UInt64, UInt64]:
+    # (floor(a * b / c), a * b % c). fails if the quotient does not fit
+    hi, lo = op.mulw(a, b)
+    q_hi, q_lo, r_hi, r_lo = op.divmodw(hi, lo, UInt64(0), c)
+    custom.ensure(q_hi == 0, S("ERR:MULDIV"))
+    return q_lo, r_lo
+
+
+@subroutine
+def mul_div_ceil(a: UInt64, b: UInt64, c: UInt64) -> UInt64:
+    # ceil(a * b / c). fails if the result does not fit
+    q, r = mul_divmod(a, b, c)
+    return q + 1 if r > 0 else q
+
+
+@subroutine
+def scaled_mul_div(scale: UInt64, a: UInt64, b: UInt64, c: UInt64) -> UInt64:
+    # floor(scale * a * b / c) for a small scale, e.g. 10000 for basis points.
+    # a * b = q * c + r, so the result is scale * q + floor(scale * r / c)
+    q, r = mul_divmod(a, b, c)
+    return scale * q + mul_div(scale, r, c)
@@ -19,10 +19,26 @@ class RoundTimeFraction(NamedTuple):
     dr: UInt64
 
 
+@subroutine
+def first_accessible_round() -> UInt64:
+    return math.safe_subtract(Txn.last_valid, UInt64(1001), UInt64(1))
+
+
+@subroutine
+def last_accessible_round() -> UInt64:
+    return Txn.first_valid - UInt64(1)
+
+
+@subroutine
+def is_accessible(rnd: UInt64) -> bool:
+    # block fields of rnd can be read without failing the program
+    return first_accessible_round() <= rnd and rnd <= last_accessible_round()
+
+
 @subroutine
 def get_round_time(min_round_sample: UInt64) -> RoundTimeFraction:
-    first_accessible = math.safe_subtract(Txn.last_valid, UInt64(1001), UInt64(1))
-    last_accessible = Txn.first_valid - UInt64(1)
+    first_accessible = first_accessible_round()
+    last_accessible = last_accessible_round()
     if first_accessible > UInt64(1):
         custom.ensure(
             last_accessible - first_accessible >= min_round_sample,
@@ -35,10 +51,42 @@ def get_round_time(min_round_sample: UInt64) -> RoundTimeFraction:
     return RoundTimeFraction(dt=ts_delta, dr=block_delta)
 
 
+@subroutine
+def get_round_time_since(since_round: UInt64) -> RoundTimeFraction:
+    # round time over the accessible blocks after since_round. dr is 0 if none
+    first_accessible = math.max_u64(first_accessible_round(), since_round)
+    last_accessible = last_accessible_round()
+    if first_accessible >= last_accessible:
+        return RoundTimeFraction(dt=UInt64(0), dr=UInt64(0))
+    ts_delta = op.Block.blk_timestamp(last_accessible) - op.Block.blk_timestamp(
+        first_accessible
+    )
+    return RoundTimeFraction(dt=ts_delta, dr=last_accessible - first_accessible)
+
+
+@subroutine
+def get_avg_payout_since(since_round: UInt64, stride: UInt64) -> UInt64:
+    # mean proposer payout of the accessible rounds after since_round that are
+    # multiples of stride, so the sampled rounds do not depend on the caller's
+    # validity window. 0 if none of them paid out
+    first_accessible = math.max_u64(first_accessible_round(), since_round + 1)
+    last_accessible = last_accessible_round()
+    rnd = first_accessible + (stride - first_accessible % stride) % stride
+    num_payouts = UInt64(0)
+    sum_payouts = UInt64(0)
+    while rnd <= last_accessible:
+        payout = op.Block.blk_proposer_payout(rnd)
+        if payout > UInt64(0):
+            num_payouts = num_payouts + UInt64(1)
+            sum_payouts = sum_payouts + payout
+        rnd = rnd + stride
+    return sum_payouts // num_payouts if num_payouts > UInt64(0) else UInt64(0)
+
+
 @subroutine
 def get_block_rewards() -> UInt64:
-    first_accessible = math.safe_subtract(Txn.last_valid, UInt64(1001), UInt64(1))
-    last_accessible = Txn.first_valid - UInt64(1)
+    first_accessible = first_accessible_round()
+    last_accessible = last_accessible_round()
     delta = last_accessible - first_accessible
     bonus = op.Block.blk_bonus(last_accessible)
     num_payouts = UInt64(0)
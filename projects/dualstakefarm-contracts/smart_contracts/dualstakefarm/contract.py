@@ -1,11 +1,14 @@
+from typing import NamedTuple
+
 from algopy import (
     Account,
     Application,
     ARC4Contract,
     Asset,
-    BigUInt,
     BoxMap,
+    Bytes,
     Global,
+    GlobalState,
     StateTotals,
     String,
     Txn,
@@ -21,17 +24,29 @@ from algopy.arc4 import abi_call, abimethod
 from ..common import custom, math, round_time, send, validate
 
 S = String
-B = BigUInt
 
 
 @subroutine
 def get_tm2_net_amt(amt: UInt64) -> UInt64:
-    return amt - (UInt64(30) * amt // UInt64(10000))
+    return amt - math.mul_div(UInt64(30), amt, UInt64(10000))
 
 
-# required block range availability to sample avg round time. constant
+# required block range availability to sample avg round time
+# before the round time oracle is seeded. constant
 MIN_ROUND_SAMPLE = 500
 
+# rounds of history after which the oracle fully reflects a new sample
+ORACLE_ROUND_WINDOW = 1000
+
+# the block payout oracle samples the rounds that are multiples of this
+ORACLE_PAYOUT_STRIDE = 100
+
+# update_oracle folds new blocks in at most once per this many rounds
+ORACLE_UPDATE_ROUNDS = ORACLE_PAYOUT_STRIDE
+
+# farm amount priced as override_farm_amount by log_states_and_aprs
+DEFAULT_OVERRIDE_FARM_AMOUNT = 9000000
+
 # default value for minimum allowed duration in blocks
 DEFAULT_MIN_DURATION_BLOCKS = 30
 
@@ -40,12 +55,55 @@ DEFAULT_MIN_DURATION_BLOCKS = 30
 # bound by minimum value above
 DEFAULT_MAX_DURATION_DAYS = 45
 
+# farm boxes: 8 byte app id key + FarmBox value. boxes written before the
+# compact layout hold a 32 byte FarmState. the length tells the two apart.
+# a farm box only exists while the farm has blocks left, so the box names are
+# the live farms. expiry order is derived off chain from their state
+FARM_BOX_KEY_SIZE = 8
+FARM_BOX_SIZE = 26
+LEGACY_FARM_BOX_SIZE = 32
+FARM_BOX_MBR = 2500 + 400 * (FARM_BOX_KEY_SIZE + FARM_BOX_SIZE)
+
+# IX rewards accrued per keeper until claim_ix_rewards: b"k" + address key,
+# uint64 value. the box MBR is withheld from the keeper's first reward and paid
+# back with the claim, so keeper boxes never draw on the platform balance.
+# one block's IX reward must cover it
+IX_REWARDS_KEY_PREFIX = b"k"
+IX_REWARDS_BOX_MBR = 2500 + 400 * (1 + 32 + 8)
+
+MAX_UINT16 = 2**16 - 1
+MAX_UINT32 = 2**32 - 1
+
+# an APR curve is returned in a single log: 4 + 2 + 63 * 16 bytes
+MAX_APR_CURVE_POINTS = 63
+
 # expressed as multiples of min txn fee
 PLATFORM_FEE_PER_BLOCK = 97  # 0.097 ALGO
-TXN_FEE_PER_BLOCK = 3  # 0.003 ALGO // 3 txns per payout: 1 farm reward axfer, 1 ds swap app call, 1 send IX reward drop
+# 2 inner txns per payout (1 farm reward axfer, 1 ds swap app call) plus the
+# keeper's outer app call. the IX reward claim fee is paid by its caller
+TXN_FEE_PER_BLOCK = 3  # 0.003 ALGO
 IX_REWARDS_PER_BLOCK = (
     100  # 0.1 ALGO // caller receives 100 min txn fees as incentivized execution reward
 )
+# percent of a block's IX reward accrued to the caller of record_proposals.
+# the caller of settle receives the rest
+RECORD_IX_REWARDS_SHARE = 50
+
+
+class APRContext(NamedTuple):
+    """Chain wide APR inputs. Identical for every farm within one call"""
+
+    online_stake: UInt64
+    block_bonus: UInt64
+    avg_block_payout: UInt64
+    avg_round_time: UInt64
+    yearly_blocks: UInt64
+
+
+class TinymanPool(NamedTuple):
+    asset_1_id: UInt64
+    asset_1_reserves: UInt64
+    asset_2_reserves: UInt64
 
 
 class AlgoCost(arc4.Struct):
@@ -84,6 +142,11 @@ class APRBreakdown(arc4.Struct):
     override_farm_apr_bps: arc4.UInt64
 
 
+class APRCurvePoint(arc4.Struct):
+    farm_amount_algo: arc4.UInt64
+    farm_apr_bps: arc4.UInt64
+
+
 class FarmState(arc4.Struct):
     farm_asset: arc4.UInt64
     amount_per_block: arc4.UInt64
@@ -91,6 +154,104 @@ class FarmState(arc4.Struct):
     last_block_paid: arc4.UInt64
 
 
+class PayoutItem(arc4.Struct):
+    recipient_app: arc4.UInt64
+    block_round: arc4.UInt64
+
+
+class FarmBox(arc4.Struct):
+    """Compact on-chain farm layout. Converted to FarmState for readers"""
+
+    farm_asset: arc4.UInt64
+    amount_per_block: arc4.UInt64
+    remaining_duration_blocks: arc4.UInt32
+    last_block_paid: arc4.UInt32
+    # blocks recorded by record_proposals and not paid yet. last_block_paid is
+    # the last recorded or paid block
+    pending_blocks: arc4.UInt16
+
+
+class ProposalMatch(arc4.Struct):
+    block_round: arc4.UInt64
+    app_index: arc4.UInt16
+
+
+# ARC-28 events. indexer/events.py mirrors these signatures
+
+
+class FarmCreated(arc4.Struct):
+    recipient_app: arc4.UInt64
+    farm_asset: arc4.UInt64
+    amount_per_block: arc4.UInt64
+    duration_blocks: arc4.UInt64
+    creator: arc4.Address
+
+
+class FarmExtended(arc4.Struct):
+    recipient_app: arc4.UInt64
+    added_amount_per_block: arc4.UInt64
+    added_duration_blocks: arc4.UInt64
+    amount_per_block: arc4.UInt64
+    remaining_duration_blocks: arc4.UInt64
+
+
+class FarmPayout(arc4.Struct):
+    recipient_app: arc4.UInt64
+    # last block paid. num_blocks proposed blocks up to it are paid in one transfer
+    block_round: arc4.UInt64
+    num_blocks: arc4.UInt64
+    amount: arc4.UInt64
+    keeper: arc4.Address
+
+
+class FarmProposalsRecorded(arc4.Struct):
+    recipient_app: arc4.UInt64
+    # last block recorded
+    block_round: arc4.UInt64
+    num_blocks: arc4.UInt64
+    pending_blocks: arc4.UInt64
+    keeper: arc4.Address
+
+
+class FarmExpired(arc4.Struct):
+    recipient_app: arc4.UInt64
+    farm_asset: arc4.UInt64
+
+
+class IXRewardsClaimed(arc4.Struct):
+    amount: arc4.UInt64
+    keeper: arc4.Address
+
+
+class FeesWithdrawn(arc4.Struct):
+    amount: arc4.UInt64
+    receiver: arc4.Address
+
+
+class GlobalSnapshot(arc4.Struct):
+    """Platform state and counters for monitoring, read in one call"""
+
+    round_: arc4.UInt64
+    balance: arc4.UInt64
+    locked_balance: arc4.UInt64
+    txn_fuel: arc4.UInt64
+    global_remaining_blocks: arc4.UInt64
+    ix_accrued: arc4.UInt64
+    active_farms: arc4.UInt64
+    blocks_paid: arc4.UInt64
+    farms_created: arc4.UInt64
+    farms_extended: arc4.UInt64
+    farms_expired: arc4.UInt64
+    ix_pb: arc4.UInt64
+    plat_fee_pb: arc4.UInt64
+    txn_fee_pb: arc4.UInt64
+    max_duration_days: arc4.UInt64
+    min_duration_blocks: arc4.UInt64
+    avg_round_time: arc4.UInt64
+    avg_block_payout: arc4.UInt64
+    online_stake: arc4.UInt64
+
+
 class FarmStateAndAPR(arc4.Struct):
     balance: arc4.UInt64
     staked: arc4.UInt64
@@ -119,9 +280,16 @@ class DualstakeFarm(
 ):
     def __init__(self) -> None:
         self.manager = Txn.sender
-        self.farms = BoxMap(Application, FarmState, key_prefix=b"")
+        self.farms = BoxMap(Application, Bytes, key_prefix=b"")
         self.txn_fuel = UInt64(0)
         self.global_remaining_blocks = UInt64(0)
+        # IX rewards earned by keepers and not claimed yet. part of the locked
+        # balance. read with a default of 0: apps updated in place start without it
+        self.ix_rewards = BoxMap(Account, UInt64, key_prefix=IX_REWARDS_KEY_PREFIX)
+        self.ix_accrued = GlobalState(UInt64)
+        # pending blocks whose record_proposals share of the IX reward is in
+        # ix_accrued already. same default
+        self.ix_recorded_blocks = GlobalState(UInt64)
 
         self.max_duration_days = UInt64(DEFAULT_MAX_DURATION_DAYS)
         self.min_duration_blocks = UInt64(DEFAULT_MIN_DURATION_BLOCKS)
@@ -130,6 +298,20 @@ class DualstakeFarm(
         self.plat_fee_pb = UInt64(PLATFORM_FEE_PER_BLOCK)
         self.txn_fee_pb = UInt64(TXN_FEE_PER_BLOCK)
 
+        # round time (x10000 seconds) and proposer payout moving averages.
+        # read with a default of 0: apps updated in place start without them
+        self.oracle_round = GlobalState(UInt64)
+        self.avg_round_time = GlobalState(UInt64)
+        self.avg_block_payout = GlobalState(UInt64)
+
+        # operational counters. apps updated in place start without them,
+        # so they are read with a default of 0. payouts write none of them:
+        # blocks paid is blocks_funded - global_remaining_blocks
+        self.blocks_funded = GlobalState(UInt64)
+        self.farms_created = GlobalState(UInt64)
+        self.farms_extended = GlobalState(UInt64)
+        self.farms_expired = GlobalState(UInt64)
+
     @arc4.baremethod(allow_actions=("UpdateApplication",))
     def update(self) -> None:
         self.ensure_manager_caller()
@@ -142,30 +324,64 @@ class DualstakeFarm(
     def calc_tm_denom(
         self, a1: UInt64, a2: UInt64, v: UInt64, amount: UInt64
     ) -> UInt64:
-        return op.btoi((B(a1) * B(a2) // B(v + get_tm2_net_amt(amount))).bytes)
+        return math.mul_div(a1, a2, v + get_tm2_net_amt(amount))
 
     @subroutine
-    def get_tinyman_algo_price_for_asset(
-        self,
-        tm2: Application,
-        tma: Account,
-        farm_amount: UInt64,
-    ) -> UInt64:
+    def read_tinyman_pool(self, tm2: Application, tma: Account) -> TinymanPool:
         aid1, exists1 = op.AppLocal.get_ex_uint64(tma, tm2, b"asset_1_id")
         a1, exists2 = op.AppLocal.get_ex_uint64(tma, tm2, b"asset_1_reserves")
         a2, exists3 = op.AppLocal.get_ex_uint64(tma, tm2, b"asset_2_reserves")
         custom.ensure(exists1 and exists2 and exists3, S("ERR:TM STT"))
+        return TinymanPool(asset_1_id=aid1, asset_1_reserves=a1, asset_2_reserves=a2)
+
+    @subroutine
+    def get_tinyman_algo_price(self, pool: TinymanPool, farm_amount: UInt64) -> UInt64:
+        if farm_amount == UInt64(0):
+            return UInt64(0)
+        a1 = pool.asset_1_reserves
+        a2 = pool.asset_2_reserves
         ret = UInt64(0)
-        if aid1 != UInt64(0):
+        if pool.asset_1_id != UInt64(0):
             ret = a2 - self.calc_tm_denom(a1, a2, a1, farm_amount) - UInt64(1)
         else:
             ret = a1 - self.calc_tm_denom(a1, a2, a2, farm_amount) - UInt64(1)
         return ret
 
+    @subroutine
+    def get_apr_context(self) -> APRContext:
+        avg_round_time = self.get_avg_round_time()
+        return APRContext(
+            online_stake=op.online_stake(),
+            block_bonus=op.Block.blk_bonus(Txn.first_valid - UInt64(1)),
+            avg_block_payout=self.avg_block_payout.get(UInt64(0)),
+            avg_round_time=avg_round_time,
+            yearly_blocks=UInt64(86400) * UInt64(365) * UInt64(10000) // avg_round_time,
+        )
+
     @subroutine
     def _project_apr(
         self, recipient_app: Application, override_farm_amount: UInt64
     ) -> APRBreakdown:
+        farm_amount = UInt64(0)
+        if recipient_app in self.farms:
+            farm_amount = self.load_farm(recipient_app).amount_per_block.as_uint64()
+
+        return self._project_apr_in_context(
+            recipient_app, farm_amount, override_farm_amount, self.get_apr_context()
+        )
+
+    @subroutine
+    def _project_apr_in_context(
+        self,
+        recipient_app: Application,
+        farm_amount: UInt64,
+        override_farm_amount: UInt64,
+        ctx: APRContext,
+    ) -> APRBreakdown:
+        """
+        Per farm part of the APR projection.
+        Chain wide inputs come from ctx so batch callers compute them once.
+        """
         tm2_app_id, exists2 = op.AppGlobal.get_ex_uint64(recipient_app, b"tm2_app_id")
         tm2_lp_addr, exists3 = op.AppGlobal.get_ex_bytes(recipient_app, b"lp_id")
 
@@ -173,68 +389,43 @@ class DualstakeFarm(
         staked, exists4 = op.AppGlobal.get_ex_uint64(recipient_app, b"staked")
         custom.ensure(exists1 and exists2 and exists3 and exists4, S("ERR:DS STT"))
 
-        farm_amount = UInt64(0)
-        if recipient_app in self.farms:
-            farm_amount = self.farms[recipient_app].amount_per_block.native
-
-        farm_amount_algo = (
-            self.get_tinyman_algo_price_for_asset(
-                Application(tm2_app_id), Account(tm2_lp_addr), farm_amount
+        farm_amount_algo = UInt64(0)
+        override_farm_amount_algo = UInt64(0)
+        if farm_amount > UInt64(0) or override_farm_amount > UInt64(0):
+            # read pool reserves once for both prices
+            pool = self.read_tinyman_pool(Application(tm2_app_id), Account(tm2_lp_addr))
+            farm_amount_algo = self.get_tinyman_algo_price(pool, farm_amount)
+            override_farm_amount_algo = self.get_tinyman_algo_price(
+                pool, override_farm_amount
             )
-            if farm_amount > UInt64(0)
-            else UInt64(0)
-        )
-
-        override_farm_amount_algo = (
-            self.get_tinyman_algo_price_for_asset(
-                Application(tm2_app_id), Account(tm2_lp_addr), override_farm_amount
-            )
-            if override_farm_amount > UInt64(0)
-            else UInt64(0)
-        )
 
         # balance is staked+fees. Use this to calculate blocks (nom in % of online)
         balance = recipient_app.address.balance
-        total_online_stake = BigUInt(op.online_stake())
-
-        current_block_rewards = op.Block.blk_bonus(Txn.first_valid - UInt64(1))
-        # current_avg_block_payout = round_time.get_block_rewards()
 
-        rt_fraction = round_time.get_round_time(UInt64(MIN_ROUND_SAMPLE))
-        avg_round_time = UInt64(10000) * rt_fraction.dt // rt_fraction.dr
-        global_yearly_blocks_produced = BigUInt(
-            UInt64(86400) * UInt64(365) * rt_fraction.dr // rt_fraction.dt
-        )
+        current_block_rewards = ctx.block_bonus
 
-        own_yearly_blocks_produced = (
-            global_yearly_blocks_produced * balance // total_online_stake
+        own_yearly_blocks_produced = math.mul_div(
+            ctx.yearly_blocks, balance, ctx.online_stake
         )
 
-        base_rewards = (current_block_rewards) * own_yearly_blocks_produced
-        base_apr_bps = (
-            UInt64(10000) * base_rewards // staked if staked > UInt64(0) else BigUInt(0)
+        base_apr_bps = self.get_apr_bps(
+            current_block_rewards, own_yearly_blocks_produced, staked
         )
-
-        farm_rewards = (farm_amount_algo) * own_yearly_blocks_produced
-        farm_apr_bps = (
-            UInt64(10000) * farm_rewards // staked if staked > UInt64(0) else BigUInt(0)
+        farm_apr_bps = self.get_apr_bps(
+            farm_amount_algo, own_yearly_blocks_produced, staked
         )
-
-        override_farm_rewards = (override_farm_amount_algo) * own_yearly_blocks_produced
-        override_farm_apr_bps = (
-            (UInt64(10000) * override_farm_rewards // staked)
-            if staked > UInt64(0)
-            else BigUInt(0)
+        override_farm_apr_bps = self.get_apr_bps(
+            override_farm_amount_algo, own_yearly_blocks_produced, staked
         )
 
         return APRBreakdown(
             balance=arc4.UInt64(balance),
             staked=arc4.UInt64(staked),
-            online_stake=arc4.UInt64(total_online_stake),
-            avg_round_time=arc4.UInt64(avg_round_time),
+            online_stake=arc4.UInt64(ctx.online_stake),
+            avg_round_time=arc4.UInt64(ctx.avg_round_time),
             expected_yearly_blocks=arc4.UInt64(own_yearly_blocks_produced),
             current_block_bonus=arc4.UInt64(current_block_rewards),
-            current_avg_block_payout=arc4.UInt64(0),
+            current_avg_block_payout=arc4.UInt64(ctx.avg_block_payout),
             current_farm_amount=arc4.UInt64(farm_amount),
             current_farm_amount_algo=arc4.UInt64(farm_amount_algo),
             override_farm_amount=arc4.UInt64(override_farm_amount),
@@ -244,6 +435,17 @@ class DualstakeFarm(
             override_farm_apr_bps=arc4.UInt64(override_farm_apr_bps),
         )
 
+    @subroutine
+    def get_apr_bps(
+        self, reward_per_block: UInt64, yearly_blocks: UInt64, staked: UInt64
+    ) -> UInt64:
+        """Yearly rewards in basis points of staked. 0 if nothing is staked"""
+        if staked == UInt64(0):
+            return UInt64(0)
+        return math.scaled_mul_div(
+            UInt64(10000), reward_per_block, yearly_blocks, staked
+        )
+
     @abimethod(readonly=True)
     def project_apr(
         self,
@@ -252,6 +454,46 @@ class DualstakeFarm(
     ) -> APRBreakdown:
         return self._project_apr(recipient_app, override_farm_amount)
 
+    @abimethod(readonly=True)
+    def project_apr_curve(
+        self,
+        recipient_app: Application,
+        override_farm_amounts: arc4.DynamicArray[arc4.UInt64],
+    ) -> arc4.DynamicArray[APRCurvePoint]:
+        """
+        Farm APR for each of override_farm_amounts, as project_apr would report
+        it in override_farm_amount_algo and override_farm_apr_bps.
+        Dualstake and pool state and the chain context are read once.
+        """
+        custom.ensure(
+            override_farm_amounts.length <= UInt64(MAX_APR_CURVE_POINTS),
+            S("ERR:POINTS"),
+        )
+        tm2_app_id, exists1 = op.AppGlobal.get_ex_uint64(recipient_app, b"tm2_app_id")
+        tm2_lp_addr, exists2 = op.AppGlobal.get_ex_bytes(recipient_app, b"lp_id")
+        staked, exists3 = op.AppGlobal.get_ex_uint64(recipient_app, b"staked")
+        custom.ensure(exists1 and exists2 and exists3, S("ERR:DS STT"))
+
+        ctx = self.get_apr_context()
+        pool = self.read_tinyman_pool(Application(tm2_app_id), Account(tm2_lp_addr))
+        own_yearly_blocks_produced = math.mul_div(
+            ctx.yearly_blocks, recipient_app.address.balance, ctx.online_stake
+        )
+
+        curve = arc4.DynamicArray[APRCurvePoint]()
+        for amount in override_farm_amounts:
+            farm_amount_algo = self.get_tinyman_algo_price(pool, amount.as_uint64())
+            farm_apr_bps = self.get_apr_bps(
+                farm_amount_algo, own_yearly_blocks_produced, staked
+            )
+            curve.append(
+                APRCurvePoint(
+                    farm_amount_algo=arc4.UInt64(farm_amount_algo),
+                    farm_apr_bps=arc4.UInt64(farm_apr_bps),
+                )
+            )
+        return curve
+
     @subroutine
     def calculate_algo_cost(
         self, recipient_app: Application, farm_asset: Asset, duration_blocks: UInt64
@@ -261,9 +503,7 @@ class DualstakeFarm(
             if Global.current_application_address.is_opted_in(farm_asset)
             else Global.asset_opt_in_min_balance
         )
-        box_mbr = (
-            UInt64(0) if recipient_app in self.farms else UInt64(5 * 8 * 400 + 2500)
-        )  # box size is 1+4 uint64s
+        box_mbr = UInt64(0) if recipient_app in self.farms else UInt64(FARM_BOX_MBR)
 
         ix_cost = self.get_ix_rewards_per_block() * duration_blocks
         txn_fee_cost = self.get_txn_fee_per_block() * duration_blocks
@@ -306,23 +546,84 @@ class DualstakeFarm(
         Get max allowed duration for a contract in days.
         Estimates the blocks to be produced in the next 45 days (MAX_DURATION_DAYS).
         """
-        ds_balance = BigUInt(recipient_app.address.balance)
-        total_online_stake = BigUInt(op.online_stake())
-        # round_time = (dt == time2 - time1) / (dr == block2 - block1)
-        rt_fraction = round_time.get_round_time(UInt64(MIN_ROUND_SAMPLE))
         # blocks produced = 45 days in seconds / round_time
-        blocks_produced = BigUInt(
+        blocks_produced = (
             UInt64(86400)
             * UInt64(DEFAULT_MAX_DURATION_DAYS)
-            * rt_fraction.dr
-            // rt_fraction.dt
+            * UInt64(10000)
+            // self.get_avg_round_time()
         )
         # max duration = percentage_of_stake * blocks produced in 45 days
         # = own_stake * blocks_produced / total_stake
-        max_duration = ds_balance * blocks_produced // total_online_stake
-        return math.max(
-            UInt64(DEFAULT_MIN_DURATION_BLOCKS), op.btoi(max_duration.bytes)
+        max_duration = math.mul_div(
+            recipient_app.address.balance, blocks_produced, op.online_stake()
         )
+        return math.max_u64(UInt64(DEFAULT_MIN_DURATION_BLOCKS), max_duration)
+
+    @subroutine
+    def get_avg_round_time(self) -> UInt64:
+        """
+        Average round time in 1/10000 seconds.
+        Reads the oracle. Falls back to sampling blocks until the oracle is seeded.
+        """
+        avg_round_time = self.avg_round_time.get(UInt64(0))
+        if avg_round_time > UInt64(0):
+            return avg_round_time
+        # round_time = (dt == time2 - time1) / (dr == block2 - block1)
+        rt_fraction = round_time.get_round_time(UInt64(MIN_ROUND_SAMPLE))
+        return UInt64(10000) * rt_fraction.dt // rt_fraction.dr
+
+    @abimethod
+    def update_oracle(self) -> None:
+        """
+        Fold new blocks into the oracle. Anyone can call it. It does nothing
+        until ORACLE_UPDATE_ROUNDS rounds have passed since the last update,
+        so keepers add it to their payout groups at little cost.
+        """
+        if round_time.last_accessible_round() >= self.oracle_round.get(
+            UInt64(0)
+        ) + UInt64(ORACLE_UPDATE_ROUNDS):
+            self.fold_oracle()
+
+    @subroutine
+    def fold_oracle(self) -> None:
+        """
+        Fold the blocks accessible since the last update into the oracle.
+        Both samples weigh in by the rounds they cover, so frequent updates
+        move the averages no faster than rare ones.
+        Costs two timestamp reads and at most one payout read per stride.
+        """
+        oracle_round = self.oracle_round.get(UInt64(0))
+        last_round = round_time.last_accessible_round()
+        if last_round <= oracle_round:
+            return
+
+        rt_fraction = round_time.get_round_time_since(oracle_round)
+        if rt_fraction.dr > UInt64(0):
+            weight = math.min_u64(rt_fraction.dr, UInt64(ORACLE_ROUND_WINDOW))
+            sample = UInt64(10000) * rt_fraction.dt // rt_fraction.dr
+            avg_round_time = self.avg_round_time.get(UInt64(0))
+            if avg_round_time == UInt64(0):
+                self.avg_round_time.value = sample
+            else:
+                self.avg_round_time.value = math.ema(
+                    avg_round_time, sample, weight, UInt64(ORACLE_ROUND_WINDOW)
+                )
+
+            # non incentive eligible proposers get no payout, those are skipped
+            payout = round_time.get_avg_payout_since(
+                oracle_round, UInt64(ORACLE_PAYOUT_STRIDE)
+            )
+            if payout > UInt64(0):
+                avg_block_payout = self.avg_block_payout.get(UInt64(0))
+                if avg_block_payout == UInt64(0):
+                    self.avg_block_payout.value = payout
+                else:
+                    self.avg_block_payout.value = math.ema(
+                        avg_block_payout, payout, weight, UInt64(ORACLE_ROUND_WINDOW)
+                    )
+
+        self.oracle_round.value = last_round
 
     @subroutine
     def validate_duration(
@@ -346,13 +647,15 @@ class DualstakeFarm(
         custom.ensure(recipient_app not in self.farms, S("ERR:EXISTS"))
 
         custom.ensure(Txn.group_index > 0, S("ERR:NO PAY"))
+        # a farm ends when its last block is paid, which deletes its box
+        custom.ensure(duration_blocks > 0, S("ERR:NO BLKS"))
 
         # validate ALGO payment. positioned before so it can cover optin and box MBR
         validate.payment_amount_exact(
             Txn.group_index - UInt64(1),  # previous txn
             self.calculate_algo_cost(
                 recipient_app, farm_asset, duration_blocks
-            ).total_cost.native,
+            ).total_cost.as_uint64(),
         )
 
         # validate ASA deposit. positioned after app call so we can opt in if needed
@@ -375,17 +678,33 @@ class DualstakeFarm(
             send.optin(farm_asset, UInt64(0))
 
         # create farm box entry
-        self.farms[recipient_app] = FarmState(
-            farm_asset=arc4.UInt64(farm_asset.id),
-            amount_per_block=arc4.UInt64(amount_per_block),
-            remaining_duration_blocks=arc4.UInt64(duration_blocks),
-            last_block_paid=arc4.UInt64(Global.round + 1),
+        self.store_farm(
+            recipient_app,
+            FarmBox(
+                farm_asset=arc4.UInt64(farm_asset.id),
+                amount_per_block=arc4.UInt64(amount_per_block),
+                remaining_duration_blocks=self.to_u32(duration_blocks),
+                last_block_paid=self.to_u32(Global.round + 1),
+                pending_blocks=arc4.UInt16(0),
+            ),
         )
+        self.farms_created.value = self.farms_created.get(UInt64(0)) + 1
+        self.fund_blocks(duration_blocks)
 
         # add to global txn fuel
         self.txn_fuel = self.txn_fuel + self.get_spend_per_block() * duration_blocks
         self.global_remaining_blocks = self.global_remaining_blocks + duration_blocks
 
+        arc4.emit(
+            FarmCreated(
+                recipient_app=arc4.UInt64(recipient_app.id),
+                farm_asset=arc4.UInt64(farm_asset.id),
+                amount_per_block=arc4.UInt64(amount_per_block),
+                duration_blocks=arc4.UInt64(duration_blocks),
+                creator=arc4.Address(Txn.sender),
+            )
+        )
+
     @abimethod
     def extend_duration_blocks(
         self,
@@ -394,39 +713,55 @@ class DualstakeFarm(
     ) -> None:
         custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
 
-        state = self.farms[recipient_app].copy()
-        farm_asset = Asset(state.farm_asset.native)
+        state = self.load_farm(recipient_app)
+        farm_asset = Asset(state.farm_asset.as_uint64())
 
         # validate ALGO and ASA payments. keeping create_farm before/after structure for simplicity
         validate.payment_amount_exact(
             Txn.group_index - UInt64(1),  # previous txn
             self.calculate_algo_cost(
                 recipient_app, farm_asset, duration_blocks
-            ).total_cost.native,
+            ).total_cost.as_uint64(),
         )
 
         validate.axfer_amount_exact(
             Txn.group_index + UInt64(1),  # next txn
             farm_asset,
-            state.amount_per_block.native * duration_blocks,
+            state.amount_per_block.as_uint64() * duration_blocks,
         )
 
         self.validate_duration(
-            recipient_app, state.remaining_duration_blocks.native + duration_blocks
+            recipient_app, state.remaining_duration_blocks.as_uint64() + duration_blocks
         )
 
         # adjust remaining blocks in state
-        state.remaining_duration_blocks = arc4.UInt64(
-            state.remaining_duration_blocks.native + duration_blocks
+        state.remaining_duration_blocks = self.to_u32(
+            state.remaining_duration_blocks.as_uint64() + duration_blocks
         )
         # save state
-        self.farms[recipient_app] = state.copy()
+        self.store_farm(recipient_app, state)
+        self.farms_extended.value = self.farms_extended.get(UInt64(0)) + 1
+        # folded after validation so the duration check matches a prior quote
+        self.fold_oracle()
 
         # adjust txn fuel remaining
         self.txn_fuel = self.txn_fuel + self.get_spend_per_block() * duration_blocks
 
+        self.fund_blocks(duration_blocks)
         self.global_remaining_blocks = self.global_remaining_blocks + duration_blocks
 
+        arc4.emit(
+            FarmExtended(
+                recipient_app=arc4.UInt64(recipient_app.id),
+                added_amount_per_block=arc4.UInt64(0),
+                added_duration_blocks=arc4.UInt64(duration_blocks),
+                amount_per_block=state.amount_per_block,
+                remaining_duration_blocks=arc4.UInt64(
+                    state.remaining_duration_blocks.as_uint64()
+                ),
+            )
+        )
+
     @abimethod
     def extend_amount_per_block(
         self,
@@ -435,42 +770,43 @@ class DualstakeFarm(
     ) -> None:
         custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
 
-        state = self.farms[recipient_app].copy()
-        farm_asset = Asset(state.farm_asset.native)
+        state = self.load_farm(recipient_app)
+        farm_asset = Asset(state.farm_asset.as_uint64())
 
         validate.axfer_amount_exact(
             Txn.group_index + UInt64(1),  # next txn
             farm_asset,
-            amount_per_block * state.remaining_duration_blocks.native,
+            amount_per_block * state.remaining_duration_blocks.as_uint64(),
         )
 
         # adjust amount per block in state
         state.amount_per_block = arc4.UInt64(
-            state.amount_per_block.native + amount_per_block
+            state.amount_per_block.as_uint64() + amount_per_block
         )
         # save state
-        self.farms[recipient_app] = state.copy()
+        self.store_farm(recipient_app, state)
+        self.farms_extended.value = self.farms_extended.get(UInt64(0)) + 1
+        # folded after validation so the duration check matches a prior quote
+        self.fold_oracle()
+
+        arc4.emit(
+            FarmExtended(
+                recipient_app=arc4.UInt64(recipient_app.id),
+                added_amount_per_block=arc4.UInt64(amount_per_block),
+                added_duration_blocks=arc4.UInt64(0),
+                amount_per_block=state.amount_per_block,
+                remaining_duration_blocks=arc4.UInt64(
+                    state.remaining_duration_blocks.as_uint64()
+                ),
+            )
+        )
 
-    @abimethod()
-    def payout(
-        self, recipient_app: Application, block_round: UInt64, call_swap: arc4.Bool
+    @subroutine
+    def ensure_block_proposer(
+        self, recipient_app: Application, block_round: UInt64, last_block_paid: UInt64
     ) -> None:
-        # ensure farm exists
-        custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
-
-        # load farm state
-        state = self.farms[recipient_app].copy()
-
-        # ensure we have remaining blocks to pay out in this farm
-        # if not, delete farm state and return
-        if state.remaining_duration_blocks == 0:
-            del self.farms[recipient_app]
-            # TODO Emit event?
-            log("expired")
-            return
-
         # ensure our block is after the last block we have paid
-        custom.ensure(block_round > state.last_block_paid, S("ERR:PAST"))
+        custom.ensure(block_round > last_block_paid, S("ERR:PAST"))
 
         # ensure app escrow produced the block
         custom.ensure(
@@ -478,9 +814,35 @@ class DualstakeFarm(
             S("ERR:NOT BLK PROP"),
         )
 
-        # track spent txn costs to subtract from global
-        txn_fuel_spent = UInt64(0)
+    @subroutine
+    def is_block_payable(
+        self, recipient_app: Application, block_round: UInt64, last_block_paid: UInt64
+    ) -> bool:
+        """
+        Non-failing variant of ensure_block_proposer.
+        Rounds outside the accessible block range are not payable.
+        """
+        if block_round <= last_block_paid:
+            return False
+        if not round_time.is_accessible(block_round):
+            return False
+        return op.Block.blk_proposer(block_round) == recipient_app.address
 
+    @subroutine
+    def pay_farm_blocks(
+        self,
+        recipient_app: Application,
+        farm: FarmBox,
+        num_blocks: UInt64,
+        last_block_round: UInt64,
+        call_swap: bool,  # noqa: FBT001
+    ) -> None:
+        """
+        Pay out num_blocks verified blocks of a farm in one go:
+        optional swap and one aggregated axfer. Box state is updated once,
+        with farm.pending_blocks still recorded but unpaid afterwards.
+        IX rewards and global accounting are left to the caller.
+        """
         # call swap if needed
         if call_swap:
             abi_call(
@@ -489,37 +851,301 @@ class DualstakeFarm(
                 fee=Global.min_txn_fee,
             )
 
-        # subtract txn fuel regardless of call swap or not
-        txn_fuel_spent = txn_fuel_spent + Global.min_txn_fee
-
         # pay out reward
+        amount = farm.amount_per_block.as_uint64() * num_blocks
         send.axfer(
-            Asset(state.farm_asset.native),
+            Asset(farm.farm_asset.as_uint64()),
             recipient_app.address,
-            state.amount_per_block.native,
+            amount,
             Global.min_txn_fee,
         )
-        txn_fuel_spent = txn_fuel_spent + Global.min_txn_fee
-
-        # send ix reward
-        send.algo_pay(Txn.sender, self.get_ix_rewards_per_block(), Global.min_txn_fee)
-        txn_fuel_spent = (
-            txn_fuel_spent + Global.min_txn_fee + self.get_ix_rewards_per_block()
+        arc4.emit(
+            FarmPayout(
+                recipient_app=arc4.UInt64(recipient_app.id),
+                block_round=arc4.UInt64(last_block_round),
+                num_blocks=arc4.UInt64(num_blocks),
+                amount=arc4.UInt64(amount),
+                keeper=arc4.Address(Txn.sender),
+            )
         )
 
         # update box state
-        state.last_block_paid = arc4.UInt64(block_round)
-        state.remaining_duration_blocks = arc4.UInt64(
-            state.remaining_duration_blocks.native - UInt64(1)
+        new_farm = farm.copy()
+        new_farm.last_block_paid = self.to_u32(last_block_round)
+        new_farm.remaining_duration_blocks = arc4.UInt32(
+            farm.remaining_duration_blocks.as_uint64() - num_blocks
         )
-        if state.remaining_duration_blocks == 0:
-            del self.farms[recipient_app]
+        if new_farm.remaining_duration_blocks == 0:
+            self.delete_farm(recipient_app, new_farm)
         else:
-            self.farms[recipient_app] = state.copy()
+            self.store_farm(recipient_app, new_farm)
+
+    @subroutine
+    def accrue_ix_rewards(self, amount: UInt64) -> None:
+        # credit the caller the ix reward for the blocks proven in this call.
+        # moves it from txn fuel to ix_accrued once the blocks are accounted for
+        accrued, exists = self.ix_rewards.maybe(Txn.sender)
+        if not exists:
+            # the new box MBR is funded from this reward
+            custom.ensure(amount >= IX_REWARDS_BOX_MBR, S("ERR:IX MBR"))
+            amount -= IX_REWARDS_BOX_MBR
+        self.ix_rewards[Txn.sender] = accrued + amount
+        self.ix_accrued.value = self.ix_accrued.get(UInt64(0)) + amount
+
+    @subroutine
+    def fund_blocks(self, num_blocks: UInt64) -> None:
+        """
+        Count blocks added to global_remaining_blocks. Apps updated in place
+        start counting from the blocks remaining at their first funding.
+        """
+        self.blocks_funded.value = (
+            self.blocks_funded.get(self.global_remaining_blocks) + num_blocks
+        )
 
+    @subroutine
+    def account_paid_blocks(self, num_blocks: UInt64, prepaid: UInt64) -> None:
         # update global txn fuel state
-        self.txn_fuel = self.txn_fuel - txn_fuel_spent
-        self.global_remaining_blocks = self.global_remaining_blocks - 1
+        # subtract the txn fuel reserved per block regardless of call swap or not.
+        # batched payouts send fewer inner txns, the difference stays with the platform.
+        # prepaid IX rewards left txn fuel when the blocks were recorded
+        self.txn_fuel = (
+            self.txn_fuel + prepaid - self.get_spend_per_block() * num_blocks
+        )
+        self.global_remaining_blocks = self.global_remaining_blocks - num_blocks
+
+    @abimethod()
+    def payout(
+        self, recipient_app: Application, block_round: UInt64, call_swap: arc4.Bool
+    ) -> None:
+        # ensure farm exists
+        custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
+
+        # load farm state
+        farm = self.load_farm(recipient_app)
+
+        # ensure we have remaining blocks to pay out in this farm
+        # if not, delete farm state and return
+        if farm.remaining_duration_blocks == 0:
+            self.delete_farm(recipient_app, farm)
+            return
+
+        # recorded blocks already claim their share of the remaining blocks
+        custom.ensure(
+            farm.pending_blocks.as_uint64()
+            < farm.remaining_duration_blocks.as_uint64(),
+            S("ERR:BLKS"),
+        )
+
+        self.ensure_block_proposer(
+            recipient_app, block_round, farm.last_block_paid.as_uint64()
+        )
+
+        self.pay_farm_blocks(
+            recipient_app, farm, UInt64(1), block_round, call_swap.native
+        )
+        self.accrue_ix_rewards(self.get_ix_rewards_per_block())
+        self.account_paid_blocks(UInt64(1), UInt64(0))
+
+    @abimethod()
+    def payout_many(
+        self,
+        recipient_app: Application,
+        block_rounds: arc4.DynamicArray[arc4.UInt64],
+        call_swap: arc4.Bool,
+    ) -> None:
+        """
+        Pay out several blocks proposed by the same farmed escrow in one app call.
+        block_rounds must be strictly ascending and after the last paid block.
+        """
+        # ensure farm exists
+        custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
+
+        # load farm state
+        farm = self.load_farm(recipient_app)
+
+        if farm.remaining_duration_blocks == 0:
+            self.delete_farm(recipient_app, farm)
+            return
+
+        num_blocks = block_rounds.length
+        custom.ensure(num_blocks > 0, S("ERR:NO BLKS"))
+        custom.ensure(
+            farm.pending_blocks.as_uint64() + num_blocks
+            <= farm.remaining_duration_blocks.as_uint64(),
+            S("ERR:BLKS"),
+        )
+
+        # verify every proposer in one pass. each round must be after the previous one
+        last_block_round = farm.last_block_paid.as_uint64()
+        for block_round in block_rounds:
+            self.ensure_block_proposer(
+                recipient_app, block_round.as_uint64(), last_block_round
+            )
+            last_block_round = block_round.as_uint64()
+
+        self.pay_farm_blocks(
+            recipient_app, farm, num_blocks, last_block_round, call_swap.native
+        )
+        self.accrue_ix_rewards(self.get_ix_rewards_per_block() * num_blocks)
+        self.account_paid_blocks(num_blocks, UInt64(0))
+
+    @abimethod()
+    def payout_batch(
+        self, items: arc4.DynamicArray[PayoutItem], call_swap: arc4.Bool
+    ) -> arc4.UInt64:
+        """
+        Pay out (recipient_app, block_round) items across many farms in one app call.
+        Items that can not be paid are logged as SKIP and do not fail the call.
+        Consecutive items of the same farm share one box read/write, swap and axfer;
+        IX rewards and global accounting are done once for the whole batch.
+        Returns the number of blocks paid.
+        """
+        total_blocks = UInt64(0)
+
+        # farm currently being accumulated
+        app_id = UInt64(0)
+        exists = False
+        farm = FarmBox(
+            farm_asset=arc4.UInt64(0),
+            amount_per_block=arc4.UInt64(0),
+            remaining_duration_blocks=arc4.UInt32(0),
+            last_block_paid=arc4.UInt32(0),
+            pending_blocks=arc4.UInt16(0),
+        )
+        num_blocks = UInt64(0)
+        last_block_round = UInt64(0)
+
+        for i in urange(items.length):
+            item = items[i].copy()
+            if item.recipient_app.as_uint64() != app_id:
+                # flush previous farm before switching
+                if num_blocks > 0:
+                    self.pay_farm_blocks(
+                        Application(app_id),
+                        farm,
+                        num_blocks,
+                        last_block_round,
+                        call_swap.native,
+                    )
+                    total_blocks += num_blocks
+
+                app_id = item.recipient_app.as_uint64()
+                num_blocks = UInt64(0)
+                exists = Application(app_id) in self.farms
+                if exists:
+                    farm = self.load_farm(Application(app_id))
+                    last_block_round = farm.last_block_paid.as_uint64()
+                    if farm.remaining_duration_blocks == 0:
+                        self.delete_farm(Application(app_id), farm)
+                        exists = False
+
+            if (
+                exists
+                and farm.pending_blocks.as_uint64() + num_blocks
+                < farm.remaining_duration_blocks.as_uint64()
+                and self.is_block_payable(
+                    Application(app_id), item.block_round.as_uint64(), last_block_round
+                )
+            ):
+                num_blocks += 1
+                last_block_round = item.block_round.as_uint64()
+            else:
+                log(b"SKIP", item)
+
+        if num_blocks > 0:
+            self.pay_farm_blocks(
+                Application(app_id),
+                farm,
+                num_blocks,
+                last_block_round,
+                call_swap.native,
+            )
+            total_blocks += num_blocks
+
+        if total_blocks > 0:
+            self.accrue_ix_rewards(self.get_ix_rewards_per_block() * total_blocks)
+            self.account_paid_blocks(total_blocks, UInt64(0))
+
+        return arc4.UInt64(total_blocks)
+
+    @abimethod()
+    def record_proposals(
+        self,
+        recipient_app: Application,
+        block_rounds: arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        """
+        Prove blocks proposed by a farmed escrow while they are still accessible,
+        without paying them. Sends no inner transactions: the blocks become
+        pending and are paid by settle. The caller earns RECORD_IX_REWARDS_SHARE
+        percent of their IX rewards now.
+        block_rounds must be strictly ascending and after the last paid block.
+        """
+        custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
+
+        farm = self.load_farm(recipient_app)
+        pending = farm.pending_blocks.as_uint64() + block_rounds.length
+        num_blocks = block_rounds.length
+        custom.ensure(num_blocks > 0, S("ERR:NO BLKS"))
+        custom.ensure(
+            pending <= farm.remaining_duration_blocks.as_uint64(),
+            S("ERR:BLKS"),
+        )
+        custom.ensure(pending <= UInt64(MAX_UINT16), S("ERR:PEND"))
+
+        last_block_round = farm.last_block_paid.as_uint64()
+        for block_round in block_rounds:
+            self.ensure_block_proposer(
+                recipient_app, block_round.as_uint64(), last_block_round
+            )
+            last_block_round = block_round.as_uint64()
+
+        farm.last_block_paid = self.to_u32(last_block_round)
+        farm.pending_blocks = arc4.UInt16(pending)
+        self.store_farm(recipient_app, farm)
+
+        amount = self.get_record_ix_rewards_per_block() * num_blocks
+        self.accrue_ix_rewards(amount)
+        self.txn_fuel = self.txn_fuel - amount
+        self.ix_recorded_blocks.value = (
+            self.ix_recorded_blocks.get(UInt64(0)) + num_blocks
+        )
+
+        arc4.emit(
+            FarmProposalsRecorded(
+                recipient_app=arc4.UInt64(recipient_app.id),
+                block_round=arc4.UInt64(last_block_round),
+                num_blocks=arc4.UInt64(num_blocks),
+                pending_blocks=arc4.UInt64(pending),
+                keeper=arc4.Address(Txn.sender),
+            )
+        )
+
+    @abimethod()
+    def settle(self, recipient_app: Application, call_swap: arc4.Bool) -> None:
+        """
+        Pay all pending blocks of a farm in one go. The part of their IX rewards
+        record_proposals did not accrue goes to the caller. Open to anyone, at
+        any time after the blocks were recorded.
+        """
+        custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
+
+        farm = self.load_farm(recipient_app)
+        pending = farm.pending_blocks.as_uint64()
+        custom.ensure(pending > 0, S("ERR:NO PEND"))
+
+        farm.pending_blocks = arc4.UInt16(0)
+        self.pay_farm_blocks(
+            recipient_app,
+            farm,
+            pending,
+            farm.last_block_paid.as_uint64(),
+            call_swap.native,
+        )
+        prepaid = self.get_record_ix_rewards_per_block() * pending
+        self.accrue_ix_rewards(self.get_ix_rewards_per_block() * pending - prepaid)
+        self.ix_recorded_blocks.value = self.ix_recorded_blocks.get(UInt64(0)) - pending
+        self.account_paid_blocks(pending, prepaid)
 
     @abimethod
     def noop(self) -> None:
@@ -528,11 +1154,9 @@ class DualstakeFarm(
     @abimethod
     def withdraw_fees(self, amount: UInt64) -> None:
         self.ensure_manager_caller()
-        locked_balance = Global.current_application_address.min_balance + (
-            self.global_remaining_blocks * self.get_spend_per_block()
-        )
         custom.ensure(
-            locked_balance + amount <= Global.current_application_address.balance,
+            self.get_locked_balance() + amount
+            <= Global.current_application_address.balance,
             S("ERR:OVER"),
         )
         send.algo_pay(
@@ -540,6 +1164,36 @@ class DualstakeFarm(
             amount,
             UInt64(0),
         )
+        arc4.emit(
+            FeesWithdrawn(amount=arc4.UInt64(amount), receiver=arc4.Address(Txn.sender))
+        )
+
+    @abimethod
+    def claim_ix_rewards(self) -> UInt64:
+        """
+        Pay the caller all IX rewards its payouts accrued, in one transaction,
+        plus the MBR of its rewards box which is deleted.
+        The inner payment fee is covered by the caller. Returns the amount paid.
+        """
+        accrued, exists = self.ix_rewards.maybe(Txn.sender)
+        custom.ensure(exists, S("ERR:NO RWD"))
+        del self.ix_rewards[Txn.sender]
+        self.ix_accrued.value = self.ix_accrued.get(UInt64(0)) - accrued
+
+        amount = accrued + IX_REWARDS_BOX_MBR
+        send.algo_pay(Txn.sender, amount, UInt64(0))
+        arc4.emit(
+            IXRewardsClaimed(
+                amount=arc4.UInt64(amount), keeper=arc4.Address(Txn.sender)
+            )
+        )
+        return amount
+
+    @abimethod(readonly=True)
+    def get_ix_rewards(self, keeper: Account) -> UInt64:
+        """Amount claim_ix_rewards would pay keeper"""
+        accrued, exists = self.ix_rewards.maybe(keeper)
+        return accrued + IX_REWARDS_BOX_MBR if exists else UInt64(0)
 
     @abimethod
     def optout(self, asset: Asset) -> None:
@@ -564,22 +1218,66 @@ class DualstakeFarm(
 
     @abimethod(readonly=True)
     def get_state(self, recipient_app: Application) -> FarmState:
-        return self.farms[recipient_app]
+        return self.farm_state(self.load_farm(recipient_app))
+
+    @abimethod(readonly=True)
+    def get_pending_blocks(self, recipient_app: Application) -> UInt64:
+        custom.ensure(recipient_app in self.farms, S("ERR:NO FARM"))
+        return self.load_farm(recipient_app).pending_blocks.as_uint64()
+
+    @abimethod(readonly=True)
+    def get_global_snapshot(self) -> GlobalSnapshot:
+        """Counters, fee parameters, round time and online stake in one read"""
+        return GlobalSnapshot(
+            round_=arc4.UInt64(Global.round),
+            balance=arc4.UInt64(Global.current_application_address.balance),
+            locked_balance=arc4.UInt64(self.get_locked_balance()),
+            txn_fuel=arc4.UInt64(self.txn_fuel),
+            global_remaining_blocks=arc4.UInt64(self.global_remaining_blocks),
+            ix_accrued=arc4.UInt64(self.ix_accrued.get(UInt64(0))),
+            # farms from before the counters existed are not counted
+            active_farms=arc4.UInt64(
+                math.safe_subtract(
+                    self.farms_created.get(UInt64(0)),
+                    self.farms_expired.get(UInt64(0)),
+                    UInt64(0),
+                )
+            ),
+            blocks_paid=arc4.UInt64(
+                self.blocks_funded.get(self.global_remaining_blocks)
+                - self.global_remaining_blocks
+            ),
+            farms_created=arc4.UInt64(self.farms_created.get(UInt64(0))),
+            farms_extended=arc4.UInt64(self.farms_extended.get(UInt64(0))),
+            farms_expired=arc4.UInt64(self.farms_expired.get(UInt64(0))),
+            ix_pb=arc4.UInt64(self.ix_pb),
+            plat_fee_pb=arc4.UInt64(self.plat_fee_pb),
+            txn_fee_pb=arc4.UInt64(self.txn_fee_pb),
+            max_duration_days=arc4.UInt64(self.max_duration_days),
+            min_duration_blocks=arc4.UInt64(self.min_duration_blocks),
+            avg_round_time=arc4.UInt64(self.get_avg_round_time()),
+            avg_block_payout=arc4.UInt64(self.avg_block_payout.get(UInt64(0))),
+            online_stake=arc4.UInt64(op.online_stake()),
+        )
 
     @abimethod(readonly=True)
     def log_states(self, box_names: arc4.DynamicArray[arc4.UInt64]) -> None:
+        """
+        Log each farm box as stored: a FarmBox, a legacy FarmState, or nothing
+        for app ids without a farm. The box length tells the layouts apart.
+        """
         for k in urange(box_names.length):
-            box_name = Application(box_names[k].native)
-            if box_name in self.farms:
-                log(self.farms[box_name])
-            else:
-                log(FarmState.from_bytes(b""))
+            # farm box keys are the 8 byte app id, as the arc4.UInt64 encodes it
+            data, _exists = op.Box.get(box_names[k].bytes)
+            log(data)
 
     @subroutine
-    def _get_state_and_apr(self, app_id: UInt64) -> FarmStateAndAPR:
+    def _get_state_and_apr(
+        self, app_id: UInt64, override_farm_amount: UInt64, ctx: APRContext
+    ) -> FarmStateAndAPR:
         box_name = Application(app_id)
         state = (
-            self.farms[box_name]
+            self.farm_state(self.load_farm(box_name))
             if box_name in self.farms
             else FarmState(
                 farm_asset=arc4.UInt64(0),
@@ -588,7 +1286,9 @@ class DualstakeFarm(
                 remaining_duration_blocks=arc4.UInt64(0),
             )
         )
-        apr = self._project_apr(Application(app_id), UInt64(9000000))
+        apr = self._project_apr_in_context(
+            box_name, state.amount_per_block.as_uint64(), override_farm_amount, ctx
+        )
         return FarmStateAndAPR(
             balance=apr.balance,
             staked=apr.staked,
@@ -612,18 +1312,154 @@ class DualstakeFarm(
 
     @abimethod(readonly=True)
     def get_state_and_apr(self, app_id: arc4.UInt64) -> FarmStateAndAPR:
-        return self._get_state_and_apr(app_id.native)
+        return self._get_state_and_apr(
+            app_id.as_uint64(),
+            UInt64(DEFAULT_OVERRIDE_FARM_AMOUNT),
+            self.get_apr_context(),
+        )
+
+    @subroutine
+    def _log_states_and_aprs(
+        self, app_ids: arc4.DynamicArray[arc4.UInt64], override_farm_amount: UInt64
+    ) -> None:
+        # chain wide inputs are computed once, the loop only does per farm work
+        ctx = self.get_apr_context()
+        for app_id in app_ids:
+            log(self._get_state_and_apr(app_id.as_uint64(), override_farm_amount, ctx))
 
     @abimethod(readonly=True)
     def log_states_and_aprs(self, app_ids: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for k in urange(app_ids.length):
-            log(self._get_state_and_apr(app_ids[k].native))
+        self._log_states_and_aprs(app_ids, UInt64(DEFAULT_OVERRIDE_FARM_AMOUNT))
+
+    @abimethod(readonly=True)
+    def log_states_and_aprs_override(
+        self,
+        app_ids: arc4.DynamicArray[arc4.UInt64],
+        override_farm_amount: UInt64,
+    ) -> None:
+        """
+        log_states_and_aprs with a caller chosen override amount.
+        0 skips override pricing entirely.
+        """
+        self._log_states_and_aprs(app_ids, override_farm_amount)
 
     @abimethod(readonly=True)
     def log_block_proposers(self, start_round: UInt64, end_round: UInt64) -> None:
         for rnd in urange(start_round, end_round + 1):
             log(op.Block.blk_proposer(rnd))
 
+    @abimethod(readonly=True)
+    def log_farm_proposals(
+        self,
+        app_ids: arc4.DynamicArray[arc4.UInt64],
+        start_round: UInt64,
+        end_round: UInt64,
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Scan start_round..end_round for blocks proposed by the escrows of app_ids.
+        Logs a ProposalMatch (round, index into app_ids) per matching block
+        and returns the number of proposals per app.
+        """
+        escrows = Bytes()
+        counts = arc4.DynamicArray[arc4.UInt64]()
+        for app_id in app_ids:
+            escrows += Application(app_id.as_uint64()).address.bytes
+            counts.append(arc4.UInt64(0))
+
+        for rnd in urange(start_round, end_round + 1):
+            proposer = op.Block.blk_proposer(rnd).bytes
+            for idx in urange(app_ids.length):
+                if op.extract(escrows, idx * UInt64(32), UInt64(32)) == proposer:
+                    log(
+                        ProposalMatch(
+                            block_round=arc4.UInt64(rnd), app_index=arc4.UInt16(idx)
+                        )
+                    )
+                    counts[idx] = arc4.UInt64(counts[idx].as_uint64() + UInt64(1))
+                    break
+
+        return counts
+
+    @subroutine
+    def load_farm(self, recipient_app: Application) -> FarmBox:
+        """
+        Decode a farm box. Legacy boxes convert to the compact layout,
+        with nothing pending, and are rewritten on the next store.
+        """
+        data = self.farms[recipient_app]
+        if data.length != UInt64(LEGACY_FARM_BOX_SIZE):
+            return FarmBox.from_bytes(data)
+
+        state = FarmState.from_bytes(data)
+        return FarmBox(
+            farm_asset=state.farm_asset,
+            amount_per_block=state.amount_per_block,
+            remaining_duration_blocks=self.to_u32(
+                state.remaining_duration_blocks.as_uint64()
+            ),
+            last_block_paid=self.to_u32(state.last_block_paid.as_uint64()),
+            pending_blocks=arc4.UInt16(0),
+        )
+
+    @subroutine
+    def farm_state(self, farm: FarmBox) -> FarmState:
+        return FarmState(
+            farm_asset=farm.farm_asset,
+            amount_per_block=farm.amount_per_block,
+            remaining_duration_blocks=arc4.UInt64(
+                farm.remaining_duration_blocks.as_uint64()
+            ),
+            last_block_paid=arc4.UInt64(farm.last_block_paid.as_uint64()),
+        )
+
+    @subroutine
+    def store_farm(self, recipient_app: Application, farm: FarmBox) -> None:
+        """Encode a farm box in the compact layout, rewriting legacy boxes"""
+        custom.ensure(
+            farm.pending_blocks.as_uint64()
+            <= farm.remaining_duration_blocks.as_uint64(),
+            S("ERR:BLKS"),
+        )
+        data = farm.bytes
+        # box_put can not change the size of an existing box
+        length, exists = op.Box.length(op.itob(recipient_app.id))
+        if exists and length != data.length:
+            del self.farms[recipient_app]
+        self.farms[recipient_app] = data
+
+    @subroutine
+    def delete_farm(self, recipient_app: Application, farm: FarmBox) -> None:
+        """Remove a finished farm. Every farm deletion is reported as FarmExpired"""
+        del self.farms[recipient_app]
+        self.farms_expired.value = self.farms_expired.get(UInt64(0)) + 1
+        arc4.emit(
+            FarmExpired(
+                recipient_app=arc4.UInt64(recipient_app.id),
+                farm_asset=farm.farm_asset,
+            )
+        )
+
+    @subroutine
+    def to_u32(self, value: UInt64) -> arc4.UInt32:
+        # arc4.UInt32 truncates silently
+        custom.ensure(value <= UInt64(MAX_UINT32), S("ERR:U32"))
+        return arc4.UInt32(value)
+
+    @subroutine
+    def get_locked_balance(self) -> UInt64:
+        """
+        Balance backing MBR, the fees of all blocks left to pay and the IX
+        rewards keepers have not claimed. Recorded blocks already moved their
+        record share of the IX reward to ix_accrued
+        """
+        return (
+            Global.current_application_address.min_balance
+            + self.global_remaining_blocks * self.get_spend_per_block()
+            + self.ix_accrued.get(UInt64(0))
+            - self.ix_recorded_blocks.get(UInt64(0))
+            * self.get_record_ix_rewards_per_block()
+        )
+
     @subroutine
     def ensure_manager_caller(self) -> None:
         custom.ensure(Txn.sender == self.manager, S("ERR:UNAUTH"))
@@ -644,6 +1480,10 @@ class DualstakeFarm(
     def get_ix_rewards_per_block(self) -> UInt64:
         return self.ix_pb * Global.min_txn_fee
 
+    @subroutine
+    def get_record_ix_rewards_per_block(self) -> UInt64:
+        return self.get_ix_rewards_per_block() * RECORD_IX_REWARDS_SHARE // 100
+
     @subroutine
     def get_platform_fee_per_block(self) -> UInt64:
         return self.plat_fee_pb * Global.min_txn_fee
@@ -0,0 +1,34 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks import compare
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_mock_run_matches_the_committed_baseline() -> None:
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks", "check", "--mock"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "REGRESSION" not in result.stdout
+    baseline = json.loads((ROOT / "benchmarks" / "baseline.mock.json").read_text())
+    assert {"payout[swap=False]", "payout_many[k=16]"} <= set(baseline)
+    # the mock only prices calls, it does not run them
+    assert all(list(metrics) == ["opcode_cost"] for metrics in baseline.values())
+
+
+def test_compare_flags_metrics_above_the_tolerance() -> None:
+    baseline = {"a": {"opcode_cost": 1000, "log_bytes": 10}, "b": {"opcode_cost": 5}}
+    current = {"a": {"opcode_cost": 1020, "log_bytes": 11}, "c": {"opcode_cost": 5}}
+    regressions, missing = compare(baseline, current, tolerance=0.02)
+    assert [(r.scenario, r.metric, r.baseline, r.current) for r in regressions] == [
+        ("a", "log_bytes", 10, 11)
+    ]
+    assert missing == ["b", "c"]
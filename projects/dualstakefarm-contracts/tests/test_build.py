@@ -0,0 +1,90 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import build as build_module
+from smart_contracts._helpers.build import build, smart_contracts_path
+
+contract_path = smart_contracts_path / "dualstakefarm" / "contract.py"
+
+
+class FakeAlgokit:
+    """Stands in for `algokit compile` and `algokit generate client`."""
+
+    def __init__(self) -> None:
+        self.commands: list[list[str]] = []
+
+    def __call__(
+        self, args: list[object], **kwargs: object
+    ) -> subprocess.CompletedProcess[str]:
+        command = [str(arg) for arg in args]
+        self.commands.append(command)
+        if command[1:4] == ["--no-color", "compile", "python"]:
+            if command[4] == "--version":
+                return subprocess.CompletedProcess(args, 0, "puyapy 4.3.3\n")
+            out_dir = Path(command[5].removeprefix("--out-dir="))
+            (out_dir / "Farm.arc32.json").write_text("{}")
+            (out_dir / "Farm.approval.teal").write_text(
+                "main:\n    int 1\n    return\n"
+            )
+            (out_dir / "Farm.clear.teal").write_text("main:\n    int 1\n    return\n")
+        elif command[1:3] == ["generate", "client"]:
+            Path(command[-1]).write_text("")
+        return subprocess.CompletedProcess(args, 0, "")
+
+    @property
+    def builds(self) -> int:
+        return sum("--output-arc32" in command for command in self.commands)
+
+
+@pytest.fixture
+def algokit(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FakeAlgokit:
+    fake = FakeAlgokit()
+    monkeypatch.setattr(build_module.subprocess, "run", fake)
+    monkeypatch.setattr(build_module, "cache_path", tmp_path / "build-cache")
+    monkeypatch.setattr(build_module, "_compiler_version", None)
+    return fake
+
+
+def test_unchanged_tree_is_skipped(algokit: FakeAlgokit, tmp_path: Path) -> None:
+    output_dir = tmp_path / "artifacts"
+    app_spec = build(output_dir, contract_path)
+    assert app_spec == output_dir / "Farm.arc32.json"
+    assert (output_dir / "Farm.cost.json").exists()
+
+    assert build(output_dir, contract_path) == app_spec
+    assert algokit.builds == 1
+
+
+def test_force_rebuilds(algokit: FakeAlgokit, tmp_path: Path) -> None:
+    output_dir = tmp_path / "artifacts"
+    build(output_dir, contract_path)
+    build(output_dir, contract_path, force=True)
+    assert algokit.builds == 2
+
+
+def test_missing_artifacts_are_rebuilt(algokit: FakeAlgokit, tmp_path: Path) -> None:
+    output_dir = tmp_path / "artifacts"
+    build(output_dir, contract_path)
+    (output_dir / "Farm.cost.json").unlink()
+    build(output_dir, contract_path)
+    assert algokit.builds == 2
+
+
+def test_compiler_version_is_resolved_once(
+    algokit: FakeAlgokit, tmp_path: Path
+) -> None:
+    output_dir = tmp_path / "artifacts"
+    for _ in range(3):
+        build(output_dir, contract_path)
+    assert sum("--version" in command for command in algokit.commands) == 1
+
+
+def test_compiler_version_change_rebuilds(algokit: FakeAlgokit, tmp_path: Path) -> None:
+    output_dir = tmp_path / "artifacts"
+    build(output_dir, contract_path, version="puyapy 4.3.3")
+    build(output_dir, contract_path, version="puyapy 4.4.0")
+    assert algokit.builds == 2
+    # a version passed in by main() never spawns the compiler to ask for it
+    assert not any("--version" in command for command in algokit.commands)
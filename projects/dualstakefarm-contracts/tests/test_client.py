@@ -0,0 +1,215 @@
+import asyncio
+import json
+import socket
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from typing import Any
+
+import pytest
+from algosdk import account
+from algosdk.abi import Method
+
+from client import (
+    AlgodError,
+    AlgodPool,
+    AppSpec,
+    CallLimits,
+    DualstakeFarmClient,
+    Endpoint,
+    SimulateError,
+    chunk_size,
+    rounds_to_expiry,
+)
+from client.client import LOG_STATES_COST
+from client.spec import DEFAULT_APP_SPEC
+from keeper.farms import decode_farm_box
+from simulation.mock_algod import FARM_APP_ID, MockAlgod, farm_network, serve
+
+FARMS = 8
+UNKNOWN_APP_ID = 1
+
+
+@pytest.fixture(scope="module")
+def mock() -> MockAlgod:
+    return farm_network(seed=1, farms=FARMS)
+
+
+@pytest.fixture(scope="module")
+def url(mock: MockAlgod) -> Iterator[str]:
+    with serve(mock, port=0) as url:
+        yield url
+
+
+def run(
+    pool: AlgodPool, scenario: Callable[[AlgodPool], Awaitable[Any]]
+) -> Any:  # noqa: ANN401
+    async def with_pool() -> Any:  # noqa: ANN401
+        async with pool:
+            return await scenario(pool)
+
+    return asyncio.run(asyncio.wait_for(with_pool(), timeout=30))
+
+
+def make_client(pool: AlgodPool, **kwargs: Any) -> DualstakeFarmClient:
+    _, sender = account.generate_account()
+    return DualstakeFarmClient(pool, FARM_APP_ID, sender, **kwargs)
+
+
+def dead_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_spec_has_every_method_the_client_calls() -> None:
+    spec = AppSpec.load()
+    for name in [
+        "log_states",
+        "log_states_and_aprs",
+        "log_states_and_aprs_override",
+        "get_global_snapshot",
+        "get_algo_cost_and_max_duration",
+    ]:
+        spec.method(name)
+    for name in spec.costs:
+        spec.method(name)
+    assert spec.returns["get_state"].name == "FarmState"
+    assert spec.logged_struct("log_states_and_aprs_override").name == (
+        "FarmStateAndAPR"
+    )
+    assert spec.returns["get_global_snapshot"].name == "GlobalSnapshot"
+
+
+def test_chunk_sizes_come_from_the_build_cost_model() -> None:
+    spec = AppSpec.load()
+    cost_model = json.loads(
+        DEFAULT_APP_SPEC.with_name("DualstakeFarm.cost.json").read_text()
+    )
+    log_states = cost_model["methods"]["log_states"]
+    assert spec.costs["log_states"].base == log_states["cost"]
+
+    limits = CallLimits(extra_opcode_budget=2_000)
+    cost = spec.costs["log_states"]
+    size = chunk_size(limits, cost, 32)
+    assert cost.base + size * cost.per_item <= 700 + limits.extra_opcode_budget
+    assert cost.base + (size + 1) * cost.per_item > 700 + limits.extra_opcode_budget
+    assert size != chunk_size(limits, LOG_STATES_COST, 32)
+    # app args cap the chunk once the budget no longer does
+    assert chunk_size(CallLimits(), cost, 32) == (2048 - 6) // 8
+
+
+def test_get_states_over_the_mock_algod(mock: MockAlgod, url: str) -> None:
+    boxes = mock.apps[FARM_APP_ID].boxes
+
+    async def scenario(pool: AlgodPool) -> None:
+        client = make_client(pool, max_chunk_size=3)
+        app_ids = await client.farm_ids()
+        assert len(app_ids) == FARMS
+        assert app_ids == sorted(int.from_bytes(name) for name in boxes)
+
+        states = await client.get_states([*app_ids, UNKNOWN_APP_ID, app_ids[0]])
+        assert list(states) == app_ids
+        for app_id, state in states.items():
+            farm = decode_farm_box(app_id, boxes[app_id.to_bytes(8, "big")])
+            assert state._asdict() == {
+                "farm_asset": farm.farm_asset,
+                "amount_per_block": farm.amount_per_block,
+                "remaining_duration_blocks": farm.remaining_duration_blocks,
+                "last_block_paid": farm.last_block_paid,
+            }
+        assert await client.get_state(UNKNOWN_APP_ID) is None
+
+    run(AlgodPool([Endpoint(url)]), scenario)
+
+
+def test_active_farms_are_ordered_by_expected_expiry(url: str) -> None:
+    codec = AppSpec.load().logged_struct("log_states_and_aprs")
+
+    def state(staked: int, remaining: int) -> tuple[Any, ...]:
+        fields = dict.fromkeys(codec.tuple_type._fields, 0)
+        fields |= {
+            "staked": staked,
+            "online_stake": 10**15,
+            "remaining_duration_blocks": remaining,
+        }
+        return codec.tuple_type(**fields)
+
+    farms = {
+        11: state(0, 10),
+        12: state(10**12, 100),
+        13: state(10**13, 100),
+        14: state(10**12, 5),
+    }
+    assert rounds_to_expiry(farms[11]) is None
+    assert rounds_to_expiry(farms[12]) == 100_000
+
+    async def scenario(pool: AlgodPool) -> None:
+        client = make_client(pool)
+
+        async def refresh() -> dict[int, tuple[Any, ...]]:
+            return farms
+
+        client.refresh = refresh  # type: ignore[method-assign]
+        ordered = await client.get_active_farms()
+        assert [app_id for app_id, _ in ordered] == [14, 13, 12, 11]
+
+    run(AlgodPool([Endpoint(url)]), scenario)
+
+
+def test_chunks_are_halved_on_a_limit_failure(url: str) -> None:
+    async def scenario(pool: AlgodPool) -> None:
+        client = make_client(pool)
+        simulate = client.simulate
+        chunks = []
+
+        async def limited(
+            calls: Sequence[tuple[Method, list[Any]]],
+        ) -> list[dict[str, Any]]:
+            app_ids = calls[0][1][0]
+            chunks.append(len(app_ids))
+            if len(app_ids) > 2:
+                raise SimulateError("logic eval error: log size limit exceeded")
+            return await simulate(calls)
+
+        client.simulate = limited  # type: ignore[method-assign]
+        states = await client.get_states(await client.farm_ids())
+        assert len(states) == FARMS
+        assert chunks == [8, 4, 4, 2, 2, 2, 2]
+
+    run(AlgodPool([Endpoint(url)]), scenario)
+
+
+def test_other_simulate_failures_are_raised(url: str) -> None:
+    async def scenario(pool: AlgodPool) -> None:
+        client = make_client(pool)
+        # the mock does not price farms
+        with pytest.raises(SimulateError, match="is not simulated"):
+            await client.get_states_and_aprs(await client.farm_ids())
+
+    run(AlgodPool([Endpoint(url)]), scenario)
+
+
+def test_pool_fails_over_to_a_live_endpoint(url: str) -> None:
+    async def scenario(pool: AlgodPool) -> None:
+        params = await pool.suggested_params()
+        assert params.gen == "mocknet-v1"
+        # the failed endpoint goes last
+        assert [state.endpoint.url for state in pool._ordered()] == [url, dead]
+        assert await pool.box_names(FARM_APP_ID)
+
+    dead = dead_url()
+    run(AlgodPool([Endpoint(dead), Endpoint(url)]), scenario)
+
+
+def test_pool_raises_on_client_errors_and_dead_endpoints(url: str) -> None:
+    async def scenario(pool: AlgodPool) -> None:
+        with pytest.raises(AlgodError, match="404"):
+            await pool.box_names(UNKNOWN_APP_ID)
+
+    run(AlgodPool([Endpoint(url)]), scenario)
+
+    async def unreachable(pool: AlgodPool) -> None:
+        with pytest.raises(AlgodError, match="Every algod endpoint failed"):
+            await pool.suggested_params()
+
+    run(AlgodPool([Endpoint(dead_url())]), unreachable)
@@ -0,0 +1,228 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.cost_model import (
+    CostModel,
+    build_cost_model,
+    parse_teal,
+)
+from smart_contracts.dualstakefarm.contract import (
+    ORACLE_PAYOUT_STRIDE,
+    ORACLE_ROUND_WINDOW,
+)
+
+BUILT_COSTS = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "dualstakefarm"
+    / "DualstakeFarm.cost.json"
+)
+APP_CALL_BUDGET = 700
+
+
+def model(teal: str) -> CostModel:
+    return CostModel(parse_teal(teal))
+
+
+def test_parse_splits_blocks_at_labels_and_branches() -> None:
+    blocks = parse_teal("""
+#pragma version 11
+main:
+    int 1
+    bz skip
+    pushbytes "a b // c" // comment
+    log
+skip:
+    int 1
+    return
+""")
+    assert list(blocks) == ["main", "main~1", "skip"]
+    assert blocks["main"].targets == ["skip"]
+    assert blocks["main~1"].ops == [["pushbytes", '"a b // c"'], ["log"]]
+    assert blocks["skip"].is_exit
+
+
+def test_branches_take_the_most_expensive_path() -> None:
+    cost = model("""
+main:
+    int 1
+    bz cheap
+    int 2
+    sha256
+    pop
+    int 1
+    return
+cheap:
+    int 1
+    return
+""").subroutine("main")
+    # int + bz, then int + sha256 (35) + pop + int + return
+    assert cost.cost == 2 + 39
+    assert cost.inner_txns == 0
+    assert cost.loops == []
+
+
+def test_failing_paths_are_not_counted() -> None:
+    cost = model("""
+main:
+    int 1
+    bnz ok
+    sha256
+    err
+ok:
+    int 1
+    return
+""").subroutine("main")
+    assert cost.cost == 4
+
+
+def test_callsub_includes_callee_cost_and_inner_txns() -> None:
+    cost = model("""
+main:
+    callsub pay
+    callsub pay
+    int 1
+    return
+pay:
+    itxn_begin
+    itxn_submit
+    retsub
+""").subroutine("main")
+    assert cost.cost == 2 * (1 + 3) + 2
+    assert cost.inner_txns == 2
+    assert cost.calls == ["pay"]
+
+
+def test_loop_cost_per_iteration() -> None:
+    cost = model("""
+main:
+    int 0
+loop:
+    // contract.py:12
+    dup
+    int 3
+    <
+    bz done
+    int 1
+    +
+    b loop
+done:
+    return
+""").subroutine("main")
+    # the loop running zero times: int, the header and return
+    assert cost.cost == 1 + 4 + 1
+    [loop] = cost.loops
+    assert loop.header == "loop"
+    assert loop.source == "contract.py:12"
+    # header plus the body back to it
+    assert loop.cost_per_iteration == 4 + 3
+    assert loop.inner_txns_per_iteration == 0
+
+
+def test_callee_loops_are_listed_once() -> None:
+    cost = model("""
+main:
+    callsub first
+    callsub second
+    int 1
+    return
+first:
+    callsub scan
+    retsub
+second:
+    callsub scan
+    retsub
+scan:
+    int 0
+scan_top:
+    dup
+    bz scan_done
+    b scan_top
+scan_done:
+    retsub
+""").subroutine("main")
+    assert [loop.header for loop in cost.loops] == ["scan_top"]
+
+
+def test_method_cost_includes_routing() -> None:
+    cost_model = build_cost_model(
+        """
+main:
+    txn NumAppArgs
+    bz bare
+    pushbytes 0x01
+    txna ApplicationArgs 0
+    match main_foo_route@2
+    err
+main_foo_route@2:
+    callsub foo
+    int 1
+    return
+bare:
+    int 1
+    return
+foo:
+    retsub
+""",
+        "main:\n    int 1\n    return\n",
+    )
+    foo = cost_model["methods"]["foo"]
+    # routing (5 ops) and the route block with its callee (4 ops)
+    assert foo["cost"] == 9
+    assert foo["calls"] == ["foo"]
+    assert list(cost_model["subroutines"]) == ["foo"]
+    assert cost_model["clear"]["cost"] == 2
+
+
+def test_methods_inlined_into_the_router_keep_their_loops() -> None:
+    # puyapy 5 jumps from the router straight to the method body
+    cost_model = build_cost_model(
+        """
+main:
+    txn NumAppArgs
+    bz bare
+    pushbytes 0x01
+    txna ApplicationArgs 0
+    match foo
+    err
+bare:
+    int 1
+    return
+foo:
+    int 3
+foo_while_top@1:
+    dup
+    bz foo_after_while@2
+    int 1
+    -
+    b foo_while_top@1
+foo_after_while@2:
+    return
+""",
+        "main:\n    int 1\n    return\n",
+    )
+    foo = cost_model["methods"]["foo"]
+    # routing (5 ops), the method body (1 op) and the loop exit (3 ops)
+    assert foo["cost"] == 9
+    (loop,) = foo["loops"]
+    assert loop["header"] == "foo_while_top@1"
+    assert loop["cost_per_iteration"] == 5
+
+
+@pytest.mark.parametrize(
+    "method", ["payout", "payout_many", "record_proposals", "settle"]
+)
+def test_a_one_block_payout_fits_one_app_call(method: str) -> None:
+    cost = json.loads(BUILT_COSTS.read_text())["methods"][method]
+    one_block = sum(loop["cost_per_iteration"] for loop in cost["loops"])
+    assert cost["cost"] + one_block < APP_CALL_BUDGET
+
+
+def test_a_full_oracle_update_fits_one_app_call() -> None:
+    cost = json.loads(BUILT_COSTS.read_text())["methods"]["update_oracle"]
+    (samples,) = cost["loops"]
+    full_window = ORACLE_ROUND_WINDOW // ORACLE_PAYOUT_STRIDE
+    assert cost["cost"] + full_window * samples["cost_per_iteration"] < APP_CALL_BUDGET
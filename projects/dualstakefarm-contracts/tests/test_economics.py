@@ -0,0 +1,131 @@
+import pytest
+
+np = pytest.importorskip("numpy", reason="needs the analysis group")
+
+from hypothesis import given  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+
+from economics import model  # noqa: E402
+from economics.parity import check_parity  # noqa: E402
+
+u64s = st.integers(min_value=0, max_value=model.MAX_UINT64)
+positive_u64s = st.integers(min_value=1, max_value=model.MAX_UINT64)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_model_matches_the_contract(seed: int) -> None:
+    assert check_parity(300, seed) == []
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2**64],
+        [-1, 2**63],
+        [2**63, 1],
+        [np.int64(3), 2**70],
+        [[1, 2], [3, 2**65]],
+        np.arange(3, dtype=np.uint64),
+    ],
+)
+def test_ints_keeps_every_value_exact(values: object) -> None:
+    arr = model.ints(values)
+    assert arr.dtype == np.object_
+    # np.integer is not an int subclass
+    assert all(isinstance(value, int) for value in arr.flat)
+    assert arr.tolist() == np.asarray(values, dtype=np.object_).tolist()
+
+
+@pytest.mark.parametrize("values", [1.5, [1, 2.0], np.array([1.0]), ["1"]])
+def test_ints_rejects_non_integers(values: object) -> None:
+    with pytest.raises(TypeError):
+        model.ints(values)
+
+
+def test_scalars_give_0d_arrays() -> None:
+    assert model.get_tm2_net_amt(10000).shape == ()
+    assert model.get_tinyman_algo_price(0, 10**12, 10**9, 10**6).shape == ()
+    assert model.get_max_duration(10**12, 10**15, 28000).shape == ()
+
+
+@given(u64s)
+def test_tm2_net_amount(amount: int) -> None:
+    net = int(model.get_tm2_net_amt(amount))
+    assert net == amount - 30 * amount // 10000
+    assert net <= amount
+    if amount < model.MAX_UINT64:
+        assert net <= int(model.get_tm2_net_amt(amount + 1))
+
+
+@given(
+    st.sampled_from([0, 1]),
+    positive_u64s,
+    positive_u64s,
+    st.lists(u64s, min_size=1, max_size=8),
+)
+def test_price_broadcasts_like_scalars(
+    asset_1_id: int, a1: int, a2: int, amounts: list[int]
+) -> None:
+    def price(amount: int) -> int | None:
+        try:
+            return int(model.get_tinyman_algo_price(asset_1_id, a1, a2, amount))
+        except (OverflowError, ZeroDivisionError):
+            return None
+
+    scalars = [price(amount) for amount in amounts]
+    if None in scalars:
+        with pytest.raises((OverflowError, ZeroDivisionError)):
+            model.get_tinyman_algo_price(asset_1_id, a1, a2, amounts)
+    else:
+        prices = model.get_tinyman_algo_price(asset_1_id, a1, a2, amounts)
+        assert prices.tolist() == scalars
+
+
+@given(
+    positive_u64s,
+    positive_u64s,
+    st.integers(min_value=1, max_value=2**40),
+    st.integers(min_value=1, max_value=2**40),
+)
+def test_price_is_below_the_algo_reserves_and_monotonic(
+    algo_reserves: int, asset_reserves: int, amount: int, more: int
+) -> None:
+    # asset_1_id 0: asset_1 is ALGO
+    try:
+        low, high = model.get_tinyman_algo_price(
+            0, algo_reserves, asset_reserves, [amount, amount + more]
+        ).tolist()
+    except OverflowError:
+        return
+    assert 0 <= low <= high < algo_reserves
+
+
+@given(
+    duration=st.integers(min_value=0, max_value=10**7),
+    farm_exists=st.booleans(),
+    opted_in=st.booleans(),
+)
+def test_algo_cost_is_linear_in_duration(
+    duration: int, *, farm_exists: bool, opted_in: bool
+) -> None:
+    kwargs = {"farm_exists": farm_exists, "opted_in": opted_in}
+    one = model.calculate_algo_cost(1, **kwargs)
+    cost = model.calculate_algo_cost(duration, **kwargs)
+    assert cost.total_cost == cost.ix_cost + cost.txn_fee_cost + cost.platform_cost
+    assert cost.total_cost == duration * one.total_cost
+    assert cost.optin_cost == (0 if opted_in else model.ASSET_OPT_IN_MIN_BALANCE)
+    assert (cost.box_cost == 0) == farm_exists
+
+
+@given(
+    st.integers(min_value=0, max_value=10**16),
+    st.integers(min_value=10**15, max_value=10**16),
+    st.integers(min_value=20000, max_value=50000),
+)
+def test_max_duration_is_at_least_the_minimum_and_grows_with_the_balance(
+    balance: int, online_stake: int, avg_round_time: int
+) -> None:
+    max_duration = int(model.get_max_duration(balance, online_stake, avg_round_time))
+    assert max_duration >= model.DEFAULT_MIN_DURATION_BLOCKS
+    richer = model.get_max_duration(balance + 10**12, online_stake, avg_round_time)
+    assert max_duration <= int(richer)
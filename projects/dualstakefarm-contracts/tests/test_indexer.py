@@ -0,0 +1,128 @@
+import gzip
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from algosdk.logic import get_application_address
+
+from indexer import ArchiveStore, RoundGapError, ingest, iter_blocks, payout_counters
+from indexer.__main__ import main
+from indexer.dumps import dump_files
+from simulation.mock_algod import FARM_APP_ID, farm_network, serve
+
+APP_ID = 1234
+
+
+def write_dump(path: Path, rounds: range) -> Path:
+    lines = "".join(json.dumps({"rnd": rnd}) + "\n" for rnd in rounds)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".gz":
+        path.write_bytes(gzip.compress(lines.encode()))
+    else:
+        path.write_text(lines)
+    return path
+
+
+def test_dump_files_sort_by_round_not_name(tmp_path: Path) -> None:
+    write_dump(tmp_path / "10.jsonl", range(10, 12))
+    write_dump(tmp_path / "9.jsonl", range(9, 10))
+    write_dump(tmp_path / "older" / "blocks-2.jsonl.gz", range(2, 9))
+    (tmp_path / "notes.txt").write_text("")
+    assert [file.name for file in dump_files([tmp_path])] == [
+        "blocks-2.jsonl.gz",
+        "9.jsonl",
+        "10.jsonl",
+    ]
+    assert [block["rnd"] for block in iter_blocks([tmp_path])] == list(range(2, 12))
+
+
+def test_ingest_resumes_after_the_checkpoint(tmp_path: Path) -> None:
+    store = ArchiveStore(tmp_path / "store")
+    stats = ingest(
+        store, iter_blocks([write_dump(tmp_path / "1.jsonl", range(1, 5))]), APP_ID
+    )
+    assert (stats.blocks, store.last_round) == (4, 4)
+
+    store = ArchiveStore(tmp_path / "store")
+    dumps = [tmp_path / "1.jsonl", write_dump(tmp_path / "5.jsonl", range(5, 8))]
+    stats = ingest(store, iter_blocks(dumps), APP_ID)
+    assert (stats.skipped, stats.blocks, store.last_round) == (4, 3, 7)
+
+
+def test_ingest_raises_on_a_gap_after_committing(tmp_path: Path) -> None:
+    write_dump(tmp_path / "1.jsonl", range(1, 5))
+    write_dump(tmp_path / "6.jsonl", range(6, 8))
+    store = ArchiveStore(tmp_path / "store")
+    with pytest.raises(RoundGapError, match="round 6 follows 4"):
+        ingest(store, iter_blocks([tmp_path]), APP_ID)
+    assert ArchiveStore(tmp_path / "store").last_round == 4
+
+
+def test_ingest_raises_on_a_gap_after_the_checkpoint(tmp_path: Path) -> None:
+    store = ArchiveStore(tmp_path / "store")
+    ingest(
+        store,
+        iter_blocks([write_dump(tmp_path / "a" / "1.jsonl", range(1, 5))]),
+        APP_ID,
+    )
+    with pytest.raises(RoundGapError):
+        ingest(
+            store,
+            iter_blocks([write_dump(tmp_path / "b" / "9.jsonl", range(9, 10))]),
+            APP_ID,
+        )
+    assert store.last_round == 4
+
+
+def test_payout_counters_count_paid_farms_only(tmp_path: Path) -> None:
+    def call(
+        rnd: int, method: str, args: dict[str, Any], paid: list[int]
+    ) -> dict[str, Any]:
+        axfers = [
+            {"receiver": get_application_address(app), "amount": 1} for app in paid
+        ]
+        return {
+            "round": rnd,
+            "type": "call",
+            "method": method,
+            "args": args,
+            "axfers": axfers,
+        }
+
+    store = ArchiveStore(tmp_path / "store")
+    store.append(
+        10,
+        [
+            call(10, "payout", {"recipient_app": 5, "call_swap": True}, [5]),
+            call(10, "settle", {"recipient_app": 6, "call_swap": False}, [6]),
+        ],
+    )
+    batch = {"items": [[5, 11], [6, 11], [7, 11]], "call_swap": True}
+    store.append(12, [call(12, "payout_batch", batch, [5, 7])])
+    # failed to pay, and a call that never swaps
+    store.append(13, [call(13, "payout", {"recipient_app": 8, "call_swap": True}, [])])
+    store.append(14, [call(14, "record_proposals", {"recipient_app": 5}, [])])
+    store.commit(14)
+
+    counters = payout_counters(store)
+    assert (counters.last_payout_round, counters.swap_calls) == (12, 3)
+    assert payout_counters(store, max_round=10).swap_calls == 1
+
+
+def test_ingest_seeds_farms_from_the_app_boxes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mock = farm_network(seed=1, farms=3)
+    farms = {int.from_bytes(name) for name in mock.apps[FARM_APP_ID].boxes}
+    dump = write_dump(tmp_path / "1.jsonl", range(1, 3))
+    store = tmp_path / "store"
+    with serve(mock, port=0) as url:
+        monkeypatch.setenv("ALGOD_SERVERS", url)
+        args = ["--store", str(store), "--app-id", str(FARM_APP_ID), "--farm", "7"]
+        monkeypatch.setattr(
+            sys, "argv", ["indexer", "ingest", *args, "--farms-from-algod", str(dump)]
+        )
+        main()
+    assert ArchiveStore(store).farms == {7, *farms}
@@ -0,0 +1,180 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from keeper import Farm, Keeper, KeeperConfig, KeeperStats, LocalAlgod
+from keeper.pipeline import PayoutJob
+
+APP_ID = 5
+FARM_ID = 77
+OTHER = "A" * 58
+
+
+def run(coro: Coroutine[Any, Any, None]) -> None:
+    asyncio.run(asyncio.wait_for(coro, timeout=30))
+
+
+def make_keeper(algod: LocalAlgod, **config: Any) -> Keeper:
+    private_key, address = account.generate_account()
+    config = {
+        "call_swap": False,
+        "claim_threshold": 0,
+        "refresh_interval": 0.05,
+        "retry_base_delay": 0.01,
+        "inflight_delay": 0.01,
+        **config,
+    }
+    return Keeper(
+        algod,
+        KeeperConfig(app_id=APP_ID, **config),
+        address,
+        AccountTransactionSigner(private_key),
+    )
+
+
+def make_algod(**kwargs: Any) -> tuple[LocalAlgod, Farm]:
+    algod = LocalAlgod(APP_ID, start_round=1000, **kwargs)
+    farm = Farm(FARM_ID, 9, 10, 100, 1000)
+    algod.set_farm(farm)
+    return algod, farm
+
+
+async def drive(
+    algod: LocalAlgod, keeper: Keeper, proposers: list[str], settle: int = 10
+) -> KeeperStats:
+    """Run the keeper over rounds with the given proposers, then let it settle."""
+    task = asyncio.create_task(keeper.run())
+    await asyncio.sleep(0.02)
+    for proposer in proposers + [OTHER] * settle:
+        await algod.propose(proposer)
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.1)
+    keeper.stop()
+    return await task
+
+
+def test_pays_every_proposed_block() -> None:
+    async def scenario() -> None:
+        algod, farm = make_algod()
+        keeper = make_keeper(algod)
+        stats = await drive(algod, keeper, [farm.escrow, OTHER] * 10)
+        assert (stats.detected, stats.paid, stats.missed) == (10, 10, 0)
+        on_chain = algod.get_farm(FARM_ID)
+        assert on_chain is not None
+        assert on_chain.remaining_duration_blocks == 90
+        assert on_chain.last_block_paid == 1019
+        assert keeper.book.get(FARM_ID) == on_chain
+
+    run(scenario())
+
+
+def test_retries_rejected_groups() -> None:
+    async def scenario() -> None:
+        algod, farm = make_algod(fail_rate=0.3, seed=3)
+        keeper = make_keeper(algod)
+        stats = await drive(algod, keeper, [farm.escrow, OTHER] * 10, settle=20)
+        assert stats.retries
+        on_chain = algod.get_farm(FARM_ID)
+        assert on_chain is not None
+        # a retried round is forfeited once a later one of the farm got paid
+        assert on_chain.last_block_paid == 1019
+        assert stats.paid == 100 - on_chain.remaining_duration_blocks
+        assert keeper.book.get(FARM_ID) == on_chain
+
+    run(scenario())
+
+
+def test_records_near_the_deadline_then_settles() -> None:
+    async def scenario() -> None:
+        algod, farm = make_algod()
+        # every block is within the margin of its proof deadline
+        keeper = make_keeper(algod, record_margin=5000)
+        stats = await drive(algod, keeper, [farm.escrow, OTHER] * 5)
+        assert stats.paid == 0
+        assert stats.recorded == stats.settled == 5
+        on_chain = algod.get_farm(FARM_ID)
+        assert on_chain is not None
+        assert (on_chain.pending_blocks, on_chain.remaining_duration_blocks) == (0, 95)
+        assert keeper.book.get(FARM_ID) == on_chain
+
+    run(scenario())
+
+
+def test_book_follows_confirmation_not_submission() -> None:
+    async def scenario() -> None:
+        algod, farm = make_algod()
+        keeper = make_keeper(algod)
+        await keeper.refresh_farms()
+        block_round = await algod.propose(farm.escrow)
+        keeper.last_round = await algod.propose(OTHER)
+
+        submit = asyncio.create_task(keeper._submit([PayoutJob(FARM_ID, block_round)]))
+        while not algod.submitted:
+            await asyncio.sleep(0)
+        booked = keeper.book.get(FARM_ID)
+        assert booked is not None
+        assert booked.last_block_paid == 1000
+        assert not submit.done()
+
+        await algod.propose(OTHER)
+        await submit
+        assert booked.last_block_paid == block_round
+        assert booked.remaining_duration_blocks == 99
+
+    run(scenario())
+
+
+def test_pays_out_among_more_farms_than_a_group_can_reference() -> None:
+    async def scenario() -> None:
+        algod, farm = make_algod()
+        # 1000 farms: a 12 byte per farm registry would need 12 box refs
+        for app_id in range(FARM_ID + 1, FARM_ID + 1000):
+            algod.set_farm(Farm(app_id, 9, 10, 100, 1000))
+        keeper = make_keeper(algod)
+        await keeper.refresh_farms()
+        assert len(keeper.book) == 1000
+        block_round = await algod.propose(farm.escrow)
+        keeper.last_round = await algod.propose(OTHER)
+
+        submit = asyncio.create_task(keeper._submit([PayoutJob(FARM_ID, block_round)]))
+        while not algod.submitted:
+            await asyncio.sleep(0)
+        await algod.propose(OTHER)
+        await submit
+        assert keeper.stats.paid == 1
+        on_chain = algod.get_farm(FARM_ID)
+        assert on_chain is not None
+        assert on_chain.remaining_duration_blocks == 99
+
+    run(scenario())
+
+
+def test_batches_take_only_the_jobs_they_need() -> None:
+    async def scenario() -> None:
+        algod, _ = make_algod()
+        keeper = make_keeper(algod, max_rounds_per_call=3)
+        for app_id, block_round in [(1, 10), (1, 11), (1, 12), (1, 13), (2, 5)]:
+            await keeper._enqueue(PayoutJob(app_id, block_round))
+        # a job queued twice is queued once
+        await keeper._enqueue(PayoutJob(1, 12))
+
+        _, _, first = keeper.jobs.get_nowait()
+        assert keeper._unqueue(first)
+        assert (first.app_id, first.block_round) == (2, 5)
+        assert keeper._take_batch(first) == [first]
+
+        _, _, first = keeper.jobs.get_nowait()
+        assert keeper._unqueue(first)
+        batch = keeper._take_batch(first)
+        assert [job.block_round for job in batch] == [10, 11, 12]
+        assert list(keeper._queued) == [1]
+        assert list(keeper._queued[1]) == [13]
+
+        # the queue entries of the batched jobs are dropped when they come up
+        entries = [keeper.jobs.get_nowait()[2] for _ in range(keeper.jobs.qsize())]
+        assert [keeper._unqueue(job) for job in entries] == [False, False, True]
+
+    run(scenario())
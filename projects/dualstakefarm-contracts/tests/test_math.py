@@ -0,0 +1,107 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from algopy import UInt64
+from algopy_testing import algopy_testing_context
+from hypothesis import given
+from hypothesis import strategies as st
+
+from smart_contracts.common.math import (
+    mul_div,
+    mul_div_ceil,
+    mul_divmod,
+    scaled_mul_div,
+)
+
+MAX_UINT64 = 2**64 - 1
+ODD_FACTOR = (2**65 - 1) // 31
+# divw overflow, division by zero and a failed custom.ensure
+FAILURES = (ValueError, ArithmeticError, RuntimeError)
+
+u64s = st.integers(min_value=0, max_value=MAX_UINT64)
+scales = st.sampled_from([1, 100, 10_000, 10**6])
+
+
+def run(subroutine: Callable[..., Any], *args: int) -> Any:  # noqa: ANN401
+    # custom.ensure logs before it fails, which needs an app call in the group
+    with algopy_testing_context() as context, context.txn.create_group(
+        [context.any.txn.application_call()]
+    ):
+        return subroutine(*map(UInt64, args))
+
+
+def check(subroutine: Callable[..., Any], args: tuple[int, ...], expected: int) -> None:
+    if expected > MAX_UINT64:
+        with pytest.raises(FAILURES):
+            run(subroutine, *args)
+    else:
+        assert run(subroutine, *args) == expected
+
+
+@given(u64s, u64s, u64s)
+def test_mul_div(a: int, b: int, c: int) -> None:
+    if c == 0:
+        with pytest.raises(ZeroDivisionError):
+            run(mul_div, a, b, c)
+    else:
+        check(mul_div, (a, b, c), a * b // c)
+
+
+@given(u64s, u64s, u64s)
+def test_mul_div_ceil(a: int, b: int, c: int) -> None:
+    if c == 0:
+        with pytest.raises(ZeroDivisionError):
+            run(mul_div_ceil, a, b, c)
+    else:
+        check(mul_div_ceil, (a, b, c), -(-a * b // c))
+
+
+@given(u64s, u64s, u64s)
+def test_mul_divmod(a: int, b: int, c: int) -> None:
+    if c == 0:
+        with pytest.raises(ZeroDivisionError):
+            run(mul_divmod, a, b, c)
+    elif a * b // c > MAX_UINT64:
+        with pytest.raises(FAILURES):
+            run(mul_divmod, a, b, c)
+    else:
+        assert run(mul_divmod, a, b, c) == divmod(a * b, c)
+
+
+@given(scales, u64s, u64s, u64s)
+def test_scaled_mul_div(scale: int, a: int, b: int, c: int) -> None:
+    if c == 0:
+        with pytest.raises(ZeroDivisionError):
+            run(scaled_mul_div, scale, a, b, c)
+    else:
+        check(scaled_mul_div, (scale, a, b, c), scale * a * b // c)
+
+
+@pytest.mark.parametrize(
+    ("subroutine", "args", "expected"),
+    [
+        # the 128 bit product does not have to fit, only the result
+        (mul_div, (MAX_UINT64, MAX_UINT64, MAX_UINT64), MAX_UINT64),
+        (mul_div, (2**63, 2, 1), 2**64),
+        (mul_div_ceil, (MAX_UINT64, MAX_UINT64, MAX_UINT64), MAX_UINT64),
+        (mul_div_ceil, (MAX_UINT64, MAX_UINT64, MAX_UINT64 - 1), MAX_UINT64 + 2),
+        # 31 * ODD_FACTOR = 2 * MAX_UINT64 + 1: the floor fits and the ceiling does not
+        (mul_div, (31, ODD_FACTOR, 2), MAX_UINT64),
+        (mul_div_ceil, (31, ODD_FACTOR, 2), MAX_UINT64 + 1),
+        (mul_div_ceil, (2**64 - 2, 3, 3), 2**64 - 2),
+        (scaled_mul_div, (10_000, MAX_UINT64, 1, 10_000), MAX_UINT64),
+        (scaled_mul_div, (10_000, MAX_UINT64, 2, 10_000), 2 * MAX_UINT64),
+        (scaled_mul_div, (10_000, 2**63, 3, 2**63), 30_000),
+    ],
+)
+def test_edges(
+    subroutine: Callable[..., Any], args: tuple[int, ...], expected: int
+) -> None:
+    check(subroutine, args, expected)
+
+
+def test_mul_divmod_fails_when_the_quotient_does_not_fit() -> None:
+    with pytest.raises(RuntimeError, match="err opcode"):
+        run(mul_divmod, 2**63, 4, 1)
+    assert run(mul_divmod, MAX_UINT64, MAX_UINT64, MAX_UINT64) == (MAX_UINT64, 0)
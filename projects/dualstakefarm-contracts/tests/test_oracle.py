@@ -0,0 +1,68 @@
+import random
+
+from simulation import Chain, Emulator
+from simulation.__main__ import ONLINE_STAKE
+from smart_contracts.dualstakefarm.contract import (
+    ORACLE_PAYOUT_STRIDE,
+    ORACLE_ROUND_WINDOW,
+    ORACLE_UPDATE_ROUNDS,
+)
+
+
+def advance_to(chain: Chain, last_round: int) -> None:
+    # the oracle reads up to first_valid - 1, which is the chain's last round
+    chain.advance(last_round - chain.round_)
+
+
+def test_payout_oracle_ignores_the_callers_last_round() -> None:
+    chain = Chain(rng=random.Random(0), online_stake=ONLINE_STAKE)
+    with Emulator.start(chain) as emulator:
+        emulator.call("fold_oracle")
+        bonus = chain.block_bonus
+        assert emulator.global_uint("avg_block_payout") == bonus
+
+        # a keeper picks first_valid so that the last accessible round pays a lot
+        spike = chain.round_ + ORACLE_PAYOUT_STRIDE // 2
+        assert spike % ORACLE_PAYOUT_STRIDE
+        chain.payouts[spike] = 1000 * bonus
+        advance_to(chain, spike)
+        emulator.call("fold_oracle")
+        assert emulator.global_uint("avg_block_payout") == bonus
+
+
+def test_payout_oracle_weighs_samples_by_the_rounds_they_cover() -> None:
+    chain = Chain(rng=random.Random(1), online_stake=ONLINE_STAKE)
+    with Emulator.start(chain) as emulator:
+        emulator.call("fold_oracle")
+        bonus = chain.block_bonus
+        chain.block_bonus = 2 * bonus
+
+        # one stride of per round updates moves the average by about a stride
+        for _ in range(ORACLE_PAYOUT_STRIDE):
+            chain.advance()
+            emulator.call("fold_oracle")
+        moved = emulator.global_uint("avg_block_payout") - bonus
+        assert moved <= bonus * ORACLE_PAYOUT_STRIDE // ORACLE_ROUND_WINDOW
+
+        # a sample over the whole accessible window all but replaces it
+        chain.advance(ORACLE_ROUND_WINDOW)
+        emulator.call("fold_oracle")
+        assert emulator.global_uint("avg_block_payout") > 2 * bonus - bonus // 50
+
+
+def test_update_oracle_folds_at_most_once_per_update_interval() -> None:
+    chain = Chain(rng=random.Random(2), online_stake=ONLINE_STAKE)
+    with Emulator.start(chain) as emulator:
+        emulator.call("update_oracle")
+        oracle_round = emulator.global_uint("oracle_round")
+        assert oracle_round
+
+        chain.advance(ORACLE_UPDATE_ROUNDS - 1)
+        emulator.call("update_oracle")
+        assert emulator.global_uint("oracle_round") == oracle_round
+
+        chain.advance()
+        emulator.call("update_oracle")
+        assert emulator.global_uint("oracle_round") == oracle_round + (
+            ORACLE_UPDATE_ROUNDS
+        )
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from indexer import decode_logs
+from simulation import Chain, Emulator, Harness
+from simulation.__main__ import ONLINE_STAKE
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_random_operations_keep_the_invariants(seed: int) -> None:
+    rng = random.Random(seed)
+    chain = Chain(rng=random.Random(rng.getrandbits(64)), online_stake=ONLINE_STAKE)
+    with Emulator.start(chain) as emulator:
+        harness = Harness(
+            emulator, rng, num_farms=8, num_assets=3, max_duration=200, check_every=1
+        )
+        # raises InvariantError on the first disagreement with the model
+        stats = harness.run(1000)
+    assert stats.checks > stats.total
+    assert sum(harness.model.swaps.values())
+    # every operation ran, including IX reward claims and the rejected calls
+    assert set(stats.ops) == {operation.__name__ for operation, _ in harness.operations}
+    assert stats.blocks_paid
+    assert stats.rejected["claim_ix_rewards"] < stats.ops["claim_ix_rewards"]
+
+
+def test_an_expired_farm_is_reported_as_farm_expired() -> None:
+    rng = random.Random(0)
+    chain = Chain(rng=random.Random(rng.getrandbits(64)), online_stake=ONLINE_STAKE)
+    with Emulator.start(chain) as emulator:
+        harness = Harness(
+            emulator, rng, num_farms=1, num_assets=1, max_duration=1, check_every=1
+        )
+        assert harness.create_farm()
+        (farm,) = harness.model.farms.values()
+        # the one block farm expires with its first payout
+        while not harness.payout():
+            harness.advance()
+        harness.check()
+        payout = emulator.context.txn.last_active
+        logs = [bytes(payout.logs(i)) for i in range(int(payout.num_logs))]
+    assert harness.model.counters["farms_expired"] == 1
+    assert (
+        "FarmExpired",
+        {"recipient_app": farm.app_id, "farm_asset": farm.asset_id},
+    ) in decode_logs(logs)
@@ -1,7 +1,6 @@
 import * as algokit from "@algorandfoundation/algokit-utils";
 import algosdk, { makeEmptyTransactionSigner } from "algosdk";
 import {
-  FarmStateFromTuple,
   FarmStateAndAprFromTuple,
   FarmState as FarmStateInternal,
   DualstakeFarmClient,
@@ -10,6 +9,8 @@ import {
 } from "./DualstakeFarmClient.js";
 
 const TXN_VALIDITY = 8;
+// IX rewards accrued by a keeper: "k" + address public key, written by payouts
+const ixRewardsBox = (keeper: string) => new Uint8Array([...new TextEncoder().encode("k"), ...algosdk.decodeAddress(keeper).publicKey]);
 
 export type DSAprBreakdown = AprBreakdown;
 
@@ -48,6 +49,19 @@ export interface DSFarmParams extends DSFarmCost {
 
 const signer = makeEmptyTransactionSigner();
 
+// log_states logs each farm box as stored: 26 bytes of (uint64, uint64, uint32, uint32, uint16),
+// or a legacy 32 byte FarmState of four uint64s. the box length tells them apart
+const decodeFarmBox = (box: Uint8Array): FarmStateInternal => {
+  const view = new DataView(box.buffer, box.byteOffset, box.byteLength);
+  const legacy = box.length === 32;
+  return {
+    farmAsset: view.getBigUint64(0),
+    amountPerBlock: view.getBigUint64(8),
+    remainingDurationBlocks: legacy ? view.getBigUint64(16) : BigInt(view.getUint32(16)),
+    lastBlockPaid: legacy ? view.getBigUint64(24) : BigInt(view.getUint32(20)),
+  };
+};
+
 export class DSFarmSDK {
   client: DualstakeFarmClient;
   algorand: algokit.AlgorandClient;
@@ -76,10 +90,18 @@ export class DSFarmSDK {
     return this.client.appId;
   }
 
-  async getFarms(): Promise<Map<bigint, FarmState>> {
+  // a farm box only exists while the farm has blocks left, so its name lists the live farms
+  async getFarmIds(): Promise<bigint[]> {
     const { algod } = this.client.algorand.client;
     const { boxes } = await algod.getApplicationBoxes(Number(this.appId)).do();
-    const appIds = boxes.map(({ name: n }: { name: Uint8Array }) => algosdk.decodeUint64(n, "bigint"));
+    // farm boxes are keyed by the 8 byte app id, skip the keeper reward boxes
+    return boxes
+      .filter(({ name: n }: { name: Uint8Array }) => n.length === 8)
+      .map(({ name: n }: { name: Uint8Array }) => algosdk.decodeUint64(n, "bigint"));
+  }
+
+  async getFarms(): Promise<Map<bigint, FarmState>> {
+    const appIds = await this.getFarmIds();
 
     const { confirmations } = await this.client
       .newGroup()
@@ -100,13 +122,11 @@ export class DSFarmSDK {
 
     const logs = confirmations[0]!.logs ?? [];
     for (let idx = 0; idx < logs.length; idx++) {
+      // app ids without a farm log nothing
+      if (!logs[idx].length) continue;
       const appId = appIds[idx];
       const appEscrow = algosdk.getApplicationAddress(appId);
-      const method = this.client.appClient.getABIMethod("get_state");
-      const farmState = FarmStateFromTuple(
-        // @ts-ignore
-        method.returns.type.decode(logs[idx])
-      );
+      const farmState = decodeFarmBox(logs[idx]);
       farmStates.set(appId, {
         ...farmState,
         appId,
@@ -162,6 +182,14 @@ export class DSFarmSDK {
     return farmStates;
   }
 
+  // live farms, soonest expected expiry first. farms whose escrow is not staked go last
+  async getActiveFarms(): Promise<FarmStateAndAPR[]> {
+    const farms = await this.getFarmsAndAPR(await this.getFarmIds());
+    const expiry = ({ staked, remainingDurationSec }: FarmStateAndAPR) =>
+      !staked ? Number.POSITIVE_INFINITY : Number(remainingDurationSec);
+    return [...farms.values()].sort((a, b) => expiry(a) - expiry(b) || Number(a.appId - b.appId));
+  }
+
   async getFarm(dsAppId: bigint): Promise<FarmState> {
     const { returns } = await this.client
       .newGroup()
@@ -460,7 +488,7 @@ export class DSFarmSDK {
 
     const composer = await this.client
       .newGroup()
-      .noop()
+      .updateOracle()
       .payout({
         args: {
           blockRound,
@@ -471,7 +499,7 @@ export class DSFarmSDK {
         accountReferences: [dsState.lpId],
         appReferences: [dsAppId, dsState.tinymanAppId],
         assetReferences: [farmAssetId],
-        boxReferences: [algosdk.encodeUint64(dsAppId)],
+        boxReferences: [algosdk.encodeUint64(dsAppId), ixRewardsBox(this.sender)],
         firstValidRound,
         lastValidRound,
         sender: this.sender,
@@ -518,7 +546,7 @@ export class DSFarmSDK {
     const dsAppId = listing.appId;
     const farmAssetId = listing.asaId;
     const fees = 1000 + blockRounds.length * 1000;
-    let composer = this.client.newGroup().noop();
+    let composer = this.client.newGroup().updateOracle();
 
     for (let i = 0; i < blockRounds.length; i++) {
       composer = composer.payout({
@@ -531,7 +559,7 @@ export class DSFarmSDK {
         accountReferences: [dsState.lpId],
         appReferences: [dsAppId, dsState.tinymanAppId],
         assetReferences: [farmAssetId],
-        boxReferences: [algosdk.encodeUint64(dsAppId)],
+        boxReferences: [algosdk.encodeUint64(dsAppId), ixRewardsBox(this.sender)],
         firstValidRound,
         lastValidRound,
         signer,